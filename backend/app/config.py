@@ -26,6 +26,13 @@ class Settings(BaseSettings):
     NAVER_CLIENT_SECRET: Optional[str] = None
     NAVER_CALLBACK_URL: str = "http://localhost:3000/naver/callback"  # 프론트엔드 콜백 URL
     NAVER_API_BASE_URL: str = "https://openapi.naver.com"
+    NAVER_SHOPPING_QPS: float = 8.0  # 쇼핑 검색 API 초당 최대 요청 수 (Open API 할당량 이내)
+    NAVER_SHOPPING_MAX_CONCURRENCY: int = 8  # 대량 검색 동시 요청 수
+    NAVER_SHOPPING_CACHE_TTL: int = 600  # 검색 결과 캐시 시간(초)
+    NAVER_SHOPPING_BULK_MAX: int = 500  # 대량 검색 1회 최대 검색어 수
+    PRODUCT_PAGE_MAX_CONCURRENCY: int = 8  # 상품 페이지 일괄 추출 동시 요청 수
+    PRODUCT_PAGE_CACHE_TTL: int = 3600  # 상품 페이지 추출 결과 캐시 시간(초)
+    PRODUCT_PAGE_BATCH_MAX: int = 200  # 일괄 추출 1회 최대 URL 수
 
     # Database Settings
     # Use /data for cloud (fly.io persistent volume), local path for development
@@ -35,12 +42,46 @@ class Settings(BaseSettings):
         else f"sqlite:///{Path(__file__).resolve().parent.parent / 'database' / 'coupang_cs.db'}"
     )
 
+    # Query Profiler Settings
+    QUERY_PROFILER_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 100.0  # 이 시간 이상 걸린 SQL을 느린 쿼리로 기록
+    SLOW_QUERY_TOP_N: int = 50  # 유지할 느린 쿼리 fingerprint 수
+    SLOW_QUERY_EXPLAIN: bool = True  # 느린 SELECT의 EXPLAIN QUERY PLAN 캡처
+
+    # Audit Log Writer Settings
+    AUDIT_LOG_BATCH_SIZE: int = 200  # 이만큼 쌓이면 즉시 일괄 기록
+    AUDIT_LOG_FLUSH_INTERVAL: float = 1.0  # 최대 기록 지연(초)
+    AUDIT_LOG_MAX_PENDING: int = 10000  # 버퍼 한도 (넘으면 보안 이벤트가 아닌 새 로그는 버림)
+    AUDIT_LOG_MAX_RETRIES: int = 5  # 일시적 DB 오류 시 배치 재시도 한도
+
+    # Learned Pattern Rewriter Settings
+    LEARNING_PATTERN_RELOAD_SECONDS: int = 300  # 다른 프로세스의 패턴 변경 반영 주기
+    LEARNING_USAGE_FLUSH_BATCH: int = 100  # 적용 횟수가 이만큼 쌓이면 일괄 기록
+    LEARNING_USAGE_FLUSH_INTERVAL: float = 60.0  # 적용 횟수 최대 기록 지연(초)
+
     # Redis Settings
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Cache Settings
+    CACHE_MAX_ENTRIES: int = 10000  # 인메모리 캐시 최대 항목 수 (LRU 제거)
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 인메모리 캐시 최대 크기 (추정치)
+    CACHE_REDIS_ENABLED: bool = False  # REDIS_URL을 2차 캐시로 사용
+
+    # Rate Limit Settings
+    RATE_LIMIT_STORE: str = "memory"  # memory, sqlite (같은 머신 워커 공유), redis (여러 머신 공유)
+    RATE_LIMIT_SQLITE_PATH: str = str(Path(__file__).resolve().parent.parent / "database" / "rate_limits.db")
+
     # OpenAI Settings
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_MODEL: str = "gpt-4"
+    OPENAI_RPM_LIMIT: int = 500  # 분당 요청 한도 (계정 등급에 맞게 설정, 0이면 제한 없음)
+    OPENAI_TPM_LIMIT: int = 90000  # 분당 토큰 한도 (0이면 제한 없음)
+    OPENAI_MAX_CONCURRENCY: int = 16  # 최대 동시 요청 수 (429 시 자동 축소)
+    OPENAI_MAX_RETRIES: int = 4  # 429 재시도 횟수
+
+    # Prompt Context Retrieval
+    POLICY_CONTEXT_TOKEN_BUDGET: int = 500  # 프롬프트에 넣는 정책/FAQ/가이드 컨텍스트 최대 토큰
+    POLICY_CONTEXT_TOP_K: int = 6  # 컨텍스트에 넣는 최대 청크 수
 
     # Security Settings
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
@@ -73,9 +114,12 @@ class Settings(BaseSettings):
     TEMPLATES_DIR: Path = KNOWLEDGE_BASE_DIR / "templates"
     FAQ_DIR: Path = KNOWLEDGE_BASE_DIR / "faq"
     PRODUCTS_DIR: Path = KNOWLEDGE_BASE_DIR / "products"
+    ISSUE_GUIDES_DIR: Path = BASE_DIR / "app" / "knowledge_base" / "issue_guides"
 
     # Scheduler Settings
     AUTO_START_SCHEDULER: bool = True
+    ACCOUNT_FANOUT_MAX_WORKERS: int = 4  # 작업(label)별 계정 동시 실행 수
+    ACCOUNT_FANOUT_TIMEOUT_SECONDS: int = 1800  # 계정 1개 작업 제한 시간
 
     # Email Settings (for notifications)
     SMTP_HOST: Optional[str] = None
@@ -1,122 +1,483 @@
 """
 Caching System
 캐싱 시스템
+
+- 1차: 프로세스 내 LRU/TTL 캐시 (항목 수/추정 크기 상한, 락 스트라이핑)
+- 2차 (선택): Redis (CACHE_REDIS_ENABLED, REDIS_URL) - 여러 워커/머신이 공유
+- prefix(':' 구분 단위, 첫 세그먼트)/태그 색인으로 무효화 시 해당 키만 처리
+- stale-while-revalidate: 만료 후 stale_ttl 동안은 이전 값을 반환하고 백그라운드에서 갱신
+- @cached 데코레이터는 single-flight: 비어 있는 키는 동시 호출 중 한 번만 계산
 """
-from typing import Optional, Any, Callable
-from datetime import datetime, timedelta
+from typing import Optional, Any, Callable, Dict, Iterable, List, Set, Tuple
+from collections import OrderedDict
 from functools import wraps
-import json
 import hashlib
+import pickle
+import sys
+import threading
+import time
 from loguru import logger
 
+_MISSING = object()
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "stale_until", "size", "tags")
+
+    def __init__(self, value, expires_at, stale_until, size, tags):
+        self.value = value
+        self.expires_at = expires_at  # None = 만료 없음
+        self.stale_until = stale_until
+        self.size = size
+        self.tags = tags
+
+
+class _Stripe:
+    """키 해시로 나뉜 캐시 조각 (조각마다 별도 락과 LRU 순서)"""
+    __slots__ = ("lock", "entries", "bytes", "hits", "misses", "stale_hits", "sets", "deletes", "evictions")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.stale_hits = 0
+        self.sets = self.deletes = self.evictions = 0
+
+
+def _estimate_size(value: Any) -> int:
+    """직렬화 크기로 값 크기 추정 (직렬화 불가 객체는 얕은 크기)"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def _key_prefixes(key: str) -> List[str]:
+    """'a:b:c' → ['a:', 'a:b:'] (prefix 색인 단위)"""
+    prefixes = []
+    index = key.find(":")
+    while index != -1:
+        prefixes.append(key[:index + 1])
+        index = key.find(":", index + 1)
+    return prefixes
+
+
+def _key_head(key: str) -> str:
+    """'a:b:c' → 'a' (':' 없는 prefix 무효화용 첫 세그먼트 색인 단위)"""
+    return key.split(":", 1)[0]
+
+
+class RedisCacheTier:
+    """
+    Redis 2차 캐시 (best-effort: 오류는 경고 후 캐시 미스로 처리)
+    값은 (value, expires_at, stale_until, tags)를 pickle로 저장, 태그는 Redis set으로 색인
+    (태그 set은 가장 늦게 만료되는 항목에 맞춰 만료)
+    """
+
+    def __init__(self, url: Optional[str] = None, client=None, namespace: str = "cache:"):
+        if client is None:
+            import redis  # 선택 의존성 (requirements.txt 주석 참고)
+            client = redis.Redis.from_url(url, socket_timeout=0.5)
+        self.client = client
+        self.namespace = namespace
+
+    def get(self, key: str) -> Optional[Tuple[Any, Optional[float], Optional[float], Tuple[str, ...]]]:
+        try:
+            raw = self.client.get(self.namespace + key)
+            if raw is None:
+                return None
+            payload = pickle.loads(raw)
+            if len(payload) == 3:  # 태그 저장 이전 형식
+                payload = (*payload, ())
+            return payload
+        except Exception as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None
+
+    def set(self, key: str, value: Any, expires_at: Optional[float], stale_until: Optional[float], tags: Iterable[str] = ()):
+        try:
+            ttl = int(stale_until - time.time()) + 1 if stale_until else None
+            tags = tuple(tags)
+            self.client.set(self.namespace + key, pickle.dumps((value, expires_at, stale_until, tags)), ex=ttl)
+            for tag in tags:
+                tag_key = f"{self.namespace}tag:{tag}"
+                tag_ttl = self.client.ttl(tag_key)  # -2: 없음, -1: 만료 없음
+                self.client.sadd(tag_key, key)
+                if ttl is None:
+                    self.client.persist(tag_key)
+                elif tag_ttl == -2 or 0 <= tag_ttl < ttl:
+                    self.client.expire(tag_key, ttl)
+        except Exception as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    def delete(self, keys: Iterable[str]):
+        keys = [self.namespace + key for key in keys]
+        if not keys:
+            return
+        try:
+            self.client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.namespace}{prefix}*"))
+            if keys:
+                self.client.delete(*keys)
+            return len(keys)
+        except Exception as e:
+            logger.warning(f"Redis cache invalidate failed: {e}")
+            return 0
+
+    def invalidate_tag(self, tag: str) -> int:
+        tag_key = f"{self.namespace}tag:{tag}"
+        try:
+            members = [m.decode() if isinstance(m, bytes) else m for m in self.client.smembers(tag_key)]
+            self.delete(members)
+            self.client.delete(tag_key)
+            return len(members)
+        except Exception as e:
+            logger.warning(f"Redis cache invalidate failed: {e}")
+            return 0
+
+    def clear(self):
+        self.invalidate_prefix("")
+
 
 class InMemoryCache:
     """
-    Simple in-memory cache with TTL support
-    TTL을 지원하는 간단한 인메모리 캐시
+    Bounded LRU/TTL cache with optional Redis second tier
+    크기 제한 LRU/TTL 인메모리 캐시 (선택적으로 Redis 2차 캐시)
     """
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        max_entries: int = 10000,
+        max_bytes: Optional[int] = None,
+        stripes: int = 16,
+        l2: Optional[RedisCacheTier] = None
+    ):
         """
         Args:
             default_ttl: Default time-to-live in seconds (기본 만료 시간, 초)
+            max_entries: 최대 항목 수 (조각별로 균등 분배, 초과 시 LRU 제거)
+            max_bytes: 최대 추정 크기 (None이면 크기 계산 생략)
+            stripes: 락 조각 수
+            l2: 2차 캐시
         """
-        self.cache = {}
-        self.expiry = {}
         self.default_ttl = default_ttl
-        self.stats = {
-            "hits": 0,
-            "misses": 0,
-            "sets": 0,
-            "deletes": 0
-        }
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.l2 = l2
+        self._stripes = [_Stripe() for _ in range(max(stripes, 1))]
+        self._stripe_entries = max(max_entries // len(self._stripes), 1)
+        self._stripe_bytes = max_bytes // len(self._stripes) if max_bytes else None
+
+        # prefix/태그 → 키 집합 (조각 락 → 색인 락 순서로만 획득)
+        self._index_lock = threading.Lock()
+        self._prefix_index: Dict[str, Set[str]] = {}
+        self._head_index: Dict[str, Set[str]] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+
+    def _stripe(self, key: str) -> _Stripe:
+        return self._stripes[hash(key) % len(self._stripes)]
 
     def get(self, key: str) -> Optional[Any]:
-        """캐시에서 값 가져오기"""
-        # Check if key exists and not expired
-        if key in self.cache:
-            if key in self.expiry:
-                if datetime.utcnow() > self.expiry[key]:
-                    # Expired
-                    self.delete(key)
-                    self.stats["misses"] += 1
-                    return None
-
-            self.stats["hits"] += 1
-            logger.debug(f"Cache HIT: {key}")
-            return self.cache[key]
-
-        self.stats["misses"] += 1
-        logger.debug(f"Cache MISS: {key}")
-        return None
+        """캐시에서 값 가져오기 (만료된 값은 None)"""
+        value, fresh = self.get_entry(key)
+        return value if fresh else None
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
-        """캐시에 값 저장"""
-        self.cache[key] = value
+    def get_entry(self, key: str) -> Tuple[Any, bool]:
+        """
+        (값, 신선 여부) 반환
+        - 신선: (value, True)
+        - stale 기간: (value, False)
+        - 없음: (_MISSING, False)
+        """
+        now = time.time()
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is not None:
+                if entry.expires_at is None or now <= entry.expires_at:
+                    stripe.entries.move_to_end(key)
+                    stripe.hits += 1
+                    return entry.value, True
+                if entry.stale_until is not None and now <= entry.stale_until:
+                    stripe.hits += 1
+                    stripe.stale_hits += 1
+                    return entry.value, False
+                self._remove(stripe, key)
+            stripe.misses += 1
+
+        if self.l2 is not None:
+            payload = self.l2.get(key)
+            if payload is not None:
+                value, expires_at, stale_until, tags = payload
+                if stale_until is None or now <= stale_until:
+                    self._store(key, value, expires_at, stale_until, tuple(tags), write_through=False)
+                    return value, expires_at is None or now <= expires_at
+        return _MISSING, False
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Iterable[str] = (), stale_ttl: int = 0):
+        """
+        캐시에 값 저장
 
+        Args:
+            ttl: 만료 시간(초), 0 이하면 만료 없음
+            tags: 무효화용 태그
+            stale_ttl: 만료 후 stale 값을 반환할 수 있는 추가 시간(초)
+        """
         if ttl is None:
             ttl = self.default_ttl
-
-        if ttl > 0:
-            self.expiry[key] = datetime.utcnow() + timedelta(seconds=ttl)
-
-        self.stats["sets"] += 1
-        logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
+        now = time.time()
+        expires_at = now + ttl if ttl > 0 else None
+        stale_until = expires_at + stale_ttl if expires_at is not None else None
+        self._store(key, value, expires_at, stale_until, tuple(tags), write_through=True)
+
+    def _store(self, key, value, expires_at, stale_until, tags, write_through: bool):
+        size = _estimate_size(value) if self.max_bytes else 0
+        stripe = self._stripe(key)
+        with stripe.lock:
+            if key in stripe.entries:
+                self._remove(stripe, key)
+            stripe.entries[key] = _Entry(value, expires_at, stale_until, size, tags)
+            stripe.bytes += size
+            stripe.sets += 1
+            with self._index_lock:
+                for prefix in _key_prefixes(key):
+                    self._prefix_index.setdefault(prefix, set()).add(key)
+                self._head_index.setdefault(_key_head(key), set()).add(key)
+                for tag in tags:
+                    self._tag_index.setdefault(tag, set()).add(key)
+
+            # LRU 제거 (방금 넣은 항목은 제외)
+            while len(stripe.entries) > 1 and (
+                len(stripe.entries) > self._stripe_entries
+                or (self._stripe_bytes is not None and stripe.bytes > self._stripe_bytes)
+            ):
+                self._remove(stripe, next(iter(stripe.entries)))
+                stripe.evictions += 1
+
+        if write_through and self.l2 is not None:
+            self.l2.set(key, value, expires_at, stale_until, tags)
+
+    def _remove(self, stripe: _Stripe, key: str) -> bool:
+        """조각에서 항목 제거 (조각 락 보유 상태에서 호출)"""
+        entry = stripe.entries.pop(key, None)
+        if entry is None:
+            return False
+        stripe.bytes -= entry.size
+        with self._index_lock:
+            for prefix in _key_prefixes(key):
+                keys = self._prefix_index.get(prefix)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._prefix_index[prefix]
+            head = _key_head(key)
+            keys = self._head_index.get(head)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._head_index[head]
+            for tag in entry.tags:
+                keys = self._tag_index.get(tag)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._tag_index[tag]
+        return True
 
     def delete(self, key: str):
         """캐시에서 삭제"""
-        if key in self.cache:
-            del self.cache[key]
-        if key in self.expiry:
-            del self.expiry[key]
-        self.stats["deletes"] += 1
-        logger.debug(f"Cache DELETE: {key}")
+        stripe = self._stripe(key)
+        with stripe.lock:
+            self._remove(stripe, key)
+            stripe.deletes += 1
+        if self.l2 is not None:
+            self.l2.delete([key])
+
+    def _delete_local(self, keys: Iterable[str]) -> int:
+        count = 0
+        for key in keys:
+            stripe = self._stripe(key)
+            with stripe.lock:
+                if self._remove(stripe, key):
+                    stripe.deletes += 1
+                    count += 1
+        return count
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """prefix로 시작하는 항목 무효화 (가장 가까운 ':' 단위 또는 첫 세그먼트 색인만 확인)"""
+        boundary = prefix[:prefix.rfind(":") + 1]
+        with self._index_lock:
+            if boundary:
+                candidates = list(self._prefix_index.get(boundary, ()))
+            else:
+                # ':' 없는 prefix ("inquiry")는 해당 문자열로 시작하는 첫 세그먼트의 키만 확인
+                candidates = [
+                    key
+                    for head, keys in self._head_index.items() if head.startswith(prefix)
+                    for key in keys
+                ]
+
+        count = self._delete_local(key for key in candidates if key.startswith(prefix))
+        if self.l2 is not None:
+            count = max(count, self.l2.invalidate_prefix(prefix))
+        return count
+
+    def invalidate_tag(self, tag: str) -> int:
+        """태그가 붙은 항목 무효화"""
+        with self._index_lock:
+            keys = list(self._tag_index.get(tag, ()))
+        count = self._delete_local(keys)
+        if self.l2 is not None:
+            count = max(count, self.l2.invalidate_tag(tag))
+        return count
 
     def clear(self):
         """모든 캐시 삭제"""
-        count = len(self.cache)
-        self.cache.clear()
-        self.expiry.clear()
+        count = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                count += len(stripe.entries)
+                stripe.entries.clear()
+                stripe.bytes = 0
+                stripe.hits = stripe.misses = stripe.stale_hits = 0
+                stripe.sets = stripe.deletes = stripe.evictions = 0
+        with self._index_lock:
+            self._prefix_index.clear()
+            self._head_index.clear()
+            self._tag_index.clear()
+        if self.l2 is not None:
+            self.l2.clear()
         logger.info(f"Cache cleared: {count} items removed")
 
     def get_stats(self) -> dict:
         """캐시 통계"""
-        total_requests = self.stats["hits"] + self.stats["misses"]
-        hit_rate = self.stats["hits"] / total_requests if total_requests > 0 else 0
+        totals = {"hits": 0, "misses": 0, "stale_hits": 0, "sets": 0, "deletes": 0, "evictions": 0}
+        size = 0
+        total_bytes = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                for name in totals:
+                    totals[name] += getattr(stripe, name)
+                size += len(stripe.entries)
+                total_bytes += stripe.bytes
+
+        total_requests = totals["hits"] + totals["misses"]
+        hit_rate = totals["hits"] / total_requests if total_requests > 0 else 0
 
         return {
-            **self.stats,
+            **totals,
             "total_requests": total_requests,
-            "hit_rate": round(hit_rate, 4),
-            "size": len(self.cache)
+            "hit_rate": hit_rate,
+            "size": size,
+            "bytes": total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "l2_enabled": self.l2 is not None
         }
 
     def cleanup_expired(self):
-        """만료된 항목 정리"""
-        now = datetime.utcnow()
-        expired_keys = [
-            key for key, expiry_time in self.expiry.items()
-            if now > expiry_time
-        ]
+        """만료된 항목 정리 (stale 기간이 남은 항목은 유지)"""
+        now = time.time()
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                expired = [
+                    key for key, entry in stripe.entries.items()
+                    if entry.expires_at is not None and now > (entry.stale_until or entry.expires_at)
+                ]
+                for key in expired:
+                    self._remove(stripe, key)
+                removed += len(expired)
+
+        if removed:
+            logger.info(f"Cleaned up {removed} expired cache entries")
+
+        return removed
+
+
+class SingleFlight:
+    """같은 키에 대한 동시 계산을 한 번으로 합침 (나머지 호출은 결과를 기다림)"""
+
+    class _Call:
+        __slots__ = ("event", "result", "error")
+
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, "SingleFlight._Call"] = {}
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = SingleFlight._Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
 
-        for key in expired_keys:
-            self.delete(key)
-
-        if expired_keys:
-            logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
-
-        return len(expired_keys)
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
 
 
 # Global cache instance
 _cache: Optional[InMemoryCache] = None
+_cache_lock = threading.Lock()
+_flight = SingleFlight()
+
+
+def _create_l2() -> Optional[RedisCacheTier]:
+    """CACHE_REDIS_ENABLED일 때 Redis 2차 캐시 연결 (실패 시 1차 캐시만 사용)"""
+    from ..config import settings
+    if not settings.CACHE_REDIS_ENABLED:
+        return None
+    try:
+        tier = RedisCacheTier(settings.REDIS_URL)
+        tier.client.ping()
+        return tier
+    except Exception as e:
+        logger.warning(f"Redis cache tier unavailable, using in-memory cache only: {e}")
+        return None
 
 
 def get_cache() -> InMemoryCache:
     """Get global cache instance"""
     global _cache
     if _cache is None:
-        _cache = InMemoryCache(default_ttl=300)  # 5 minutes default
+        with _cache_lock:
+            if _cache is None:
+                from ..config import settings
+                _cache = InMemoryCache(
+                    default_ttl=300,  # 5 minutes default
+                    max_entries=settings.CACHE_MAX_ENTRIES,
+                    max_bytes=settings.CACHE_MAX_BYTES,
+                    l2=_create_l2()
+                )
     return _cache
 
 
@@ -135,7 +496,7 @@ def cache_key(*args, **kwargs) -> str:
     return hashlib.md5(key_string.encode()).hexdigest()
 
 
-def cached(ttl: int = 300, key_prefix: str = ""):
+def cached(ttl: int = 300, key_prefix: str = "", stale_ttl: int = 0):
     """
     Decorator for caching function results
     함수 결과를 캐싱하는 데코레이터
@@ -143,6 +504,7 @@ def cached(ttl: int = 300, key_prefix: str = ""):
     Args:
         ttl: Time to live in seconds
         key_prefix: Prefix for cache key
+        stale_ttl: 만료 후 이전 값을 반환하며 백그라운드 갱신할 시간(초)
 
     Example:
         @cached(ttl=600, key_prefix="user")
@@ -159,17 +521,23 @@ def cached(ttl: int = 300, key_prefix: str = ""):
             args_key = cache_key(*args, **kwargs)
             full_key = f"{key_prefix}:{func_name}:{args_key}" if key_prefix else f"{func_name}:{args_key}"
 
-            # Try to get from cache
-            result = cache.get(full_key)
+            value, fresh = cache.get_entry(full_key)
+            if fresh and value is not None:
+                return value
 
-            if result is not None:
+            def compute():
+                result = func(*args, **kwargs)
+                if result is not None:
+                    cache.set(full_key, result, ttl=ttl, stale_ttl=stale_ttl)
                 return result
 
-            # Call function and cache result
-            result = func(*args, **kwargs)
-            cache.set(full_key, result, ttl=ttl)
+            if value is not _MISSING and value is not None:
+                # stale 값 반환, 갱신은 한 스레드만 백그라운드에서
+                if not _flight.in_flight(full_key):
+                    threading.Thread(target=_refresh, args=(full_key, compute), daemon=True).start()
+                return value
 
-            return result
+            return _flight.do(full_key, compute)
 
         # Add cache control methods
         wrapper.cache_clear = lambda: get_cache().clear()
@@ -180,24 +548,32 @@ def cached(ttl: int = 300, key_prefix: str = ""):
     return decorator
 
 
+def _refresh(key: str, compute: Callable[[], Any]):
+    """stale 값 백그라운드 갱신 (실패해도 기존 stale 값 유지)"""
+    try:
+        _flight.do(key, compute)
+    except Exception as e:
+        logger.warning(f"Cache refresh failed for {key}: {str(e)}")
+
+
 def cache_invalidate(key_prefix: str):
     """
     Invalidate cache entries with given prefix
     특정 prefix를 가진 캐시 항목 무효화
     """
-    cache = get_cache()
+    count = get_cache().invalidate_prefix(key_prefix)
+    logger.info(f"Invalidated {count} cache entries with prefix '{key_prefix}'")
+    return count
 
-    # Find and delete matching keys
-    keys_to_delete = [
-        key for key in cache.cache.keys()
-        if key.startswith(key_prefix)
-    ]
 
-    for key in keys_to_delete:
-        cache.delete(key)
-
-    logger.info(f"Invalidated {len(keys_to_delete)} cache entries with prefix '{key_prefix}'")
-    return len(keys_to_delete)
+def cache_invalidate_tag(tag: str):
+    """
+    Invalidate cache entries with given tag
+    특정 태그가 붙은 캐시 항목 무효화
+    """
+    count = get_cache().invalidate_tag(tag)
+    logger.info(f"Invalidated {count} cache entries with tag '{tag}'")
+    return count
 
 
 # Specialized cache decorators
@@ -0,0 +1,140 @@
+"""
+Keyset Pagination
+키셋(seek) 페이지네이션
+
+OFFSET은 건너뛸 행을 모두 읽어야 해서 뒤쪽 페이지일수록 느려지므로,
+마지막 행의 (정렬 컬럼, id)를 불투명 커서로 넘겨 다음 페이지를 인덱스 탐색으로 조회
+- 정렬 컬럼이 같은 행은 id로 순서 결정 (중복/누락 없음)
+- 날짜 컬럼은 DB에 저장된 문자열 그대로 비교 (SQLite에서 마이크로초 표기 차이로 인한 경계 오류 방지)
+- NULL은 SQLite 기본 순서대로 내림차순에서는 마지막, 오름차순에서는 처음
+전체 개수는 선택: exact (매번 COUNT), cached (COUNT 결과를 잠시 캐시), none
+"""
+import base64
+import hashlib
+import json
+from typing import Any, List, NamedTuple, Optional
+
+from sqlalchemy import DateTime, String, and_, cast, or_, type_coerce
+from sqlalchemy.orm import Query
+
+from .cache import get_cache
+
+COUNT_MODES = ("exact", "cached", "none")
+COUNT_CACHE_TTL = 60  # cached 모드의 COUNT 결과 유지 시간(초)
+
+
+class InvalidCursorError(ValueError):
+    """잘못된 페이지 커서"""
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """(정렬 값, id) → URL-safe 커서 문자열"""
+    raw = json.dumps([sort_value, row_id], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """커서 문자열 → (정렬 값, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return sort_value, int(row_id)
+    except Exception:
+        raise InvalidCursorError("잘못된 페이지 커서입니다")
+
+
+def _is_datetime(column) -> bool:
+    return isinstance(getattr(column, "type", None), DateTime)
+
+
+def keyset_page(
+    query: Query,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+    offset: int = 0
+) -> Page:
+    """
+    (sort_column, id_column) 순서로 한 페이지 조회
+
+    Args:
+        query: 필터가 적용된 단일 엔티티 쿼리 (정렬은 여기서 지정)
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+        descending: 내림차순 여부
+        offset: 커서가 없을 때만 적용 (기존 offset 파라미터 호환)
+
+    Returns:
+        Page(items, next_cursor) - 마지막 페이지면 next_cursor는 None
+    """
+    raw_sort = cast(sort_column, String) if _is_datetime(sort_column) else sort_column
+    coerce = (lambda value: type_coerce(value, String)) if _is_datetime(sort_column) else (lambda value: value)
+
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        if descending:
+            if sort_value is None:
+                condition = and_(sort_column.is_(None), id_column < row_id)
+            else:
+                condition = or_(
+                    sort_column < coerce(sort_value),
+                    and_(sort_column == coerce(sort_value), id_column < row_id),
+                    sort_column.is_(None)
+                )
+        else:
+            if sort_value is None:
+                condition = or_(
+                    and_(sort_column.is_(None), id_column > row_id),
+                    sort_column.isnot(None)
+                )
+            else:
+                condition = or_(
+                    sort_column > coerce(sort_value),
+                    and_(sort_column == coerce(sort_value), id_column > row_id)
+                )
+        query = query.filter(condition)
+        offset = 0
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    rows = query.add_columns(raw_sort, id_column).offset(offset).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(last[-2], last[-1])
+    return Page([row[0] for row in rows], next_cursor)
+
+
+def count_total(query: Query, mode: str = "exact") -> Optional[int]:
+    """
+    전체 개수
+
+    Args:
+        mode: exact (매번 COUNT), cached (같은 조건의 COUNT를 COUNT_CACHE_TTL초 재사용), none (생략)
+    """
+    if mode == "none":
+        return None
+    if mode == "cached":
+        compiled = query.statement.compile()
+        signature = f"{compiled}|{sorted(compiled.params.items(), key=lambda item: item[0])!r}"
+        key = "count:" + hashlib.md5(signature.encode()).hexdigest()
+        cache = get_cache()
+        total = cache.get(key)
+        if total is None:
+            total = query.order_by(None).count()
+            cache.set(key, total, ttl=COUNT_CACHE_TTL)
+        return total
+    return query.order_by(None).count()
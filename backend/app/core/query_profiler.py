@@ -0,0 +1,323 @@
+"""
+Query Profiler
+SQL 실행 시간 측정 및 느린 쿼리 기록
+
+SQLAlchemy 엔진 이벤트로 모든 문장의 실행 시간을 재고:
+- 리터럴/IN 목록을 정규화한 fingerprint 단위로 집계 (느린 쿼리 상위 N개만 유지, 고정 크기)
+- 느린 SELECT는 fingerprint당 한 번 EXPLAIN QUERY PLAN을 캡처 (SQLite)
+- 실행 계획에서 전체 스캔(SCAN <table>)을 찾아 표시, 주요 테이블은 별도 강조
+- 전체 스캔 쿼리의 WHERE/ORDER BY 컬럼으로 복합 인덱스 추천 (동등 조건 → 범위/정렬 순)
+"""
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import event, inspect
+
+# 전체 스캔 시 강조할 대용량 테이블
+WATCHED_TABLES = ("inquiries", "responses", "return_logs", "product_coupon_trackings")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*(?:\?\s*,\s*)*\?\s*\)", re.IGNORECASE)
+_POSTCOMPILE = re.compile(r"\(__\[POSTCOMPILE_\w+\]\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_CONDITION = re.compile(
+    r"\b(\w+)\.(\w+)\s*(=|!=|<>|>=|<=|>|<|\bIN\b|\bLIKE\b|\bIS\b|\bBETWEEN\b)", re.IGNORECASE
+)
+_ORDER_BY = re.compile(r"\bORDER BY\s+(.+?)(?:\bLIMIT\b|\bOFFSET\b|$)", re.IGNORECASE)
+_ORDER_COLUMN = re.compile(r"(\w+)\.(\w+)")
+# SCAN = 테이블(또는 인덱스 전체) 순회, SEARCH = 인덱스로 범위를 좁힌 탐색
+_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)", re.IGNORECASE)
+
+
+def fingerprint(statement: str) -> str:
+    """문장 정규화 (리터럴 → ?, IN 목록 → IN (...), 공백 정리)"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _POSTCOMPILE.sub("(...)", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def parameter_shape(parameters: Any) -> str:
+    """바인드 값은 고객 정보를 담을 수 있으므로 타입만 남김 (예: "(str, int, NoneType)")"""
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        if parameters and all(isinstance(p, (list, tuple, dict)) for p in parameters):
+            # executemany: 첫 행의 형태와 행 수
+            return f"{len(parameters)} x {parameter_shape(parameters[0])}"
+        return "(" + ", ".join(type(p).__name__ for p in parameters) + ")"
+    return type(parameters).__name__
+
+
+def parse_plan(rows: List[Tuple]) -> Dict[str, Any]:
+    """EXPLAIN QUERY PLAN 결과에서 전체 스캔 테이블 추출"""
+    details = [str(row[-1]) for row in rows]
+    full_scans = []
+    for detail in details:
+        match = _FULL_SCAN.match(detail)
+        if match and not detail.upper().startswith("SCAN CONSTANT ROW") and match.group(1) not in full_scans:
+            full_scans.append(match.group(1))
+    return {"plan": details, "full_scans": full_scans}
+
+
+def extract_columns(statement: str) -> Dict[str, Dict[str, List[str]]]:
+    """
+    WHERE/ORDER BY에서 테이블별 컬럼 추출
+
+    Returns:
+        {table: {"equality": [...], "range": [...], "order": [...]}}
+    """
+    columns: Dict[str, Dict[str, List[str]]] = {}
+
+    def add(table, kind, column):
+        bucket = columns.setdefault(table, {"equality": [], "range": [], "order": []})
+        if column not in bucket[kind]:
+            bucket[kind].append(column)
+
+    upper = statement.upper()
+    where_at = upper.find(" WHERE ")
+    if where_at != -1:
+        end_candidates = [upper.find(k, where_at) for k in (" GROUP BY ", " ORDER BY ", " LIMIT ")]
+        end = min([c for c in end_candidates if c != -1], default=len(statement))
+        for table, column, operator in _CONDITION.findall(statement[where_at:end]):
+            operator = operator.upper()
+            kind = "equality" if operator in ("=", "IN", "IS") else "range"
+            add(table, kind, column)
+
+    order = _ORDER_BY.search(statement)
+    if order:
+        for table, column in _ORDER_COLUMN.findall(order.group(1)):
+            add(table, "order", column)
+
+    return columns
+
+
+class QueryProfiler:
+    """엔진 하나에 연결하는 쿼리 프로파일러"""
+
+    def __init__(
+        self,
+        threshold_ms: float = 100,
+        top_n: int = 50,
+        explain: bool = True,
+        watched_tables: Tuple[str, ...] = WATCHED_TABLES
+    ):
+        self.threshold_ms = threshold_ms
+        self.top_n = top_n
+        self.explain = explain
+        self.watched_tables = set(watched_tables)
+        self.engine = None
+        self._lock = threading.Lock()
+        self._slow: Dict[str, Dict[str, Any]] = {}
+        self.total_statements = 0
+        self.total_ms = 0.0
+        self.slow_statements = 0
+
+    # ---------- 이벤트 ----------
+
+    def install(self, engine) -> "QueryProfiler":
+        """엔진 이벤트 등록"""
+        self.engine = engine
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        return self
+
+    def uninstall(self):
+        if self.engine is not None:
+            event.remove(self.engine, "before_cursor_execute", self._before)
+            event.remove(self.engine, "after_cursor_execute", self._after)
+            self.engine = None
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+
+        with self._lock:
+            self.total_statements += 1
+            self.total_ms += elapsed_ms
+
+        if elapsed_ms >= self.threshold_ms:
+            try:
+                self.record_slow(statement, parameters, elapsed_ms, cursor, executemany)
+            except Exception as e:
+                logger.debug(f"Slow query record failed: {e}")
+
+    # ---------- 기록 ----------
+
+    def record_slow(self, statement: str, parameters, elapsed_ms: float, cursor=None, executemany: bool = False):
+        """느린 문장 집계 (상위 N개 fingerprint만 유지)"""
+        key = fingerprint(statement)
+        now = time.time()
+
+        with self._lock:
+            self.slow_statements += 1
+            entry = self._slow.get(key)
+            if entry is None:
+                if len(self._slow) >= self.top_n:
+                    # 가장 덜 느린 항목보다 느릴 때만 교체
+                    weakest = min(self._slow, key=lambda k: self._slow[k]["max_ms"])
+                    if self._slow[weakest]["max_ms"] >= elapsed_ms:
+                        return
+                    del self._slow[weakest]
+                entry = self._slow[key] = {
+                    "fingerprint": key,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "last_ms": 0.0,
+                    "last_seen": None,
+                    "parameter_types": None,
+                    "plan": None,
+                    "full_scans": []
+                }
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["last_ms"] = elapsed_ms
+            entry["last_seen"] = now
+            entry["parameter_types"] = parameter_shape(parameters)[:300]
+            needs_plan = entry["plan"] is None
+
+        if needs_plan and self.explain and not executemany and cursor is not None:
+            plan = self._explain(cursor, statement, parameters)
+            if plan is not None:
+                with self._lock:
+                    if key in self._slow:
+                        self._slow[key].update(plan)
+                        if plan["full_scans"]:
+                            watched = [t for t in plan["full_scans"] if t in self.watched_tables]
+                            if watched:
+                                logger.warning(
+                                    f"[SLOW QUERY] {elapsed_ms:.1f}ms full scan on {', '.join(watched)}: {key[:200]}"
+                                )
+
+    def _explain(self, cursor, statement: str, parameters) -> Optional[Dict[str, Any]]:
+        """같은 DBAPI 연결에서 EXPLAIN QUERY PLAN 실행 (SQLite SELECT만)"""
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return None
+        if self.engine is not None and self.engine.dialect.name != "sqlite":
+            return None
+        try:
+            rows = cursor.connection.execute("EXPLAIN QUERY PLAN " + statement, parameters or ()).fetchall()
+        except Exception as e:
+            logger.debug(f"EXPLAIN failed: {e}")
+            return None
+        return parse_plan(rows)
+
+    # ---------- 조회 ----------
+
+    def slow_queries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """느린 쿼리 목록 (최대 실행 시간 내림차순)"""
+        with self._lock:
+            entries = [dict(entry) for entry in self._slow.values()]
+        entries.sort(key=lambda e: e["max_ms"], reverse=True)
+        for entry in entries:
+            entry["avg_ms"] = round(entry["total_ms"] / entry["count"], 2)
+            entry["total_ms"] = round(entry["total_ms"], 2)
+            entry["max_ms"] = round(entry["max_ms"], 2)
+            entry["last_ms"] = round(entry["last_ms"], 2)
+            entry["watched_full_scans"] = [t for t in entry["full_scans"] if t in self.watched_tables]
+        return entries[:limit] if limit else entries
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "total_statements": self.total_statements,
+                "total_ms": round(self.total_ms, 2),
+                "avg_ms": round(self.total_ms / self.total_statements, 3) if self.total_statements else 0,
+                "slow_statements": self.slow_statements,
+                "tracked_fingerprints": len(self._slow),
+                "threshold_ms": self.threshold_ms,
+                "top_n": self.top_n
+            }
+
+    def reset(self):
+        with self._lock:
+            self._slow.clear()
+            self.total_statements = 0
+            self.total_ms = 0.0
+            self.slow_statements = 0
+
+    def recommend_indexes(self) -> List[Dict[str, Any]]:
+        """
+        전체 스캔이 발생한 느린 쿼리의 조건 컬럼으로 복합 인덱스 추천
+        (동등 조건 컬럼 → 범위 조건 1개 또는 정렬 컬럼, 기존 인덱스가 같은 prefix를 가지면 제외)
+        """
+        existing = self._existing_indexes()
+        recommendations: Dict[Tuple[str, Tuple[str, ...]], Dict[str, Any]] = {}
+
+        for entry in self.slow_queries():
+            if not entry["full_scans"]:
+                continue
+            for table, cols in extract_columns(entry["fingerprint"]).items():
+                if table not in entry["full_scans"]:
+                    continue
+                columns = list(cols["equality"])
+                tail = cols["range"][:1] or cols["order"][:1]
+                columns += [c for c in tail if c not in columns]
+                if not columns:
+                    continue
+                if any(index[:len(columns)] == columns for index in existing.get(table, [])):
+                    continue
+
+                key = (table, tuple(columns))
+                rec = recommendations.get(key)
+                if rec is None:
+                    name = f"idx_{table}_{'_'.join(columns)}"
+                    rec = recommendations[key] = {
+                        "table": table,
+                        "columns": columns,
+                        "sql": f"CREATE INDEX IF NOT EXISTS {name} ON {table}({', '.join(columns)})",
+                        "watched": table in self.watched_tables,
+                        "queries": 0,
+                        "total_ms": 0.0
+                    }
+                rec["queries"] += entry["count"]
+                rec["total_ms"] = round(rec["total_ms"] + entry["total_ms"], 2)
+
+        return sorted(recommendations.values(), key=lambda r: (not r["watched"], -r["total_ms"]))
+
+    def _existing_indexes(self) -> Dict[str, List[List[str]]]:
+        if self.engine is None:
+            return {}
+        try:
+            inspector = inspect(self.engine)
+            result = {}
+            for table in inspector.get_table_names():
+                indexes = [list(i["column_names"]) for i in inspector.get_indexes(table)]
+                pk = inspector.get_pk_constraint(table).get("constrained_columns") or []
+                if pk:
+                    indexes.append(list(pk))
+                result[table] = indexes
+            return result
+        except Exception as e:
+            logger.debug(f"Index inspection failed: {e}")
+            return {}
+
+
+# Global profiler instance
+_profiler: Optional[QueryProfiler] = None
+
+
+def install_query_profiler(engine, **kwargs) -> QueryProfiler:
+    """전역 프로파일러를 엔진에 연결"""
+    global _profiler
+    if _profiler is not None:
+        _profiler.uninstall()
+    _profiler = QueryProfiler(**kwargs).install(engine)
+    return _profiler
+
+
+def get_query_profiler() -> Optional[QueryProfiler]:
+    return _profiler
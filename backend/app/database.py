@@ -14,6 +14,16 @@ engine = create_engine(
     echo=settings.DEBUG
 )
 
+# SQL 실행 시간 측정 / 느린 쿼리 기록 (GET /api/monitoring/db/slow-queries)
+if settings.QUERY_PROFILER_ENABLED:
+    from .core.query_profiler import install_query_profiler
+    install_query_profiler(
+        engine,
+        threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+        top_n=settings.SLOW_QUERY_TOP_N,
+        explain=settings.SLOW_QUERY_EXPLAIN
+    )
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -114,6 +114,31 @@ async def lifespan(app: FastAPI):
     except:
         pass
 
+    # Close shared outbound HTTP clients
+    try:
+        from .services.naver_shopping_client import close_naver_shopping_client
+        from .services.product_page_extractor import close_product_page_extractor
+        from .services.llm_gateway import close_llm_gateway
+        await close_naver_shopping_client()
+        await close_product_page_extractor()
+        close_llm_gateway()
+    except Exception as e:
+        logger.error(f"Failed to close outbound HTTP clients: {str(e)}")
+
+    # Flush buffered audit logs
+    try:
+        from .services.audit_writer import close_audit_writers
+        close_audit_writers()
+    except Exception as e:
+        logger.error(f"Failed to flush audit logs: {str(e)}")
+
+    # Record buffered learned pattern usage
+    try:
+        from .services.pattern_rewriter import close_pattern_rewriters
+        close_pattern_rewriters()
+    except Exception as e:
+        logger.error(f"Failed to record learned pattern usage: {str(e)}")
+
     engine.dispose()
 
 
@@ -128,6 +153,7 @@ app = FastAPI(
 
 # Add custom middlewares (order matters - LAST added = FIRST executed)
 # Rate limiting first (innermost - runs closest to the app)
+# 경로별 정책은 rate_limit.DEFAULT_ROUTE_POLICIES, 상태 저장소는 RATE_LIMIT_STORE 설정
 app.add_middleware(
     RateLimitMiddleware,
     requests_per_minute=60,
@@ -1,16 +1,22 @@
 """
 Rate Limiting Middleware
 요청 제한 미들웨어
+
+GCRA 카운터로 클라이언트/윈도우당 실수 1개만 저장 (요청 타임스탬프 목록을 보관하지 않음)
+경로별 정책: 대량 처리 엔드포인트는 엄격하게, 상태 폴링은 넉넉하게
 """
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Dict, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
-import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import math
+import re
 from loguru import logger
 
+from .rate_limit_store import GCRAWindow, InMemoryRateLimitStore, create_rate_limit_store
+
 
 def add_cors_headers(response: Response) -> Response:
     """Add CORS headers to response"""
@@ -21,151 +27,158 @@ def add_cors_headers(response: Response) -> Response:
     return response
 
 
+WINDOW_SECONDS = {
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400
+}
+
+WINDOW_LABELS = {
+    'minute': "1 minute",
+    'hour': "1 hour",
+    'day': "1 day"
+}
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """경로 그룹별 제한 (분/시/일)"""
+    name: str
+    requests_per_minute: int
+    requests_per_hour: int
+    requests_per_day: int
+
+    @property
+    def limits(self) -> Dict[str, int]:
+        return {
+            'minute': self.requests_per_minute,
+            'hour': self.requests_per_hour,
+            'day': self.requests_per_day
+        }
+
+
+# 대량 처리 (쿠폰 일괄 적용, 일괄 답변 제출, 특수양식 배치, 일괄 업로드 등)
+BULK_POLICY = RateLimitPolicy("bulk", requests_per_minute=10, requests_per_hour=100, requests_per_day=1000)
+
+# 대시보드/진행률 폴링 (이전에는 제한 제외 경로, 폭주만 막도록 넉넉하게)
+POLLING_POLICY = RateLimitPolicy("polling", requests_per_minute=300, requests_per_hour=10000, requests_per_day=100000)
+
+# (경로 정규식, 정책) - 위에서부터 먼저 일치하는 정책 적용
+# naver[^/]*는 이전 "/api/naver" 접두사 제외와 같은 범위 (naver-accounts, naverpay, naver-shopping 등)
+DEFAULT_ROUTE_POLICIES: List[Tuple[str, RateLimitPolicy]] = [
+    (r"^/api/[^/]+/(.*/)?(bulk(/|$)|bulk-|batch(/|$)|[^/]*-bulk(/|$))", BULK_POLICY),
+    (r"^/api/(promotion/progress|automation/stats|automation/chatgpt|system/stats|responses/pending"
+     r"|returns/statistics|returns/list|accounts|naver[^/]*|coupang-accounts|auto-mode)(/|$)", POLLING_POLICY),
+]
+
+
 class RateLimiter:
     """
-    Rate limiter using sliding window algorithm
-    슬라이딩 윈도우 알고리즘을 사용한 요청 제한기
+    Rate limiter using GCRA counters
+    GCRA 카운터를 사용한 요청 제한기 (클라이언트당 O(1) 메모리, 저장소 교체 가능)
     """
 
     def __init__(
         self,
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
-        requests_per_day: int = 10000
+        requests_per_day: int = 10000,
+        route_policies: Optional[List[Tuple[str, RateLimitPolicy]]] = None,
+        store=None
     ):
-        self.limits = {
-            'minute': requests_per_minute,
-            'hour': requests_per_hour,
-            'day': requests_per_day
-        }
-
-        # Store request timestamps per client
-        self.requests: Dict[str, deque] = defaultdict(lambda: deque())
-
-        # Blocked clients (IP -> unblock_time)
-        self.blocked: Dict[str, datetime] = {}
+        self.default_policy = RateLimitPolicy(
+            "default", requests_per_minute, requests_per_hour, requests_per_day
+        )
+        self.limits = self.default_policy.limits
+        self.route_policies = [
+            (re.compile(pattern), policy) for pattern, policy in (route_policies or [])
+        ]
+        self.store = store if store is not None else InMemoryRateLimitStore()
+
+    def policy_for(self, path: Optional[str]) -> RateLimitPolicy:
+        """경로에 적용할 정책"""
+        if path:
+            for pattern, policy in self.route_policies:
+                if pattern.search(path):
+                    return policy
+        return self.default_policy
+
+    def _windows(self, client_id: str, policy: RateLimitPolicy) -> List[GCRAWindow]:
+        return [
+            GCRAWindow(f"rl:{policy.name}:{window}:{client_id}", limit, WINDOW_SECONDS[window])
+            for window, limit in policy.limits.items()
+        ]
 
-    def is_allowed(self, client_id: str) -> tuple[bool, Optional[Dict]]:
+    def is_allowed(self, client_id: str, path: Optional[str] = None, now: Optional[float] = None) -> tuple[bool, Optional[Dict]]:
         """
         Check if request is allowed
 
         Returns:
             (allowed: bool, info: dict)
         """
-        now = datetime.utcnow()
-
-        # Check if blocked
-        if client_id in self.blocked:
-            if now < self.blocked[client_id]:
-                retry_after = int((self.blocked[client_id] - now).total_seconds())
-                return False, {
-                    "reason": "blocked",
-                    "retry_after_seconds": retry_after
-                }
-            else:
-                # Unblock
-                del self.blocked[client_id]
-
-        # Clean old requests
-        self._clean_old_requests(client_id, now)
-
-        # Get request counts
-        minute_count = self._count_requests(client_id, now, minutes=1)
-        hour_count = self._count_requests(client_id, now, minutes=60)
-        day_count = self._count_requests(client_id, now, minutes=1440)
-
-        # Check limits
-        if minute_count >= self.limits['minute']:
-            self._block_client(client_id, minutes=1)
-            return False, {
-                "reason": "rate_limit_minute",
-                "limit": self.limits['minute'],
-                "window": "1 minute",
-                "retry_after_seconds": 60
-            }
-
-        if hour_count >= self.limits['hour']:
-            self._block_client(client_id, minutes=5)
-            return False, {
-                "reason": "rate_limit_hour",
-                "limit": self.limits['hour'],
-                "window": "1 hour",
-                "retry_after_seconds": 300
-            }
-
-        if day_count >= self.limits['day']:
-            self._block_client(client_id, minutes=30)
+        policy = self.policy_for(path)
+        result = self.store.acquire(self._windows(client_id, policy), now=now)
+        windows = list(policy.limits)
+
+        if not result.allowed:
+            window = windows[result.denied_index]
+            retry_after = max(int(math.ceil(result.retry_after)), 1)
+            logger.warning(
+                f"Rate limit: {client_id} exceeded {policy.name}/{window} limit, retry after {retry_after}s"
+            )
             return False, {
-                "reason": "rate_limit_day",
-                "limit": self.limits['day'],
-                "window": "1 day",
-                "retry_after_seconds": 1800
+                "reason": f"rate_limit_{window}",
+                "policy": policy.name,
+                "limit": policy.limits[window],
+                "window": WINDOW_LABELS[window],
+                "retry_after_seconds": retry_after
             }
 
-        # Record request
-        self.requests[client_id].append(now)
-
-        return True, {
-            "remaining_minute": self.limits['minute'] - minute_count - 1,
-            "remaining_hour": self.limits['hour'] - hour_count - 1,
-            "remaining_day": self.limits['day'] - day_count - 1
-        }
-
-    def _clean_old_requests(self, client_id: str, now: datetime):
-        """Remove requests older than 24 hours"""
-        cutoff = now - timedelta(days=1)
+        info = {"policy": policy.name, "limits": policy.limits}
+        for window, remaining in zip(windows, result.remaining):
+            info[f"remaining_{window}"] = remaining
+        return True, info
 
-        while self.requests[client_id] and self.requests[client_id][0] < cutoff:
-            self.requests[client_id].popleft()
-
-    def _count_requests(self, client_id: str, now: datetime, minutes: int) -> int:
-        """Count requests in the last N minutes"""
-        cutoff = now - timedelta(minutes=minutes)
-        return sum(1 for ts in self.requests[client_id] if ts >= cutoff)
-
-    def _block_client(self, client_id: str, minutes: int):
-        """Block client for N minutes"""
-        self.blocked[client_id] = datetime.utcnow() + timedelta(minutes=minutes)
-        logger.warning(f"Rate limit: Blocked client {client_id} for {minutes} minutes")
-
-    def get_stats(self, client_id: str) -> Dict:
+    def get_stats(self, client_id: str, path: Optional[str] = None) -> Dict:
         """Get rate limit stats for client"""
-        now = datetime.utcnow()
-        self._clean_old_requests(client_id, now)
-
-        return {
-            "requests_last_minute": self._count_requests(client_id, now, 1),
-            "requests_last_hour": self._count_requests(client_id, now, 60),
-            "requests_last_day": self._count_requests(client_id, now, 1440),
-            "is_blocked": client_id in self.blocked,
-            "limits": self.limits
+        policy = self.policy_for(path)
+        remaining = self.store.peek(self._windows(client_id, policy))
+        stats = {
+            f"requests_last_{window}": policy.limits[window] - left
+            for window, left in zip(policy.limits, remaining)
         }
+        stats.update({
+            "is_blocked": 0 in remaining,
+            "policy": policy.name,
+            "limits": policy.limits
+        })
+        return stats
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Rate limiting middleware"""
 
-    def __init__(self, app, **kwargs):
+    def __init__(self, app, route_policies: Optional[List[Tuple[str, RateLimitPolicy]]] = None, store=None, **kwargs):
         super().__init__(app)
-        self.rate_limiter = RateLimiter(**kwargs)
+        if store is None:
+            from ..config import settings
+            store = create_rate_limit_store(
+                settings.RATE_LIMIT_STORE,
+                sqlite_path=settings.RATE_LIMIT_SQLITE_PATH,
+                redis_url=settings.REDIS_URL
+            )
+        self.rate_limiter = RateLimiter(
+            route_policies=DEFAULT_ROUTE_POLICIES if route_policies is None else route_policies,
+            store=store,
+            **kwargs
+        )
 
-        # Paths to exclude from rate limiting (polling & frequently called endpoints)
+        # Paths to exclude from rate limiting (폴링 경로는 POLLING_POLICY로 이동)
         self.excluded_paths = [
             "/health",
             "/docs",
             "/redoc",
             "/openapi.json",
-            "/api/promotion/progress",      # Progress polling endpoint
-            "/api/automation/stats",        # Dashboard stats polling
-            "/api/automation/chatgpt",      # ChatGPT status
-            "/api/system/stats",            # System stats polling
-            "/api/responses/pending",       # Pending responses polling
-            "/api/returns/statistics",      # Returns statistics
-            "/api/returns/list",            # Returns list
-            "/api/accounts",                # Account endpoints
-            "/api/naver",                   # Naver account endpoints
-            "/api/coupang-accounts",        # Coupang account endpoints
-            "/api/auto-mode",               # Auto mode endpoints
         ]
 
     async def dispatch(self, request: Request, call_next):
@@ -174,14 +187,22 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Skip rate limiting for excluded paths
-        if any(request.url.path.startswith(path) for path in self.excluded_paths):
+        path = request.url.path
+        if any(path.startswith(excluded) for excluded in self.excluded_paths):
             return await call_next(request)
 
         # Get client identifier (IP address or API key)
         client_id = self._get_client_id(request)
 
-        # Check rate limit
-        allowed, info = self.rate_limiter.is_allowed(client_id)
+        # Check rate limit (공유 저장소는 스레드풀에서, 저장소 오류 시 제한 없이 통과)
+        try:
+            if getattr(self.rate_limiter.store, "blocking", False):
+                allowed, info = await run_in_threadpool(self.rate_limiter.is_allowed, client_id, path)
+            else:
+                allowed, info = self.rate_limiter.is_allowed(client_id, path)
+        except Exception as e:
+            logger.warning(f"Rate limit store error, allowing request: {e}")
+            return await call_next(request)
 
         if not allowed:
             # Track in monitoring
@@ -190,7 +211,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             monitor.log_user_action(
                 user_id=client_id,
                 action="rate_limit_exceeded",
-                path=request.url.path,
+                path=path,
                 reason=info.get("reason")
             )
 
@@ -212,9 +233,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         if info and "remaining_minute" in info:
-            response.headers["X-RateLimit-Limit-Minute"] = str(self.rate_limiter.limits['minute'])
+            response.headers["X-RateLimit-Policy"] = info["policy"]
+            response.headers["X-RateLimit-Limit-Minute"] = str(info["limits"]['minute'])
             response.headers["X-RateLimit-Remaining-Minute"] = str(info['remaining_minute'])
-            response.headers["X-RateLimit-Limit-Hour"] = str(self.rate_limiter.limits['hour'])
+            response.headers["X-RateLimit-Limit-Hour"] = str(info["limits"]['hour'])
             response.headers["X-RateLimit-Remaining-Hour"] = str(info['remaining_hour'])
 
         return response
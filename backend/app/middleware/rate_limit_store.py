@@ -0,0 +1,245 @@
+"""
+Rate Limit Stores
+GCRA(Generic Cell Rate Algorithm) 요청 제한 상태 저장소
+
+클라이언트/윈도우마다 TAT(theoretical arrival time) 실수 하나만 저장 (O(1) 메모리)
+- 제한 L회 / 기간 T → 방출 간격 I = T / L, 허용 버스트 = T
+- 요청 시 new_tat = max(tat, now) + I, new_tat - T > now 이면 거부
+여러 윈도우(분/시/일)는 모두 허용될 때만 함께 반영 (all-or-nothing)
+
+저장소:
+- InMemoryRateLimitStore: 프로세스 내 (기본)
+- SQLiteRateLimitStore: 같은 머신의 여러 워커가 공유
+- RedisRateLimitStore: 여러 머신이 공유 (redis 패키지 선택 설치, Lua 스크립트로 원자 처리)
+"""
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from loguru import logger
+
+# TAT 비교 시 부동소수점 오차 허용치 (예: 60초 / 7회는 7번째 요청에서 미세하게 초과)
+TAT_EPSILON = 1e-6
+
+
+class GCRAWindow(NamedTuple):
+    """윈도우 1개 (key는 클라이언트/정책/윈도우 조합)"""
+    key: str
+    limit: int
+    period: float  # 초
+
+
+class GCRAResult(NamedTuple):
+    allowed: bool
+    remaining: List[int]  # 윈도우별 남은 요청 수
+    retry_after: float  # 거부 시 다시 시도할 수 있을 때까지 초
+    denied_index: Optional[int]  # 거부를 일으킨 윈도우
+
+
+def gcra_evaluate(tats: List[Optional[float]], windows: List[GCRAWindow], now: float):
+    """
+    저장된 TAT들로 요청 허용 여부 계산 (저장소 공통 로직)
+
+    Returns:
+        (GCRAResult, 허용 시 저장할 new_tat 리스트)
+    """
+    new_tats = []
+    remaining = []
+    for index, (tat, window) in enumerate(zip(tats, windows)):
+        interval = window.period / window.limit
+        new_tat = max(tat or now, now) + interval
+        allow_at = new_tat - window.period
+        if allow_at > now + TAT_EPSILON:
+            return GCRAResult(False, [], allow_at - now, index), None
+        new_tats.append(new_tat)
+        remaining.append(max(int(math.floor((window.period - (new_tat - now)) / interval + TAT_EPSILON)), 0))
+    return GCRAResult(True, remaining, 0.0, None), new_tats
+
+
+def gcra_remaining(tat: Optional[float], window: GCRAWindow, now: float) -> int:
+    """요청 없이 현재 남은 요청 수 계산"""
+    interval = window.period / window.limit
+    used = max((tat or now) - now, 0)
+    return max(int(math.floor((window.period - used) / interval + TAT_EPSILON)), 0)
+
+
+class InMemoryRateLimitStore:
+    """프로세스 내 저장소 (만료된 TAT는 주기적으로 정리)"""
+
+    SWEEP_EVERY = 10000
+    blocking = False  # 이벤트 루프에서 바로 호출해도 되는 저장소
+
+    def __init__(self):
+        self._tats: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._ops = 0
+
+    def acquire(self, windows: List[GCRAWindow], now: Optional[float] = None) -> GCRAResult:
+        now = time.time() if now is None else now
+        with self._lock:
+            result, new_tats = gcra_evaluate([self._tats.get(w.key) for w in windows], windows, now)
+            if new_tats:
+                for window, tat in zip(windows, new_tats):
+                    self._tats[window.key] = tat
+
+            self._ops += 1
+            if self._ops >= self.SWEEP_EVERY:
+                self._sweep(now)
+        return result
+
+    def peek(self, windows: List[GCRAWindow], now: Optional[float] = None) -> List[int]:
+        now = time.time() if now is None else now
+        with self._lock:
+            return [gcra_remaining(self._tats.get(w.key), w, now) for w in windows]
+
+    def _sweep(self, now: float):
+        """TAT가 지난 항목은 새 요청과 동일하므로 삭제"""
+        expired = [key for key, tat in self._tats.items() if tat <= now]
+        for key in expired:
+            del self._tats[key]
+        self._ops = 0
+
+    def __len__(self):
+        return len(self._tats)
+
+
+class SQLiteRateLimitStore:
+    """SQLite 파일 저장소 (같은 머신의 여러 uvicorn 워커가 공유)"""
+
+    blocking = True  # 파일 잠금 대기 가능 → 스레드풀에서 호출
+
+    def __init__(self, path: str = "database/rate_limits.db", timeout: float = 5):
+        self.path = path
+        self.timeout = timeout  # 다른 워커의 잠금 대기 시간(초)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS rate_limit_tats (key TEXT PRIMARY KEY, tat REAL NOT NULL)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, windows: List[GCRAWindow], now: Optional[float] = None) -> GCRAResult:
+        now = time.time() if now is None else now
+        conn = self._connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            tats = [self._get(conn, w.key) for w in windows]
+            result, new_tats = gcra_evaluate(tats, windows, now)
+            if new_tats:
+                conn.executemany(
+                    "INSERT INTO rate_limit_tats (key, tat) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                    [(w.key, tat) for w, tat in zip(windows, new_tats)]
+                )
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def peek(self, windows: List[GCRAWindow], now: Optional[float] = None) -> List[int]:
+        now = time.time() if now is None else now
+        conn = self._connection()
+        return [gcra_remaining(self._get(conn, w.key), w, now) for w in windows]
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """만료된 TAT 삭제"""
+        now = time.time() if now is None else now
+        cursor = self._connection().execute("DELETE FROM rate_limit_tats WHERE tat <= ?", (now,))
+        return cursor.rowcount
+
+    @staticmethod
+    def _get(conn: sqlite3.Connection, key: str) -> Optional[float]:
+        row = conn.execute("SELECT tat FROM rate_limit_tats WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+
+# KEYS: 윈도우 키들, ARGV: now, 그리고 윈도우별 (limit, period)
+_REDIS_GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local new_tats = {}
+local remaining = {}
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i])
+    local period = tonumber(ARGV[2 * i + 1])
+    local interval = period / limit
+    local tat = tonumber(redis.call('GET', key)) or now
+    if tat < now then tat = now end
+    local new_tat = tat + interval
+    local allow_at = new_tat - period
+    if allow_at > now + 1e-6 then
+        return {0, tostring(allow_at - now), i - 1}
+    end
+    new_tats[i] = new_tat
+    remaining[i] = math.max(math.floor((period - (new_tat - now)) / interval + 1e-6), 0)
+end
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, tostring(new_tats[i]), 'PX', math.ceil((new_tats[i] - now) * 1000))
+end
+local out = {1, '0', -1}
+for i = 1, #remaining do out[#out + 1] = remaining[i] end
+return out
+"""
+
+
+class RedisRateLimitStore:
+    """Redis 저장소 (여러 머신 공유, 키는 TAT 만료 시 자동 삭제)"""
+
+    blocking = True  # 네트워크 호출 → 스레드풀에서 호출
+
+    def __init__(self, url: str, client=None):
+        if client is None:
+            import redis  # 선택 의존성 (requirements.txt 주석 참고)
+            client = redis.Redis.from_url(url, socket_timeout=0.5)
+        self.client = client
+        self._script = client.register_script(_REDIS_GCRA_SCRIPT)
+
+    def acquire(self, windows: List[GCRAWindow], now: Optional[float] = None) -> GCRAResult:
+        now = time.time() if now is None else now
+        args = [now]
+        for window in windows:
+            args.extend([window.limit, window.period])
+        reply = self._script(keys=[w.key for w in windows], args=args)
+
+        allowed = int(reply[0]) == 1
+        if not allowed:
+            return GCRAResult(False, [], float(reply[1]), int(reply[2]))
+        return GCRAResult(True, [max(int(r), 0) for r in reply[3:]], 0.0, None)
+
+    def peek(self, windows: List[GCRAWindow], now: Optional[float] = None) -> List[int]:
+        now = time.time() if now is None else now
+        values = self.client.mget([w.key for w in windows])
+        return [
+            gcra_remaining(float(value) if value is not None else None, window, now)
+            for value, window in zip(values, windows)
+        ]
+
+
+def create_rate_limit_store(kind: str = "memory", sqlite_path: Optional[str] = None, redis_url: Optional[str] = None):
+    """
+    설정값으로 저장소 생성 (공유 저장소를 쓸 수 없으면 프로세스 내 저장소로 대체)
+
+    Args:
+        kind: memory, sqlite, redis
+    """
+    try:
+        if kind == "sqlite":
+            return SQLiteRateLimitStore(sqlite_path or "database/rate_limits.db")
+        if kind == "redis":
+            store = RedisRateLimitStore(redis_url)
+            store.client.ping()
+            return store
+    except Exception as e:
+        logger.warning(f"Rate limit store '{kind}' unavailable, falling back to in-memory: {e}")
+    return InMemoryRateLimitStore()
@@ -9,17 +9,20 @@ from .knowledge_base import KnowledgeBase
 from .learning import ResponseFeedback, LearningPattern, PromptImprovement
 from .customer import CustomerProfile
 from .comment import InquiryComment, InquiryTag, InquiryBookmark
-from .user import User, Role, Permission, AuditLog
+from .user import User, Role, Permission, AuditLog, AuditLogSummary
 from .template import Template
 from .coupang_account import CoupangAccount
 from .return_log import ReturnLog
 from .naver_account import NaverAccount
 from .account_set import AccountSet
-from .coupon_config import CouponAutoSyncConfig, ProductCouponTracking, CouponApplyLog
+from .coupon_config import CouponAutoSyncConfig, ProductCouponTracking, CouponApplyLog, CouponRequestStatus
 from .naver_review import NaverReviewTemplate, NaverReviewLog, NaverReviewImage, NaverReviewStats
 from .delivery import NaverPayDelivery, NaverPayDeliveryHistory, NaverPaySchedule
 from .ip_mapping import IPMapping, SheetConfig
 from .auto_mode_session import AutoModeSession
+from .product_catalog import CatalogProduct, CatalogVendorItem, CatalogSyncState
+from .scheduler_job import SchedulerJobLock, SchedulerJobRun
+from .payload_blob import PayloadBlob
 
 __all__ = [
     "Inquiry",
@@ -38,6 +41,7 @@ __all__ = [
     "Role",
     "Permission",
     "AuditLog",
+    "AuditLogSummary",
     "Template",
     "CoupangAccount",
     "ReturnLog",
@@ -46,6 +50,7 @@ __all__ = [
     "CouponAutoSyncConfig",
     "ProductCouponTracking",
     "CouponApplyLog",
+    "CouponRequestStatus",
     "NaverReviewTemplate",
     "NaverReviewLog",
     "NaverReviewImage",
@@ -55,5 +60,11 @@ __all__ = [
     "NaverPaySchedule",
     "IPMapping",
     "SheetConfig",
-    "AutoModeSession"
+    "AutoModeSession",
+    "CatalogProduct",
+    "CatalogVendorItem",
+    "CatalogSyncState",
+    "SchedulerJobLock",
+    "SchedulerJobRun",
+    "PayloadBlob"
 ]
@@ -24,6 +24,7 @@ class AutoReturnConfig(Base):
     process_enabled = Column(Boolean, default=True, nullable=False, comment="자동 처리 활성화")
     process_interval_minutes = Column(Integer, default=20, nullable=False, comment="처리 주기(분)")
     process_batch_size = Column(Integer, default=50, nullable=False, comment="한 번에 처리할 최대 개수")
+    process_workers = Column(Integer, default=1, nullable=False, comment="병렬 브라우저 워커 수 (1이면 순차 처리)")
 
     # 상태 필터링
     auto_process_statuses = Column(JSON, default=list, nullable=False, comment="자동 처리할 상태 목록")
@@ -69,6 +70,7 @@ class AutoReturnConfig(Base):
             "process_enabled": self.process_enabled,
             "process_interval_minutes": self.process_interval_minutes,
             "process_batch_size": self.process_batch_size,
+            "process_workers": self.process_workers,
             "auto_process_statuses": self.auto_process_statuses,
             "exclude_statuses": self.exclude_statuses,
             "max_retry_count": self.max_retry_count,
@@ -100,6 +102,7 @@ class AutoReturnConfig(Base):
             "process_enabled": True,
             "process_interval_minutes": 20,
             "process_batch_size": 50,
+            "process_workers": 1,
             "auto_process_statuses": [
                 "RELEASE_STOP_UNCHECKED",
                 "RETURNS_UNCHECKED",
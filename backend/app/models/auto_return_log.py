@@ -2,9 +2,10 @@
 자동 반품 처리 실행 로그 모델
 자동화 실행 내역과 성능을 추적하기 위한 로그
 """
-from sqlalchemy import Column, Integer, String, Boolean, JSON, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
 from sqlalchemy.sql import func
 from ..database import Base
+from .payload_blob import ArchivedPayload
 
 
 class AutoReturnExecutionLog(Base):
@@ -28,19 +29,21 @@ class AutoReturnExecutionLog(Base):
     failed_count = Column(Integer, default=0, comment="실패 개수")
 
     # 상세 정보
-    details = Column(JSON, nullable=True, comment="상세 실행 정보")
+    details_ref = Column(String(64), nullable=True, comment="상세 실행 정보 blob digest")
+    details = ArchivedPayload("details_ref")
     error_message = Column(Text, nullable=True, comment="에러 메시지")
 
     # 메타데이터
     triggered_by = Column(String, nullable=True, comment="scheduler, manual, api 등")
-    config_snapshot = Column(JSON, nullable=True, comment="실행 시점의 설정 스냅샷")
+    config_snapshot_ref = Column(String(64), nullable=True, comment="실행 시점의 설정 스냅샷 blob digest")
+    config_snapshot = ArchivedPayload("config_snapshot_ref")
 
     def __repr__(self):
         return f"<AutoReturnExecutionLog(id={self.id}, type={self.execution_type}, status={self.status})>"
 
-    def to_dict(self):
-        """딕셔너리로 변환"""
-        return {
+    def to_dict(self, include_payload: bool = True):
+        """딕셔너리로 변환 (include_payload=False면 압축 보관한 details 제외, 목록용)"""
+        data = {
             "id": self.id,
             "execution_type": self.execution_type,
             "status": self.status,
@@ -50,7 +53,9 @@ class AutoReturnExecutionLog(Base):
             "total_items": self.total_items,
             "success_count": self.success_count,
             "failed_count": self.failed_count,
-            "details": self.details,
             "error_message": self.error_message,
             "triggered_by": self.triggered_by,
         }
+        if include_payload:
+            data["details"] = self.details
+        return data
@@ -2,7 +2,7 @@
 Coupon Auto-Sync Configuration Models
 쿠폰 자동연동 설정 모델
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -119,7 +119,8 @@ class ProductCouponTracking(Base):
     # 쿠폰 적용 예정일
     coupon_apply_scheduled_at = Column(DateTime, nullable=False)
 
-    # 상태: pending, processing, completed, failed, skipped
+    # 상태: pending, processing, completed, failed, unknown, skipped
+    # (processing: 즉시할인쿠폰 요청 결과 확인 대기 중, unknown: 결과 확인 시간 초과)
     status = Column(String(50), default="pending", index=True)
 
     # 즉시할인쿠폰 적용 상태
@@ -138,6 +139,11 @@ class ProductCouponTracking(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # 추적 목록 키셋 페이지네이션
+        Index("idx_coupon_tracking_account_created_id", "coupang_account_id", "created_at", "id"),
+    )
+
     def to_dict(self):
         """Convert to dictionary"""
         return {
@@ -189,6 +195,10 @@ class BulkApplyProgress(Base):
     download_success = Column(Integer, default=0)
     download_failed = Column(Integer, default=0)
 
+    # 즉시할인쿠폰 비동기 요청 결과 대기/확인 불가 아이템 수
+    instant_pending = Column(Integer, default=0)
+    instant_unknown = Column(Integer, default=0)
+
     # 오류 메시지
     error_message = Column(Text, nullable=True)
 
@@ -205,7 +215,10 @@ class BulkApplyProgress(Base):
 
         applying_progress = 0
         total_apply = self.instant_total + self.download_total
-        applied = self.instant_success + self.instant_failed + self.download_success + self.download_failed
+        applied = (
+            self.instant_success + self.instant_failed + (self.instant_unknown or 0)
+            + self.download_success + self.download_failed
+        )
         if total_apply > 0:
             applying_progress = round((applied / total_apply) * 100, 1)
 
@@ -222,6 +235,8 @@ class BulkApplyProgress(Base):
             "instant_total": self.instant_total,
             "instant_success": self.instant_success,
             "instant_failed": self.instant_failed,
+            "instant_pending": self.instant_pending or 0,
+            "instant_unknown": self.instant_unknown or 0,
             "download_total": self.download_total,
             "download_success": self.download_success,
             "download_failed": self.download_failed,
@@ -263,6 +278,11 @@ class CouponApplyLog(Base):
     # Timestamp
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # 적용 이력 키셋 페이지네이션
+        Index("idx_coupon_apply_log_account_created_id", "coupang_account_id", "created_at", "id"),
+    )
+
     def to_dict(self):
         """Convert to dictionary"""
         return {
@@ -279,3 +299,66 @@ class CouponApplyLog(Base):
             "error_message": self.error_message,
             "created_at": self.created_at.isoformat() if self.created_at else None
         }
+
+
+class CouponRequestStatus(Base):
+    """쿠폰 비동기 요청(requestedId / requestTransactionId) 상태 추적"""
+    __tablename__ = "coupon_request_statuses"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # 연결된 쿠팡 계정
+    coupang_account_id = Column(Integer, ForeignKey("coupang_accounts.id"), nullable=False, index=True)
+
+    # 요청 정보
+    coupon_type = Column(String(50), nullable=False, default="instant")  # instant, download
+    request_id = Column(String(100), nullable=False, index=True)  # requestedId / requestTransactionId
+    coupon_id = Column(Integer, nullable=True)
+    vendor_item_ids = Column(JSON, default=list)
+    item_count = Column(Integer, default=0)
+
+    # 결과를 반영할 대상 (선택)
+    bulk_progress_id = Column(Integer, ForeignKey("bulk_apply_progress.id"), nullable=True)
+    tracking_id = Column(Integer, ForeignKey("product_coupon_trackings.id"), nullable=True)
+    apply_log_id = Column(Integer, ForeignKey("coupon_apply_logs.id"), nullable=True)
+
+    # 상태: REQUESTED, DONE, FAIL, UNKNOWN
+    status = Column(String(20), default="REQUESTED")
+    success_count = Column(Integer, default=0)
+    failed_count = Column(Integer, default=0)
+    failed_vendor_items = Column(JSON, nullable=True)
+    error_message = Column(Text, nullable=True)
+
+    # 폴링 스케줄
+    poll_count = Column(Integer, default=0)
+    next_poll_at = Column(DateTime, default=datetime.utcnow)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    resolved_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_coupon_request_status_next_poll", "status", "next_poll_at"),
+    )
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            "id": self.id,
+            "coupang_account_id": self.coupang_account_id,
+            "coupon_type": self.coupon_type,
+            "request_id": self.request_id,
+            "coupon_id": self.coupon_id,
+            "item_count": self.item_count,
+            "bulk_progress_id": self.bulk_progress_id,
+            "tracking_id": self.tracking_id,
+            "status": self.status,
+            "success_count": self.success_count,
+            "failed_count": self.failed_count,
+            "failed_vendor_items": self.failed_vendor_items or [],
+            "error_message": self.error_message,
+            "poll_count": self.poll_count,
+            "next_poll_at": self.next_poll_at.isoformat() if self.next_poll_at else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None
+        }
@@ -3,9 +3,10 @@ Issue Response Model
 쿠팡 판매 관련 문제 대응 모델
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
+from .payload_blob import ArchivedPayload
 
 
 class IssueResponse(Base):
@@ -21,7 +22,8 @@ class IssueResponse(Base):
     original_content = Column(Text, nullable=False)  # 원본 메일/알림 내용
 
     # AI 분석 결과
-    ai_analysis = Column(JSON)  # 문제 분석 결과 (JSON)
+    ai_analysis_ref = Column(String(64))  # 문제 분석 결과 blob digest
+    ai_analysis = ArchivedPayload("ai_analysis_ref")  # 문제 분석 결과 (JSON, payload_blobs에 압축 보관)
     severity = Column(String(20), default="medium")  # low, medium, high, critical
     summary = Column(String(500))  # 요약
     deadline = Column(String(50))  # 대응 기한
@@ -43,15 +45,19 @@ class IssueResponse(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        """딕셔너리 변환"""
-        return {
+    __table_args__ = (
+        # 대응 이력 키셋 페이지네이션
+        Index("idx_issue_responses_created_id", "created_at", "id"),
+    )
+
+    def to_dict(self, include_payload: bool = True):
+        """딕셔너리 변환 (include_payload=False면 압축 보관한 ai_analysis 제외, 목록용)"""
+        data = {
             "id": self.id,
             "coupang_account_id": self.coupang_account_id,
             "issue_type": self.issue_type,
             "issue_subtype": self.issue_subtype,
             "original_content": self.original_content,
-            "ai_analysis": self.ai_analysis,
             "severity": self.severity,
             "summary": self.summary,
             "deadline": self.deadline,
@@ -67,6 +73,9 @@ class IssueResponse(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+        if include_payload:
+            data["ai_analysis"] = self.ai_analysis
+        return data
 
     def __repr__(self):
         return f"<IssueResponse {self.id}: {self.issue_type}/{self.issue_subtype}>"
@@ -3,9 +3,10 @@ Naver Delivery Sync Model
 네이버 배송 정보 → 쿠팡 송장 동기화 모델
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 from ..database import Base
+from .payload_blob import ArchivedPayload
 
 
 class NaverDeliveryInfo(Base):
@@ -36,7 +37,8 @@ class NaverDeliveryInfo(Base):
 
     # 송장 등록 상태
     status = Column(String(50), default="pending")  # pending, matched, uploaded, failed
-    upload_result = Column(JSON)  # 업로드 결과
+    upload_result_ref = Column(String(64))  # 업로드 결과 blob digest
+    upload_result = ArchivedPayload("upload_result_ref")  # 업로드 결과 (JSON, payload_blobs에 압축 보관)
     error_message = Column(Text)  # 에러 메시지
     uploaded_at = Column(DateTime)  # 송장 등록 시간
 
@@ -45,8 +47,9 @@ class NaverDeliveryInfo(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        return {
+    def to_dict(self, include_payload: bool = True):
+        """딕셔너리 변환 (include_payload=False면 압축 보관한 upload_result 제외, 목록용)"""
+        data = {
             "id": self.id,
             "naver_account_id": self.naver_account_id,
             "store_name": self.store_name,
@@ -63,13 +66,15 @@ class NaverDeliveryInfo(Base):
             "is_matched": self.is_matched,
             "match_confidence": self.match_confidence,
             "status": self.status,
-            "upload_result": self.upload_result,
             "error_message": self.error_message,
             "uploaded_at": self.uploaded_at.isoformat() if self.uploaded_at else None,
             "collected_at": self.collected_at.isoformat() if self.collected_at else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+        if include_payload:
+            data["upload_result"] = self.upload_result
+        return data
 
     def __repr__(self):
         return f"<NaverDeliveryInfo {self.id}: {self.receiver_name} - {self.tracking_number}>"
@@ -0,0 +1,191 @@
+"""
+Payload Blob Model
+압축 원본 페이로드 저장소
+
+쿠팡 API 원본/실행 상세/AI 분석 결과 같은 큰 JSON을 목록·통계 쿼리가 훑는 테이블에
+그대로 두지 않고 payload_blobs 테이블에 압축해 보관:
+- 키는 정규화 JSON(키 정렬)의 SHA-256 → 같은 페이로드는 한 번만 저장 (중복 제거)
+- 압축은 zstandard가 있으면 zstd, 없으면 gzip (blob마다 codec 기록, 압축해도 줄지 않으면 raw)
+- 원래 테이블에는 digest(64자)만 두고, ArchivedPayload 속성이 읽을 때만 blob을 조회
+  (상세 화면에서만 로드, 객체별로 digest 기준 캐시)
+- 값을 바꾸면 flush 직전(before_flush)에 없는 blob만 한 번의 조회로 확인 후
+  INSERT ... ON CONFLICT DO NOTHING으로 추가 (동시에 같은 페이로드를 쓰는 세션끼리 충돌하지 않음,
+  digest가 같으면 행 자체가 바뀌지 않음)
+- 더 이상 참조되지 않는 blob은 delete_orphan_blobs()가 정리 (스케줄러 일일 작업)
+"""
+import gzip
+import hashlib
+import json
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, event, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session, object_session
+
+from ..database import Base
+
+try:
+    import zstandard
+    CODEC = "zstd"
+except ImportError:  # 선택 의존성 (없으면 gzip)
+    zstandard = None
+    CODEC = "gzip"
+
+_PENDING_KEY = "_pending_payload_blobs"
+
+# 이 기간 안에 저장/재참조된 blob은 참조가 없어도 정리하지 않음 (커밋 전 세션이 참조 중일 수 있음)
+ORPHAN_GRACE_PERIOD = timedelta(hours=6)
+
+
+class PayloadBlob(Base):
+    """압축된 JSON 페이로드 (내용 주소 기반)"""
+    __tablename__ = "payload_blobs"
+
+    digest = Column(String(64), primary_key=True, comment="정규화 JSON의 SHA-256")
+    codec = Column(String(10), nullable=False, comment="zstd, gzip 또는 raw(압축 안 함)")
+    raw_size = Column(Integer, nullable=False, comment="압축 전 크기(bytes)")
+    data = Column(LargeBinary, nullable=False, comment="압축된 JSON")
+    created_at = Column(DateTime, default=datetime.utcnow, comment="저장 또는 마지막 재참조 시각 (정리 유예 기준)")
+
+    def __repr__(self):
+        return f"<PayloadBlob {self.digest[:12]} {self.codec} {self.raw_size}B>"
+
+
+def encode_payload(value: Any) -> Tuple[str, bytes]:
+    """페이로드 → (digest, 직렬화한 JSON bytes)"""
+    canonical = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest(), raw
+
+
+def compress_payload(raw: bytes) -> Tuple[str, bytes]:
+    """(codec, 압축 데이터) - 압축해도 줄지 않는 작은 페이로드는 그대로 저장 (codec=raw)"""
+    if CODEC == "zstd":
+        data = zstandard.ZstdCompressor(level=6).compress(raw)
+    else:
+        data = gzip.compress(raw, compresslevel=6)
+    return (CODEC, data) if len(data) < len(raw) else ("raw", raw)
+
+
+def decompress_payload(codec: str, data: bytes) -> Any:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd payload blobs")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == "gzip":
+        raw = gzip.decompress(data)
+    else:
+        raw = data
+    return json.loads(raw.decode("utf-8"))
+
+
+def load_payload(db: Optional[Session], digest: str) -> Any:
+    """digest로 페이로드 조회 (세션이 없거나 blob이 없으면 None)"""
+    if db is None:
+        logger.warning(f"Cannot load archived payload {digest[:12]} from a detached object")
+        return None
+    blob = db.get(PayloadBlob, digest)
+    if blob is None:
+        logger.warning(f"Archived payload not found: {digest}")
+        return None
+    return decompress_payload(blob.codec, blob.data)
+
+
+class ArchivedPayload:
+    """
+    payload_blobs에 보관하는 JSON 속성 (기존 JSON 컬럼과 같은 방식으로 읽고 쓰기)
+
+    Args:
+        ref_attr: digest를 저장하는 컬럼 속성 이름
+    """
+
+    def __init__(self, ref_attr: str):
+        self.ref_attr = ref_attr
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self._cache_key = f"_archived_{name}"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        digest = getattr(obj, self.ref_attr)
+        if not digest:
+            return None
+        cached = obj.__dict__.get(self._cache_key)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+        value = load_payload(object_session(obj), digest)
+        obj.__dict__[self._cache_key] = (digest, value)
+        return value
+
+    def __set__(self, obj, value):
+        if value is None:
+            obj.__dict__.pop(self._cache_key, None)
+            setattr(obj, self.ref_attr, None)
+            return
+        digest, raw = encode_payload(value)
+        obj.__dict__[self._cache_key] = (digest, value)
+        if getattr(obj, self.ref_attr) != digest:
+            obj.__dict__.setdefault(_PENDING_KEY, {})[digest] = raw
+            setattr(obj, self.ref_attr, digest)
+
+
+@event.listens_for(Session, "before_flush")
+def _store_pending_blobs(session, flush_context, instances):
+    pending: Dict[str, bytes] = {}
+    for obj in chain(session.new, session.dirty):
+        blobs = obj.__dict__.pop(_PENDING_KEY, None)
+        if blobs:
+            pending.update(blobs)
+    if not pending:
+        return
+
+    now = datetime.utcnow()
+    connection = session.connection()
+    table = PayloadBlob.__table__
+    # 이미 있는 blob은 재참조 시각을 갱신한 뒤 존재 여부 확인
+    # (쓰기 잠금을 먼저 잡으므로 정리 작업이 이 사이에 지우지 못하고, 이미 지웠다면 아래에서 다시 추가)
+    connection.execute(update(table).where(table.c.digest.in_(list(pending))).values(created_at=now))
+    stored = {obj.digest for obj in session.new if isinstance(obj, PayloadBlob)}
+    stored.update(connection.execute(select(table.c.digest).where(table.c.digest.in_(list(pending)))).scalars())
+
+    rows = []
+    for digest, raw in pending.items():
+        if digest not in stored:
+            codec, data = compress_payload(raw)
+            rows.append({"digest": digest, "codec": codec, "raw_size": len(raw), "data": data, "created_at": now})
+    if rows:
+        # 조회 이후 다른 세션이 같은 blob을 먼저 커밋했어도 무시 (내용이 같으므로 안전)
+        connection.execute(insert(table).on_conflict_do_nothing(index_elements=["digest"]), rows)
+
+
+def reference_columns() -> List[Any]:
+    """blob digest를 저장하는 컬럼 (ArchivedPayload 속성이 있는 모든 모델)"""
+    columns = []
+    for mapper in Base.registry.mappers:
+        for attr in vars(mapper.class_).values():
+            if isinstance(attr, ArchivedPayload):
+                columns.append(getattr(mapper.class_, attr.ref_attr))
+    return columns
+
+
+def delete_orphan_blobs(db: Session, grace_period: timedelta = ORPHAN_GRACE_PERIOD) -> int:
+    """
+    어느 행도 참조하지 않는 blob 삭제 (동기화로 값이 바뀌어 더 이상 쓰지 않는 페이로드)
+
+    grace_period 안에 저장/재참조된 blob은 남김. 커밋은 호출한 쪽에서 수행
+
+    Returns:
+        삭제한 blob 수
+    """
+    # ArchivedPayload를 쓰는 모델을 모두 등록해 참조 컬럼을 빠짐없이 찾음 (models/__init__에 없는 모델 포함)
+    from . import auto_return_log, issue_response, naver_delivery_sync, return_log  # noqa: F401
+
+    query = db.query(PayloadBlob).filter(PayloadBlob.created_at < datetime.utcnow() - grace_period)
+    for column in reference_columns():
+        query = query.filter(PayloadBlob.digest.not_in(select(column).where(column.isnot(None))))
+    return query.delete(synchronize_session=False)
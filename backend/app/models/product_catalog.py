@@ -0,0 +1,111 @@
+"""
+Product Catalog Mirror Models
+쿠팡 등록상품 카탈로그 로컬 미러 모델
+"""
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index, UniqueConstraint
+from datetime import datetime
+
+from ..database import Base
+
+
+class CatalogProduct(Base):
+    """등록상품 미러 (계정별 sellerProductId)"""
+    __tablename__ = "catalog_products"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # 연결된 쿠팡 계정
+    coupang_account_id = Column(Integer, ForeignKey("coupang_accounts.id"), nullable=False)
+
+    # 상품 정보
+    seller_product_id = Column(BigInteger, nullable=False)
+    seller_product_name = Column(String(500), nullable=True)
+    status_name = Column(String(50), nullable=True)  # 승인완료, 임시저장 등 (목록 API statusName)
+    product_created_at = Column(String(30), nullable=True)  # 목록 API createdAt 원문 (yyyy-MM-ddTHH:mm:ss)
+
+    # 동기화 상태
+    last_seen_token = Column(String(50), nullable=True)  # 마지막으로 발견된 목록 페이지 토큰
+    last_seen_at = Column(DateTime, nullable=True)
+    detail_synced_at = Column(DateTime, nullable=True)  # vendorItem 목록 동기화 시각
+    vendor_item_count = Column(Integer, default=0)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("coupang_account_id", "seller_product_id", name="uq_catalog_product_account_seller"),
+        Index("idx_catalog_product_account_created", "coupang_account_id", "product_created_at"),
+    )
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            "id": self.id,
+            "coupang_account_id": self.coupang_account_id,
+            "seller_product_id": self.seller_product_id,
+            "seller_product_name": self.seller_product_name,
+            "status_name": self.status_name,
+            "product_created_at": self.product_created_at,
+            "last_seen_token": self.last_seen_token,
+            "last_seen_at": self.last_seen_at.isoformat() if self.last_seen_at else None,
+            "detail_synced_at": self.detail_synced_at.isoformat() if self.detail_synced_at else None,
+            "vendor_item_count": self.vendor_item_count
+        }
+
+
+class CatalogVendorItem(Base):
+    """옵션(vendorItemId) 미러"""
+    __tablename__ = "catalog_vendor_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    coupang_account_id = Column(Integer, ForeignKey("coupang_accounts.id"), nullable=False)
+    seller_product_id = Column(BigInteger, nullable=False)
+    vendor_item_id = Column(BigInteger, nullable=False, index=True)
+    item_name = Column(String(500), nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("coupang_account_id", "vendor_item_id", name="uq_catalog_vendor_item_account_item"),
+        Index("idx_catalog_vendor_item_account_product", "coupang_account_id", "seller_product_id"),
+    )
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            "seller_product_id": self.seller_product_id,
+            "vendor_item_id": self.vendor_item_id,
+            "item_name": self.item_name
+        }
+
+
+class CatalogSyncState(Base):
+    """카탈로그 목록 동기화 상태 (scope: all 또는 date:yyyy-MM-dd)"""
+    __tablename__ = "catalog_sync_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    coupang_account_id = Column(Integer, ForeignKey("coupang_accounts.id"), nullable=False)
+    scope = Column(String(50), nullable=False)
+
+    last_token = Column(String(50), nullable=True)  # 진행 중 동기화의 다음 페이지 토큰 (중단 시 재개용)
+    product_count = Column(Integer, default=0)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("coupang_account_id", "scope", name="uq_catalog_sync_state_account_scope"),
+    )
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            "coupang_account_id": self.coupang_account_id,
+            "scope": self.scope,
+            "last_token": self.last_token,
+            "product_count": self.product_count,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None
+        }
@@ -34,6 +34,7 @@ class Response(Base):
     format_check_passed = Column(Boolean, default=True)
     content_check_passed = Column(Boolean, default=True)
     policy_check_passed = Column(Boolean, default=True)
+    validation_fingerprint = Column(String(64))  # Hash of validation inputs (skip unchanged re-validation)
 
     # Approval Workflow
     status = Column(String(20), default="draft")  # draft, pending_approval, approved, rejected, submitted
@@ -2,9 +2,10 @@
 Return Log Model
 반품 처리 로그 데이터베이스 모델
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, JSON, Numeric
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, JSON, Numeric, Index
 from sqlalchemy.sql import func
 from ..database import Base
+from .payload_blob import ArchivedPayload
 
 
 class ReturnLog(Base):
@@ -95,8 +96,9 @@ class ReturnLog(Base):
         comment="pending, processing, completed, failed"
     )
 
-    # 원본 데이터 (JSON)
-    raw_data = Column(JSON, nullable=True, comment="쿠팡 API 원본 데이터")
+    # 원본 데이터 (JSON, payload_blobs에 압축 보관)
+    raw_data_ref = Column(String(64), nullable=True, comment="쿠팡 API 원본 데이터 blob digest")
+    raw_data = ArchivedPayload("raw_data_ref")
 
     # 메타 정보
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성 시간")
@@ -104,5 +106,11 @@ class ReturnLog(Base):
     processed_by = Column(String(100), nullable=True, comment="처리자")
     notes = Column(Text, nullable=True, comment="메모")
 
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (created_at, id)
+        Index("idx_return_logs_created_id", "created_at", "id"),
+        Index("idx_return_logs_status_created_id", "status", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<ReturnLog(id={self.id}, coupang_order_id={self.coupang_order_id}, status={self.status})>"
@@ -0,0 +1,68 @@
+"""
+Scheduler Job Models
+스케줄러 작업 리스(lease) 잠금 및 실행 이력 모델
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Index
+from datetime import datetime
+
+from ..database import Base
+
+
+class SchedulerJobLock(Base):
+    """작업별 리스 잠금 (여러 인스턴스 중 하나만 실행)"""
+    __tablename__ = "scheduler_job_locks"
+
+    job_id = Column(String(100), primary_key=True)
+
+    owner = Column(String(200), nullable=True)  # 보유 인스턴스 (호스트/머신 ID:PID)
+    token = Column(String(50), nullable=True)  # 실행별 토큰 (해제/갱신 시 본인 확인)
+    acquired_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True)  # 만료 시 다른 인스턴스가 가져갈 수 있음
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            "job_id": self.job_id,
+            "owner": self.owner,
+            "acquired_at": self.acquired_at.isoformat() if self.acquired_at else None,
+            "heartbeat_at": self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None
+        }
+
+
+class SchedulerJobRun(Base):
+    """작업 실행 이력"""
+    __tablename__ = "scheduler_job_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    job_id = Column(String(100), nullable=False)
+    owner = Column(String(200), nullable=True)
+
+    # 결과: success, failed, skipped (다른 인스턴스가 실행 중)
+    status = Column(String(20), nullable=False)
+    items_processed = Column(Integer, default=0)
+    error_message = Column(Text, nullable=True)
+
+    started_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("idx_scheduler_job_run_job_started", "job_id", "started_at"),
+    )
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            "id": self.id,
+            "job_id": self.job_id,
+            "owner": self.owner,
+            "status": self.status,
+            "items_processed": self.items_processed,
+            "error_message": self.error_message,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": self.duration_seconds
+        }
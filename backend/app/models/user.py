@@ -1,7 +1,7 @@
 """
 User and Role Models
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from passlib.context import CryptContext
@@ -122,3 +122,19 @@ class AuditLog(Base):
 
     # Relationship
     user = relationship("User")
+
+
+class AuditLogSummary(Base):
+    """Hourly audit log counts per user/IP/action (security dashboard and detection aggregates)"""
+    __tablename__ = "audit_log_summary"
+
+    id = Column(Integer, primary_key=True, index=True)
+    bucket_start = Column(DateTime, nullable=False)  # Start of the hour (UTC)
+    user_id = Column(Integer)
+    ip_address = Column(String(50))
+    action = Column(String(100), nullable=False)
+    count = Column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        Index("idx_audit_summary_bucket_action", "bucket_start", "action"),
+    )
@@ -2,7 +2,8 @@
 Advanced Features API Router
 Includes: Learning, Customer History, Templates, Performance, Backup
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import Response as HTTPResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from pydantic import BaseModel
@@ -14,7 +15,8 @@ from ..services.customer_history import CustomerHistoryService
 from ..services.template_manager import TemplateManager
 from ..services.performance import PerformanceMonitor
 from ..services.backup import BackupService
-from ..services.reporting import ReportingService
+from ..services.reporting import DASHBOARD_GROUPS, ReportingService
+from ..services.dashboard_counters import get_dashboard_counters, not_modified
 from ..scheduler import get_scheduler
 
 router = APIRouter(prefix="/advanced", tags=["Advanced Features"])
@@ -269,6 +271,13 @@ def get_scheduler_status():
     return scheduler.get_job_status()
 
 
+@router.get("/scheduler/jobs/{job_id}/runs")
+def get_scheduler_job_runs(job_id: str, limit: int = 50):
+    """Get run history of a scheduled job"""
+    scheduler = get_scheduler()
+    return {"job_id": job_id, "runs": scheduler.get_job_history(job_id, limit=min(limit, 500))}
+
+
 # ===== Reporting Endpoints =====
 
 @router.get("/reports/daily")
@@ -296,7 +305,10 @@ def get_monthly_report(months_ago: int = 0, db: Session = Depends(get_db)):
 
 
 @router.get("/reports/dashboard")
-def get_dashboard(db: Session = Depends(get_db)):
-    """Get real-time dashboard"""
-    service = ReportingService(db)
-    return service.get_real_time_dashboard()
+def get_dashboard(request: Request, response: HTTPResponse, db: Session = Depends(get_db)):
+    """Get real-time dashboard (304 when the counters have not changed)"""
+    snapshot = get_dashboard_counters(db).snapshot(db, *DASHBOARD_GROUPS)
+    cached = not_modified(request, response, snapshot.etag)
+    if cached:
+        return cached
+    return ReportingService(db).get_real_time_dashboard(snapshot=snapshot)
@@ -2,6 +2,7 @@
 Coupang Open API Router
 """
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from loguru import logger
 from typing import Optional, List
@@ -10,6 +11,7 @@ import requests
 from sqlalchemy.orm import Session
 from ..services.coupang_api_client import CoupangAPIClient
 from ..services.ai_response_generator import AIResponseGenerator
+from ..services.ai_stream import SSE_HEADERS, sse_event
 from ..config import settings
 from ..database import SessionLocal, get_db
 from ..models.automation_log import AutomationExecutionLog
@@ -54,6 +56,18 @@ class InquiryReplyRequest(BaseModel):
     credentials: Optional[CoupangAPICredentials] = None  # API 인증 정보
 
 
+class AnswerDraftStreamRequest(BaseModel):
+    """답변 초안 스트리밍 요청"""
+    inquiry_id: int
+    inquiry_text: str
+    customer_name: str = "고객"
+    product_name: Optional[str] = None
+    order_number: Optional[str] = None
+    submit: bool = False  # True면 생성 완료 후 바로 답변 제출
+    reply_by: Optional[str] = None  # None이면 설정값 사용
+    credentials: Optional[CoupangAPICredentials] = None  # API 인증 정보
+
+
 class AutoAnswerRequest(BaseModel):
     """자동 답변 요청"""
     start_date: Optional[str] = None  # None이면 오늘-7일
@@ -414,6 +428,61 @@ async def reply_to_online_inquiry(inquiry_id: int, request: InquiryReplyRequest)
         raise HTTPException(status_code=500, detail="상품별 고객문의 답변에 실패했습니다")
 
 
+@router.post("/inquiries/answer-draft/stream")
+def stream_answer_draft(request: AnswerDraftStreamRequest):
+    """
+    고객문의 답변 초안 생성 (SSE 스트리밍)
+
+    ChatGPT 답변을 토큰 단위로 전달(token 이벤트)하고, 완료되면 전체 답변을 done 이벤트로 전달합니다.
+    submit=true이면 완료된 답변을 바로 제출하고 submitted 이벤트를 보냅니다.
+    submit=false이면 운영자가 확인/수정한 뒤 /inquiries/online/{inquiry_id}/reply로 제출합니다.
+    """
+    def event_generator():
+        answer_content = ""
+        for event in AIResponseGenerator().stream_response_from_text(
+            request.inquiry_text,
+            customer_name=request.customer_name,
+            product_name=request.product_name,
+            order_number=request.order_number
+        ):
+            if event["type"] == "done":
+                answer_content = event["response_text"]
+                event = {**event, "inquiry_id": request.inquiry_id}
+            yield sse_event(event)
+
+        if not request.submit or not answer_content:
+            return
+
+        try:
+            reply_by = (
+                (request.credentials.wing_username if request.credentials else None)
+                or request.reply_by
+                or settings.COUPANG_WING_ID
+                or (request.credentials.vendor_id if request.credentials else None)
+            )
+            result = _create_client(request.credentials).reply_to_online_inquiry(
+                inquiry_id=request.inquiry_id,
+                content=answer_content,
+                reply_by=reply_by
+            )
+            success = result.get("code") in [200, "200"]
+            if success:
+                logger.success(f"문의 {request.inquiry_id}: 답변 완료 (스트리밍)")
+            else:
+                logger.error(f"문의 {request.inquiry_id}: 답변 제출 실패 - {result.get('message')}")
+            yield sse_event({
+                "type": "submitted",
+                "inquiry_id": request.inquiry_id,
+                "success": success,
+                "message": result.get("message")
+            })
+        except Exception as e:
+            logger.error(f"문의 {request.inquiry_id} 답변 제출 중 오류: {str(e)}")
+            yield sse_event({"type": "error", "message": "답변 제출에 실패했습니다"})
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.post("/inquiries/auto-answer")
 async def auto_answer_inquiries(request: AutoAnswerRequest, http_request: Request):
     """
@@ -528,26 +597,35 @@ async def auto_answer_inquiries(request: AutoAnswerRequest, http_request: Reques
 
         results = []
 
+        # 답변 대상 선별
+        pending = []
         for inquiry in inquiries:
             inquiry_id = inquiry.get("inquiryId")
-            inquiry_content = inquiry.get("content")
 
-            try:
-                # 이미 답변이 있는지 확인
-                if inquiry.get("commentDtoList"):
-                    logger.info(f"문의 {inquiry_id}: 이미 답변 있음, 건너뜀")
-                    stats["skipped"] += 1
-                    continue
+            # 이미 답변이 있는지 확인
+            if inquiry.get("commentDtoList"):
+                logger.info(f"문의 {inquiry_id}: 이미 답변 있음, 건너뜀")
+                stats["skipped"] += 1
+                continue
 
-                # AI로 답변 생성
-                if request.auto_generate and ai_generator:
-                    generated = ai_generator.generate_response_from_text(inquiry_content)
-                    answer_content = generated.get("response_text", "") if generated else ""
-                else:
-                    # 수동 답변이 필요한 경우
-                    logger.warning(f"문의 {inquiry_id}: 자동 생성 비활성화, 건너뜀")
-                    stats["skipped"] += 1
-                    continue
+            if not (request.auto_generate and ai_generator):
+                # 수동 답변이 필요한 경우
+                logger.warning(f"문의 {inquiry_id}: 자동 생성 비활성화, 건너뜀")
+                stats["skipped"] += 1
+                continue
+
+            pending.append(inquiry)
+
+        # AI 답변 일괄 생성 (LLM 게이트웨이가 RPM/TPM 예산 안에서 동시 처리)
+        generated_answers = await ai_generator.generate_many_from_text(
+            [inquiry.get("content") for inquiry in pending]
+        ) if pending else []
+
+        for inquiry, generated in zip(pending, generated_answers):
+            inquiry_id = inquiry.get("inquiryId")
+
+            try:
+                answer_content = generated.get("response_text", "") if generated else ""
 
                 if not answer_content:
                     logger.error(f"문의 {inquiry_id}: 답변 생성 실패")
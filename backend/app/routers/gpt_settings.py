@@ -156,3 +156,14 @@ def get_response_styles():
             {"id": "casual", "name": "일반체", "description": "자연스럽고 편안한 어투"}
         ]
     }
+
+
+@router.get("/gateway-metrics")
+def get_gateway_metrics():
+    """OpenAI 게이트웨이 지표 (대기열 깊이, 동시 실행 한도, 분당 토큰 처리량, 429 횟수 등)"""
+    from ..services.llm_gateway import get_llm_gateway
+
+    gateway = get_llm_gateway()
+    if gateway is None:
+        return {"enabled": False, "message": "OpenAI API 키가 설정되지 않았습니다"}
+    return {"enabled": True, **gateway.metrics()}
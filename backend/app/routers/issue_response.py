@@ -3,12 +3,16 @@ Issue Response API Router
 쿠팡 판매 문제 대응 API
 """
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from loguru import logger
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 
-from ..database import get_db
+from ..database import SessionLocal, get_db
+from ..core.pagination import InvalidCursorError
 from ..services.issue_response_service import IssueResponseService
+from ..services.ai_stream import SSE_HEADERS, sse_event
 
 router = APIRouter(prefix="/issue-response", tags=["issue-response"])
 
@@ -115,6 +119,43 @@ def generate_response(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/generate/stream")
+def generate_response_stream(request: GenerateRequest):
+    """
+    AI 답변 생성 (SSE 스트리밍)
+
+    - 생성 중인 답변을 token 이벤트로 실시간 전달
+    - 완료되면 저장 후 /generate와 같은 결과를 done 이벤트로 전달
+    """
+    # 스트리밍은 요청 의존성 종료 이후까지 이어지므로 전용 세션 사용
+    db = SessionLocal()
+    try:
+        events = IssueResponseService(db).stream_response(
+            issue_id=request.issue_id,
+            response_type=request.response_type,
+            additional_context=request.additional_context or "",
+            seller_name=request.seller_name or ""
+        )
+    except ValueError as e:
+        db.close()
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        db.close()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    def event_generator():
+        try:
+            for event in events:
+                yield sse_event(event)
+        except Exception as e:
+            logger.error(f"Issue response streaming error: {e}")
+            yield sse_event({"type": "error", "message": str(e)})
+        finally:
+            db.close()
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.get("/guides")
 def get_all_guides(db: Session = Depends(get_db)):
     """
@@ -184,24 +225,29 @@ def get_history(
     issue_type: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
-    이전 대응 이력 조회
+    이전 대응 이력 조회 (다음 페이지는 cursor = next_cursor)
     """
     try:
         service = IssueResponseService(db)
-        history = service.get_history(
+        page = service.get_history_page(
             coupang_account_id=coupang_account_id,
             issue_type=issue_type,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         return {
             "success": True,
-            "data": history,
-            "count": len(history)
+            "data": page["data"],
+            "count": len(page["data"]),
+            "next_cursor": page["next_cursor"]
         }
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
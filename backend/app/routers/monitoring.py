@@ -7,6 +7,7 @@ from typing import Optional, List, Dict
 from datetime import datetime
 
 from ..services.monitoring import get_monitor, MonitoringLevel
+from ..core.query_profiler import get_query_profiler
 
 router = APIRouter(prefix="/monitoring", tags=["Monitoring"])
 
@@ -201,6 +202,48 @@ def get_system_stats():
     }
 
 
+@router.get("/db/slow-queries")
+def get_slow_queries(limit: int = Query(20, ge=1, le=200)):
+    """
+    느린 SQL 목록 (fingerprint별 집계, 실행 계획, 전체 스캔 테이블)
+    """
+    profiler = get_query_profiler()
+    if profiler is None:
+        return {"enabled": False, "queries": []}
+
+    return {
+        "enabled": True,
+        "summary": profiler.summary(),
+        "queries": profiler.slow_queries(limit)
+    }
+
+
+@router.get("/db/index-recommendations")
+def get_index_recommendations():
+    """
+    느린 쿼리의 전체 스캔을 없애기 위한 복합 인덱스 추천
+    """
+    profiler = get_query_profiler()
+    if profiler is None:
+        return {"enabled": False, "recommendations": []}
+
+    return {
+        "enabled": True,
+        "recommendations": profiler.recommend_indexes()
+    }
+
+
+@router.post("/db/slow-queries/reset")
+def reset_slow_queries():
+    """
+    느린 쿼리 기록 초기화
+    """
+    profiler = get_query_profiler()
+    if profiler is not None:
+        profiler.reset()
+    return {"success": True}
+
+
 @router.post("/test/log-event")
 def test_log_event(
     category: str,
@@ -4,7 +4,7 @@
 import logging
 import json
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -14,6 +14,7 @@ from ..models.naver_delivery_sync import NaverDeliveryInfo, CoupangPendingOrder,
 from ..models.coupang_account import CoupangAccount
 from ..services.naver_delivery_sync_service import NaverDeliverySyncService
 from ..services.naverpay_scraper import get_scraper, scrape_logger
+from ..services.dashboard_counters import get_dashboard_counters, not_modified
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/delivery-sync", tags=["Delivery Sync"])
@@ -193,7 +194,7 @@ async def get_deliveries(
 
         deliveries = query.order_by(NaverDeliveryInfo.created_at.desc()).limit(limit).all()
 
-        return [d.to_dict() for d in deliveries]
+        return [d.to_dict(include_payload=False) for d in deliveries]
 
     except Exception as e:
         logger.error(f"배송 정보 조회 오류: {e}")
@@ -395,11 +396,14 @@ async def bulk_upload(
 # ========== Stats API ==========
 
 @router.get("/stats", response_model=SyncStats)
-async def get_sync_stats(db: Session = Depends(get_db)):
-    """동기화 통계"""
+async def get_sync_stats(request: Request, response: Response, db: Session = Depends(get_db)):
+    """동기화 통계 (ETag가 같으면 304)"""
     try:
-        service = get_sync_service(db)
-        return service.get_delivery_stats()
+        snapshot = get_dashboard_counters(db).snapshot(db, "naver_delivery")
+        cached = not_modified(request, response, snapshot.etag)
+        if cached:
+            return cached
+        return get_sync_service(db).get_delivery_stats(snapshot=snapshot)
 
     except Exception as e:
         logger.error(f"통계 조회 오류: {e}")
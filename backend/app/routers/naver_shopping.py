@@ -2,21 +2,25 @@
 네이버 쇼핑 검색 API 라우터
 """
 import httpx
-import re
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from loguru import logger
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, unquote
 import os
 
+from ..config import settings
+from ..services.naver_shopping_client import NaverShoppingError, get_naver_shopping_client
+from ..services.product_page_extractor import NAME_SOURCE_ALIASES, get_product_page_extractor
+
 router = APIRouter(prefix="/naver-shopping", tags=["네이버 쇼핑"])
 
 # 네이버 API 키 설정
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID", "4ZmdjnkDVs3ZuvE3SUtv")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET", "Xdn6gxR0ds")
-NAVER_SEARCH_API_URL = "https://openapi.naver.com/v1/search/shop.json"
+
+
+def _shopping_client():
+    return get_naver_shopping_client(NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
 
 
 class ShoppingItem(BaseModel):
@@ -44,6 +48,7 @@ class ShoppingSearchResponse(BaseModel):
     display: int
     items: List[ShoppingItem]
     query: str
+    cached: bool = False  # 캐시된 결과 여부
 
 
 @router.get("/search", response_model=ShoppingSearchResponse)
@@ -66,72 +71,11 @@ async def search_shopping(
         - dsc: 가격 높은순
     """
     try:
-        headers = {
-            "X-Naver-Client-Id": NAVER_CLIENT_ID,
-            "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-        }
-
-        params = {
-            "query": query,
-            "display": display,
-            "start": start,
-            "sort": sort
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                NAVER_SEARCH_API_URL,
-                headers=headers,
-                params=params,
-                timeout=10.0
-            )
-
-            if response.status_code != 200:
-                logger.error(f"Naver API error: {response.status_code} - {response.text}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"네이버 API 오류: {response.text}"
-                )
-
-            data = response.json()
-
-            # HTML 태그 제거 및 상품명 정제
-            items = []
-            for item in data.get("items", []):
-                # title에서 HTML 태그 제거
-                title = item.get("title", "")
-                title = title.replace("<b>", "").replace("</b>", "")
-
-                # 상점명 접두사 제거 (예: [쿠오카], (센텀시티점), [쿠오카 공식] 등)
-                title = re.sub(r'^(\[[^\]]*\]|\([^)]*\))+\s*', '', title)
-                # 앞에 남아있는 불필요한 기호 제거
-                title = re.sub(r'^[\s\-_:]+', '', title).strip()
-
-                items.append(ShoppingItem(
-                    title=title,
-                    link=item.get("link", ""),
-                    image=item.get("image"),
-                    lprice=item.get("lprice", "0"),
-                    hprice=item.get("hprice", "0"),
-                    mallName=item.get("mallName", ""),
-                    productId=item.get("productId", ""),
-                    productType=item.get("productType", "1"),
-                    brand=item.get("brand"),
-                    maker=item.get("maker"),
-                    category1=item.get("category1"),
-                    category2=item.get("category2"),
-                    category3=item.get("category3"),
-                    category4=item.get("category4")
-                ))
-
-            return ShoppingSearchResponse(
-                total=data.get("total", 0),
-                start=data.get("start", 1),
-                display=data.get("display", len(items)),
-                items=items,
-                query=query
-            )
+        result = await _shopping_client().search(query, display=display, start=start, sort=sort)
+        return ShoppingSearchResponse(**result)
 
+    except NaverShoppingError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except httpx.TimeoutException:
         logger.error("Naver API timeout")
         raise HTTPException(status_code=504, detail="네이버 API 응답 시간 초과")
@@ -140,6 +84,55 @@ async def search_shopping(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class BulkSearchRequest(BaseModel):
+    """대량 검색 요청"""
+    queries: List[str] = Field(..., min_length=1, description="검색어(상품명) 목록")
+    display: int = Field(5, ge=1, le=100, description="검색어별 검색 결과 개수")
+    sort: str = Field("sim", description="정렬 옵션 (sim, date, asc, dsc)")
+
+
+class BulkSearchResult(BaseModel):
+    """검색어별 결과"""
+    query: str
+    success: bool
+    result: Optional[ShoppingSearchResponse] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
+
+class BulkSearchResponse(BaseModel):
+    """대량 검색 응답"""
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BulkSearchResult]
+
+
+@router.post("/search/bulk", response_model=BulkSearchResponse)
+async def search_shopping_bulk(request: BulkSearchRequest):
+    """
+    여러 상품명을 한 번에 검색 (가격 비교용)
+
+    - 같은 검색어(대소문자/공백 차이 포함)는 한 번만 조회
+    - 서버에서 동시 요청 수와 초당 요청 수를 제한해 네이버 API 할당량 준수
+    - 검색어별로 성공/실패를 따로 반환
+    """
+    if len(request.queries) > settings.NAVER_SHOPPING_BULK_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.NAVER_SHOPPING_BULK_MAX}개까지 검색할 수 있습니다"
+        )
+
+    results = await _shopping_client().search_many(request.queries, display=request.display, sort=request.sort)
+    succeeded = sum(1 for r in results if r["success"])
+    return BulkSearchResponse(
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
+
+
 @router.get("/health")
 async def health_check():
     """API 상태 확인"""
@@ -182,191 +175,15 @@ async def extract_product_name(
     - 위메프
     - 티몬
     """
-    try:
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.lower()
-
-        # User-Agent 설정 (봇 차단 우회)
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(url, headers=headers, timeout=15.0)
-
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch URL: {url}, status: {response.status_code}")
-                return ProductNameResponse(
-                    success=False,
-                    source=domain,
-                    error=f"페이지 로드 실패 (상태 코드: {response.status_code})"
-                )
-
-            html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
-            product_name = None
-            source = "unknown"
-
-            # 11번가
-            if "11st.co.kr" in domain:
-                source = "11번가"
-                # 방법 1: meta og:title
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-                # 방법 2: h1.title
-                if not product_name:
-                    title_el = soup.select_one("h1.title, h2.title, .prd_name")
-                    if title_el:
-                        product_name = title_el.get_text(strip=True)
-
-            # 쿠팡
-            elif "coupang.com" in domain:
-                source = "쿠팡"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-                if not product_name:
-                    title_el = soup.select_one("h1.prod-buy-header__title, h2.prod-buy-header__title")
-                    if title_el:
-                        product_name = title_el.get_text(strip=True)
-
-            # 네이버 쇼핑
-            elif "naver.com" in domain or "shopping.naver" in domain:
-                source = "네이버쇼핑"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-                if not product_name:
-                    title_el = soup.select_one("h3.product_name, .productName, h2._3oDjSvLwcS")
-                    if title_el:
-                        product_name = title_el.get_text(strip=True)
-
-            # G마켓
-            elif "gmarket.co.kr" in domain:
-                source = "G마켓"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-                if not product_name:
-                    title_el = soup.select_one("h1.itemtit, .item_tit")
-                    if title_el:
-                        product_name = title_el.get_text(strip=True)
-
-            # 옥션
-            elif "auction.co.kr" in domain:
-                source = "옥션"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-                if not product_name:
-                    title_el = soup.select_one("h1.itemtit, .item_tit")
-                    if title_el:
-                        product_name = title_el.get_text(strip=True)
-
-            # 인터파크
-            elif "interpark.com" in domain:
-                source = "인터파크"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-
-            # 위메프
-            elif "wemakeprice.com" in domain:
-                source = "위메프"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-
-            # 티몬
-            elif "tmon.co.kr" in domain:
-                source = "티몬"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-
-            # SSG (신세계몰, 이마트몰)
-            elif "ssg.com" in domain:
-                source = "SSG"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-
-            # 롯데ON
-            elif "lotteon.com" in domain:
-                source = "롯데ON"
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-
-            # 기타 사이트 - 일반적인 방법 시도
-            else:
-                source = domain
-                # og:title 시도
-                meta = soup.find("meta", property="og:title")
-                if meta and meta.get("content"):
-                    product_name = meta["content"]
-                # title 태그
-                if not product_name:
-                    title_el = soup.find("title")
-                    if title_el:
-                        product_name = title_el.get_text(strip=True)
-                # h1 태그
-                if not product_name:
-                    h1 = soup.find("h1")
-                    if h1:
-                        product_name = h1.get_text(strip=True)
-
-            # 상품명 정제
-            if product_name:
-                # 불필요한 문자열 제거
-                product_name = product_name.strip()
-
-                # 사이트명 접미사 제거 (예: " - 11번가", " | 쿠팡")
-                product_name = re.sub(r'\s*[-|:]\s*(11번가|쿠팡|G마켓|옥션|인터파크|위메프|티몬|SSG|롯데ON|네이버쇼핑).*$', '', product_name, flags=re.IGNORECASE)
-
-                # 상점명 접두사 제거 (예: [쿠오카], (센텀시티점), [쿠오카 공식] 등)
-                # 패턴: 대괄호나 소괄호로 둘러싸인 상점명/지점명이 앞에 연속으로 나오는 경우
-                product_name = re.sub(r'^(\[[^\]]*\]|\([^)]*\))+\s*', '', product_name)
-
-                # 앞에 남아있는 불필요한 기호 제거
-                product_name = re.sub(r'^[\s\-_:]+', '', product_name)
-
-                # 특수문자 정리
-                product_name = re.sub(r'\s+', ' ', product_name).strip()
-
-                logger.info(f"Extracted product name from {source}: {product_name[:50]}...")
-
-                return ProductNameResponse(
-                    success=True,
-                    product_name=product_name,
-                    source=source
-                )
-            else:
-                return ProductNameResponse(
-                    success=False,
-                    source=source,
-                    error="상품명을 찾을 수 없습니다"
-                )
+    page = await get_product_page_extractor().extract(url)
+    source = NAME_SOURCE_ALIASES.get(page.source, page.source)
+    if page.error:
+        return ProductNameResponse(success=False, source=source, error=page.error)
+    if not page.product_name:
+        return ProductNameResponse(success=False, source=source, error="상품명을 찾을 수 없습니다")
 
-    except httpx.TimeoutException:
-        logger.error(f"Timeout fetching URL: {url}")
-        return ProductNameResponse(
-            success=False,
-            source="unknown",
-            error="페이지 로드 시간 초과"
-        )
-    except Exception as e:
-        logger.error(f"Error extracting product name from {url}: {e}")
-        return ProductNameResponse(
-            success=False,
-            source="unknown",
-            error=str(e)
-        )
+    logger.info(f"Extracted product name from {source}: {page.product_name[:50]}...")
+    return ProductNameResponse(success=True, product_name=page.product_name, source=source)
 
 
 @router.get("/extract-product-image", response_model=ProductImageResponse)
@@ -384,131 +201,66 @@ async def extract_product_image(
     - 옥션
     - 기타 (og:image 메타태그 사용)
     """
-    try:
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.lower()
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
-
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(url, headers=headers, timeout=15.0)
-
-            if response.status_code != 200:
-                return ProductImageResponse(
-                    success=False,
-                    source=domain,
-                    error=f"페이지 로드 실패 (상태 코드: {response.status_code})"
-                )
-
-            html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
-            image_url = None
-            source = "unknown"
-
-            # 네이버 스마트스토어
-            if "smartstore.naver.com" in domain or "shopping.naver.com" in domain or "brand.naver.com" in domain:
-                source = "네이버스마트스토어"
-                # 대표이미지 찾기
-                img = soup.find("img", alt="대표이미지")
-                if img and img.get("src"):
-                    image_url = img["src"]
-                # og:image 메타태그
-                if not image_url:
-                    meta = soup.find("meta", property="og:image")
-                    if meta and meta.get("content"):
-                        image_url = meta["content"]
-                # 다른 이미지 선택자
-                if not image_url:
-                    img = soup.select_one("._3X6PiBgKq9 img, .bd_2DO68 img, ._1LY7DqCnwR img")
-                    if img and img.get("src"):
-                        image_url = img["src"]
-
-            # 11번가
-            elif "11st.co.kr" in domain:
-                source = "11번가"
-                meta = soup.find("meta", property="og:image")
-                if meta and meta.get("content"):
-                    image_url = meta["content"]
-                if not image_url:
-                    img = soup.select_one(".img_full img, #prdImg, .c_product_img img")
-                    if img and img.get("src"):
-                        image_url = img["src"]
-
-            # 쿠팡
-            elif "coupang.com" in domain:
-                source = "쿠팡"
-                meta = soup.find("meta", property="og:image")
-                if meta and meta.get("content"):
-                    image_url = meta["content"]
-                if not image_url:
-                    img = soup.select_one(".prod-image__detail img, .prod-image img")
-                    if img and img.get("src"):
-                        image_url = img["src"]
-
-            # G마켓
-            elif "gmarket.co.kr" in domain:
-                source = "G마켓"
-                meta = soup.find("meta", property="og:image")
-                if meta and meta.get("content"):
-                    image_url = meta["content"]
-
-            # 옥션
-            elif "auction.co.kr" in domain:
-                source = "옥션"
-                meta = soup.find("meta", property="og:image")
-                if meta and meta.get("content"):
-                    image_url = meta["content"]
-
-            # 기타 사이트 - og:image 메타태그 사용
-            else:
-                source = domain
-                meta = soup.find("meta", property="og:image")
-                if meta and meta.get("content"):
-                    image_url = meta["content"]
-                # 첫 번째 큰 이미지 찾기
-                if not image_url:
-                    for img in soup.find_all("img"):
-                        src = img.get("src") or img.get("data-src")
-                        if src and ("product" in src.lower() or "item" in src.lower() or "goods" in src.lower()):
-                            image_url = src
-                            break
-
-            if image_url:
-                # 상대 경로를 절대 경로로 변환
-                if image_url.startswith("//"):
-                    image_url = "https:" + image_url
-                elif image_url.startswith("/"):
-                    image_url = f"https://{domain}{image_url}"
-
-                logger.info(f"Extracted product image from {source}: {image_url[:80]}...")
-
-                return ProductImageResponse(
-                    success=True,
-                    image_url=image_url,
-                    source=source
-                )
-            else:
-                return ProductImageResponse(
-                    success=False,
-                    source=source,
-                    error="이미지를 찾을 수 없습니다"
-                )
+    page = await get_product_page_extractor().extract(url)
+    if page.error:
+        return ProductImageResponse(success=False, source=page.source, error=page.error)
+    if not page.image_url:
+        return ProductImageResponse(success=False, source=page.source, error="이미지를 찾을 수 없습니다")
 
-    except httpx.TimeoutException:
-        logger.error(f"Timeout fetching URL: {url}")
-        return ProductImageResponse(
-            success=False,
-            source="unknown",
-            error="페이지 로드 시간 초과"
+    logger.info(f"Extracted product image from {page.source}: {page.image_url[:80]}...")
+    return ProductImageResponse(success=True, image_url=page.image_url, source=page.source)
+
+
+class ExtractBatchRequest(BaseModel):
+    """상품 페이지 일괄 추출 요청"""
+    urls: List[str] = Field(..., min_length=1, description="상품 페이지 URL 목록")
+
+
+class ExtractedPage(BaseModel):
+    """URL별 추출 결과"""
+    url: str
+    success: bool
+    product_name: Optional[str] = None
+    image_url: Optional[str] = None
+    source: str
+    error: Optional[str] = None
+
+
+class ExtractBatchResponse(BaseModel):
+    """상품 페이지 일괄 추출 응답"""
+    total: int
+    succeeded: int
+    results: List[ExtractedPage]
+
+
+@router.post("/extract-batch", response_model=ExtractBatchResponse)
+async def extract_product_pages(request: ExtractBatchRequest):
+    """
+    여러 상품 페이지의 상품명과 대표 이미지를 한 번에 추출
+
+    - 서버에서 동시 요청 수를 제한해 병렬 처리
+    - 상품명 또는 이미지를 하나라도 찾으면 성공
+    """
+    if len(request.urls) > settings.PRODUCT_PAGE_BATCH_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.PRODUCT_PAGE_BATCH_MAX}개까지 추출할 수 있습니다"
         )
-    except Exception as e:
-        logger.error(f"Error extracting product image from {url}: {e}")
-        return ProductImageResponse(
-            success=False,
-            source="unknown",
-            error=str(e)
+
+    pages = await get_product_page_extractor().extract_many(request.urls)
+    results = [
+        ExtractedPage(
+            url=url,
+            success=not page.error and bool(page.product_name or page.image_url),
+            product_name=page.product_name,
+            image_url=page.image_url,
+            source=page.source,
+            error=page.error or (None if page.product_name or page.image_url else "상품 정보를 찾을 수 없습니다")
         )
+        for url, page in pages
+    ]
+    return ExtractBatchResponse(
+        total=len(results),
+        succeeded=sum(1 for r in results if r.success),
+        results=results
+    )
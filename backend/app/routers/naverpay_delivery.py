@@ -4,15 +4,16 @@
 import logging
 from datetime import datetime, date
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 import json
 
 from ..database import get_db
+from ..core.pagination import InvalidCursorError, keyset_page
 from ..models.delivery import NaverPayDelivery, NaverPaySchedule
-from ..services.naverpay_scraper import get_scraper, reset_scraper, scrape_logger
+from ..services.naverpay_scraper import get_scraper, reset_scraper, resolve_scrape_mode, scrape_logger
 from ..services.delivery_tracker import (
     get_tracking_url,
     get_all_couriers,
@@ -93,12 +94,24 @@ async def get_login_status():
 
 # ========== Scraping API ==========
 
+def _validate_scrape_mode(mode: Optional[str]) -> str:
+    """스크래핑 모드 검증 (알 수 없는 모드는 400)"""
+    try:
+        return resolve_scrape_mode(mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post("/scrape")
-async def scrape_deliveries(db: Session = Depends(get_db)):
+async def scrape_deliveries(
+    mode: Optional[str] = Query(None, description="스크래핑 모드 (network/dom)"),
+    db: Session = Depends(get_db)
+):
     """배송 정보 스크래핑 (동기식)"""
+    mode = _validate_scrape_mode(mode)
     try:
         scraper = await get_scraper()
-        deliveries = await scraper.scrape_deliveries_sync()
+        deliveries = await scraper.scrape_deliveries_sync(mode=mode)
 
         # DB에 저장
         today = date.today().isoformat()
@@ -138,8 +151,12 @@ async def scrape_deliveries(db: Session = Depends(get_db)):
 
 
 @router.get("/scrape/stream")
-async def scrape_deliveries_stream(db: Session = Depends(get_db)):
+async def scrape_deliveries_stream(
+    mode: Optional[str] = Query(None, description="스크래핑 모드 (network/dom)"),
+    db: Session = Depends(get_db)
+):
     """배송 정보 스크래핑 (SSE 스트리밍)"""
+    mode = _validate_scrape_mode(mode)
 
     async def event_generator():
         try:
@@ -147,7 +164,7 @@ async def scrape_deliveries_stream(db: Session = Depends(get_db)):
             today = date.today().isoformat()
             saved_count = 0
 
-            async for result in scraper.scrape_deliveries():
+            async for result in scraper.scrape_deliveries(mode=mode):
                 if result["type"] == "delivery":
                     # DB에 저장
                     delivery = result["data"]
@@ -192,12 +209,19 @@ async def scrape_deliveries_stream(db: Session = Depends(get_db)):
 
 @router.get("/deliveries", response_model=List[DeliveryResponse])
 async def get_deliveries(
+    response: Response,
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
     courier: Optional[str] = Query(None, description="택배사 필터"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="페이지 크기 (없으면 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답 X-Next-Cursor 헤더 값"),
     db: Session = Depends(get_db)
 ):
-    """저장된 배송 정보 조회"""
+    """
+    저장된 배송 정보 조회
+
+    limit 지정 시 키셋 페이지네이션 (다음 페이지 커서는 X-Next-Cursor 응답 헤더)
+    """
     try:
         query = db.query(NaverPayDelivery)
 
@@ -208,7 +232,14 @@ async def get_deliveries(
         if courier:
             query = query.filter(NaverPayDelivery.courier == courier)
 
-        deliveries = query.order_by(NaverPayDelivery.collected_at.desc()).all()
+        if limit:
+            deliveries, next_cursor = keyset_page(
+                query, NaverPayDelivery.collected_at, NaverPayDelivery.id, limit, cursor=cursor
+            )
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+        else:
+            deliveries = query.order_by(NaverPayDelivery.collected_at.desc()).all()
 
         result = []
         for d in deliveries:
@@ -218,6 +249,8 @@ async def get_deliveries(
 
         return result
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"배송 정보 조회 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,7 +1,7 @@
 """
 Promotion Router - 프로모션(쿠폰) 자동연동 API
 """
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request, Response
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
@@ -9,7 +9,9 @@ from loguru import logger
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..database import SessionLocal, get_db
-from ..services.coupon_auto_sync_service import CouponAutoSyncService
+from ..services.coupon_auto_sync_service import COUPON_COUNTER_GROUPS, CouponAutoSyncService
+from ..core.pagination import COUNT_MODES, InvalidCursorError
+from ..services.dashboard_counters import get_dashboard_counters, not_modified
 from ..exceptions import NotFoundError, ValidationError as AppValidationError, APIError, DatabaseError
 from sqlalchemy.orm import Session
 
@@ -569,6 +571,8 @@ async def get_tracking_list(
     status: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -579,16 +583,23 @@ async def get_tracking_list(
         status: 상태 필터 (pending, processing, completed, failed, skipped)
         limit: 조회 개수
         offset: 시작 위치
+        cursor: 이전 응답의 next_cursor (지정 시 offset 무시)
+        count: 전체 개수 계산 방식 exact, cached, none (기본: cursor 없으면 exact, 있으면 cached)
     """
     if limit < 1 or limit > 500:
         raise HTTPException(status_code=400, detail="limit은 1-500 사이여야 합니다")
     if offset < 0:
         raise HTTPException(status_code=400, detail="offset은 0 이상이어야 합니다")
+    count = count or ("cached" if cursor else "exact")
+    if count not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"count는 {', '.join(COUNT_MODES)} 중 하나여야 합니다")
 
     try:
         service = CouponAutoSyncService(db)
-        result = service.get_tracking_list(account_id, status, limit, offset)
+        result = service.get_tracking_list(account_id, status, limit, offset, cursor=cursor, count=count)
         return result
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError as e:
         logger.error(f"Database error getting tracking list: {str(e)}")
         raise HTTPException(status_code=500, detail="데이터베이스 오류가 발생했습니다")
@@ -602,6 +613,8 @@ async def get_apply_logs(
     account_id: int,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -611,16 +624,23 @@ async def get_apply_logs(
         account_id: 쿠팡 계정 ID
         limit: 조회 개수
         offset: 시작 위치
+        cursor: 이전 응답의 next_cursor (지정 시 offset 무시)
+        count: 전체 개수 계산 방식 exact, cached, none (기본: cursor 없으면 exact, 있으면 cached)
     """
     if limit < 1 or limit > 500:
         raise HTTPException(status_code=400, detail="limit은 1-500 사이여야 합니다")
     if offset < 0:
         raise HTTPException(status_code=400, detail="offset은 0 이상이어야 합니다")
+    count = count or ("cached" if cursor else "exact")
+    if count not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"count는 {', '.join(COUNT_MODES)} 중 하나여야 합니다")
 
     try:
         service = CouponAutoSyncService(db)
-        result = service.get_apply_logs(account_id, limit, offset)
+        result = service.get_apply_logs(account_id, limit, offset, cursor=cursor, count=count)
         return result
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError as e:
         logger.error(f"Database error getting apply logs: {str(e)}")
         raise HTTPException(status_code=500, detail="데이터베이스 오류가 발생했습니다")
@@ -630,7 +650,7 @@ async def get_apply_logs(
 
 
 @router.get("/statistics/{account_id}")
-async def get_statistics(account_id: int, db: Session = Depends(get_db)):
+async def get_statistics(account_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """
     쿠폰 자동연동 통계 조회
 
@@ -638,9 +658,11 @@ async def get_statistics(account_id: int, db: Session = Depends(get_db)):
         account_id: 쿠팡 계정 ID
     """
     try:
-        service = CouponAutoSyncService(db)
-        result = service.get_statistics(account_id)
-        return result
+        snapshot = get_dashboard_counters(db).snapshot(db, *COUPON_COUNTER_GROUPS)
+        cached = not_modified(request, response, snapshot.etag)
+        if cached:
+            return cached
+        return CouponAutoSyncService(db).get_statistics(account_id, snapshot=snapshot)
     except SQLAlchemyError as e:
         logger.error(f"Database error getting statistics: {str(e)}")
         raise HTTPException(status_code=500, detail="데이터베이스 오류가 발생했습니다")
@@ -649,6 +671,68 @@ async def get_statistics(account_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="통계 조회에 실패했습니다")
 
 
+# ==================== 상품 카탈로그 미러 API ====================
+
+@router.post("/catalog/{account_id}/sync")
+async def sync_product_catalog(
+    account_id: int,
+    background_tasks: BackgroundTasks,
+    max_pages: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    상품 카탈로그 미러 동기화 (백그라운드, 중단된 동기화는 이어서 진행)
+
+    Args:
+        account_id: 쿠팡 계정 ID
+        max_pages: 이번 실행에서 조회할 최대 페이지 수
+    """
+    try:
+        def run_catalog_sync():
+            db_session = SessionLocal()
+            try:
+                CouponAutoSyncService(db_session).sync_catalog(account_id, max_pages=max_pages)
+            except Exception as e:
+                logger.error(f"Background catalog sync error for account {account_id}: {str(e)}")
+            finally:
+                db_session.close()
+
+        background_tasks.add_task(run_catalog_sync)
+
+        return {
+            "success": True,
+            "message": "상품 카탈로그 동기화가 백그라운드에서 시작되었습니다."
+        }
+    except Exception as e:
+        logger.error(f"Error starting catalog sync: {str(e)}")
+        raise HTTPException(status_code=500, detail="카탈로그 동기화 시작에 실패했습니다")
+
+
+@router.get("/catalog/{account_id}/vendor-items")
+async def get_catalog_vendor_items(
+    account_id: int,
+    seller_product_ids: str,
+    db: Session = Depends(get_db)
+):
+    """
+    카탈로그 미러에서 sellerProductId → vendorItemId 조회
+
+    Args:
+        account_id: 쿠팡 계정 ID
+        seller_product_ids: 쉼표로 구분된 등록상품 ID 목록
+    """
+    try:
+        ids = [int(value) for value in seller_product_ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="seller_product_ids는 숫자여야 합니다")
+
+    try:
+        return CouponAutoSyncService(db).get_catalog_vendor_items(account_id, ids)
+    except SQLAlchemyError as e:
+        logger.error(f"Database error getting catalog vendor items: {str(e)}")
+        raise HTTPException(status_code=500, detail="데이터베이스 오류가 발생했습니다")
+
+
 # ==================== 관리자 API ====================
 
 @router.post("/admin/sync-all")
@@ -3,13 +3,14 @@ Responses API Router
 """
 import logging
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from ..models import Inquiry, Response
 from ..exceptions import NotFoundError, ValidationError as AppValidationError, APIError, DatabaseError
 from ..services import (
@@ -17,6 +18,7 @@ from ..services import (
     ResponseValidator,
     ResponseSubmitter
 )
+from ..services.ai_stream import SSE_HEADERS, sse_event
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,10 @@ class GenerateResponseRequest(BaseModel):
     method: str = "template"  # template, ai, hybrid
 
 
+class StreamResponseRequest(BaseModel):
+    inquiry_id: int
+
+
 class ApproveResponseRequest(BaseModel):
     approved_by: str
     edited_text: Optional[str] = None
@@ -98,6 +104,39 @@ def generate_response(
         raise HTTPException(status_code=500, detail="Failed to generate response")
 
 
+@router.post("/generate/stream")
+def generate_response_stream(
+    request: StreamResponseRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Generate an AI response and stream its tokens (SSE)
+
+    Emits "token" events as the completion arrives, then a "done" event with the
+    saved response_id, full response_text and validation result.
+    """
+    if not db.query(Inquiry.id).filter(Inquiry.id == request.inquiry_id).first():
+        raise HTTPException(status_code=404, detail="Inquiry not found")
+
+    def event_generator():
+        # 스트리밍은 요청 의존성 종료 이후까지 이어지므로 전용 세션 사용
+        stream_db = SessionLocal()
+        try:
+            inquiry = stream_db.query(Inquiry).filter(Inquiry.id == request.inquiry_id).first()
+            for event in ResponseGenerator(stream_db).stream_ai_response(inquiry):
+                if event["type"] == "done":
+                    response = stream_db.query(Response).filter(Response.id == event["response_id"]).first()
+                    event["validation"] = ResponseValidator(stream_db).validate_response(response, inquiry)
+                yield sse_event(event)
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}")
+            yield sse_event({"type": "error", "message": "Failed to generate response"})
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.get("/pending-approval", response_model=List[ResponseSchema])
 def get_pending_approval(
     limit: int = 50,
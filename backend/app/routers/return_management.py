@@ -2,7 +2,7 @@
 Return Management Router
 반품 관리 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
@@ -19,6 +19,8 @@ from ..models.return_log import ReturnLog
 from ..models.coupang_account import CoupangAccount
 from ..models.auto_return_config import AutoReturnConfig
 from ..config import settings
+from ..core.pagination import COUNT_MODES, InvalidCursorError, count_total, keyset_page
+from ..services.dashboard_counters import get_dashboard_counters, not_modified
 
 
 router = APIRouter(
@@ -58,6 +60,7 @@ class AutoReturnConfigUpdate(BaseModel):
     process_enabled: Optional[bool] = None
     process_interval_minutes: Optional[int] = None
     process_batch_size: Optional[int] = None
+    process_workers: Optional[int] = None
     auto_process_statuses: Optional[List[str]] = None
     exclude_statuses: Optional[List[str]] = None
     max_retry_count: Optional[int] = None
@@ -392,11 +395,20 @@ async def get_return_logs(
     naver_processed: Optional[bool] = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
     반품 로그 목록 조회
+
+    - cursor: 이전 응답의 next_cursor (지정 시 offset 무시, 뒤쪽 페이지도 일정한 속도)
+    - count: exact, cached, none (기본: cursor 없으면 exact, 있으면 cached)
     """
+    count = count or ("cached" if cursor else "exact")
+    if count not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"count는 {', '.join(COUNT_MODES)} 중 하나여야 합니다")
+
     try:
         query = db.query(ReturnLog)
 
@@ -406,18 +418,18 @@ async def get_return_logs(
         if naver_processed is not None:
             query = query.filter(ReturnLog.naver_processed == naver_processed)
 
-        # 최신순 정렬
-        query = query.order_by(ReturnLog.created_at.desc())
-
-        # 페이지네이션
-        total = query.count()
-        logs = query.offset(offset).limit(limit).all()
+        # 최신순 정렬 + 페이지네이션
+        total = count_total(query, count)
+        logs, next_cursor = keyset_page(
+            query, ReturnLog.created_at, ReturnLog.id, limit, cursor=cursor, offset=offset
+        )
 
         return {
             "success": True,
             "total": total,
             "offset": offset,
             "limit": limit,
+            "next_cursor": next_cursor,
             "data": [
                 {
                     "id": log.id,
@@ -442,6 +454,8 @@ async def get_return_logs(
             ]
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"반품 로그 조회 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -686,23 +700,30 @@ async def process_naver_returns(
 
 
 @router.get("/statistics")
-async def get_return_statistics(db: Session = Depends(get_db)):
+async def get_return_statistics(request: Request, response: Response, db: Session = Depends(get_db)):
     """
     반품 처리 통계
+
+    증분 카운터에서 조회하며 ETag가 같으면 304 반환
     """
     try:
-        total = db.query(ReturnLog).count()
-        pending = db.query(ReturnLog).filter(ReturnLog.status == "pending").count()
-        processing = db.query(ReturnLog).filter(ReturnLog.status == "processing").count()
-        completed = db.query(ReturnLog).filter(ReturnLog.status == "completed").count()
-        failed = db.query(ReturnLog).filter(ReturnLog.status == "failed").count()
-
-        naver_processed = db.query(ReturnLog).filter(ReturnLog.naver_processed == True).count()
-        naver_pending = db.query(ReturnLog).filter(ReturnLog.naver_processed == False).count()
-
-        # 최근 24시간 통계
-        yesterday = datetime.now() - timedelta(hours=24)
-        recent_24h = db.query(ReturnLog).filter(ReturnLog.created_at >= yesterday).count()
+        snapshot = get_dashboard_counters(db).snapshot(db, "return_logs")
+        cached = not_modified(request, response, snapshot.etag)
+        if cached:
+            return cached
+
+        counts = snapshot.values["return_logs"]
+        total = counts.get("total", 0)
+        pending = counts.get("status:pending", 0)
+        processing = counts.get("status:processing", 0)
+        completed = counts.get("status:completed", 0)
+        failed = counts.get("status:failed", 0)
+
+        naver_processed = counts.get("naver:True", 0)
+        naver_pending = counts.get("naver:False", 0)
+
+        # 최근 24시간 통계 (재계산 시 정확한 값으로 보정)
+        recent_24h = counts.get("recent_24h", 0)
 
         return {
             "success": True,
@@ -4,11 +4,10 @@
 """
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from loguru import logger
 from sqlalchemy.orm import Session
-import asyncio
 import json
 
 from ..database import SessionLocal, get_db
@@ -39,6 +38,22 @@ class BatchProcessRequest(BaseModel):
     account_id: int
     inquiries: List[dict]
     headless: bool = True
+    prefetch: int = Field(3, ge=1, le=10, description="브라우저 제출보다 먼저 생성해 둘 AI 답변 수")
+    pages: int = Field(1, ge=1, le=4, description="동시에 사용할 브라우저 페이지 수 (같은 로그인 세션)")
+
+
+def to_special_inquiries(items: List[dict]) -> List[SpecialFormInquiry]:
+    """요청 문의 목록 → SpecialFormInquiry 리스트"""
+    return [
+        SpecialFormInquiry(
+            inquiry_id=str(inq.get("inquiry_id", "")),
+            inquiry_content=inq.get("inquiry_content", ""),
+            customer_name=inq.get("customer_name", "고객"),
+            special_reply_content=inq.get("special_reply_content", ""),
+            special_link=inq.get("special_link")
+        )
+        for inq in items
+    ]
 
 
 class SpecialFormStatusResponse(BaseModel):
@@ -203,7 +218,8 @@ async def batch_process_special_forms(
     """
     일괄 특수 양식 처리
 
-    여러 건의 특수 양식 문의를 순차적으로 처리합니다.
+    여러 건의 특수 양식 문의를 처리합니다.
+    다음 문의들의 AI 답변을 미리 생성하면서(prefetch) 브라우저에서 제출하고,
     처리 결과를 한 번에 반환합니다.
     """
     try:
@@ -238,26 +254,20 @@ async def batch_process_special_forms(
                     detail="자동화 초기화 실패 - Wing 로그인 확인 필요"
                 )
 
-            # 문의 리스트 변환 및 처리
-            for inq_data in request.inquiries:
-                inquiry = SpecialFormInquiry(
-                    inquiry_id=str(inq_data.get("inquiry_id", "")),
-                    inquiry_content=inq_data.get("inquiry_content", ""),
-                    customer_name=inq_data.get("customer_name", "고객"),
-                    special_reply_content=inq_data.get("special_reply_content", ""),
-                    special_link=inq_data.get("special_link")
-                )
-
-                result = await automation.process_special_inquiry(inquiry)
-                results.append(result)
-
-                if result["status"] == "submitted":
-                    success_count += 1
-                else:
-                    failed_count += 1
-
-                # 다음 문의 처리 전 대기
-                await asyncio.sleep(2)
+            # AI 답변 생성과 브라우저 제출을 겹쳐서 처리
+            results_by_index = {}
+            async for event in automation.process_batch(
+                to_special_inquiries(request.inquiries),
+                prefetch=request.prefetch,
+                pages=request.pages
+            ):
+                if event["type"] in ("success", "failed", "error"):
+                    results_by_index[event["index"]] = event["data"]
+                    if event["type"] == "success":
+                        success_count += 1
+                    else:
+                        failed_count += 1
+            results = [results_by_index[i] for i in sorted(results_by_index)]
 
         finally:
             await automation.close()
@@ -289,6 +299,7 @@ async def batch_process_stream(
     일괄 특수 양식 처리 (SSE 스트리밍)
 
     처리 진행 상황을 실시간으로 스트리밍합니다.
+    stage 이벤트로 문의별 AI 답변 생성(ai_response)과 브라우저 제출(browser) 단계의 시작/완료를 알립니다.
     """
     # 계정 정보 가져오기 (스트리밍 전에 검증)
     account, decrypted_password = get_account_with_credentials(db, request.account_id)
@@ -319,20 +330,12 @@ async def batch_process_stream(
 
             yield f"data: {json.dumps({'type': 'init', 'message': '초기화 완료, 처리 시작'}, ensure_ascii=False)}\n\n"
 
-            # 문의 리스트 변환
-            inquiries = [
-                SpecialFormInquiry(
-                    inquiry_id=str(inq.get("inquiry_id", "")),
-                    inquiry_content=inq.get("inquiry_content", ""),
-                    customer_name=inq.get("customer_name", "고객"),
-                    special_reply_content=inq.get("special_reply_content", ""),
-                    special_link=inq.get("special_link")
-                )
-                for inq in request.inquiries
-            ]
-
-            # 일괄 처리 (스트리밍)
-            async for result in automation.process_batch(inquiries):
+            # 일괄 처리 (스트리밍, 단계별 진행 상황 포함)
+            async for result in automation.process_batch(
+                to_special_inquiries(request.inquiries),
+                prefetch=request.prefetch,
+                pages=request.pages
+            ):
                 yield f"data: {json.dumps(result, ensure_ascii=False)}\n\n"
 
         except Exception as e:
@@ -8,6 +8,7 @@ from datetime import datetime
 from pydantic import BaseModel
 
 from ..database import get_db
+from ..core.pagination import InvalidCursorError
 from ..services.template_recommendation import TemplateRecommendationService
 from ..services.sentiment_analysis import SentimentAnalysisService
 from ..services.ab_testing import ABTestingService
@@ -425,7 +426,8 @@ def create_audit_log(request: AuditLogRequest, db: Session = Depends(get_db)):
         request.ip_address,
         request.user_agent
     )
-    return {"id": log.id, "timestamp": log.timestamp}
+    # 기록은 버퍼를 거쳐 비동기로 처리되므로 id는 아직 없음
+    return {"id": log.id, "timestamp": log.timestamp, "queued": True}
 
 
 @router.get("/audit/user/{user_id}")
@@ -509,9 +511,12 @@ def advanced_search_inquiries(
     filters: Dict = Body(...),
     db: Session = Depends(get_db)
 ):
-    """Advanced inquiry search with complex filters"""
+    """Advanced inquiry search with complex filters (다음 페이지는 filters.cursor = next_cursor)"""
     service = AdvancedSearchService(db)
-    results = service.search_inquiries(filters)
+    try:
+        results, next_cursor = service.search_inquiries_page(filters)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return {
         "results": [
@@ -525,7 +530,8 @@ def advanced_search_inquiries(
             }
             for inq in results
         ],
-        "count": len(results)
+        "count": len(results),
+        "next_cursor": next_cursor
     }
 
 
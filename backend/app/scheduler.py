@@ -2,14 +2,20 @@
 Automated Scheduler Service
 Runs background tasks on schedule
 """
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-from datetime import datetime
+from datetime import datetime, timedelta
 from loguru import logger
-from typing import Optional
+from typing import Callable, Dict, Optional
+import threading
+import time
 
 from .database import SessionLocal
+from .models.payload_blob import delete_orphan_blobs
+from .models.scheduler_job import SchedulerJobLock, SchedulerJobRun
+from .services.job_lease import JobLease
 from .services.auto_workflow import AutoWorkflow
 from .services.inquiry_collector import InquiryCollector
 from .services.auto_return_collector import AutoReturnCollector
@@ -21,11 +27,139 @@ from .config import settings
 class AutomationScheduler:
     """
     Manages scheduled automation tasks
+
+    - 작업마다 DB 리스 잠금을 잡아 여러 인스턴스 중 한 곳에서만 실행
+    - 같은 작업은 겹쳐 실행하지 않고(max_instances=1), 밀린 실행은 한 번으로 합침(coalesce)
+    - 실행기 분리: default(문의/리포트), coupon(장시간 쿠폰 작업), browser(브라우저 자동화)
+    - 실행마다 소요 시간/처리 건수/결과를 scheduler_job_runs에 기록
     """
 
-    def __init__(self):
-        self.scheduler = BackgroundScheduler()
+    EXECUTOR_WORKERS = {
+        "default": 4,
+        "coupon": 2,
+        "browser": 1
+    }
+    JOB_DEFAULTS = {
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": 300
+    }
+
+    # 리스 TTL (하트비트로 연장, 인스턴스가 죽으면 TTL 후 다른 인스턴스가 가져감)
+    LEASE_TTL_SECONDS = 300
+    LEASE_HEARTBEAT_SECONDS = 60
+
+    RUN_HISTORY_RETENTION_DAYS = 30
+    STATUS_HISTORY_HOURS = 24
+    STATUS_RECENT_RUNS = 5
+
+    def __init__(self, session_factory: Callable = SessionLocal):
+        self.session_factory = session_factory
+        self.scheduler = BackgroundScheduler(
+            executors={name: ThreadPoolExecutor(workers) for name, workers in self.EXECUTOR_WORKERS.items()},
+            job_defaults=dict(self.JOB_DEFAULTS)
+        )
         self.is_running = False
+        self._running_jobs: Dict[str, datetime] = {}
+        self._running_lock = threading.Lock()
+
+    def _add_job(self, func: Callable, trigger, job_id: str, name: str, executor: str = "default"):
+        """리스 잠금/실행 이력 래퍼로 감싸 작업 등록"""
+        self.scheduler.add_job(
+            func=self.run_job,
+            args=[job_id, func],
+            trigger=trigger,
+            id=job_id,
+            name=name,
+            executor=executor,
+            replace_existing=True
+        )
+
+    def run_job(self, job_id: str, func: Callable) -> Optional[dict]:
+        """
+        리스를 잡고 작업 실행 후 이력 기록
+
+        다른 인스턴스가 리스를 보유 중이면 실행하지 않고 skipped로 기록.
+        func는 처리 건수(int)를 반환하고, 실패 시 예외를 던짐
+        """
+        db = self.session_factory()
+        lease = JobLease(db, job_id, self.LEASE_TTL_SECONDS)
+        started_at = datetime.utcnow()
+        started = time.monotonic()
+        status, items, error = "success", 0, None
+
+        try:
+            if not lease.acquire():
+                logger.info(f"[SCHEDULER] {job_id}: 다른 인스턴스에서 실행 중, 건너뜀")
+                return self._record_run(db, job_id, lease.owner, "skipped", started_at, 0.0)
+
+            with self._running_lock:
+                self._running_jobs[job_id] = started_at
+            stop = threading.Event()
+            heartbeat = threading.Thread(target=self._heartbeat, args=(lease, stop), daemon=True)
+            heartbeat.start()
+
+            try:
+                items = func() or 0
+            except Exception as e:
+                status, error = "failed", str(e)
+                logger.error(f"[SCHEDULER] {job_id} 실패: {error}")
+            finally:
+                stop.set()
+                heartbeat.join(timeout=5)
+                lease.release()
+                with self._running_lock:
+                    self._running_jobs.pop(job_id, None)
+
+            duration = time.monotonic() - started
+            logger.info(f"[SCHEDULER] {job_id}: {status}, items={items}, {duration:.1f}s")
+            return self._record_run(db, job_id, lease.owner, status, started_at, duration, items, error)
+        finally:
+            db.close()
+
+    def _heartbeat(self, lease: JobLease, stop: threading.Event):
+        """실행 중 리스 만료 시각 연장 (별도 세션)"""
+        while not stop.wait(self.LEASE_HEARTBEAT_SECONDS):
+            db = self.session_factory()
+            try:
+                if not lease.bind(db).renew():
+                    return
+            except Exception as e:
+                logger.error(f"[SCHEDULER] {lease.job_id}: 리스 갱신 실패: {e}")
+                db.rollback()
+            finally:
+                db.close()
+
+    @staticmethod
+    def _record_run(
+        db,
+        job_id: str,
+        owner: str,
+        status: str,
+        started_at: datetime,
+        duration: float,
+        items: int = 0,
+        error: Optional[str] = None
+    ) -> Optional[dict]:
+        """실행 이력 저장 (기록 실패가 작업 결과에 영향을 주지 않도록 격리)"""
+        try:
+            run = SchedulerJobRun(
+                job_id=job_id,
+                owner=owner,
+                status=status,
+                items_processed=int(items),
+                error_message=error,
+                started_at=started_at,
+                finished_at=started_at + timedelta(seconds=duration),
+                duration_seconds=round(duration, 3)
+            )
+            db.add(run)
+            db.commit()
+            return run.to_dict()
+        except Exception as e:
+            logger.error(f"[SCHEDULER] {job_id}: 실행 이력 저장 실패: {e}")
+            db.rollback()
+            return None
 
     def start(self):
         """Start the scheduler"""
@@ -36,93 +170,103 @@ class AutomationScheduler:
         logger.info("Starting automation scheduler...")
 
         # Task 1: Auto-collect inquiries every 30 minutes
-        self.scheduler.add_job(
+        self._add_job(
             func=self.auto_collect_inquiries,
             trigger=IntervalTrigger(minutes=30),
-            id='auto_collect',
-            name='Auto Collect Inquiries',
-            replace_existing=True
+            job_id='auto_collect',
+            name='Auto Collect Inquiries'
         )
 
         # Task 2: Auto-process inquiries every 15 minutes
-        self.scheduler.add_job(
+        self._add_job(
             func=self.auto_process_inquiries,
             trigger=IntervalTrigger(minutes=15),
-            id='auto_process',
-            name='Auto Process Inquiries',
-            replace_existing=True
+            job_id='auto_process',
+            name='Auto Process Inquiries'
         )
 
         # Task 3: Morning report at 9 AM
-        self.scheduler.add_job(
+        self._add_job(
             func=self.send_morning_report,
             trigger=CronTrigger(hour=9, minute=0),
-            id='morning_report',
-            name='Daily Morning Report',
-            replace_existing=True
+            job_id='morning_report',
+            name='Daily Morning Report'
         )
 
         # Task 4: Evening report at 6 PM
-        self.scheduler.add_job(
+        self._add_job(
             func=self.send_evening_report,
             trigger=CronTrigger(hour=18, minute=0),
-            id='evening_report',
-            name='Daily Evening Report',
-            replace_existing=True
+            job_id='evening_report',
+            name='Daily Evening Report'
         )
 
         # Task 5: Process pending approvals every hour
-        self.scheduler.add_job(
+        self._add_job(
             func=self.process_pending_approvals,
             trigger=IntervalTrigger(hours=1),
-            id='pending_approvals',
-            name='Process Pending Approvals',
-            replace_existing=True
+            job_id='pending_approvals',
+            name='Process Pending Approvals'
         )
 
         # Task 6: Cleanup old logs daily at midnight
-        self.scheduler.add_job(
+        self._add_job(
             func=self.cleanup_old_logs,
             trigger=CronTrigger(hour=0, minute=0),
-            id='cleanup_logs',
-            name='Cleanup Old Logs',
-            replace_existing=True
+            job_id='cleanup_logs',
+            name='Cleanup Old Logs'
         )
 
         # Task 7: Auto-fetch Coupang returns every 15 minutes
-        self.scheduler.add_job(
+        self._add_job(
             func=self.auto_fetch_returns,
             trigger=IntervalTrigger(minutes=15),
-            id='auto_fetch_returns',
-            name='Auto Fetch Coupang Returns',
-            replace_existing=True
+            job_id='auto_fetch_returns',
+            name='Auto Fetch Coupang Returns'
         )
 
         # Task 8: Auto-process Naver returns every 20 minutes
-        self.scheduler.add_job(
+        self._add_job(
             func=self.auto_process_returns,
             trigger=IntervalTrigger(minutes=20),
-            id='auto_process_returns',
+            job_id='auto_process_returns',
             name='Auto Process Naver Returns',
-            replace_existing=True
+            executor='browser'
         )
 
         # Task 9: Auto-apply coupons to new products every hour
-        self.scheduler.add_job(
+        self._add_job(
             func=self.auto_apply_coupons,
             trigger=IntervalTrigger(hours=1),
-            id='auto_apply_coupons',
+            job_id='auto_apply_coupons',
             name='Auto Apply Coupons to New Products',
-            replace_existing=True
+            executor='coupon'
         )
 
         # Task 10: Detect new products for coupon tracking every 6 hours
-        self.scheduler.add_job(
+        self._add_job(
             func=self.auto_detect_new_products,
             trigger=IntervalTrigger(hours=6),
-            id='auto_detect_products',
+            job_id='auto_detect_products',
             name='Auto Detect New Products for Coupon',
-            replace_existing=True
+            executor='coupon'
+        )
+
+        # Task 11: Resolve outstanding coupon requests every 2 minutes
+        self._add_job(
+            func=self.poll_coupon_requests,
+            trigger=IntervalTrigger(minutes=2),
+            job_id='poll_coupon_requests',
+            name='Poll Coupon Request Status',
+            executor='coupon'
+        )
+
+        # Task 12: Delete unreferenced payload blobs daily at 3:30 AM
+        self._add_job(
+            func=self.cleanup_payload_blobs,
+            trigger=CronTrigger(hour=3, minute=30),
+            job_id='cleanup_payload_blobs',
+            name='Cleanup Orphaned Payload Blobs'
         )
 
         self.scheduler.start()
@@ -149,8 +293,10 @@ class AutomationScheduler:
             collector = InquiryCollector(db)
             inquiries = collector.collect_new_inquiries()
             logger.success(f"Collected {len(inquiries)} new inquiries")
+            return len(inquiries)
         except Exception as e:
             logger.error(f"Error in auto_collect_inquiries: {str(e)}")
+            raise
         finally:
             db.close()
 
@@ -181,9 +327,12 @@ class AutomationScheduler:
                     level="warning"
                 )
 
+            return results['generated']
+
         except Exception as e:
             logger.error(f"Error in auto_process_inquiries: {str(e)}")
             self._send_alert(f"❌ Auto-processing failed: {str(e)}", level="error")
+            raise
         finally:
             db.close()
 
@@ -203,8 +352,10 @@ class AutomationScheduler:
                     f"auto-approved {results['auto_approved']}, "
                     f"submitted {results['submitted']}"
                 )
+            return results['processed']
         except Exception as e:
             logger.error(f"Error processing pending approvals: {str(e)}")
+            raise
         finally:
             db.close()
 
@@ -225,8 +376,10 @@ class AutomationScheduler:
             notifier.send_daily_report(report, time='morning')
 
             logger.success("Morning report sent")
+            return 1
         except Exception as e:
             logger.error(f"Error sending morning report: {str(e)}")
+            raise
         finally:
             db.close()
 
@@ -247,8 +400,10 @@ class AutomationScheduler:
             notifier.send_daily_report(report, time='evening')
 
             logger.success("Evening report sent")
+            return 1
         except Exception as e:
             logger.error(f"Error sending evening report: {str(e)}")
+            raise
         finally:
             db.close()
 
@@ -260,18 +415,42 @@ class AutomationScheduler:
         db = SessionLocal()
         try:
             from .models import ActivityLog
-            from datetime import timedelta
 
             cutoff_date = datetime.utcnow() - timedelta(days=90)
             deleted = db.query(ActivityLog).filter(
                 ActivityLog.created_at < cutoff_date
             ).delete()
 
+            run_cutoff = datetime.utcnow() - timedelta(days=self.RUN_HISTORY_RETENTION_DAYS)
+            deleted_runs = db.query(SchedulerJobRun).filter(
+                SchedulerJobRun.started_at < run_cutoff
+            ).delete()
+
             db.commit()
-            logger.success(f"Cleaned up {deleted} old log entries")
+            logger.success(f"Cleaned up {deleted} old log entries, {deleted_runs} job runs")
+            return deleted + deleted_runs
         except Exception as e:
             logger.error(f"Error cleaning up logs: {str(e)}")
             db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def cleanup_payload_blobs(self):
+        """
+        Delete payload blobs that no row references any more (payloads replaced on re-sync)
+        """
+        logger.info("Cleaning up orphaned payload blobs...")
+        db = SessionLocal()
+        try:
+            deleted = delete_orphan_blobs(db)
+            db.commit()
+            logger.success(f"Deleted {deleted} orphaned payload blobs")
+            return deleted
+        except Exception as e:
+            logger.error(f"Error cleaning up payload blobs: {str(e)}")
+            db.rollback()
+            raise
         finally:
             db.close()
 
@@ -290,12 +469,15 @@ class AutomationScheduler:
                     f"Collected {result['total_fetched']} returns "
                     f"(New: {result['saved']}, Updated: {result['updated']})"
                 )
-            else:
-                logger.warning(f"Return collection failed: {result['message']}")
+                return result['total_fetched']
+
+            logger.warning(f"Return collection failed: {result['message']}")
+            return 0
 
         except Exception as e:
             logger.error(f"Error in auto_fetch_returns: {str(e)}")
             self._send_alert(f"❌ Auto-fetch returns failed: {str(e)}", level="error")
+            raise
         finally:
             db.close()
 
@@ -321,12 +503,15 @@ class AutomationScheduler:
                         f"⚠️ {result['failed']} returns failed to process",
                         level="warning"
                     )
-            else:
-                logger.warning(f"Return processing skipped: {result['message']}")
+                return result['processed']
+
+            logger.warning(f"Return processing skipped: {result['message']}")
+            return 0
 
         except Exception as e:
             logger.error(f"Error in auto_process_returns: {str(e)}")
             self._send_alert(f"❌ Auto-process returns failed: {str(e)}", level="error")
+            raise
         finally:
             db.close()
 
@@ -338,11 +523,38 @@ class AutomationScheduler:
         db = SessionLocal()
         try:
             service = CouponAutoSyncService(db)
-            service.run_auto_sync_all_accounts()
-            logger.success("Coupon auto-sync completed for all enabled accounts")
+            result = service.run_auto_sync_all_accounts()
+            logger.success(
+                f"Coupon auto-sync completed: {result['succeeded']}/{result['total_accounts']} accounts "
+                f"(failed: {result['failed']}, timed out: {result['timed_out']})"
+            )
+
+            if result["failed_accounts"]:
+                self._send_alert(
+                    f"⚠️ Coupon auto-sync failed for accounts {result['failed_accounts']}",
+                    level="warning"
+                )
+            return result["succeeded"]
         except Exception as e:
             logger.error(f"Error in auto_apply_coupons: {str(e)}")
             self._send_alert(f"❌ Auto-apply coupons failed: {str(e)}", level="error")
+            raise
+        finally:
+            db.close()
+
+    def poll_coupon_requests(self):
+        """
+        Resolve outstanding instant-coupon requests into progress and tracking records
+        """
+        db = SessionLocal()
+        try:
+            result = CouponAutoSyncService(db).poll_coupon_requests()
+            if result["resolved"]:
+                logger.info(f"Resolved {result['resolved']} coupon requests")
+            return result["resolved"]
+        except Exception as e:
+            logger.error(f"Error in poll_coupon_requests: {str(e)}")
+            raise
         finally:
             db.close()
 
@@ -353,41 +565,49 @@ class AutomationScheduler:
         logger.info("Starting scheduled new product detection...")
         db = SessionLocal()
         try:
-            from .models import CoupangAccount, CouponAutoSyncConfig
+            from .models import CouponAutoSyncConfig
+            from .services.account_fanout import run_per_account
 
             # Get all enabled coupon configs
-            configs = db.query(CouponAutoSyncConfig).filter(
-                CouponAutoSyncConfig.is_enabled == True
-            ).all()
-
-            total_detected = 0
-            total_registered = 0
-
-            for config in configs:
-                try:
-                    service = CouponAutoSyncService(db)
-
-                    # Detect new products
-                    detect_result = service.detect_new_products(config.coupang_account_id)
-                    if detect_result.get("success"):
-                        new_products = detect_result.get("new_products", [])
-                        if new_products:
-                            # Register for tracking
-                            register_result = service.register_products_for_tracking(
-                                config.coupang_account_id,
-                                new_products
-                            )
-                            total_detected += len(new_products)
-                            total_registered += register_result.get("registered", 0)
-
-                except Exception as e:
-                    logger.error(f"Error detecting products for account {config.coupang_account_id}: {str(e)}")
+            account_ids = [
+                row[0] for row in db.query(CouponAutoSyncConfig.coupang_account_id).filter(
+                    CouponAutoSyncConfig.is_enabled == True
+                ).all()
+            ]
+
+            def detect_account(account_db, account_id: int) -> dict:
+                service = CouponAutoSyncService(account_db)
+
+                # Detect new products
+                detect_result = service.detect_new_products(account_id)
+                new_products = detect_result.get("new_products", []) if detect_result.get("success") else []
+                if not new_products:
+                    return {"detected": 0, "registered": 0}
+
+                # Register for tracking
+                register_result = service.register_products_for_tracking(account_id, new_products)
+                return {"detected": len(new_products), "registered": register_result.get("registered", 0)}
+
+            # 계정별 별도 세션/워커에서 병렬 실행
+            results = run_per_account(account_ids, detect_account, label="detect-products")
+
+            total_detected = sum(r["result"]["detected"] for r in results if r["success"])
+            total_registered = sum(r["result"]["registered"] for r in results if r["success"])
+            failed_accounts = [r["account_id"] for r in results if not r["success"]]
+
+            if failed_accounts:
+                self._send_alert(
+                    f"⚠️ New product detection failed for accounts {failed_accounts}",
+                    level="warning"
+                )
 
             logger.success(f"New product detection completed: Detected {total_detected}, Registered {total_registered}")
+            return total_detected
 
         except Exception as e:
             logger.error(f"Error in auto_detect_new_products: {str(e)}")
             self._send_alert(f"❌ Auto-detect new products failed: {str(e)}", level="error")
+            raise
         finally:
             db.close()
 
@@ -460,8 +680,10 @@ class AutomationScheduler:
             # 비동기 실행
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(do_scrape())
-            loop.close()
+            try:
+                result = loop.run_until_complete(do_scrape())
+            finally:
+                loop.close()
 
             if result['success']:
                 logger.success(
@@ -471,12 +693,14 @@ class AutomationScheduler:
 
                 # 실행 이력 저장
                 self._save_naverpay_history(result)
+                return result['new_saved']
             else:
                 logger.warning(f"NaverPay scraping skipped: {result.get('reason', 'unknown')}")
 
         except Exception as e:
             logger.error(f"Error in auto_scrape_naverpay: {str(e)}")
             self._send_alert(f"❌ NaverPay scraping failed: {str(e)}", level="error")
+            raise
         finally:
             db.close()
 
@@ -533,12 +757,12 @@ class AutomationScheduler:
                 logger.error("Invalid schedule configuration")
                 return False
 
-            self.scheduler.add_job(
+            self._add_job(
                 func=self.auto_scrape_naverpay,
                 trigger=trigger,
-                id=job_id,
+                job_id=job_id,
                 name=f'NaverPay Scraping ({job_id})',
-                replace_existing=True
+                executor='browser'
             )
 
             logger.success(f"NaverPay schedule added: {job_id}")
@@ -592,20 +816,76 @@ class AutomationScheduler:
                 })
         return jobs
 
+    def get_job_history(self, job_id: str, limit: int = 50) -> list:
+        """작업 실행 이력 조회 (최신순)"""
+        db = self.session_factory()
+        try:
+            runs = db.query(SchedulerJobRun).filter(
+                SchedulerJobRun.job_id == job_id
+            ).order_by(SchedulerJobRun.started_at.desc()).limit(limit).all()
+            return [run.to_dict() for run in runs]
+        finally:
+            db.close()
+
     def get_job_status(self):
         """
         Get status of all scheduled jobs
+
+        작업별 실행기, 로컬 실행 여부, 리스 보유 인스턴스, 최근 실행 이력과
+        최근 STATUS_HISTORY_HOURS시간 통계(실행/실패/건너뜀 횟수, 평균/최대 소요 시간) 포함
         """
+        locks: Dict[str, dict] = {}
+        runs_by_job: Dict[str, list] = {}
+
+        db = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            for lock in db.query(SchedulerJobLock).filter(SchedulerJobLock.expires_at > now).all():
+                locks[lock.job_id] = lock.to_dict()
+
+            since = now - timedelta(hours=self.STATUS_HISTORY_HOURS)
+            runs = db.query(SchedulerJobRun).filter(
+                SchedulerJobRun.started_at >= since
+            ).order_by(SchedulerJobRun.started_at.desc()).all()
+            for run in runs:
+                runs_by_job.setdefault(run.job_id, []).append(run)
+        except Exception as e:
+            logger.error(f"Failed to load job history: {e}")
+        finally:
+            db.close()
+
+        with self._running_lock:
+            running_jobs = dict(self._running_jobs)
+
         jobs = []
         for job in self.scheduler.get_jobs():
+            runs = runs_by_job.get(job.id, [])
+            executed = [run for run in runs if run.status != "skipped"]
+            durations = [run.duration_seconds or 0 for run in executed]
+            running_since = running_jobs.get(job.id)
+
             jobs.append({
                 'id': job.id,
                 'name': job.name,
+                'executor': job.executor,
                 'next_run': job.next_run_time.isoformat() if job.next_run_time else None,
-                'trigger': str(job.trigger)
+                'trigger': str(job.trigger),
+                'running_since': running_since.isoformat() if running_since else None,
+                'lease': locks.get(job.id),
+                'last_run': runs[0].to_dict() if runs else None,
+                'recent_runs': [run.to_dict() for run in runs[:self.STATUS_RECENT_RUNS]],
+                'stats': {
+                    'runs': len(executed),
+                    'failed': sum(1 for run in executed if run.status == "failed"),
+                    'skipped': len(runs) - len(executed),
+                    'items_processed': sum(run.items_processed or 0 for run in executed),
+                    'avg_duration_seconds': round(sum(durations) / len(durations), 3) if durations else None,
+                    'max_duration_seconds': max(durations) if durations else None
+                }
             })
         return {
             'running': self.is_running,
+            'executors': dict(self.EXECUTOR_WORKERS),
             'jobs': jobs
         }
 
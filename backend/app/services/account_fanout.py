@@ -0,0 +1,186 @@
+"""
+Account Fan-out Executor
+계정별 작업 병렬 실행기
+
+여러 쿠팡 계정에 같은 작업을 돌릴 때 계정 하나가 느려도 나머지가 밀리지 않도록:
+- 계정마다 별도 워커 스레드와 별도 DB 세션에서 실행
+- 작업(label)마다 별도 동시 실행 한도 (ACCOUNT_FANOUT_MAX_WORKERS), 다른 작업의 지연에 영향받지 않음
+- 계정별 제한 시간 (시작 시점부터 계산, 초과 시 결과를 기다리지 않고 timed_out 처리)
+- 제한 시간을 넘겨 아직 실행 중인 계정은 끝날 때까지 같은 작업의 다음 실행에서 건너뜀
+결과는 입력 계정 순서대로 반환
+"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+
+# 작업(label)별 동시 실행 한도와 실행 중인 계정 (시간 초과로 포기한 스레드 포함)
+_registry_lock = threading.Lock()
+_job_slots: Dict[str, threading.BoundedSemaphore] = {}
+_running_accounts: Dict[str, Set[int]] = {}
+
+
+def _slots_for(label: str) -> threading.BoundedSemaphore:
+    with _registry_lock:
+        slots = _job_slots.get(label)
+        if slots is None:
+            slots = _job_slots[label] = threading.BoundedSemaphore(settings.ACCOUNT_FANOUT_MAX_WORKERS)
+        return slots
+
+
+def running_accounts(label: str) -> Set[int]:
+    """작업(label)에서 아직 실행 중인 계정 ID (시간 초과 후 남은 스레드 포함)"""
+    with _registry_lock:
+        return set(_running_accounts.get(label, ()))
+
+
+def _claim_accounts(label: str, account_ids: List[int]) -> List[int]:
+    """실행 중이 아닌 계정만 실행 중으로 표시하고 반환"""
+    with _registry_lock:
+        running = _running_accounts.setdefault(label, set())
+        claimed = [account_id for account_id in account_ids if account_id not in running]
+        running.update(claimed)
+        return claimed
+
+
+def _release_account(label: str, account_id: int) -> None:
+    with _registry_lock:
+        _running_accounts.get(label, set()).discard(account_id)
+
+
+def run_per_account(
+    account_ids: Iterable[int],
+    work: Callable[[Session, int], Any],
+    timeout: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+    label: str = "fanout"
+) -> List[Dict[str, Any]]:
+    """
+    계정별로 work(db, account_id)를 병렬 실행
+
+    Args:
+        account_ids: 대상 쿠팡 계정 ID 목록
+        work: 계정 1개 처리 함수 (전용 세션을 받음, 반환값은 result에 담김)
+        timeout: 계정별 제한 시간(초), 기본 ACCOUNT_FANOUT_TIMEOUT_SECONDS
+        max_workers: 이번 호출의 워커 수 (작업별 한도를 넘지 않음)
+        session_factory: 세션 생성 함수
+        label: 작업 이름 (동시 실행 한도/실행 중 계정 구분, 로그 표시)
+
+    Returns:
+        [{"account_id", "success", "result" | "error", "timed_out", "skipped", "duration_seconds"}]
+    """
+    account_ids = list(account_ids)
+    if not account_ids:
+        return []
+
+    timeout = timeout if timeout is not None else settings.ACCOUNT_FANOUT_TIMEOUT_SECONDS
+    slots = _slots_for(label)
+    results: Dict[int, Dict[str, Any]] = {}
+
+    claimed = _claim_accounts(label, account_ids)
+    for account_id in account_ids:
+        if account_id not in claimed:
+            logger.warning(f"[{label}] account {account_id}: 이전 실행이 아직 진행 중이라 건너뜀")
+            results[account_id] = {
+                "account_id": account_id,
+                "success": False,
+                "error": "이전 실행이 아직 진행 중",
+                "timed_out": False,
+                "skipped": True,
+                "duration_seconds": 0.0
+            }
+    if not claimed:
+        return [results[account_id] for account_id in account_ids]
+
+    max_workers = min(max_workers or settings.ACCOUNT_FANOUT_MAX_WORKERS, len(claimed))
+    submitted_at = time.monotonic()
+    started_at: Dict[int, float] = {}
+
+    def run(account_id: int) -> Dict[str, Any]:
+        try:
+            # 한도가 시간 초과 스레드로 차 있으면 무한정 기다리지 않음
+            if not slots.acquire(timeout=timeout):
+                return {
+                    "account_id": account_id,
+                    "success": False,
+                    "error": f"실행 슬롯 대기 시간 초과 ({timeout}초)",
+                    "timed_out": True
+                }
+            try:
+                started_at[account_id] = time.monotonic()
+                db = session_factory()
+                try:
+                    result = work(db, account_id)
+                    return {"account_id": account_id, "success": True, "result": result}
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"[{label}] account {account_id} 실패: {str(e)}")
+                    return {"account_id": account_id, "success": False, "error": str(e)}
+                finally:
+                    db.close()
+            finally:
+                slots.release()
+        finally:
+            _release_account(label, account_id)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=label)
+    futures = {executor.submit(run, account_id): account_id for account_id in claimed}
+    pending = set(futures)
+
+    try:
+        while pending:
+            # 시작된 작업 중 가장 먼저 제한 시간에 도달하는 시점까지 대기
+            now = time.monotonic()
+            deadlines = [
+                started_at[futures[f]] + timeout for f in pending if futures[f] in started_at
+            ]
+            wait_for = max(min(deadlines) - now, 0) if deadlines else timeout
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                result = future.result()
+                account_id = result["account_id"]
+                result["duration_seconds"] = round(time.monotonic() - started_at.get(account_id, submitted_at), 3)
+                result.setdefault("timed_out", False)
+                result["skipped"] = False
+                results[account_id] = result
+
+            now = time.monotonic()
+            for future in list(pending):
+                account_id = futures[future]
+                if account_id in started_at and now - started_at[account_id] >= timeout:
+                    # 스레드는 강제 종료할 수 없으므로 결과만 포기
+                    # (끝날 때까지 실행 중으로 남아 같은 작업의 다음 실행에서 건너뜀)
+                    pending.discard(future)
+                    logger.warning(f"[{label}] account {account_id}: {timeout}초 제한 시간 초과")
+                    results[account_id] = {
+                        "account_id": account_id,
+                        "success": False,
+                        "error": f"제한 시간 초과 ({timeout}초)",
+                        "timed_out": True,
+                        "skipped": False,
+                        "duration_seconds": round(now - started_at[account_id], 3)
+                    }
+    finally:
+        executor.shutdown(wait=False)
+
+    return [results[account_id] for account_id in account_ids]
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """fan-out 결과 요약 (성공/실패/시간 초과/건너뜀 계정 수)"""
+    return {
+        "total_accounts": len(results),
+        "succeeded": sum(1 for r in results if r["success"]),
+        "failed": sum(1 for r in results if not r["success"] and not r.get("timed_out") and not r.get("skipped")),
+        "timed_out": sum(1 for r in results if r.get("timed_out")),
+        "skipped": sum(1 for r in results if r.get("skipped")),
+        "failed_accounts": [r["account_id"] for r in results if not r["success"]]
+    }
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 from loguru import logger
 
+from ..core.pagination import Page, keyset_page
 from ..models import Inquiry, Response, CustomerProfile
 
 
@@ -38,6 +39,51 @@ class AdvancedSearchService:
         - confidence_min: Minimum confidence score
         - confidence_max: Maximum confidence score
         """
+        query = self._filtered_inquiry_query(filters)
+
+        # Sorting
+        sort_by = filters.get('sort_by', 'created_at')
+        sort_order = filters.get('sort_order', 'desc')
+
+        if hasattr(Inquiry, sort_by):
+            column = getattr(Inquiry, sort_by)
+            if sort_order == 'desc':
+                query = query.order_by(column.desc())
+            else:
+                query = query.order_by(column.asc())
+
+        # Pagination
+        limit = filters.get('limit', 50)
+        offset = filters.get('offset', 0)
+
+        return query.limit(limit).offset(offset).all()
+
+    def search_inquiries_page(self, filters: Dict[str, Any]) -> Page:
+        """
+        Advanced inquiry search with keyset pagination
+        search_inquiries와 같은 필터, 정렬 컬럼 + id 기준 커서 페이지네이션
+
+        Extra filters:
+        - cursor: 이전 결과의 next_cursor (지정 시 offset 무시)
+        """
+        query = self._filtered_inquiry_query(filters)
+
+        sort_by = filters.get('sort_by', 'created_at')
+        if not hasattr(Inquiry, sort_by):
+            sort_by = 'created_at'
+
+        return keyset_page(
+            query,
+            getattr(Inquiry, sort_by),
+            Inquiry.id,
+            filters.get('limit', 50),
+            cursor=filters.get('cursor'),
+            descending=filters.get('sort_order', 'desc') == 'desc',
+            offset=filters.get('offset', 0)
+        )
+
+    def _filtered_inquiry_query(self, filters: Dict[str, Any]):
+        """검색 필터가 적용된 문의 쿼리 (정렬/페이지네이션 제외)"""
         query = self.db.query(Inquiry)
 
         # Keyword search (full-text like)
@@ -103,22 +149,7 @@ class AdvancedSearchService:
         if 'confidence_max' in filters:
             query = query.filter(Inquiry.confidence_score <= filters['confidence_max'])
 
-        # Sorting
-        sort_by = filters.get('sort_by', 'created_at')
-        sort_order = filters.get('sort_order', 'desc')
-
-        if hasattr(Inquiry, sort_by):
-            column = getattr(Inquiry, sort_by)
-            if sort_order == 'desc':
-                query = query.order_by(column.desc())
-            else:
-                query = query.order_by(column.asc())
-
-        # Pagination
-        limit = filters.get('limit', 50)
-        offset = filters.get('offset', 0)
-
-        return query.limit(limit).offset(offset).all()
+        return query
 
     def save_search_filter(
         self,
@@ -2,12 +2,23 @@
 AI Response Generator using OpenAI
 """
 import json
-from typing import Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from openai import OpenAI
 from loguru import logger
 
 from ..models import Inquiry
 from ..config import settings
+from .ai_stream import strip_markdown, stream_chat_completion
+from .llm_gateway import get_llm_gateway
+
+# 답변 생성 공통 파라미터 (일반 호출/스트리밍 호출 공용)
+GENERATION_PARAMS = {
+    "temperature": 0.7,
+    "max_tokens": 800,
+    "top_p": 0.9,
+    "frequency_penalty": 0.3,
+    "presence_penalty": 0.3
+}
 
 
 class AIResponseGenerator:
@@ -20,7 +31,9 @@ class AIResponseGenerator:
             logger.warning("OpenAI API key not configured")
             self.client = None
         else:
+            # 스트리밍용 클라이언트 (일반 호출은 RPM/TPM 예산을 공유하는 게이트웨이 사용)
             self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.gateway = get_llm_gateway()
 
     def generate_response(
         self,
@@ -53,35 +66,16 @@ class AIResponseGenerator:
             logger.info(f"Generating AI response for inquiry {inquiry.id}")
 
             # Call OpenAI API
-            response = self.client.chat.completions.create(
+            response = self.gateway.complete_sync(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_message}
                 ],
-                temperature=0.7,
-                max_tokens=800,
-                top_p=0.9,
-                frequency_penalty=0.3,
-                presence_penalty=0.3
+                **GENERATION_PARAMS
             )
 
-            # Extract response
-            ai_response = response.choices[0].message.content.strip()
-
-            # Remove markdown formatting
-            ai_response = ai_response.replace('**', '')
-            ai_response = ai_response.replace('__', '')
-            ai_response = ai_response.replace('*', '')
-            ai_response = ai_response.replace('_', '')
-
-            # Parse metadata if included
-            result = {
-                "response_text": ai_response,
-                "model": settings.OPENAI_MODEL,
-                "tokens_used": response.usage.total_tokens,
-                "confidence": self._estimate_confidence(response)
-            }
+            result = self._build_result(response)
 
             logger.success(f"AI response generated for inquiry {inquiry.id}")
             return result
@@ -177,6 +171,101 @@ class AIResponseGenerator:
 
         return message
 
+    def _create_text_message(
+        self,
+        inquiry_text: str,
+        customer_name: str = "고객",
+        product_name: str = None,
+        order_number: str = None
+    ) -> str:
+        """
+        Create user message for a plain text inquiry
+
+        Returns:
+            User message string
+        """
+        return f"""다음 고객 문의에 대한 답변을 작성해주세요.
+
+[고객 정보]
+고객명: {customer_name}
+주문번호: {order_number or 'N/A'}
+상품명: {product_name or 'N/A'}
+
+[문의 내용]
+{inquiry_text}
+
+위 정보를 바탕으로 전문적이고 친절한 답변을 한국어로 작성해주세요."""
+
+    def stream_response(
+        self,
+        inquiry: Inquiry,
+        policy_context: str = "",
+        template_hint: str = ""
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a response token by token (same prompt as generate_response)
+
+        Args:
+            inquiry: Inquiry object
+            policy_context: Related policy information
+            template_hint: Template or guideline hint
+
+        Yields:
+            {"type": "token", "text"} events, then a final
+            {"type": "done", "response_text", "model", "tokens_used", "confidence"}
+            or {"type": "error", "message"}
+        """
+        logger.info(f"Streaming AI response for inquiry {inquiry.id}")
+        yield from self._stream([
+            {"role": "system", "content": self._create_system_prompt(policy_context)},
+            {"role": "user", "content": self._create_user_message(inquiry, template_hint)}
+        ])
+
+    def stream_response_from_text(
+        self,
+        inquiry_text: str,
+        customer_name: str = "고객",
+        product_name: str = None,
+        order_number: str = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a response for a plain text inquiry (same prompt as generate_response_from_text)
+
+        Yields:
+            Same events as stream_response
+        """
+        logger.info("Streaming AI response for text inquiry")
+        yield from self._stream([
+            {"role": "system", "content": self._create_system_prompt("")},
+            {"role": "user", "content": self._create_text_message(inquiry_text, customer_name, product_name, order_number)}
+        ])
+
+    def _stream(self, messages) -> Iterator[Dict[str, Any]]:
+        if not self.client:
+            logger.error("OpenAI client not initialized")
+            yield {"type": "error", "message": "OpenAI client not initialized"}
+            return
+
+        try:
+            for event in stream_chat_completion(
+                self.client,
+                model=settings.OPENAI_MODEL,
+                messages=messages,
+                **GENERATION_PARAMS
+            ):
+                if event["type"] == "done":
+                    event = {
+                        "type": "done",
+                        "response_text": event["response_text"],
+                        "model": settings.OPENAI_MODEL,
+                        "tokens_used": event["tokens_used"],
+                        "confidence": self._confidence_for(event["finish_reason"])
+                    }
+                yield event
+        except Exception as e:
+            logger.error(f"Error streaming AI response: {str(e)}")
+            yield {"type": "error", "message": str(e)}
+
     def _estimate_confidence(self, response) -> float:
         """
         Estimate confidence based on response metadata
@@ -184,6 +273,18 @@ class AIResponseGenerator:
         Args:
             response: OpenAI response object
 
+        Returns:
+            Confidence score (0-100)
+        """
+        return self._confidence_for(getattr(response.choices[0], 'finish_reason', None))
+
+    def _confidence_for(self, finish_reason: Optional[str]) -> float:
+        """
+        Confidence from the completion finish reason
+
+        Args:
+            finish_reason: 'stop', 'length', ...
+
         Returns:
             Confidence score (0-100)
         """
@@ -191,11 +292,10 @@ class AIResponseGenerator:
         base_confidence = 75.0
 
         # Adjust based on finish reason
-        if hasattr(response.choices[0], 'finish_reason'):
-            if response.choices[0].finish_reason == 'stop':
-                base_confidence += 10
-            elif response.choices[0].finish_reason == 'length':
-                base_confidence -= 10
+        if finish_reason == 'stop':
+            base_confidence += 10
+        elif finish_reason == 'length':
+            base_confidence -= 10
 
         return min(100, max(0, base_confidence))
 
@@ -234,7 +334,7 @@ class AIResponseGenerator:
 
 개선된 답변을 작성해주세요. 핵심 정보는 유지하되, 더 자연스럽고 따뜻한 어투로 작성해주세요."""
 
-            response = self.client.chat.completions.create(
+            response = self.gateway.complete_sync(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -244,13 +344,8 @@ class AIResponseGenerator:
                 max_tokens=800
             )
 
-            enhanced = response.choices[0].message.content.strip()
-
             # Remove markdown formatting
-            enhanced = enhanced.replace('**', '')
-            enhanced = enhanced.replace('__', '')
-            enhanced = enhanced.replace('*', '')
-            enhanced = enhanced.replace('_', '')
+            enhanced = strip_markdown(response.choices[0].message.content)
 
             logger.info(f"Template response enhanced for inquiry {inquiry.id}")
 
@@ -299,7 +394,7 @@ class AIResponseGenerator:
   "score": 0-100
 }}"""
 
-            response = self.client.chat.completions.create(
+            response = self.gateway.complete_sync(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -350,50 +445,21 @@ class AIResponseGenerator:
             system_prompt = self._create_system_prompt("")
 
             # Prepare user message for text-only inquiry
-            message = f"""다음 고객 문의에 대한 답변을 작성해주세요.
-
-[고객 정보]
-고객명: {customer_name}
-주문번호: {order_number or 'N/A'}
-상품명: {product_name or 'N/A'}
-
-[문의 내용]
-{inquiry_text}
-
-위 정보를 바탕으로 전문적이고 친절한 답변을 한국어로 작성해주세요."""
+            message = self._create_text_message(inquiry_text, customer_name, product_name, order_number)
 
             logger.info(f"Generating AI response for text inquiry")
 
             # Call OpenAI API
-            response = self.client.chat.completions.create(
+            response = self.gateway.complete_sync(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": message}
                 ],
-                temperature=0.7,
-                max_tokens=800,
-                top_p=0.9,
-                frequency_penalty=0.3,
-                presence_penalty=0.3
+                **GENERATION_PARAMS
             )
 
-            # Extract response
-            ai_response = response.choices[0].message.content.strip()
-
-            # Remove markdown formatting
-            ai_response = ai_response.replace('**', '')
-            ai_response = ai_response.replace('__', '')
-            ai_response = ai_response.replace('*', '')
-            ai_response = ai_response.replace('_', '')
-
-            # Parse metadata if included
-            result = {
-                "response_text": ai_response,
-                "model": settings.OPENAI_MODEL,
-                "tokens_used": response.usage.total_tokens,
-                "confidence": self._estimate_confidence(response)
-            }
+            result = self._build_result(response)
 
             logger.success(f"AI response generated from text inquiry")
             return result
@@ -401,3 +467,72 @@ class AIResponseGenerator:
         except Exception as e:
             logger.error(f"Error generating AI response from text: {str(e)}")
             return None
+
+    async def generate_many_from_text(
+        self,
+        inquiry_texts: List[str],
+        customer_name: str = "고객"
+    ) -> List[Optional[Dict[str, any]]]:
+        """
+        Generate responses for many plain text inquiries concurrently
+
+        Requests go through the shared LLM gateway, so throughput is bounded by
+        the RPM/TPM budget rather than by per-call latency.
+
+        Args:
+            inquiry_texts: Customer inquiry texts
+            customer_name: Customer name used in the prompt
+
+        Returns:
+            Result per inquiry in input order (None where generation failed)
+        """
+        if not self.client:
+            logger.error("OpenAI client not initialized")
+            return [None] * len(inquiry_texts)
+
+        system_prompt = self._create_system_prompt("")
+        responses = await self.gateway.complete_many([
+            {
+                "model": settings.OPENAI_MODEL,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": self._create_text_message(text, customer_name)}
+                ],
+                **GENERATION_PARAMS
+            }
+            for text in inquiry_texts
+        ])
+
+        results = []
+        for response in responses:
+            if isinstance(response, Exception):
+                logger.error(f"Error generating AI response from text: {str(response)}")
+                results.append(None)
+                continue
+            try:
+                results.append(self._build_result(response))
+            except Exception as e:
+                # 응답 하나가 비정상(usage/content 없음 등)이어도 나머지 결과는 유지
+                logger.error(f"Error building AI response from text: {str(e)}")
+                results.append(None)
+
+        logger.success(f"AI responses generated for {sum(1 for r in results if r)}/{len(inquiry_texts)} text inquiries")
+        return results
+
+    def _build_result(self, response) -> Dict[str, any]:
+        """
+        Build the result dictionary from a completion
+
+        Args:
+            response: OpenAI response object
+
+        Returns:
+            Dictionary with response_text and metadata
+        """
+        return {
+            # Markdown formatting removed
+            "response_text": strip_markdown(response.choices[0].message.content),
+            "model": settings.OPENAI_MODEL,
+            "tokens_used": response.usage.total_tokens,
+            "confidence": self._estimate_confidence(response)
+        }
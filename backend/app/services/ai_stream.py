@@ -0,0 +1,114 @@
+"""
+AI Answer Streaming
+AI 답변 토큰 스트리밍
+
+OpenAI 스트리밍 응답(stream=True)을 받는 대로 UI에 전달하기 위한 공통 도구:
+- 마크다운 기호 제거를 토큰 단위로 적용 (완료 후 일괄 처리한 결과와 동일)
+- 토큰 이벤트를 내보내고 마지막에 전체 텍스트/종료 사유/토큰 사용량을 담은 done 이벤트 반환
+- Server-Sent Events 직렬화
+저장은 호출하는 쪽(done 이벤트 수신 후)에서 처리
+"""
+import json
+from typing import Any, Dict, Iterator, Optional
+
+from loguru import logger
+
+# 답변에서 제거하는 마크다운 강조 기호 (**, __, *, _)
+MARKDOWN_CHARS = "*_"
+_MARKDOWN_TABLE = str.maketrans("", "", MARKDOWN_CHARS)
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"
+}
+
+
+def strip_markdown(text: str) -> str:
+    """완성된 답변의 앞뒤 공백과 마크다운 강조 기호 제거"""
+    return text.strip().translate(_MARKDOWN_TABLE)
+
+
+class MarkdownStreamCleaner:
+    """
+    strip_markdown의 증분 버전
+
+    앞쪽 공백은 첫 글자가 나올 때까지 버리고, 뒤쪽 공백은 다음 글자가 올 때까지 보류해
+    모든 조각을 feed한 뒤 finish하면 strip_markdown(전체 텍스트)와 같은 결과가 됨
+    """
+
+    def __init__(self):
+        self._started = False
+        self._pending_space = ""
+        self.text = ""
+
+    def feed(self, delta: str) -> str:
+        """원본 조각을 받아 지금 내보낼 수 있는 정리된 텍스트 반환"""
+        if not self._started:
+            delta = delta.lstrip()
+            if not delta:
+                return ""
+            self._started = True
+
+        body = delta.rstrip()
+        if not body:
+            self._pending_space += delta
+            return ""
+
+        out = (self._pending_space + body).translate(_MARKDOWN_TABLE)
+        self._pending_space = delta[len(body):]
+        self.text += out
+        return out
+
+    def finish(self) -> str:
+        """스트림 종료 (보류 중인 뒤쪽 공백은 버림)"""
+        self._pending_space = ""
+        return self.text
+
+
+def stream_chat_completion(client, **params) -> Iterator[Dict[str, Any]]:
+    """
+    OpenAI 채팅 완성을 스트리밍으로 호출
+
+    Args:
+        client: OpenAI 클라이언트
+        **params: chat.completions.create 인자 (model, messages, temperature 등)
+
+    Yields:
+        {"type": "token", "text": ...} 이벤트들, 마지막에
+        {"type": "done", "response_text", "finish_reason", "tokens_used"}
+    """
+    cleaner = MarkdownStreamCleaner()
+    finish_reason: Optional[str] = None
+    tokens_used: Optional[int] = None
+
+    stream = client.chat.completions.create(
+        stream=True,
+        stream_options={"include_usage": True},
+        **params
+    )
+    for chunk in stream:
+        if getattr(chunk, "usage", None):
+            tokens_used = chunk.usage.total_tokens
+        if not chunk.choices:
+            continue
+        choice = chunk.choices[0]
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+        text = cleaner.feed(choice.delta.content or "") if choice.delta else ""
+        if text:
+            yield {"type": "token", "text": text}
+
+    response_text = cleaner.finish()
+    logger.debug(f"Streamed completion finished ({finish_reason}, {len(response_text)} chars)")
+    yield {
+        "type": "done",
+        "response_text": response_text,
+        "finish_reason": finish_reason,
+        "tokens_used": tokens_used
+    }
+
+
+def sse_event(payload: Dict[str, Any]) -> str:
+    """SSE data 프레임 직렬화"""
+    return f"data: {json.dumps(payload, ensure_ascii=False, default=str)}\n\n"
@@ -0,0 +1,324 @@
+"""
+Audit Log Writer
+감사 로그 버퍼 기록기
+
+요청마다 INSERT + commit 하던 감사 로그 기록을 요청 경로에서 분리:
+- log_action은 메모리 버퍼에 넣고 바로 반환
+- 전용 스레드가 AUDIT_LOG_BATCH_SIZE건이 쌓이거나 AUDIT_LOG_FLUSH_INTERVAL초가 지나면
+  한 트랜잭션으로 일괄 INSERT (group commit)
+- 같은 트랜잭션에서 시간 단위 요약 테이블(audit_log_summary) 카운트를 갱신해
+  보안 대시보드/이상 탐지가 원본 로그를 매번 GROUP BY 하지 않도록 함
+- 일시적 DB 오류는 제한된 횟수만 재시도, 기록할 수 없는 행은 배치를 나눠 찾아낸 뒤 버림
+- 버퍼가 가득 차면 요청 스레드에서 기록하지 않고 새 로그를 버림 (보안 이벤트는 보존)
+- 보안 이벤트는 버퍼에 넣는 시점에 실시간 스트림(security_events)에 추가
+- 종료 시 close_audit_writers()와 atexit 훅으로 남은 버퍼 기록
+기록기는 DB 엔진별로 하나씩 유지
+"""
+import atexit
+import threading
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..config import settings
+from ..models.user import AuditLog, AuditLogSummary
+
+SECURITY_ACTIONS = frozenset([
+    'user.login',
+    'user.logout',
+    'user.login_failed',
+    'user.password_change',
+    'user.role_change',
+    'permission.grant',
+    'permission.revoke',
+    'data.export',
+    'data.delete',
+    'settings.change'
+])
+SECURITY_EVENT_LIMIT = 5000
+
+# 재시도하면 성공할 수 있는 오류 (DB 잠금/연결 끊김/풀 대기 초과), 그 외는 행 자체의 문제로 간주
+TRANSIENT_DB_ERRORS = (OperationalError, PoolTimeoutError)
+
+
+def is_security_event(action: str, status: str) -> bool:
+    """보안 관련 행동 여부"""
+    return action in SECURITY_ACTIONS or status in ('failed', 'blocked')
+
+
+def hour_bucket(value: datetime) -> datetime:
+    """요약 테이블 버킷 시작 시각 (정시)"""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+class AuditLogWriter:
+    """
+    감사 로그 일괄 기록기
+
+    Args:
+        session_factory: 기록용 세션 생성 함수 (요청 세션과 분리)
+        batch_size: 이 건수가 쌓이면 기록 스레드를 깨움
+        flush_interval: 최대 기록 지연(초)
+        max_pending: 버퍼 한도 (넘으면 보안 이벤트가 아닌 새 로그는 버림)
+        max_retries: 일시적 오류로 실패한 배치의 연속 재시도 한도 (넘으면 버림)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_pending: int = 10000,
+        max_retries: int = 5
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()  # 버퍼 보호
+        self._write_lock = threading.Lock()  # 기록은 한 번에 하나씩 (요약 카운트 갱신 순서 보장)
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._retries = 0
+        self._thread: Optional[threading.Thread] = None
+        self.security_events: Deque[Dict[str, Any]] = deque(maxlen=SECURITY_EVENT_LIMIT)
+        self.stats = {"enqueued": 0, "written": 0, "batches": 0, "errors": 0, "dropped": 0}
+
+    def enqueue(
+        self,
+        user_id: int,
+        action: str,
+        resource_type: str,
+        resource_id: Optional[int] = None,
+        details: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        status: str = 'success',
+        timestamp: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """감사 로그 1건을 버퍼에 추가 (DB 기록은 기록 스레드가 수행)"""
+        record = {
+            'user_id': user_id,
+            'action': action,
+            'resource_type': resource_type,
+            'resource_id': resource_id,
+            'details': details,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'timestamp': timestamp or datetime.utcnow()
+        }
+
+        security = is_security_event(action, status)
+        if security:
+            self.security_events.append({
+                'user_id': user_id,
+                'action': action,
+                'timestamp': record['timestamp'],
+                'status': status,
+                'ip_address': ip_address
+            })
+
+        shed = False
+        with self._lock:
+            if not self._closed and len(self._buffer) >= self.max_pending:
+                # 기록이 밀린 경우(DB 장애 등) 요청 스레드에서 기록하지 않고 버림
+                # 보안 이벤트는 가장 오래된 로그를 밀어내고 보존
+                self.stats["dropped"] += 1
+                shed = True
+                if security:
+                    self._buffer.popleft()
+            if not shed or security:
+                self._buffer.append(record)
+                self.stats["enqueued"] += 1
+            pending = len(self._buffer)
+            dropped = self.stats["dropped"]
+
+        if shed and dropped % 1000 == 1:
+            logger.warning(f"Audit log buffer full ({pending} pending), dropped {dropped} records so far")
+
+        if self._closed:
+            # 종료 후에는 기록 스레드가 없으므로 호출한 쪽에서 바로 기록
+            self.flush()
+        else:
+            self._ensure_thread()
+            if pending >= self.batch_size:
+                self._wakeup.set()
+        return record
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def flush(self) -> int:
+        """버퍼에 쌓인 로그를 지금 기록 (기록한 건수 반환)"""
+        written = 0
+        with self._write_lock:
+            while True:
+                with self._lock:
+                    batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                if not batch:
+                    return written
+
+                batch_written, retry = self._write_isolating(batch)
+                written += batch_written
+                if not retry:
+                    self._retries = 0
+                    continue
+
+                # 일시적 오류: 다음 flush에서 재시도 (연속 실패가 한도를 넘으면 버림)
+                self._retries += 1
+                if self._retries <= self.max_retries:
+                    with self._lock:
+                        self._buffer.extendleft(reversed(retry))
+                else:
+                    logger.error(f"Audit log batch dropped after {self.max_retries} retries ({len(retry)} records)")
+                    self._drop(len(retry))
+                    self._retries = 0
+                return written
+
+    def _write_isolating(self, batch: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        배치 기록, 기록할 수 없는 행이 있으면 반씩 나눠 그 행만 버림
+
+        Returns:
+            (기록한 건수, 일시적 오류로 기록하지 못해 재시도할 로그)
+        """
+        try:
+            self._write(batch)
+            return len(batch), []
+        except TRANSIENT_DB_ERRORS as e:
+            logger.warning(f"Audit log batch write failed, will retry ({len(batch)} records): {str(e)}")
+            return 0, batch
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(f"Audit log record dropped: {str(e)} ({batch[0]})")
+                self._drop(1)
+                return 0, []
+            logger.warning(f"Audit log batch write failed, splitting ({len(batch)} records): {str(e)}")
+
+        middle = len(batch) // 2
+        first_written, retry = self._write_isolating(batch[:middle])
+        if retry:
+            return first_written, retry + batch[middle:]
+        second_written, retry = self._write_isolating(batch[middle:])
+        return first_written + second_written, retry
+
+    def _drop(self, count: int):
+        with self._lock:
+            self.stats["dropped"] += count
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        """배치 INSERT + 요약 카운트 갱신을 한 트랜잭션으로 기록 (실패 시 롤백 후 예외 전달)"""
+        db = self.session_factory()
+        try:
+            db.bulk_insert_mappings(AuditLog, batch)
+
+            counts = Counter(
+                (hour_bucket(r['timestamp']), r['user_id'], r['ip_address'], r['action'])
+                for r in batch
+            )
+            buckets = {key[0] for key in counts}
+            actions = {key[3] for key in counts}
+            existing = {
+                (row.bucket_start, row.user_id, row.ip_address, row.action): row
+                for row in db.query(AuditLogSummary).filter(
+                    AuditLogSummary.bucket_start.in_(buckets),
+                    AuditLogSummary.action.in_(actions)
+                )
+            }
+            for key, count in counts.items():
+                row = existing.get(key)
+                if row is not None:
+                    row.count += count
+                else:
+                    bucket_start, user_id, ip_address, action = key
+                    db.add(AuditLogSummary(
+                        bucket_start=bucket_start,
+                        user_id=user_id,
+                        ip_address=ip_address,
+                        action=action,
+                        count=count
+                    ))
+
+            db.commit()
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+        except Exception:
+            db.rollback()
+            self.stats["errors"] += 1
+            raise
+        finally:
+            db.close()
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._buffer:
+                self.flush()
+
+    def close(self, timeout: float = 5.0) -> int:
+        """기록 스레드를 멈추고 남은 버퍼를 기록"""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        written = self.flush()
+        if self._buffer:
+            logger.error(f"Audit log writer closed with {len(self._buffer)} unwritten records")
+        return written
+
+
+_writers: Dict[Engine, AuditLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_audit_writer(bind: Engine) -> AuditLogWriter:
+    """엔진별 공유 기록기"""
+    writer = _writers.get(bind)
+    if writer is None:
+        with _writers_lock:
+            writer = _writers.get(bind)
+            if writer is None:
+                writer = AuditLogWriter(
+                    sessionmaker(autocommit=False, autoflush=False, bind=bind),
+                    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+                    flush_interval=settings.AUDIT_LOG_FLUSH_INTERVAL,
+                    max_pending=settings.AUDIT_LOG_MAX_PENDING,
+                    max_retries=settings.AUDIT_LOG_MAX_RETRIES
+                )
+                _writers[bind] = writer
+    return writer
+
+
+def close_audit_writers():
+    """모든 기록기의 남은 버퍼를 기록하고 종료 (앱 종료 훅)"""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        try:
+            written = writer.close()
+            if written:
+                logger.info(f"Audit log writer flushed {written} records on shutdown")
+        except Exception as e:
+            logger.error(f"Failed to flush audit log writer: {str(e)}")
+
+
+atexit.register(close_audit_writers)
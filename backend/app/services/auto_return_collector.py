@@ -8,6 +8,8 @@ from typing import Optional, Dict, List
 from sqlalchemy.orm import Session
 
 from .coupang_api_client import CoupangAPIClient
+from .product_catalog import ProductCatalog
+from .dashboard_counters import get_dashboard_counters
 from ..models.return_log import ReturnLog
 from ..models.coupang_account import CoupangAccount
 from ..models.auto_return_config import AutoReturnConfig
@@ -77,8 +79,8 @@ class AutoReturnCollector:
             # API 클라이언트 생성
             api_client = CoupangAPIClient(
                 vendor_id=coupang_account.vendor_id,
-                access_key=coupang_account.get_decrypted_access_key(),
-                secret_key=coupang_account.get_decrypted_secret_key()
+                access_key=coupang_account.access_key,
+                secret_key=coupang_account.secret_key
             )
 
             # 반품 데이터 수집
@@ -105,6 +107,9 @@ class AutoReturnCollector:
                     return_requests = response["data"]
                     logger.info(f"{cancel_type} 타입 {len(return_requests)}건의 반품 발견")
 
+                    # 등록상품 정보가 빠진 항목은 카탈로그 미러로 보완
+                    self._fill_product_info(return_requests)
+
                     # 각 반품 항목 처리
                     for return_request in return_requests:
                         return_items = return_request.get("returnItems", [])
@@ -193,6 +198,27 @@ class AutoReturnCollector:
                 "execution_log_id": execution_log.id,
             }
 
+    def _fill_product_info(self, return_requests: List[Dict]):
+        """vendorItemId로 카탈로그 미러를 조회하여 sellerProductId/상품명 보완"""
+        items = [
+            item
+            for return_request in return_requests
+            for item in return_request.get("returnItems", [])
+            if item.get("vendorItemId") and not (item.get("sellerProductId") and item.get("sellerProductName"))
+        ]
+        if not items:
+            return
+
+        found = ProductCatalog.lookup_vendor_items(self.db, [item["vendorItemId"] for item in items])
+        for item in items:
+            info = found.get(int(item["vendorItemId"]))
+            if not info:
+                continue
+            item["sellerProductId"] = item.get("sellerProductId") or info["seller_product_id"]
+            item["sellerProductName"] = item.get("sellerProductName") or info["seller_product_name"]
+            if not (item.get("vendorItemName") or item.get("vendorItemPackageName")) and info["item_name"]:
+                item["vendorItemName"] = info["item_name"]
+
     def _create_default_config(self) -> AutoReturnConfig:
         """기본 설정 생성"""
         default_values = AutoReturnConfig.get_default_config()
@@ -449,24 +475,15 @@ class AutoReturnCollector:
         return query.all()
 
     def get_statistics(self) -> Dict:
-        """수집 통계 조회"""
-        total = self.db.query(ReturnLog).count()
-        pending = self.db.query(ReturnLog).filter(
-            ReturnLog.status == "pending",
-            ReturnLog.naver_processed == False
-        ).count()
-        processed = self.db.query(ReturnLog).filter(
-            ReturnLog.naver_processed == True
-        ).count()
-        failed = self.db.query(ReturnLog).filter(
-            ReturnLog.status == "failed"
-        ).count()
+        """수집 통계 조회 (증분 카운터)"""
+        counts = get_dashboard_counters(self.db).snapshot(self.db, "return_logs").values["return_logs"]
+        total = counts.get("total", 0)
+        pending = counts.get("pending_unprocessed", 0)
+        processed = counts.get("naver:True", 0)
+        failed = counts.get("status:failed", 0)
 
         # 최근 24시간 수집 건수
-        yesterday = datetime.now() - timedelta(days=1)
-        recent_24h = self.db.query(ReturnLog).filter(
-            ReturnLog.created_at >= yesterday
-        ).count()
+        recent_24h = counts.get("recent_24h", 0)
 
         return {
             "total": total,
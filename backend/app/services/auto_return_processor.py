@@ -3,10 +3,12 @@
 네이버 스마트스토어에서 반품을 자동으로 처리
 """
 import logging
+import threading
 import time
-from datetime import datetime
-from typing import Optional, Dict, List
-from sqlalchemy.orm import Session
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional, Dict, List, Callable, Tuple
+from sqlalchemy.orm import Session, sessionmaker
 
 from .naver_smartstore_automation import NaverSmartStoreAutomation
 from .naver_pay_automation import NaverPayAutomation
@@ -20,12 +22,35 @@ from .auto_return_collector import AutoReturnCollector
 logger = logging.getLogger(__name__)
 
 
+# 워커가 선점(processing)한 뒤 이 시간이 지나도 끝나지 않은 반품은 대기 상태로 복구
+STALE_CLAIM_MINUTES = 30
+# 워커가 한 번에 선점하는 반품 수
+WORKER_CLAIM_SIZE = 5
+
+
 class AutoReturnProcessor:
     """자동 반품 처리 클래스"""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        session_factory: Optional[Callable[[], Session]] = None,
+        automation_factory: Optional[Callable[[AutoReturnConfig], NaverPayAutomation]] = None
+    ):
         self.db = db
         self.collector = AutoReturnCollector(db)
+        # 워커별 독립 세션/브라우저 생성기 (테스트에서 교체 가능)
+        self.session_factory = session_factory or sessionmaker(
+            autocommit=False, autoflush=False, bind=db.get_bind()
+        )
+        self.automation_factory = automation_factory or (
+            lambda config: NaverPayAutomation(headless=config.use_headless, timeout=config.selenium_timeout)
+        )
+
+    @staticmethod
+    def _account_credentials(naver_account: NaverAccount) -> Tuple[str, str]:
+        """네이버 로그인 정보 (Selenium 자동화용)"""
+        return naver_account.naver_username or "", naver_account.naver_password
 
     def process_pending_returns(self, config: Optional[AutoReturnConfig] = None, triggered_by: str = "scheduler") -> Dict:
         """
@@ -75,6 +100,10 @@ class AutoReturnProcessor:
                     "failed": 0,
                 }
 
+            # 병렬 워커 모드
+            if (config.process_workers or 1) > 1:
+                return self._process_with_worker_pool(config, execution_log, start_time)
+
             # 네이버 계정 조회
             naver_account = self.db.query(NaverAccount).first()
             if not naver_account:
@@ -116,8 +145,7 @@ class AutoReturnProcessor:
                     })
 
                 # 로그인 및 일괄 처리
-                username = naver_account.get_decrypted_username()
-                password = naver_account.get_decrypted_password()
+                username, password = self._account_credentials(naver_account)
 
                 result = automation.process_return_batch(
                     return_items=return_items,
@@ -216,6 +244,270 @@ class AutoReturnProcessor:
                 "execution_log_id": execution_log.id,
             }
 
+    # ========== 병렬 워커 모드 ==========
+
+    def release_stale_claims(self, older_than_minutes: int = STALE_CLAIM_MINUTES) -> int:
+        """
+        중단된 워커가 선점한 채 남은 반품을 대기 상태로 복구
+
+        Returns:
+            복구된 건수
+        """
+        cutoff = datetime.now() - timedelta(minutes=older_than_minutes)
+        released = self.db.query(ReturnLog).filter(
+            ReturnLog.status == "processing",
+            ReturnLog.naver_processed == False,
+            ReturnLog.updated_at < cutoff
+        ).update(
+            {ReturnLog.status: "pending", ReturnLog.processed_by: None, ReturnLog.updated_at: datetime.now()},
+            synchronize_session=False
+        )
+        self.db.commit()
+        if released:
+            logger.warning(f"선점 후 방치된 반품 {released}건을 대기 상태로 복구")
+        return released
+
+    @staticmethod
+    def claim_returns(
+        session: Session,
+        worker_id: str,
+        config: AutoReturnConfig,
+        limit: int
+    ) -> List[ReturnLog]:
+        """
+        대기 반품을 행 단위로 선점
+
+        후보를 조회한 뒤 "status가 아직 pending인 경우에만 processing으로 변경"하는
+        조건부 UPDATE로 한 건씩 선점하므로, 여러 워커(프로세스/머신 포함)가 같은
+        반품을 동시에 가져가지 않습니다.
+
+        Returns:
+            이 워커가 선점한 반품 목록
+        """
+        if limit <= 0:
+            return []
+
+        candidates = AutoReturnCollector(session).get_pending_returns(config=config, limit=limit * 2)
+        claimed_ids = []
+        for candidate in candidates:
+            updated = session.query(ReturnLog).filter(
+                ReturnLog.id == candidate.id,
+                ReturnLog.status == "pending"
+            ).update(
+                {ReturnLog.status: "processing", ReturnLog.processed_by: worker_id, ReturnLog.updated_at: datetime.now()},
+                synchronize_session=False
+            )
+            session.commit()
+            if updated:
+                claimed_ids.append(candidate.id)
+                if len(claimed_ids) >= limit:
+                    break
+
+        if not claimed_ids:
+            return []
+
+        session.expire_all()
+        return session.query(ReturnLog).filter(ReturnLog.id.in_(claimed_ids)).order_by(ReturnLog.id).all()
+
+    def _run_worker(
+        self,
+        worker_id: str,
+        naver_account_id: int,
+        config_id: int,
+        budget: Dict,
+        budget_lock: threading.Lock
+    ) -> Dict:
+        """
+        워커 1개 실행: 독립 세션 + 독립 브라우저로 로그인 후 반품을 선점하며 처리
+
+        Returns:
+            워커 처리 결과
+        """
+        session = self.session_factory()
+        automation = None
+        summary = {
+            "worker_id": worker_id,
+            "naver_account_id": naver_account_id,
+            "processed": 0,
+            "failed": 0,
+            "errors": [],
+        }
+
+        try:
+            config = session.get(AutoReturnConfig, config_id)
+            account = session.get(NaverAccount, naver_account_id)
+            username, password = self._account_credentials(account)
+
+            automation = self.automation_factory(config)
+            if not automation.driver:
+                automation.setup_driver()
+            if not automation.login(username, password):
+                summary["errors"].append(f"[{worker_id}] 로그인 실패")
+                return summary
+            if not automation.navigate_to_payment_history():
+                summary["errors"].append(f"[{worker_id}] 결제내역 페이지 이동 실패")
+                return summary
+
+            while True:
+                with budget_lock:
+                    take = min(WORKER_CLAIM_SIZE, budget["remaining"])
+                    budget["remaining"] -= take
+                if take <= 0:
+                    break
+
+                claimed = self.claim_returns(session, worker_id, config, take)
+                with budget_lock:
+                    budget["remaining"] += take - len(claimed)
+                if not claimed:
+                    break
+
+                for index, return_log in enumerate(claimed):
+                    try:
+                        success, error_msg = automation.process_single_return(
+                            return_log.product_name,
+                            return_log.receiver_name or ""
+                        )
+                    except Exception as e:
+                        success, error_msg = False, f"항목 처리 중 오류: {str(e)}"
+
+                    if success:
+                        return_log.status = "completed"
+                        return_log.naver_processed = True
+                        return_log.naver_processed_at = datetime.now()
+                        return_log.naver_process_type = "NAVERPAY_RETURN"
+                        return_log.naver_result = f"네이버페이에서 반품 처리 완료 ({worker_id})"
+                        return_log.naver_error = None
+                        summary["processed"] += 1
+                    else:
+                        return_log.status = "failed"
+                        return_log.naver_error = error_msg or "반품 처리 실패"
+                        summary["failed"] += 1
+                        if error_msg:
+                            summary["errors"].append(error_msg)
+
+                    try:
+                        session.commit()
+                    except Exception:
+                        session.rollback()
+                        # 나머지 선점분은 다른 워커/다음 실행이 가져가도록 반환
+                        self._release_claims(session, [r.id for r in claimed[index + 1:]])
+                        raise
+
+            return summary
+
+        except Exception as e:
+            error_msg = f"[{worker_id}] 워커 오류: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            summary["errors"].append(error_msg)
+            return summary
+
+        finally:
+            if automation:
+                try:
+                    automation.close()
+                except Exception as e:
+                    logger.warning(f"[{worker_id}] 브라우저 종료 중 오류: {str(e)}")
+            session.close()
+
+    @staticmethod
+    def _release_claims(session: Session, return_log_ids: List[int]):
+        """처리하지 못한 선점 반품을 대기 상태로 반환"""
+        if not return_log_ids:
+            return
+        session.query(ReturnLog).filter(
+            ReturnLog.id.in_(return_log_ids),
+            ReturnLog.status == "processing"
+        ).update(
+            {ReturnLog.status: "pending", ReturnLog.processed_by: None},
+            synchronize_session=False
+        )
+        session.commit()
+
+    def _process_with_worker_pool(
+        self,
+        config: AutoReturnConfig,
+        execution_log: AutoReturnExecutionLog,
+        start_time: datetime
+    ) -> Dict:
+        """
+        병렬 워커 모드로 대기 반품 처리
+
+        반품 로그에는 계정 정보가 없으므로 모든 워커가 같은 네이버 계정
+        (기본 계정, 없으면 로그인 정보가 있는 첫 활성 계정)으로 로그인하고,
+        각 워커가 독립 브라우저로 반품을 선점하며 처리한 결과를
+        하나의 실행 로그에 합산합니다.
+        """
+        account = self.db.query(NaverAccount).filter(
+            NaverAccount.is_active == True,
+            NaverAccount.naver_username.isnot(None),
+            NaverAccount.naver_username != "",
+            NaverAccount.naver_password_encrypted.isnot(None)
+        ).order_by(NaverAccount.is_default.desc(), NaverAccount.id).first()
+        if not account:
+            raise Exception("네이버 계정 정보가 없습니다.")
+
+        self.release_stale_claims()
+
+        worker_count = config.process_workers
+        budget = {"remaining": config.process_batch_size}
+        budget_lock = threading.Lock()
+
+        logger.info(f"병렬 반품 처리 시작: 워커 {worker_count}개, 계정 {account.name}")
+
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="return-worker") as executor:
+            futures = [
+                executor.submit(
+                    self._run_worker,
+                    f"worker-{i + 1}",
+                    account.id,
+                    config.id,
+                    budget,
+                    budget_lock
+                )
+                for i in range(worker_count)
+            ]
+            worker_results = [future.result() for future in futures]
+
+        processed_count = sum(r["processed"] for r in worker_results)
+        failed_count = sum(r["failed"] for r in worker_results)
+        errors = [error for r in worker_results for error in r["errors"]]
+        total = processed_count + failed_count
+
+        config.last_process_at = datetime.now()
+        config.last_process_count = processed_count
+        config.last_error = None if not errors else "\n".join(errors[:5])
+
+        end_time = datetime.now()
+        execution_log.status = "success" if failed_count == 0 and not errors else "partial"
+        execution_log.completed_at = end_time
+        execution_log.duration_seconds = int((end_time - start_time).total_seconds())
+        execution_log.total_items = total
+        execution_log.success_count = processed_count
+        execution_log.failed_count = failed_count
+        execution_log.details = {
+            "mode": "worker_pool",
+            "workers": [
+                {k: v for k, v in r.items() if k != "errors"} for r in worker_results
+            ],
+            "errors": errors[:10]
+        }
+        execution_log.config_snapshot = config.to_dict()
+        self.db.commit()
+
+        result = {
+            "success": True,
+            "message": f"총 {total}건 처리 (성공: {processed_count}, 실패: {failed_count}, 워커: {worker_count}개)",
+            "total": total,
+            "processed": processed_count,
+            "failed": failed_count,
+            "errors": errors,
+            "workers": execution_log.details["workers"],
+            "timestamp": datetime.now().isoformat(),
+            "execution_log_id": execution_log.id,
+        }
+        logger.info(f"처리 완료: {result['message']}")
+        return result
+
     def _process_single_return_with_retry(
         self,
         automation: NaverSmartStoreAutomation,
@@ -296,14 +296,14 @@ class AutoWorkflow:
 
         results["processed"] = len(pending_responses)
 
+        # Re-validate in one batch (unchanged responses reuse their stored result)
+        validations = self.validator.validate_many(pending_responses)
+
         for response in pending_responses:
             try:
-                # Re-validate
-                inquiry = self.db.query(Inquiry).filter(
-                    Inquiry.id == response.inquiry_id
-                ).first()
-
-                validation = self.validator.validate_response(response, inquiry)
+                validation = validations.get(response.id)
+                if validation is None:
+                    continue
 
                 # Check if can auto-approve
                 if self._can_auto_approve(response, validation):
@@ -13,7 +13,7 @@ from ..config import settings
 class CoupangAPIClient:
     """Coupang Open API 클라이언트"""
 
-    BASE_URL = "https://api-gateway.coupang.com"
+    BASE_URL = settings.COUPANG_API_BASE_URL
 
     def __init__(
         self,
@@ -5,19 +5,42 @@ Coupang Shipment Service
 import hmac
 import hashlib
 import datetime
+import random
+import threading
+import time
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List
 from urllib.parse import quote
 from loguru import logger
 from sqlalchemy.orm import Session
 
+from ..config import settings
 from ..models.naver_delivery_sync import CoupangPendingOrder, get_coupang_courier_code
+from .delivery_order_matcher import OrderMatchIndex
+from .product_catalog import ProductCatalog
 
 
 class CoupangShipmentService:
     """쿠팡 발주서/송장 API 서비스"""
 
-    BASE_URL = "https://api-gateway.coupang.com"
+    BASE_URL = settings.COUPANG_API_BASE_URL
+
+    # 송장 일괄 업로드 설정
+    UPLOAD_MAX_WORKERS = 8
+    UPLOAD_CHUNK_SIZE = 100
+    UPLOAD_MAX_RETRIES = 3
+    UPLOAD_BACKOFF_BASE = 1.0  # 초
+    TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+    # 재시도 중 앞선 시도가 반영된 경우의 응답 문구 ("이미지" 등 다른 오류와 구분되도록 구체적으로)
+    ALREADY_UPLOADED_MARKERS = ("이미 등록", "이미 송장", "이미 처리", "already registered", "already uploaded", "already exists")
+
+    # 성공한 송장 멱등성 키 (프로세스 내 공유, 재시도/재실행 시 중복 전송 방지)
+    COMPLETED_INVOICE_CACHE_SIZE = 20000
+    _completed_invoices: "OrderedDict[str, Dict]" = OrderedDict()
+    _completed_lock = threading.Lock()
 
     def __init__(
         self,
@@ -30,6 +53,7 @@ class CoupangShipmentService:
         self.access_key = access_key
         self.secret_key = secret_key
         self.vendor_id = vendor_id
+        self._http_session: Optional[requests.Session] = None
 
     def _generate_hmac(self, method: str, path: str, query: str = "") -> tuple:
         """HMAC 서명 생성"""
@@ -173,6 +197,157 @@ class CoupangShipmentService:
         orders = query.order_by(CoupangPendingOrder.created_at.desc()).all()
         return [order.to_dict() for order in orders]
 
+    @staticmethod
+    def invoice_idempotency_key(invoice: Dict) -> str:
+        """송장 멱등성 키 (배송번호 + 옵션ID + 송장번호)"""
+        raw = f"{invoice['shipment_box_id']}|{invoice['vendor_item_id']}|{invoice['tracking_number']}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+    def _get_http_session(self) -> requests.Session:
+        """송장 업로드용 HTTP 세션 (커넥션 풀 재사용)"""
+        if self._http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.UPLOAD_MAX_WORKERS,
+                pool_maxsize=self.UPLOAD_MAX_WORKERS
+            )
+            session.mount("https://", adapter)
+            self._http_session = session
+        return self._http_session
+
+    def _post_invoice(self, invoice: Dict) -> Dict[str, Any]:
+        """
+        송장 등록 API 호출 (DB 쓰기 없음, 스레드에서 호출 가능)
+
+        Returns:
+            업로드 결과 (transient: 재시도 가능한 실패 여부)
+        """
+        path = f"/v2/providers/openapi/apis/api/v4/vendors/{self.vendor_id}/orders/invoices"
+
+        body = {
+            "vendorId": self.vendor_id,
+            "orderSheetInvoiceApplyDtos": [
+                {
+                    "shipmentBoxId": int(invoice["shipment_box_id"]),
+                    "orderId": int(invoice["order_id"]),
+                    "vendorItemId": int(invoice["vendor_item_id"]),
+                    "deliveryCompanyCode": invoice["courier_code"],
+                    "invoiceNumber": invoice["tracking_number"],
+                    "splitShipping": False,
+                    "preSplitShipped": False,
+                    "estimatedShippingDate": ""
+                }
+            ]
+        }
+
+        result = {
+            "success": False,
+            "status_code": None,
+            "response": None,
+            "error": None,
+            "transient": False
+        }
+
+        try:
+            url = f"{self.BASE_URL}{path}"
+            headers = self._get_headers("POST", path, "")
+
+            logger.info(f"Uploading invoice to Coupang: {invoice['tracking_number']} for order {invoice['order_id']}")
+
+            response = self._get_http_session().post(url, headers=headers, json=body, timeout=30)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            result["error"] = str(e)
+            result["transient"] = True
+            return result
+        except Exception as e:
+            result["error"] = str(e)
+            return result
+
+        result["status_code"] = response.status_code
+
+        if response.status_code == 200:
+            try:
+                data = response.json()
+            except ValueError:
+                result["error"] = f"Invalid JSON response: {response.text[:200]}"
+                logger.error(f"Invoice upload returned non-JSON body: {invoice['tracking_number']}")
+                return result
+            result["response"] = data
+
+            # 응답 확인
+            response_list = data.get("data", {}).get("responseList", [])
+            if response_list:
+                first_result = response_list[0]
+                if first_result.get("succeed"):
+                    result["success"] = True
+                    logger.success(f"Invoice uploaded successfully: {invoice['tracking_number']}")
+                else:
+                    result["error"] = first_result.get("resultMessage") or first_result.get("resultCode")
+                    logger.error(f"Invoice upload failed: {result['error']}")
+            else:
+                result["success"] = True
+        else:
+            result["error"] = response.text
+            result["transient"] = response.status_code in self.TRANSIENT_STATUS_CODES
+            logger.error(f"Invoice upload HTTP error: {response.status_code} - {response.text}")
+
+        return result
+
+    @classmethod
+    def _is_already_uploaded(cls, error: Optional[str]) -> bool:
+        """이미 등록된 송장이라는 오류 응답인지 여부"""
+        message = str(error or "").lower()
+        return any(marker.lower() in message for marker in cls.ALREADY_UPLOADED_MARKERS)
+
+    def _upload_with_retry(self, invoice: Dict, idempotency_key: str) -> Dict[str, Any]:
+        """
+        재시도 포함 송장 업로드 (일시적 실패만 지수 백오프로 재시도)
+
+        같은 멱등성 키로 이미 성공한 송장은 다시 전송하지 않으며,
+        재시도 중 "이미 등록됨" 응답은 앞선 시도가 반영된 것으로 보고 성공 처리
+        """
+        with self._completed_lock:
+            completed = self._completed_invoices.get(idempotency_key)
+        if completed is not None:
+            return {**completed, "skipped": True, "attempts": 0}
+
+        result: Dict[str, Any] = {}
+        for attempt in range(self.UPLOAD_MAX_RETRIES + 1):
+            result = self._post_invoice(invoice)
+            result["attempts"] = attempt + 1
+
+            if (
+                not result["success"]
+                and attempt > 0
+                and self._is_already_uploaded(result.get("error"))
+            ):
+                result["success"] = True
+                result["error"] = None
+
+            if result["success"] or not result["transient"]:
+                break
+
+            if attempt < self.UPLOAD_MAX_RETRIES:
+                delay = self.UPLOAD_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, self.UPLOAD_BACKOFF_BASE)
+                logger.warning(
+                    f"Transient invoice upload failure ({invoice['tracking_number']}), "
+                    f"retry {attempt + 1}/{self.UPLOAD_MAX_RETRIES} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+        if result["success"]:
+            with self._completed_lock:
+                self._completed_invoices[idempotency_key] = {
+                    "success": True,
+                    "status_code": result.get("status_code"),
+                    "response": result.get("response"),
+                    "error": None
+                }
+                while len(self._completed_invoices) > self.COMPLETED_INVOICE_CACHE_SIZE:
+                    self._completed_invoices.popitem(last=False)
+
+        return result
+
     def upload_invoice(
         self,
         shipment_box_id: str,
@@ -194,95 +369,67 @@ class CoupangShipmentService:
         Returns:
             업로드 결과
         """
-        try:
-            path = f"/v2/providers/openapi/apis/api/v4/vendors/{self.vendor_id}/orders/invoices"
-
-            body = {
-                "vendorId": self.vendor_id,
-                "orderSheetInvoiceApplyDtos": [
-                    {
-                        "shipmentBoxId": int(shipment_box_id),
-                        "orderId": int(order_id),
-                        "vendorItemId": int(vendor_item_id),
-                        "deliveryCompanyCode": courier_code,
-                        "invoiceNumber": tracking_number,
-                        "splitShipping": False,
-                        "preSplitShipped": False,
-                        "estimatedShippingDate": ""
-                    }
-                ]
-            }
-
-            url = f"{self.BASE_URL}{path}"
-            headers = self._get_headers("POST", path, "")
-
-            logger.info(f"Uploading invoice to Coupang: {tracking_number} for order {order_id}")
-
-            response = requests.post(url, headers=headers, json=body, timeout=30)
+        result = self._post_invoice({
+            "shipment_box_id": shipment_box_id,
+            "order_id": order_id,
+            "vendor_item_id": vendor_item_id,
+            "courier_code": courier_code,
+            "tracking_number": tracking_number
+        })
+        result.pop("transient", None)
 
-            result = {
-                "success": False,
-                "status_code": response.status_code,
-                "response": None,
-                "error": None
-            }
-
-            if response.status_code == 200:
-                data = response.json()
-                result["response"] = data
-
-                # 응답 확인
-                response_list = data.get("data", {}).get("responseList", [])
-                if response_list:
-                    first_result = response_list[0]
-                    if first_result.get("succeed"):
-                        result["success"] = True
-                        logger.success(f"Invoice uploaded successfully: {tracking_number}")
-
-                        # DB 업데이트
-                        self._mark_invoice_uploaded(shipment_box_id)
-                    else:
-                        result["error"] = first_result.get("resultMessage") or first_result.get("resultCode")
-                        logger.error(f"Invoice upload failed: {result['error']}")
-                else:
-                    result["success"] = True
-                    self._mark_invoice_uploaded(shipment_box_id)
-            else:
-                result["error"] = response.text
-                logger.error(f"Invoice upload HTTP error: {response.status_code} - {response.text}")
-
-            return result
+        if result["success"]:
+            # DB 업데이트
+            self._mark_invoice_uploaded(shipment_box_id)
 
-        except Exception as e:
-            logger.error(f"Error uploading invoice: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return result
 
     def _mark_invoice_uploaded(self, shipment_box_id: str):
         """송장 업로드 완료 표시"""
+        self._mark_invoices_uploaded([shipment_box_id])
+
+    def _mark_invoices_uploaded(self, shipment_box_ids: List[str]):
+        """송장 업로드 완료 일괄 표시 (단일 UPDATE + commit)"""
+        if not shipment_box_ids:
+            return
+
         try:
-            order = self.db.query(CoupangPendingOrder).filter(
-                CoupangPendingOrder.shipment_box_id == shipment_box_id
-            ).first()
-
-            if order:
-                order.is_invoice_uploaded = True
-                order.status = "DEPARTURE"
-                order.updated_at = datetime.datetime.utcnow()
-                self.db.commit()
+            self.db.query(CoupangPendingOrder).filter(
+                CoupangPendingOrder.shipment_box_id.in_([str(i) for i in shipment_box_ids])
+            ).update(
+                {
+                    CoupangPendingOrder.is_invoice_uploaded: True,
+                    CoupangPendingOrder.status: "DEPARTURE",
+                    CoupangPendingOrder.updated_at: datetime.datetime.utcnow()
+                },
+                synchronize_session=False
+            )
+            self.db.commit()
 
         except Exception as e:
             logger.error(f"Error marking invoice uploaded: {e}")
             self.db.rollback()
 
+    def _get_uploaded_shipment_box_ids(self, shipment_box_ids: List[str]) -> set:
+        """이미 송장이 등록된 배송번호 조회 (단일 쿼리)"""
+        rows = self.db.query(CoupangPendingOrder.shipment_box_id).filter(
+            CoupangPendingOrder.shipment_box_id.in_([str(i) for i in shipment_box_ids]),
+            CoupangPendingOrder.is_invoice_uploaded == True
+        ).all()
+        return {row[0] for row in rows}
+
     def upload_invoices_batch(
         self,
-        invoices: List[Dict]
+        invoices: List[Dict],
+        max_workers: int = None,
+        chunk_size: int = None
     ) -> Dict[str, Any]:
         """
-        송장 일괄 업로드
+        송장 일괄 업로드 (병렬)
+
+        청크 단위로 최대 max_workers개를 동시에 전송하고, 일시적 실패(타임아웃,
+        429, 5xx)는 지수 백오프로 재시도합니다. 업로드 완료 표시는 청크마다
+        한 번에 DB에 반영합니다.
 
         Args:
             invoices: 송장 정보 리스트
@@ -293,43 +440,131 @@ class CoupangShipmentService:
                     "courier_code": "EPOST",
                     "tracking_number": "..."
                 }]
+            max_workers: 동시 전송 수 (기본 UPLOAD_MAX_WORKERS)
+            chunk_size: DB 반영 단위 (기본 UPLOAD_CHUNK_SIZE)
 
         Returns:
-            업로드 결과
+            업로드 결과 (details는 invoices와 같은 순서)
         """
+        max_workers = max_workers or self.UPLOAD_MAX_WORKERS
+        chunk_size = chunk_size or self.UPLOAD_CHUNK_SIZE
+
         results = {
             "total": len(invoices),
             "success": 0,
             "failed": 0,
+            "skipped": 0,
+            "retried": 0,
             "details": []
         }
 
-        for invoice in invoices:
-            result = self.upload_invoice(
-                shipment_box_id=invoice["shipment_box_id"],
-                order_id=invoice["order_id"],
-                vendor_item_id=invoice["vendor_item_id"],
-                courier_code=invoice["courier_code"],
-                tracking_number=invoice["tracking_number"]
-            )
+        seen_keys = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_start in range(0, len(invoices), chunk_size):
+                chunk = invoices[chunk_start:chunk_start + chunk_size]
+                already_uploaded = self._get_uploaded_shipment_box_ids(
+                    [invoice["shipment_box_id"] for invoice in chunk]
+                )
+
+                chunk_results: List[Optional[Dict[str, Any]]] = [None] * len(chunk)
+                futures = {}
+
+                for position, invoice in enumerate(chunk):
+                    key = self.invoice_idempotency_key(invoice)
+
+                    if key in seen_keys:
+                        chunk_results[position] = {
+                            "success": False,
+                            "skipped": True,
+                            "error": "duplicate invoice in batch",
+                            "idempotency_key": key
+                        }
+                        continue
+                    seen_keys.add(key)
+
+                    if str(invoice["shipment_box_id"]) in already_uploaded:
+                        chunk_results[position] = {
+                            "success": True,
+                            "skipped": True,
+                            "error": None,
+                            "idempotency_key": key
+                        }
+                        continue
+
+                    futures[executor.submit(self._upload_with_retry, invoice, key)] = (position, key)
+
+                for future in as_completed(futures):
+                    position, key = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"success": False, "error": str(e)}
+                    result.pop("transient", None)
+                    result["idempotency_key"] = key
+                    chunk_results[position] = result
+
+                # 청크 단위 일괄 DB 반영
+                self._mark_invoices_uploaded([
+                    invoice["shipment_box_id"]
+                    for invoice, result in zip(chunk, chunk_results)
+                    if result["success"] and not result.get("skipped")
+                ])
+
+                for invoice, result in zip(chunk, chunk_results):
+                    if result.get("skipped"):
+                        results["skipped"] += 1
+                    if result["success"]:
+                        results["success"] += 1
+                    else:
+                        results["failed"] += 1
+                    if result.get("attempts", 1) > 1:
+                        results["retried"] += 1
+
+                    results["details"].append({
+                        "order_id": invoice["order_id"],
+                        "tracking_number": invoice["tracking_number"],
+                        **result
+                    })
+
+        logger.info(
+            f"Invoice batch upload: {results['success']}/{results['total']} succeeded, "
+            f"{results['failed']} failed, {results['skipped']} skipped, {results['retried']} retried"
+        )
+        return results
 
-            if result["success"]:
-                results["success"] += 1
-            else:
-                results["failed"] += 1
+    def build_order_index(self, orders: List[Dict] = None) -> OrderMatchIndex:
+        """
+        발주서 매칭 인덱스 생성
 
-            results["details"].append({
-                "order_id": invoice["order_id"],
-                "tracking_number": invoice["tracking_number"],
-                **result
-            })
+        Args:
+            orders: 쿠팡 발주서 목록 (없으면 DB에서 한 번 조회)
 
-        return results
+        Returns:
+            매칭 인덱스
+        """
+        if orders is None:
+            orders = self.get_pending_orders_from_db()
+
+        # 카탈로그 미러의 등록상품명을 상품명 토큰에 추가 (옵션명보다 네이버 상품명과 겹치는 경우가 많음)
+        catalog = ProductCatalog.lookup_vendor_items(
+            self.db, [o.get("vendor_item_id") for o in orders if o.get("vendor_item_id")]
+        )
+        if catalog:
+            enriched = []
+            for order in orders:
+                vendor_item_id = str(order.get("vendor_item_id") or "")
+                info = catalog.get(int(vendor_item_id)) if vendor_item_id.isdigit() else None
+                enriched.append({**order, "catalog_product_name": info["seller_product_name"]} if info else order)
+            orders = enriched
+        return OrderMatchIndex(orders)
 
     def match_delivery_with_orders(
         self,
         receiver_name: str,
-        orders: List[Dict] = None
+        orders: List[Dict] = None,
+        product_name: str = None,
+        index: OrderMatchIndex = None
     ) -> Optional[Dict]:
         """
         수취인 이름으로 주문 매칭
@@ -337,80 +572,38 @@ class CoupangShipmentService:
         Args:
             receiver_name: 네이버에서 가져온 수취인 이름
             orders: 쿠팡 발주서 목록 (없으면 DB에서 조회)
+            product_name: 상품명 (동일 등급 후보 간 순위 결정)
+            index: 미리 생성한 매칭 인덱스 (있으면 orders 무시)
 
         Returns:
-            매칭된 주문 정보
+            매칭된 주문 정보 (confidence, candidates, ambiguity 포함)
         """
-        if orders is None:
-            orders = self.get_pending_orders_from_db()
+        if index is None:
+            index = self.build_order_index(orders)
+        return index.match(receiver_name, product_name)
 
-        # 정확한 이름 매칭
-        for order in orders:
-            order_receiver = order.get("receiver_name", "")
-
-            # 마스킹 제거 후 비교 (예: 유*익 → 유병익)
-            # 쿠팡은 마스킹된 이름 (신*희)으로 오는 경우가 있음
-            if self._names_match(receiver_name, order_receiver):
-                return {
-                    "matched": True,
-                    "confidence": 100,
-                    "order": order
-                }
-
-        # 부분 매칭 시도
-        for order in orders:
-            order_receiver = order.get("receiver_name", "")
-            if self._partial_name_match(receiver_name, order_receiver):
-                return {
-                    "matched": True,
-                    "confidence": 70,
-                    "order": order
-                }
-
-        return {
-            "matched": False,
-            "confidence": 0,
-            "order": None
-        }
-
-    def _names_match(self, name1: str, name2: str) -> bool:
-        """이름 매칭 (마스킹 고려)"""
-        if not name1 or not name2:
-            return False
-
-        # 완전 일치
-        if name1 == name2:
-            return True
-
-        # 마스킹 패턴 확인 (예: 신*희)
-        if '*' in name2:
-            # 첫글자와 마지막 글자 비교
-            if len(name1) == len(name2):
-                if name1[0] == name2[0] and name1[-1] == name2[-1]:
-                    return True
-
-        if '*' in name1:
-            if len(name1) == len(name2):
-                if name1[0] == name2[0] and name1[-1] == name2[-1]:
-                    return True
-
-        return False
-
-    def _partial_name_match(self, name1: str, name2: str) -> bool:
-        """부분 이름 매칭"""
-        if not name1 or not name2:
-            return False
-
-        # 공백 제거
-        n1 = name1.replace(" ", "")
-        n2 = name2.replace(" ", "").replace("*", "")
-
-        # 한 이름이 다른 이름에 포함되는 경우
-        if n1 in n2 or n2 in n1:
-            return True
+    def match_deliveries_batch(
+        self,
+        deliveries: List[Dict],
+        orders: List[Dict] = None
+    ) -> List[Dict]:
+        """
+        배송 정보 일괄 매칭 (발주서당 최대 1건)
 
-        # 첫 글자와 글자수 비교
-        if len(n1) == len(n2) and n1[0] == n2[0]:
-            return True
+        Args:
+            deliveries: 네이버 배송 정보 리스트 ({"recipient", "product_name", ...})
+            orders: 쿠팡 발주서 목록 (없으면 DB에서 조회)
 
-        return False
+        Returns:
+            deliveries와 같은 순서의 매칭 결과 리스트
+        """
+        index = self.build_order_index(orders)
+        results = index.assign(deliveries)
+
+        matched = sum(1 for r in results if r["matched"])
+        ambiguous = sum(1 for r in results if r["matched"] and r["ambiguity"] > 0)
+        logger.info(
+            f"Matched {matched}/{len(deliveries)} deliveries against {len(index)} orders "
+            f"({ambiguous} ambiguous)"
+        )
+        return results
@@ -8,12 +8,13 @@ import datetime
 import requests
 from typing import Optional, Dict, Any, List
 from loguru import logger
+from ..config import settings
 
 
 class CouponAPIClient:
     """쿠팡 쿠폰 API 클라이언트"""
 
-    BASE_URL = "https://api-gateway.coupang.com"
+    BASE_URL = settings.COUPANG_API_BASE_URL
 
     def __init__(
         self,
@@ -6,16 +6,28 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
 from loguru import logger
-import time
 
+from ..core.pagination import count_total, keyset_page
+from .account_fanout import run_per_account, summarize
 from .coupon_api_client import CouponAPIClient
-from ..models.coupon_config import CouponAutoSyncConfig, ProductCouponTracking, CouponApplyLog, BulkApplyProgress
+from .coupon_request_tracker import CouponRequestTracker, extract_requested_id
+from .dashboard_counters import DashboardSnapshot, get_dashboard_counters
+from .product_catalog import ProductCatalog
+from ..models.coupon_config import (
+    CouponAutoSyncConfig, ProductCouponTracking, CouponApplyLog, BulkApplyProgress, CouponRequestStatus
+)
 from ..models.coupang_account import CoupangAccount
 
+# 쿠폰 통계가 사용하는 대시보드 카운터 그룹 (ETag 범위)
+COUPON_COUNTER_GROUPS = ("coupon_tracking", "coupon_apply_logs")
+
 
 class CouponAutoSyncService:
     """쿠폰 자동연동 서비스"""
 
+    # 작업 종료 시 비동기 요청 결과를 기다리는 최대 시간 (남은 요청은 스케줄러가 확정)
+    REQUEST_DRAIN_TIMEOUT = 30
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -28,6 +40,10 @@ class CouponAutoSyncService:
             wing_username=account.wing_username
         )
 
+    def _get_catalog(self, coupang_account_id: int, client: CouponAPIClient) -> ProductCatalog:
+        """계정의 상품 카탈로그 미러"""
+        return ProductCatalog(self.db, coupang_account_id, client)
+
     # ==================== 설정 관리 ====================
 
     def get_config(self, coupang_account_id: int) -> Optional[CouponAutoSyncConfig]:
@@ -276,8 +292,8 @@ class CouponAutoSyncService:
         client = self._get_api_client(account)
 
         try:
-            # 해당 날짜에 승인완료된 상품 조회
-            products = client.get_all_products_by_date(
+            # 해당 날짜에 승인완료된 상품 조회 (최근 동기화된 날짜는 카탈로그 미러에서 조회)
+            products = self._get_catalog(coupang_account_id, client).list_products_created_on(
                 created_at=target_date,
                 status="APPROVED"
             )
@@ -398,6 +414,7 @@ class CouponAutoSyncService:
             return {"success": False, "message": "자동연동이 비활성화되어 있습니다."}
 
         client = self._get_api_client(account)
+        tracker = CouponRequestTracker(self.db, client, coupang_account_id)
         now = datetime.utcnow()
 
         # 적용 예정일이 지난 pending 상품 조회
@@ -410,22 +427,29 @@ class CouponAutoSyncService:
         if not pending_trackings:
             return {"success": True, "message": "적용할 상품이 없습니다.", "applied": 0}
 
+        # vendorItemId 일괄 조회 (카탈로그 미러에 없는 상품만 상세 API 호출)
+        vendor_items_by_product = self._get_catalog(coupang_account_id, client).vendor_item_ids_many(
+            [t.seller_product_id for t in pending_trackings]
+        )
+
         results = {
             "total": len(pending_trackings),
             "instant_success": 0,
             "instant_failed": 0,
+            "instant_pending": 0,
+            "instant_unknown": 0,
             "download_success": 0,
             "download_failed": 0,
             "errors": []
         }
+        submitted_tracking_ids = set()
 
         for tracking in pending_trackings:
             tracking.status = "processing"
             self.db.commit()
 
             try:
-                # vendorItemId 조회
-                vendor_item_ids = client.get_vendor_item_ids(tracking.seller_product_id)
+                vendor_item_ids = vendor_items_by_product.get(int(tracking.seller_product_id), [])
 
                 if not vendor_item_ids:
                     tracking.status = "failed"
@@ -437,12 +461,17 @@ class CouponAutoSyncService:
                     })
                     continue
 
-                # 즉시할인쿠폰 적용
+                # 즉시할인쿠폰 적용 (요청 제출 후 결과는 tracker가 비동기로 확정)
+                instant_pending = False
                 if config.instant_coupon_enabled and config.instant_coupon_id and config.instant_coupon_id > 0:
                     instant_result = self._apply_instant_coupon(
-                        client, config, tracking, vendor_item_ids
+                        client, config, tracking, vendor_item_ids, tracker
                     )
-                    if instant_result["success"]:
+                    if instant_result.get("pending"):
+                        instant_pending = True
+                        submitted_tracking_ids.add(tracking.id)
+                        results["instant_pending"] += 1
+                    elif instant_result["success"]:
                         results["instant_success"] += 1
                     else:
                         results["instant_failed"] += 1
@@ -457,8 +486,10 @@ class CouponAutoSyncService:
                     else:
                         results["download_failed"] += 1
 
-                # 상태 업데이트
-                if tracking.instant_coupon_applied or tracking.download_coupon_applied:
+                # 상태 업데이트 (즉시할인 결과 대기 중이면 processing 유지)
+                if instant_pending:
+                    tracking.status = "processing"
+                elif tracking.instant_coupon_applied or tracking.download_coupon_applied:
                     tracking.status = "completed"
                 elif tracking.error_message:
                     tracking.status = "failed"
@@ -477,6 +508,18 @@ class CouponAutoSyncService:
                     "error": str(e)
                 })
 
+        # 제출한 즉시할인 요청 결과 확인 (시간 내 확정되지 않은 요청은 스케줄러가 이어서 확인)
+        for outcome in tracker.drain(timeout=self.REQUEST_DRAIN_TIMEOUT):
+            if outcome.get("tracking_id") not in submitted_tracking_ids:
+                continue
+            results["instant_pending"] -= 1
+            if outcome["status"] == "DONE":
+                results["instant_success"] += 1
+            elif outcome["status"] == "FAIL":
+                results["instant_failed"] += 1
+            else:
+                results["instant_unknown"] += 1
+
         # 설정의 마지막 동기화 시간 업데이트
         config.last_sync_at = datetime.utcnow()
         self.db.commit()
@@ -489,9 +532,10 @@ class CouponAutoSyncService:
         client: CouponAPIClient,
         config: CouponAutoSyncConfig,
         tracking: ProductCouponTracking,
-        vendor_item_ids: List[int]
+        vendor_item_ids: List[int],
+        tracker: CouponRequestTracker
     ) -> Dict[str, Any]:
-        """즉시할인쿠폰 적용"""
+        """즉시할인쿠폰 적용 요청 제출 (처리 결과는 tracker가 확정)"""
         try:
             result = client.apply_instant_coupon_to_items(
                 coupon_id=config.instant_coupon_id,
@@ -510,35 +554,22 @@ class CouponAutoSyncService:
                 response_data=result
             )
 
-            if result.get("code") == 200 and result.get("data", {}).get("success"):
-                requested_id = result.get("data", {}).get("content", {}).get("requestedId")
+            requested_id = extract_requested_id(result)
+            if requested_id:
                 tracking.instant_coupon_request_id = requested_id
-
-                # 비동기 처리 결과 확인 (최대 5회 시도)
-                for _ in range(5):
-                    time.sleep(2)
-                    status_result = client.get_instant_coupon_request_status(requested_id)
-                    status = status_result.get("data", {}).get("content", {}).get("status")
-
-                    if status == "DONE":
-                        tracking.instant_coupon_applied = True
-                        tracking.instant_coupon_applied_at = datetime.utcnow()
-                        log.success = True
-                        self.db.add(log)
-                        return {"success": True}
-                    elif status == "FAIL":
-                        failed_items = status_result.get("data", {}).get("content", {}).get("failedVendorItems", [])
-                        error_msg = str(failed_items) if failed_items else "적용 실패"
-                        log.success = False
-                        log.error_message = error_msg
-                        self.db.add(log)
-                        return {"success": False, "error": error_msg}
-
-                # 타임아웃
+                log.request_id = requested_id
                 log.success = False
-                log.error_message = "처리 타임아웃"
                 self.db.add(log)
-                return {"success": False, "error": "처리 타임아웃"}
+                self.db.flush()
+
+                tracker.register(
+                    requested_id, vendor_item_ids,
+                    coupon_id=config.instant_coupon_id,
+                    tracking=tracking,
+                    apply_log=log,
+                    commit=False
+                )
+                return {"success": True, "pending": True, "requested_id": requested_id}
             else:
                 error_msg = result.get("message", "알 수 없는 오류")
                 log.success = False
@@ -616,9 +647,11 @@ class CouponAutoSyncService:
         coupang_account_id: int,
         status: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count: str = "exact"
     ) -> Dict[str, Any]:
-        """상품 쿠폰 적용 추적 목록 조회"""
+        """상품 쿠폰 적용 추적 목록 조회 (cursor 지정 시 키셋 페이지네이션)"""
         query = self.db.query(ProductCouponTracking).filter(
             ProductCouponTracking.coupang_account_id == coupang_account_id
         )
@@ -626,14 +659,16 @@ class CouponAutoSyncService:
         if status:
             query = query.filter(ProductCouponTracking.status == status)
 
-        total = query.count()
-        trackings = query.order_by(
-            ProductCouponTracking.created_at.desc()
-        ).offset(offset).limit(limit).all()
+        total = count_total(query, count)
+        trackings, next_cursor = keyset_page(
+            query, ProductCouponTracking.created_at, ProductCouponTracking.id,
+            limit, cursor=cursor, offset=offset
+        )
 
         return {
             "success": True,
             "total": total,
+            "next_cursor": next_cursor,
             "trackings": [t.to_dict() for t in trackings]
         }
 
@@ -641,54 +676,47 @@ class CouponAutoSyncService:
         self,
         coupang_account_id: int,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count: str = "exact"
     ) -> Dict[str, Any]:
-        """쿠폰 적용 이력 조회"""
+        """쿠폰 적용 이력 조회 (cursor 지정 시 키셋 페이지네이션)"""
         query = self.db.query(CouponApplyLog).filter(
             CouponApplyLog.coupang_account_id == coupang_account_id
         )
 
-        total = query.count()
-        logs = query.order_by(
-            CouponApplyLog.created_at.desc()
-        ).offset(offset).limit(limit).all()
+        total = count_total(query, count)
+        logs, next_cursor = keyset_page(
+            query, CouponApplyLog.created_at, CouponApplyLog.id,
+            limit, cursor=cursor, offset=offset
+        )
 
         return {
             "success": True,
             "total": total,
+            "next_cursor": next_cursor,
             "logs": [log.to_dict() for log in logs]
         }
 
-    def get_statistics(self, coupang_account_id: int) -> Dict[str, Any]:
-        """쿠폰 자동연동 통계"""
+    def get_statistics(self, coupang_account_id: int, snapshot: Optional[DashboardSnapshot] = None) -> Dict[str, Any]:
+        """쿠폰 자동연동 통계 (증분 카운터, ETag를 확인한 스냅샷이 있으면 그대로 사용)"""
+        if snapshot is None:
+            snapshot = get_dashboard_counters(self.db).snapshot(self.db, *COUPON_COUNTER_GROUPS)
+        tracking = snapshot.values["coupon_tracking"]
+        prefix = f"{coupang_account_id}:"
+
         # 전체 추적 상품 수
-        total_tracking = self.db.query(ProductCouponTracking).filter(
-            ProductCouponTracking.coupang_account_id == coupang_account_id
-        ).count()
+        total_tracking = tracking.get(prefix + "total", 0)
 
         # 상태별 수
-        pending = self.db.query(ProductCouponTracking).filter(
-            ProductCouponTracking.coupang_account_id == coupang_account_id,
-            ProductCouponTracking.status == "pending"
-        ).count()
-
-        completed = self.db.query(ProductCouponTracking).filter(
-            ProductCouponTracking.coupang_account_id == coupang_account_id,
-            ProductCouponTracking.status == "completed"
-        ).count()
-
-        failed = self.db.query(ProductCouponTracking).filter(
-            ProductCouponTracking.coupang_account_id == coupang_account_id,
-            ProductCouponTracking.status == "failed"
-        ).count()
+        pending = tracking.get(prefix + "status:pending", 0)
+        completed = tracking.get(prefix + "status:completed", 0)
+        failed = tracking.get(prefix + "status:failed", 0)
+        unknown = tracking.get(prefix + "status:unknown", 0)
 
         # 오늘 적용된 수
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_applied = self.db.query(CouponApplyLog).filter(
-            CouponApplyLog.coupang_account_id == coupang_account_id,
-            CouponApplyLog.success == True,
-            CouponApplyLog.created_at >= today_start
-        ).count()
+        today = datetime.utcnow().date().isoformat()
+        today_applied = snapshot.get("coupon_apply_logs", f"{prefix}applied:{today}")
 
         return {
             "success": True,
@@ -697,6 +725,7 @@ class CouponAutoSyncService:
                 "pending": pending,
                 "completed": completed,
                 "failed": failed,
+                "unknown": unknown,
                 "today_applied": today_applied
             }
         }
@@ -812,6 +841,8 @@ class CouponAutoSyncService:
             logger.info(f"[DEBUG] Found {len(applied_seller_product_ids)} already applied products to skip")
 
         client = self._get_api_client(account)
+        tracker = CouponRequestTracker(self.db, client, coupang_account_id)
+        catalog = self._get_catalog(coupang_account_id, client)
 
         # 진행 상황 레코드 생성
         progress = BulkApplyProgress(
@@ -828,6 +859,8 @@ class CouponAutoSyncService:
             "total_items": 0,
             "instant_success": 0,
             "instant_failed": 0,
+            "instant_pending": 0,
+            "instant_unknown": 0,
             "download_success": 0,
             "download_failed": 0,
             "errors": []
@@ -871,7 +904,11 @@ class CouponAutoSyncService:
 
                 logger.info(f"[DEBUG] Page {page_count}: processing {len(products)} products")
 
-                # 각 상품에서 vendorItemId 추출
+                # 카탈로그 미러 갱신 (신규/변경 상품만 상세 조회 대상)
+                catalog.upsert_products(products, page_token=next_token)
+
+                # 대상 상품 선별
+                target_ids = []
                 for product in products:
                     seller_product_id = product.get("sellerProductId")
                     if not seller_product_id:
@@ -885,30 +922,40 @@ class CouponAutoSyncService:
                     if skip_applied and seller_product_id in applied_seller_product_ids:
                         continue
 
-                    # vendorItemId 조회
-                    try:
-                        vendor_item_ids = client.get_vendor_item_ids(seller_product_id)
-                        if vendor_item_ids:
-                            batch_vendor_items.extend(vendor_item_ids)
-                            results["total_products"] += 1
-                            results["total_items"] += len(vendor_item_ids)
-                            processed_products += 1
-                    except Exception as e:
-                        logger.error(f"[DEBUG] Error getting vendorItemIds: {str(e)}")
+                    target_ids.append(seller_product_id)
 
-                    # 진행 상황 업데이트
-                    progress.total_products = results["total_products"]
-                    progress.total_items = results["total_items"]
+                # vendorItemId 조회 (미러에 있으면 API 호출 없음)
+                try:
+                    vendor_items_by_product = catalog.vendor_item_ids_many(target_ids)
+                except Exception as e:
+                    logger.error(f"[DEBUG] Error getting vendorItemIds: {str(e)}")
+                    vendor_items_by_product = {}
+
+                for seller_product_id in target_ids:
+                    vendor_item_ids = vendor_items_by_product.get(int(seller_product_id), [])
+                    if vendor_item_ids:
+                        batch_vendor_items.extend(vendor_item_ids)
+                        results["total_products"] += 1
+                        results["total_items"] += len(vendor_item_ids)
+                        processed_products += 1
+
+                # 진행 상황 업데이트
+                progress.total_products = results["total_products"]
+                progress.total_items = results["total_items"]
 
                 # 배치가 충분히 쌓이면 쿠폰 적용
                 if len(batch_vendor_items) >= PRODUCT_BATCH_SIZE:
                     self._apply_coupons_to_batch(
                         client, config, progress, results,
                         batch_vendor_items, account.wing_username,
-                        INSTANT_COUPON_BATCH_SIZE, DOWNLOAD_COUPON_BATCH_SIZE
+                        INSTANT_COUPON_BATCH_SIZE, DOWNLOAD_COUPON_BATCH_SIZE,
+                        tracker=tracker
                     )
                     batch_vendor_items = []  # 배치 초기화
 
+                # 제출해 둔 즉시할인 요청 중 확인 시점이 된 것만 확인 (대기 없음)
+                self._merge_request_outcomes(results, tracker.poll_due(), progress.id)
+
                 # 다음 페이지 토큰
                 next_token_str = api_result.get("nextToken", "")
                 if next_token_str and next_token_str.strip():
@@ -921,9 +968,17 @@ class CouponAutoSyncService:
                 self._apply_coupons_to_batch(
                     client, config, progress, results,
                     batch_vendor_items, account.wing_username,
-                    INSTANT_COUPON_BATCH_SIZE, DOWNLOAD_COUPON_BATCH_SIZE
+                    INSTANT_COUPON_BATCH_SIZE, DOWNLOAD_COUPON_BATCH_SIZE,
+                    tracker=tracker
                 )
 
+            # 남은 즉시할인 요청 결과 확인 (미확정 요청은 스케줄러가 이어서 반영)
+            progress.current_date = "즉시할인 처리 결과 확인 중..."
+            self.db.commit()
+            self._merge_request_outcomes(
+                results, tracker.drain(timeout=self.REQUEST_DRAIN_TIMEOUT), progress.id
+            )
+
             # 완료
             progress.status = "completed"
             progress.completed_at = datetime.utcnow()
@@ -931,7 +986,8 @@ class CouponAutoSyncService:
 
             logger.info(f"[DEBUG] === Batch Bulk Apply Complete ===")
             logger.info(f"[DEBUG] Total products: {results['total_products']}, Items: {results['total_items']}")
-            logger.info(f"[DEBUG] Instant: {results['instant_success']} success, {results['instant_failed']} failed")
+            logger.info(f"[DEBUG] Catalog: {catalog.stats['detail_requests']} detail requests, {catalog.stats['inserted']} new products")
+            logger.info(f"[DEBUG] Instant: {results['instant_success']} success, {results['instant_failed']} failed, {results['instant_pending']} pending, {results['instant_unknown']} unknown")
             logger.info(f"[DEBUG] Download: {results['download_success']} success, {results['download_failed']} failed")
 
             return {
@@ -948,6 +1004,18 @@ class CouponAutoSyncService:
             self.db.commit()
             return {"success": False, "message": str(e), "results": results}
 
+    @staticmethod
+    def _merge_request_outcomes(results: Dict[str, Any], outcomes: List[Dict[str, Any]], progress_id: int):
+        """tracker가 확정한 요청 결과를 이번 작업의 결과 집계에 반영"""
+        for outcome in outcomes:
+            if outcome.get("bulk_progress_id") != progress_id:
+                continue
+            resolved = outcome["success"] + outcome["failed"] + outcome["unknown"]
+            results["instant_pending"] -= resolved
+            results["instant_success"] += outcome["success"]
+            results["instant_failed"] += outcome["failed"]
+            results["instant_unknown"] += outcome["unknown"]
+
     def _apply_coupons_to_batch(
         self,
         client: CouponAPIClient,
@@ -957,12 +1025,16 @@ class CouponAutoSyncService:
         vendor_item_ids: List[int],
         wing_username: str,
         instant_batch_size: int,
-        download_batch_size: int
+        download_batch_size: int,
+        tracker: Optional[CouponRequestTracker] = None
     ):
         """배치에 쿠폰 적용 (즉시할인 + 다운로드)"""
         if not vendor_item_ids:
             return
 
+        tracker = tracker or CouponRequestTracker(self.db, client, config.coupang_account_id)
+        instant_before = (results["instant_success"], results["instant_failed"])
+
         logger.info(f"[DEBUG] Applying coupons to batch of {len(vendor_item_ids)} items")
 
         # 즉시할인쿠폰 적용
@@ -974,7 +1046,7 @@ class CouponAutoSyncService:
                 # 새 쿠폰 생성 모드: 1만개 상품마다 새 쿠폰 생성
                 self._apply_instant_coupon_with_auto_create(
                     client, config, progress, results,
-                    vendor_item_ids, instant_batch_size
+                    vendor_item_ids, instant_batch_size, tracker
                 )
             elif config.instant_coupon_id and config.instant_coupon_id > 0:
                 # 기존 방식: 기존 쿠폰에 추가
@@ -989,31 +1061,16 @@ class CouponAutoSyncService:
                         )
                         logger.info(f"[DEBUG] Instant coupon API response: {result}")
 
-                        if result.get("code") == 200 and result.get("data", {}).get("success"):
-                            requested_id = result.get("data", {}).get("content", {}).get("requestedId")
+                        requested_id = extract_requested_id(result)
+                        if requested_id:
+                            # 결과 확인은 tracker가 비동기로 처리 (다음 배치 제출을 막지 않음)
+                            tracker.register(
+                                requested_id, batch,
+                                coupon_id=config.instant_coupon_id,
+                                progress=progress
+                            )
+                            results["instant_pending"] += len(batch)
                             logger.info(f"[DEBUG] Instant coupon request submitted, requestedId={requested_id}")
-
-                            # 비동기 처리 결과 확인 (최대 5회)
-                            for check_num in range(5):
-                                time.sleep(2)
-                                status_result = client.get_instant_coupon_request_status(requested_id)
-                                status = status_result.get("data", {}).get("content", {}).get("status")
-                                logger.info(f"[DEBUG] Status check {check_num+1}: {status}")
-
-                                if status == "DONE":
-                                    results["instant_success"] += len(batch)
-                                    logger.info(f"[DEBUG] Batch completed successfully: {len(batch)} items")
-                                    break
-                                elif status == "FAIL":
-                                    failed_items = status_result.get("data", {}).get("content", {}).get("failedVendorItems", [])
-                                    results["instant_failed"] += len(failed_items)
-                                    results["instant_success"] += len(batch) - len(failed_items)
-                                    logger.warning(f"[DEBUG] Batch failed: {len(failed_items)} items failed, {len(batch) - len(failed_items)} succeeded")
-                                    break
-                            else:
-                                # 타임아웃 - 성공으로 간주 (백그라운드에서 처리됨)
-                                results["instant_success"] += len(batch)
-                                logger.info(f"[DEBUG] Status check timeout, assuming success: {len(batch)} items")
                         else:
                             results["instant_failed"] += len(batch)
                             logger.error(f"[DEBUG] Instant coupon API failed - code: {result.get('code')}, message: {result.get('message')}, full response: {result}")
@@ -1022,10 +1079,10 @@ class CouponAutoSyncService:
                         results["instant_failed"] += len(batch)
                         logger.error(f"[DEBUG] Instant coupon exception: {str(e)}", exc_info=True)
 
-            # 진행 상황 업데이트
+            # 진행 상황 업데이트 (비동기 요청 결과는 tracker가 확정 시 반영)
             progress.instant_total = (progress.instant_total or 0) + len(vendor_item_ids)
-            progress.instant_success = results["instant_success"]
-            progress.instant_failed = results["instant_failed"]
+            progress.instant_success = (progress.instant_success or 0) + results["instant_success"] - instant_before[0]
+            progress.instant_failed = (progress.instant_failed or 0) + results["instant_failed"] - instant_before[1]
             self.db.commit()
 
         # 다운로드쿠폰 적용
@@ -1258,7 +1315,8 @@ class CouponAutoSyncService:
         progress: BulkApplyProgress,
         results: Dict[str, Any],
         vendor_item_ids: List[int],
-        batch_size: int = 10000
+        batch_size: int = 10000,
+        tracker: Optional[CouponRequestTracker] = None
     ):
         """
         즉시할인쿠폰 자동 생성 모드: 1만개 상품마다 새 쿠폰 생성
@@ -1270,6 +1328,7 @@ class CouponAutoSyncService:
             results: 결과 딕셔너리
             vendor_item_ids: 적용할 상품 옵션 ID 목록
             batch_size: 배치 크기 (기본 10000, 즉시할인쿠폰 최대 한도)
+            tracker: 상품 적용 요청(requestedId) 결과 추적기
         """
         from datetime import datetime, timedelta
 
@@ -1374,12 +1433,22 @@ class CouponAutoSyncService:
                     vendor_item_ids=batch
                 )
 
-                if result.get("success"):
+                requested_id = extract_requested_id(result.get("applyResult")) if result.get("success") else None
+                if requested_id and tracker is not None:
+                    # 쿠폰 생성 후 상품 적용 요청 결과는 tracker가 확정
+                    tracker.register(
+                        requested_id, batch,
+                        coupon_id=result.get("couponId"),
+                        progress=progress
+                    )
+                    results["instant_pending"] += len(batch)
+                    logger.info(f"[INSTANT-AUTO] Coupon {result.get('couponId')} created, item apply requested ({len(batch)} items, requestedId={requested_id})")
+                elif result.get("success") and requested_id:
                     results["instant_success"] += len(batch)
                     logger.info(f"[INSTANT-AUTO] Coupon {result.get('couponId')} created successfully with {len(batch)} items")
                 else:
                     results["instant_failed"] += len(batch)
-                    error_msg = result.get("message", "Unknown error")
+                    error_msg = result.get("message") or (result.get("applyResult") or {}).get("message", "Unknown error")
                     logger.error(f"[INSTANT-AUTO] Failed to create coupon: {error_msg}")
 
             except Exception as e:
@@ -1400,8 +1469,62 @@ class CouponAutoSyncService:
         # 이전 코드 보존 (필요시 사용)
         pass
 
+    # ==================== 상품 카탈로그 미러 ====================
+
+    def sync_catalog(self, coupang_account_id: int, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """
+        상품 카탈로그 미러 전체 동기화 (중단 지점부터 재개)
+
+        Args:
+            coupang_account_id: 쿠팡 계정 ID
+            max_pages: 이번 실행에서 조회할 최대 페이지 수 (None이면 끝까지)
+        """
+        account = self.db.query(CoupangAccount).filter(
+            CoupangAccount.id == coupang_account_id
+        ).first()
+
+        if not account:
+            return {"success": False, "message": "계정을 찾을 수 없습니다."}
+
+        catalog = self._get_catalog(coupang_account_id, self._get_api_client(account))
+        result = catalog.sync_all(max_pages=max_pages)
+        logger.info(f"Catalog sync for account {coupang_account_id}: {result}")
+        return {"success": True, "result": result}
+
+    def get_catalog_vendor_items(self, coupang_account_id: int, seller_product_ids: List[int]) -> Dict[str, Any]:
+        """카탈로그 미러에서 sellerProductId → vendorItemId 조회 (API 호출 없음)"""
+        catalog = ProductCatalog(self.db, coupang_account_id)
+        vendor_items = catalog.vendor_item_ids_many(seller_product_ids, fetch_missing=False)
+        return {
+            "success": True,
+            "vendor_items": {str(pid): ids for pid, ids in vendor_items.items()}
+        }
+
     # ==================== 자동 실행 (스케줄러용) ====================
 
+    def poll_coupon_requests(self) -> Dict[str, Any]:
+        """
+        확인 시점이 된 쿠폰 비동기 요청 상태를 계정별로 확인하여 반영 (스케줄러에서 호출)
+        """
+        account_ids = [
+            row[0] for row in self.db.query(CouponRequestStatus.coupang_account_id).filter(
+                CouponRequestStatus.status == "REQUESTED",
+                CouponRequestStatus.next_poll_at <= datetime.utcnow()
+            ).distinct().all()
+        ]
+
+        def poll_account(db: Session, account_id: int) -> int:
+            account = db.query(CoupangAccount).filter(CoupangAccount.id == account_id).first()
+            if not account:
+                return 0
+            tracker = CouponRequestTracker(db, self._get_api_client(account), account_id)
+            return len(tracker.poll_due())
+
+        results = run_per_account(account_ids, poll_account, label="coupon-poll")
+        resolved = sum(r["result"] for r in results if r["success"])
+
+        return {"success": True, "accounts": len(account_ids), "resolved": resolved}
+
     def run_auto_sync(self, coupang_account_id: int) -> Dict[str, Any]:
         """
         자동 동기화 실행 (스케줄러에서 호출)
@@ -1439,31 +1562,27 @@ class CouponAutoSyncService:
             "results": results
         }
 
-    def run_auto_sync_all_accounts(self) -> Dict[str, Any]:
-        """모든 활성화된 계정에 대해 자동 동기화 실행"""
-        configs = self.db.query(CouponAutoSyncConfig).filter(
-            CouponAutoSyncConfig.is_enabled == True
-        ).all()
+    def run_auto_sync_all_accounts(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        모든 활성화된 계정에 대해 자동 동기화 실행
 
-        results = []
-        for config in configs:
-            try:
-                result = self.run_auto_sync(config.coupang_account_id)
-                results.append({
-                    "account_id": config.coupang_account_id,
-                    "success": True,
-                    "result": result
-                })
-            except Exception as e:
-                logger.error(f"Error running auto sync for account {config.coupang_account_id}: {str(e)}")
-                results.append({
-                    "account_id": config.coupang_account_id,
-                    "success": False,
-                    "error": str(e)
-                })
+        계정마다 별도 세션/워커에서 병렬 실행 (전역 동시 실행 한도, 계정별 제한 시간 적용)
+        """
+        account_ids = [
+            row[0] for row in self.db.query(CouponAutoSyncConfig.coupang_account_id).filter(
+                CouponAutoSyncConfig.is_enabled == True
+            ).all()
+        ]
+
+        results = run_per_account(
+            account_ids,
+            lambda db, account_id: CouponAutoSyncService(db).run_auto_sync(account_id),
+            timeout=timeout,
+            label="coupon-auto-sync"
+        )
 
         return {
             "success": True,
-            "total_accounts": len(configs),
+            **summarize(results),
             "results": results
         }
@@ -0,0 +1,303 @@
+"""
+Coupon Request Tracker
+쿠폰 비동기 요청 상태 추적기
+
+즉시할인쿠폰 적용 요청(requestedId)은 쿠팡에서 비동기로 처리되므로
+제출 직후 sleep 폴링으로 기다리지 않고 DB에 기록한 뒤 모아서 확인:
+- register: 요청 ID와 반영 대상(BulkApplyProgress / ProductCouponTracking / CouponApplyLog) 기록
+- poll_due: 확인 시점이 된 요청들의 상태를 동시에 조회하고 결과 반영
+- 미완료 요청은 지수 백오프로 재확인, 최대 횟수 초과 시 UNKNOWN (성공으로 간주하지 않음)
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.coupon_config import (
+    BulkApplyProgress,
+    CouponApplyLog,
+    CouponRequestStatus,
+    ProductCouponTracking,
+)
+
+STATUS_REQUESTED = "REQUESTED"
+STATUS_DONE = "DONE"
+STATUS_FAIL = "FAIL"
+STATUS_UNKNOWN = "UNKNOWN"
+
+
+def extract_requested_id(result: Optional[Dict[str, Any]]) -> Optional[str]:
+    """즉시할인쿠폰 적용 응답에서 requestedId 추출 (요청 실패 시 None)"""
+    if not result or result.get("code") != 200:
+        return None
+    data = result.get("data") or {}
+    if not data.get("success"):
+        return None
+    requested_id = (data.get("content") or {}).get("requestedId")
+    return str(requested_id) if requested_id else None
+
+
+class CouponRequestTracker:
+    """계정별 쿠폰 비동기 요청 상태 추적기"""
+
+    INITIAL_DELAY_SECONDS = 2
+    BACKOFF_FACTOR = 2
+    MAX_DELAY_SECONDS = 60
+    MAX_POLLS = 8  # 약 4분 (2 + 4 + 8 + 16 + 32 + 60 + 60 + 60초)
+    MAX_WORKERS = 8
+
+    def __init__(self, db: Session, client, coupang_account_id: int):
+        self.db = db
+        self.client = client
+        self.coupang_account_id = coupang_account_id
+
+    # ==================== 등록 ====================
+
+    def register(
+        self,
+        request_id: str,
+        vendor_item_ids: List[int],
+        coupon_id: Optional[int] = None,
+        coupon_type: str = "instant",
+        progress: Optional[BulkApplyProgress] = None,
+        tracking: Optional[ProductCouponTracking] = None,
+        apply_log: Optional[CouponApplyLog] = None,
+        commit: bool = True
+    ) -> CouponRequestStatus:
+        """제출된 요청을 추적 대상으로 등록"""
+        request = CouponRequestStatus(
+            coupang_account_id=self.coupang_account_id,
+            coupon_type=coupon_type,
+            request_id=str(request_id),
+            coupon_id=coupon_id,
+            vendor_item_ids=list(vendor_item_ids),
+            item_count=len(vendor_item_ids),
+            bulk_progress_id=progress.id if progress else None,
+            tracking_id=tracking.id if tracking else None,
+            apply_log_id=apply_log.id if apply_log else None,
+            status=STATUS_REQUESTED,
+            poll_count=0,
+            next_poll_at=datetime.utcnow() + timedelta(seconds=self.INITIAL_DELAY_SECONDS)
+        )
+        self.db.add(request)
+
+        if progress is not None:
+            progress.instant_pending = (progress.instant_pending or 0) + len(vendor_item_ids)
+
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return request
+
+    # ==================== 조회 ====================
+
+    def pending_count(self) -> int:
+        """결과 대기 중인 요청 수"""
+        return self.db.query(CouponRequestStatus).filter(
+            CouponRequestStatus.coupang_account_id == self.coupang_account_id,
+            CouponRequestStatus.status == STATUS_REQUESTED
+        ).count()
+
+    def next_poll_at(self) -> Optional[datetime]:
+        """가장 빠른 다음 확인 시각"""
+        return self.db.query(func.min(CouponRequestStatus.next_poll_at)).filter(
+            CouponRequestStatus.coupang_account_id == self.coupang_account_id,
+            CouponRequestStatus.status == STATUS_REQUESTED
+        ).scalar()
+
+    def _backoff_delay(self, poll_count: int) -> float:
+        delay = self.INITIAL_DELAY_SECONDS * (self.BACKOFF_FACTOR ** poll_count)
+        return min(delay, self.MAX_DELAY_SECONDS)
+
+    # ==================== 폴링 ====================
+
+    def _fetch_status(self, coupon_type: str, request_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """상태 조회 (워커 스레드에서 실행, DB 접근 없음)"""
+        try:
+            if coupon_type == "download":
+                return self.client.get_download_coupon_request_status(request_id), None
+            return self.client.get_instant_coupon_request_status(request_id), None
+        except Exception as e:
+            return None, str(e)
+
+    def poll_due(self, now: Optional[datetime] = None, limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        확인 시점이 된 요청들의 상태를 동시에 조회하고 결과 반영
+
+        Returns:
+            이번 호출에서 확정된 요청 결과 리스트
+            [{"request_id", "status", "success", "failed", "unknown", "bulk_progress_id", "tracking_id"}]
+        """
+        now = now or datetime.utcnow()
+        due = self.db.query(CouponRequestStatus).filter(
+            CouponRequestStatus.coupang_account_id == self.coupang_account_id,
+            CouponRequestStatus.status == STATUS_REQUESTED,
+            CouponRequestStatus.next_poll_at <= now
+        ).order_by(CouponRequestStatus.next_poll_at).limit(limit).all()
+
+        if not due:
+            return []
+
+        # HTTP 조회만 병렬로, DB 반영은 현재 세션에서 순차 처리
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(due))) as pool:
+            futures = [
+                (request, pool.submit(self._fetch_status, request.coupon_type, request.request_id))
+                for request in due
+            ]
+            fetched = [(request, future.result()) for request, future in futures]
+
+        outcomes = []
+        for request, (payload, error) in fetched:
+            outcome = self._apply_status(request, payload, error, now)
+            if outcome:
+                outcomes.append(outcome)
+
+        self.db.commit()
+
+        if outcomes:
+            logger.info(
+                f"[COUPON-TRACKER] account={self.coupang_account_id} polled={len(due)} resolved={len(outcomes)}"
+            )
+        return outcomes
+
+    def drain(self, timeout: float = 30, sleep=time.sleep) -> List[Dict[str, Any]]:
+        """
+        대기 중인 요청이 모두 확정되거나 timeout이 지날 때까지 폴링
+        (남은 요청은 DB에 남아 이후 스케줄러 폴링에서 확정)
+        """
+        deadline = time.monotonic() + timeout
+        outcomes: List[Dict[str, Any]] = []
+
+        while True:
+            outcomes.extend(self.poll_due())
+            next_at = self.next_poll_at()
+            if next_at is None:
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait = max((next_at - datetime.utcnow()).total_seconds(), 0)
+            sleep(min(wait, remaining))
+
+        return outcomes
+
+    # ==================== 결과 반영 ====================
+
+    def _apply_status(
+        self,
+        request: CouponRequestStatus,
+        payload: Optional[Dict[str, Any]],
+        error: Optional[str],
+        now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """조회 결과를 요청 레코드와 반영 대상에 적용 (확정 시 결과 반환)"""
+        request.poll_count = (request.poll_count or 0) + 1
+        content = ((payload or {}).get("data") or {}).get("content") or {}
+        status = content.get("status")
+
+        if status == STATUS_DONE:
+            return self._resolve(request, STATUS_DONE, success=request.item_count, failed=0)
+
+        if status == STATUS_FAIL:
+            failed_items = content.get("failedVendorItems") or []
+            failed = min(len(failed_items), request.item_count) if failed_items else request.item_count
+            error_msg = str(failed_items) if failed_items else (content.get("errorMessage") or "적용 실패")
+            return self._resolve(
+                request, STATUS_FAIL,
+                success=request.item_count - failed, failed=failed,
+                failed_items=failed_items, error=error_msg
+            )
+
+        if request.poll_count >= self.MAX_POLLS:
+            return self._resolve(
+                request, STATUS_UNKNOWN, success=0, failed=0,
+                error=error or "처리 결과 확인 시간 초과"
+            )
+
+        # 아직 처리 중 (REQUESTED) 또는 일시적 조회 오류: 백오프 후 재확인
+        request.error_message = error
+        request.next_poll_at = now + timedelta(seconds=self._backoff_delay(request.poll_count))
+        return None
+
+    def _resolve(
+        self,
+        request: CouponRequestStatus,
+        status: str,
+        success: int,
+        failed: int,
+        failed_items: Optional[List[Any]] = None,
+        error: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """요청 확정 (다른 워커가 먼저 확정했으면 None)"""
+        resolved_at = datetime.utcnow()
+        claimed = self.db.query(CouponRequestStatus).filter(
+            CouponRequestStatus.id == request.id,
+            CouponRequestStatus.status == STATUS_REQUESTED
+        ).update({
+            "status": status,
+            "poll_count": request.poll_count,
+            "success_count": success,
+            "failed_count": failed,
+            "failed_vendor_items": failed_items,
+            "error_message": error,
+            "resolved_at": resolved_at
+        }, synchronize_session=False)
+
+        if not claimed:
+            self.db.expire(request)
+            return None
+
+        self.db.expire(request)
+        unknown = request.item_count if status == STATUS_UNKNOWN else 0
+
+        if request.bulk_progress_id:
+            progress = self.db.get(BulkApplyProgress, request.bulk_progress_id)
+            if progress:
+                progress.instant_pending = max((progress.instant_pending or 0) - request.item_count, 0)
+                progress.instant_success = (progress.instant_success or 0) + success
+                progress.instant_failed = (progress.instant_failed or 0) + failed
+                progress.instant_unknown = (progress.instant_unknown or 0) + unknown
+
+        if request.tracking_id:
+            tracking = self.db.get(ProductCouponTracking, request.tracking_id)
+            if tracking:
+                self._update_tracking(tracking, status, error, resolved_at)
+
+        if request.apply_log_id:
+            log = self.db.get(CouponApplyLog, request.apply_log_id)
+            if log:
+                log.success = status == STATUS_DONE
+                log.error_message = error if status != STATUS_DONE else None
+
+        return {
+            "request_id": request.request_id,
+            "status": status,
+            "success": success,
+            "failed": failed,
+            "unknown": unknown,
+            "bulk_progress_id": request.bulk_progress_id,
+            "tracking_id": request.tracking_id
+        }
+
+    @staticmethod
+    def _update_tracking(tracking: ProductCouponTracking, status: str, error: Optional[str], resolved_at: datetime):
+        """상품 추적 상태 반영 (다운로드쿠폰이 적용됐으면 completed 유지)"""
+        if status == STATUS_DONE:
+            tracking.instant_coupon_applied = True
+            tracking.instant_coupon_applied_at = resolved_at
+            tracking.status = "completed"
+            return
+
+        tracking.error_message = error
+        if tracking.download_coupon_applied:
+            tracking.status = "completed"
+        elif status == STATUS_UNKNOWN:
+            tracking.status = "unknown"
+        else:
+            tracking.status = "failed"
@@ -0,0 +1,416 @@
+"""
+Dashboard Counters
+대시보드 실시간 카운터
+
+프론트엔드가 주기적으로 폴링하는 통계(반품/문의/답변/쿠폰/배송 동기화)를 매번 COUNT로
+다시 계산하지 않고, 프로세스 내 카운터에서 O(1)로 제공:
+- ORM flush 시 추적 대상 모델의 추가/삭제/상태 변경을 감지해 카운터 증감분(delta) 계산
+  (커밋 시 반영, 롤백 시 폐기)
+- 대량 UPDATE/DELETE(query.update 등 ORM 이벤트를 거치지 않는 쓰기)는 해당 그룹을 dirty로 표시
+- 그룹별로 RECONCILE_SECONDS마다(또는 dirty일 때) 조회 시점에 DB 집계로 다시 맞춤
+  (다른 워커 프로세스의 쓰기와 24시간 구간처럼 시간이 지나며 바뀌는 값도 이때 반영)
+- ETag는 스냅샷 값의 해시 (워커/재시작과 무관하게 같은 값이면 같은 ETag, 변경 없으면 304)
+카운터는 DB 엔진별로 하나씩 유지
+"""
+import hashlib
+import json
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from fastapi import Request
+from fastapi import Response as HTTPResponse
+from loguru import logger
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+from ..models import ActivityLog, Inquiry, Response
+from ..models.coupon_config import CouponApplyLog, ProductCouponTracking
+from ..models.naver_delivery_sync import NaverDeliveryInfo
+from ..models.return_log import ReturnLog
+
+RECONCILE_SECONDS = 60
+_DELTAS_KEY = "dashboard_counter_deltas"
+_STALE_KEY = "dashboard_counter_stale"
+
+
+def _day(value: Optional[datetime]) -> str:
+    """UTC 날짜 키 (flush 직후 값이 없으면 현재 시각 기준)"""
+    return (value or datetime.utcnow()).date().isoformat()
+
+
+class CounterSpec:
+    """
+    카운터 그룹 정의
+
+    Args:
+        name: 그룹 이름
+        model: 추적 모델
+        columns: 상태 판단에 쓰는 컬럼
+        keys: 행 상태(컬럼 값 dict) → 해당 행이 더하는 카운터 키 목록
+        reconcile: DB 집계로 전체 카운터 재계산
+        insert_keys: 추가 시에만 증가시키는 키 (시간 구간 카운터, 재계산으로 보정)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model,
+        columns: Iterable[str],
+        keys: Callable[[Dict[str, Any]], List[str]],
+        reconcile: Callable[[Session], Dict[str, int]],
+        insert_keys: Iterable[str] = ()
+    ):
+        self.name = name
+        self.model = model
+        self.columns = tuple(columns)
+        self.keys = keys
+        self.reconcile = reconcile
+        self.insert_keys = tuple(insert_keys)
+
+
+def _grouped(db: Session, model, columns, keys, extra_filter=None) -> Dict[str, int]:
+    """GROUP BY 결과를 keys 함수로 카운터 키에 합산"""
+    group_columns = [getattr(model, c) for c in columns]
+    query = db.query(*group_columns, func.count(model.id))
+    if extra_filter is not None:
+        query = query.filter(extra_filter)
+    counts: Dict[str, int] = {}
+    for row in query.group_by(*group_columns).all():
+        values = dict(zip(columns, row[:-1]))
+        for key in keys(values):
+            counts[key] = counts.get(key, 0) + row[-1]
+    return counts
+
+
+# ---------- 반품 (return_logs) ----------
+
+def _return_keys(v: Dict[str, Any]) -> List[str]:
+    naver = None if v["naver_processed"] is None else bool(v["naver_processed"])
+    keys = ["total", f"status:{v['status']}", f"naver:{naver}"]
+    if v["status"] == "pending" and naver is False:
+        keys.append("pending_unprocessed")
+    return keys
+
+
+def _return_reconcile(db: Session) -> Dict[str, int]:
+    counts = _grouped(db, ReturnLog, ("status", "naver_processed"), _return_keys)
+    counts["recent_24h"] = db.query(func.count(ReturnLog.id)).filter(
+        ReturnLog.created_at >= datetime.now() - timedelta(hours=24)
+    ).scalar() or 0
+    return counts
+
+
+# ---------- 문의 (inquiries) ----------
+
+def _inquiry_keys(v: Dict[str, Any]) -> List[str]:
+    keys = [f"status:{v['status']}", f"created:{_day(v['created_at'])}"]
+    if v["requires_human"] and v["status"] is not None and v["status"] != "processed":
+        keys.append("requires_human_open")
+    return keys
+
+
+def _inquiry_reconcile(db: Session) -> Dict[str, int]:
+    counts = _grouped(
+        db, Inquiry, ("status", "requires_human"),
+        lambda v: [k for k in _inquiry_keys({**v, "created_at": None}) if not k.startswith("created:")]
+    )
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    counts[f"created:{_day(today_start)}"] = db.query(func.count(Inquiry.id)).filter(
+        Inquiry.created_at >= today_start
+    ).scalar() or 0
+    return counts
+
+
+# ---------- 답변 (responses) ----------
+
+def _response_keys(v: Dict[str, Any]) -> List[str]:
+    keys = [f"status:{v['status']}", f"created:{_day(v['created_at'])}"]
+    if v["auto_approved"]:
+        keys.append(f"auto_approved:{_day(v['created_at'])}")
+    return keys
+
+
+def _response_reconcile(db: Session) -> Dict[str, int]:
+    counts = _grouped(db, Response, ("status",), lambda v: [f"status:{v['status']}"])
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = _day(today_start)
+    counts.update(_grouped(
+        db, Response, ("auto_approved",),
+        lambda v: [f"created:{today}"] + ([f"auto_approved:{today}"] if v["auto_approved"] else []),
+        extra_filter=Response.created_at >= today_start
+    ))
+    return counts
+
+
+# ---------- 활동 로그 (activity_logs, 최근 활동 변경 감지용) ----------
+
+def _activity_reconcile(db: Session) -> Dict[str, int]:
+    return {"total": db.query(func.count(ActivityLog.id)).scalar() or 0}
+
+
+# ---------- 쿠폰 추적/적용 이력 (계정별) ----------
+
+def _tracking_keys(v: Dict[str, Any]) -> List[str]:
+    account = v["coupang_account_id"]
+    return [f"{account}:total", f"{account}:status:{v['status']}"]
+
+
+def _tracking_reconcile(db: Session) -> Dict[str, int]:
+    return _grouped(db, ProductCouponTracking, ("coupang_account_id", "status"), _tracking_keys)
+
+
+def _apply_log_keys(v: Dict[str, Any]) -> List[str]:
+    if not v["success"]:
+        return []
+    return [f"{v['coupang_account_id']}:applied:{_day(v['created_at'])}"]
+
+
+def _apply_log_reconcile(db: Session) -> Dict[str, int]:
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = _day(today_start)
+    return _grouped(
+        db, CouponApplyLog, ("coupang_account_id", "success"),
+        lambda v: [f"{v['coupang_account_id']}:applied:{today}"] if v["success"] else [],
+        extra_filter=CouponApplyLog.created_at >= today_start
+    )
+
+
+# ---------- 네이버 배송 동기화 ----------
+
+def _delivery_reconcile(db: Session) -> Dict[str, int]:
+    return _grouped(db, NaverDeliveryInfo, ("status",), lambda v: ["total", f"status:{v['status']}"])
+
+
+SPECS = [
+    CounterSpec("return_logs", ReturnLog, ("status", "naver_processed"), _return_keys,
+                _return_reconcile, insert_keys=("recent_24h",)),
+    CounterSpec("inquiries", Inquiry, ("status", "requires_human", "created_at"), _inquiry_keys,
+                _inquiry_reconcile),
+    CounterSpec("responses", Response, ("status", "auto_approved", "created_at"), _response_keys,
+                _response_reconcile),
+    CounterSpec("activity_logs", ActivityLog, (), lambda v: ["total"], _activity_reconcile),
+    CounterSpec("coupon_tracking", ProductCouponTracking, ("coupang_account_id", "status"), _tracking_keys,
+                _tracking_reconcile),
+    CounterSpec("coupon_apply_logs", CouponApplyLog, ("coupang_account_id", "success", "created_at"),
+                _apply_log_keys, _apply_log_reconcile),
+    CounterSpec("naver_delivery", NaverDeliveryInfo, ("status",), lambda v: ["total", f"status:{v['status']}"],
+                _delivery_reconcile),
+]
+
+
+class _Group:
+    __slots__ = ("spec", "values", "reconciled_at", "dirty", "lock")
+
+    def __init__(self, spec: CounterSpec):
+        self.spec = spec
+        self.values: Dict[str, int] = {}
+        self.reconciled_at: Optional[float] = None
+        self.dirty = True
+        self.lock = threading.Lock()
+
+
+def snapshot_etag(values: Dict[str, Dict[str, int]]) -> str:
+    """카운터 값의 해시로 만든 약한 ETag"""
+    canonical = json.dumps(values, sort_keys=True, separators=(",", ":"))
+    return 'W/"' + hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+class DashboardSnapshot(NamedTuple):
+    values: Dict[str, Dict[str, int]]
+    etag: str
+
+    def get(self, group: str, key: str) -> int:
+        return self.values[group].get(key, 0)
+
+
+class DashboardCounters:
+    """엔진 하나에 대한 카운터 그룹 모음"""
+
+    def __init__(self, specs: List[CounterSpec] = SPECS, reconcile_seconds: float = RECONCILE_SECONDS):
+        self.reconcile_seconds = reconcile_seconds
+        self.groups = {spec.name: _Group(spec) for spec in specs}
+        self.by_model = {spec.model: spec for spec in specs}
+
+    def apply(self, deltas: Dict[str, Dict[str, int]]):
+        """커밋된 증감분 반영"""
+        for name, changes in deltas.items():
+            group = self.groups.get(name)
+            if group is None:
+                continue
+            changes = {k: v for k, v in changes.items() if v}
+            if not changes:
+                continue
+            with group.lock:
+                for key, delta in changes.items():
+                    group.values[key] = group.values.get(key, 0) + delta
+
+    def mark_dirty(self, name: str):
+        group = self.groups.get(name)
+        if group is not None:
+            group.dirty = True
+
+    def reconcile(self, db: Session, name: str):
+        """DB 집계로 그룹 값 재계산"""
+        group = self.groups[name]
+        values = group.spec.reconcile(db)
+        with group.lock:
+            group.values = values
+            group.reconciled_at = time.monotonic()
+            group.dirty = False
+
+    def refresh(self, db: Session, *names: str):
+        """재계산 주기가 지났거나 dirty인 그룹만 재계산"""
+        now = time.monotonic()
+        for name in names:
+            group = self.groups[name]
+            if group.dirty or group.reconciled_at is None or now - group.reconciled_at >= self.reconcile_seconds:
+                try:
+                    self.reconcile(db, name)
+                except Exception as e:
+                    logger.error(f"[COUNTERS] {name} 재계산 실패: {str(e)}")
+                    if group.reconciled_at is None:
+                        raise
+
+    def snapshot(self, db: Session, *names: str) -> DashboardSnapshot:
+        """그룹 값 복사본과 그 값으로 만든 ETag"""
+        self.refresh(db, *names)
+        values = {}
+        for name in names:
+            group = self.groups[name]
+            with group.lock:
+                values[name] = dict(group.values)
+        return DashboardSnapshot(values, snapshot_etag(values))
+
+
+_registry = weakref.WeakKeyDictionary()  # 엔진 → DashboardCounters
+_registry_lock = threading.Lock()
+
+
+def get_dashboard_counters(db: Session) -> DashboardCounters:
+    """세션이 연결된 엔진의 카운터 (처음 조회 시 생성, 이후 쓰기부터 증감 추적)"""
+    bind = db.get_bind()
+    counters = _registry.get(bind)
+    if counters is None:
+        with _registry_lock:
+            counters = _registry.setdefault(bind, DashboardCounters())
+    return counters
+
+
+def not_modified(request: Request, response: HTTPResponse, etag: str) -> Optional[HTTPResponse]:
+    """If-None-Match가 현재 ETag와 같으면 304 응답, 아니면 응답 헤더에 ETag 설정"""
+    if request.headers.get("if-none-match") == etag:
+        return HTTPResponse(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
+
+
+# ---------- ORM 이벤트 ----------
+
+def _row_values(obj, spec: CounterSpec, old: bool) -> Optional[Dict[str, Any]]:
+    """
+    flush 직후 행의 이전/현재 컬럼 값 (지연 로딩 없이 상태 dict와 변경 이력만 사용)
+
+    만료된 속성에 값을 대입한 경우처럼 이전 값을 알 수 없으면 None
+    """
+    state = inspect(obj)
+    values = {}
+    for column in spec.columns:
+        if old:
+            history = state.attrs[column].history
+            if history.deleted:
+                values[column] = history.deleted[0]
+            elif history.added:
+                return None
+            else:
+                values[column] = state.dict.get(column)
+        else:
+            values[column] = state.dict.get(column)
+    return values
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_deltas(session, flush_context):
+    try:
+        counters = _registry.get(session.get_bind())
+    except Exception:
+        return
+    if counters is None:
+        return
+
+    deltas = session.info.setdefault(_DELTAS_KEY, {})
+    stale = session.info.setdefault(_STALE_KEY, set())
+
+    def add(spec: CounterSpec, keys: Iterable[str], amount: int):
+        group = deltas.setdefault(spec.name, {})
+        for key in keys:
+            group[key] = group.get(key, 0) + amount
+
+    for obj in session.new:
+        spec = counters.by_model.get(type(obj))
+        if spec is not None:
+            add(spec, list(spec.keys(_row_values(obj, spec, old=False))) + list(spec.insert_keys), 1)
+
+    for obj in session.dirty:
+        spec = counters.by_model.get(type(obj))
+        if spec is not None and spec.columns:
+            before = _row_values(obj, spec, old=True)
+            after = _row_values(obj, spec, old=False)
+            if before is None:
+                stale.add(spec.name)
+            elif before != after:
+                add(spec, spec.keys(before), -1)
+                add(spec, spec.keys(after), 1)
+
+    for obj in session.deleted:
+        spec = counters.by_model.get(type(obj))
+        if spec is not None:
+            before = _row_values(obj, spec, old=True)
+            if before is None:
+                stale.add(spec.name)
+            else:
+                add(spec, spec.keys(before), -1)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_deltas(session):
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    stale = session.info.pop(_STALE_KEY, None)
+    if not deltas and not stale:
+        return
+    try:
+        counters = _registry.get(session.get_bind())
+    except Exception:
+        return
+    if counters is not None:
+        counters.apply(deltas or {})
+        for name in stale or ():
+            counters.mark_dirty(name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_deltas(session):
+    session.info.pop(_DELTAS_KEY, None)
+    session.info.pop(_STALE_KEY, None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_writes(orm_execute_state):
+    """query.update()/delete() 같은 대량 쓰기는 개별 행을 알 수 없으므로 다음 조회 때 재계산"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    try:
+        counters = _registry.get(orm_execute_state.session.get_bind())
+    except Exception:
+        return
+    if counters is not None:
+        spec = counters.by_model.get(mapper.class_)
+        if spec is not None:
+            # 커밋 전에 다른 세션이 재계산할 수 있으므로 커밋 시점에도 다시 표시
+            counters.mark_dirty(spec.name)
+            orm_execute_state.session.info.setdefault(_STALE_KEY, set()).add(spec.name)
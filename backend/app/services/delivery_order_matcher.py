@@ -0,0 +1,187 @@
+"""
+Delivery Order Matcher
+네이버 배송 정보 ↔ 쿠팡 발주서 매칭 인덱스
+
+발주서 목록을 한 번 인덱싱한 뒤 배송 건마다 후보만 조회하여 매칭:
+- 정확 일치: 공백 제거한 수취인 이름
+- 마스킹 일치: (첫 글자, 마지막 글자, 글자수) 버킷 (예: 신*희 ↔ 신동희)
+- 부분 일치: 이름 부분 문자열 / (첫 글자, 글자수) 버킷
+- 상품명 토큰: 같은 등급의 후보끼리 순위 결정 (카탈로그 등록상품명 포함)
+배치 매칭은 점수 순으로 일대일 배정하여 같은 발주서가 두 번 매칭되지 않음
+"""
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# 매칭 등급별 신뢰도 (기존 CoupangShipmentService 기준 유지)
+CONFIDENCE_EXACT = 100
+CONFIDENCE_MASKED = 100
+CONFIDENCE_PARTIAL = 70
+
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """이름 정규화 (공백 제거)"""
+    return (name or "").replace(" ", "").strip()
+
+
+def product_tokens(product_name: Optional[str]) -> Set[str]:
+    """상품명 토큰 (2글자 이상 한글/영문/숫자, 소문자)"""
+    return {token.lower() for token in _TOKEN_PATTERN.findall(product_name or "")}
+
+
+class OrderMatchIndex:
+    """발주서 매칭 인덱스"""
+
+    def __init__(self, orders: List[Dict]):
+        self.orders = orders
+        self._exact: Dict[str, List[int]] = defaultdict(list)
+        self._masked: Dict[Tuple[str, str, int], List[int]] = defaultdict(list)
+        self._first_len: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        self._substrings: Dict[str, Set[int]] = defaultdict(set)
+        self._unmasked: Dict[str, List[int]] = defaultdict(list)
+        self._tokens: List[Set[str]] = []
+
+        for idx, order in enumerate(orders):
+            name = normalize_name(order.get("receiver_name"))
+            self._tokens.append(
+                product_tokens(order.get("product_name")) | product_tokens(order.get("catalog_product_name"))
+            )
+            if not name:
+                continue
+
+            self._exact[name].append(idx)
+            self._masked[(name[0], name[-1], len(name))].append(idx)
+
+            # 부분 매칭용 (마스킹 문자 제거 후)
+            unmasked = name.replace("*", "")
+            if not unmasked:
+                continue
+            self._unmasked[unmasked].append(idx)
+            self._first_len[(unmasked[0], len(unmasked))].append(idx)
+            for start in range(len(unmasked)):
+                for end in range(start + 1, len(unmasked) + 1):
+                    self._substrings[unmasked[start:end]].add(idx)
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def candidates(self, receiver_name: str, product_name: Optional[str] = None) -> List[Tuple[int, int, int]]:
+        """
+        후보 발주서 조회
+
+        Returns:
+            [(order_index, confidence, product_overlap)] 순위 내림차순
+        """
+        name = normalize_name(receiver_name)
+        if not name:
+            return []
+
+        found: Dict[int, int] = {}
+
+        for idx in self._exact.get(name, []):
+            found[idx] = CONFIDENCE_EXACT
+
+        # 마스킹 일치: 한쪽에 '*'가 있고 첫/마지막 글자와 길이가 같음
+        for idx in self._masked.get((name[0], name[-1], len(name)), []):
+            if idx in found:
+                continue
+            order_name = normalize_name(self.orders[idx].get("receiver_name"))
+            if "*" in name or "*" in order_name:
+                found[idx] = CONFIDENCE_MASKED
+
+        # 부분 일치: 한 이름이 다른 이름에 포함되거나, 첫 글자와 글자수가 같음
+        partial: Set[int] = set(self._substrings.get(name, ()))
+        for start in range(len(name)):
+            for end in range(start + 1, len(name) + 1):
+                partial.update(self._unmasked.get(name[start:end], ()))
+        partial.update(self._first_len.get((name[0], len(name)), ()))
+        for idx in partial:
+            found.setdefault(idx, CONFIDENCE_PARTIAL)
+
+        tokens = product_tokens(product_name)
+        ranked = [
+            (idx, confidence, len(tokens & self._tokens[idx]) if tokens else 0)
+            for idx, confidence in found.items()
+        ]
+        ranked.sort(key=lambda c: (-c[1], -c[2], c[0]))
+        return ranked
+
+    @staticmethod
+    def _ambiguity(ranked: List[Tuple[int, int, int]]) -> float:
+        """최고 순위와 동점인 후보 비율 (0: 유일, 0.5: 2개 동점, ...)"""
+        if not ranked:
+            return 0.0
+        best = ranked[0][1:]
+        ties = sum(1 for c in ranked if c[1:] == best)
+        return round(1 - 1 / ties, 2)
+
+    def _result(self, ranked: List[Tuple[int, int, int]], chosen: Optional[Tuple[int, int, int]]) -> Dict[str, Any]:
+        if chosen is None:
+            return {
+                "matched": False,
+                "confidence": 0,
+                "order": None,
+                "candidates": len(ranked),
+                "ambiguity": self._ambiguity(ranked)
+            }
+        return {
+            "matched": True,
+            "confidence": chosen[1],
+            "order": self.orders[chosen[0]],
+            "product_overlap": chosen[2],
+            "candidates": len(ranked),
+            "ambiguity": self._ambiguity(ranked)
+        }
+
+    def match(
+        self,
+        receiver_name: str,
+        product_name: Optional[str] = None,
+        exclude: Optional[Set[int]] = None
+    ) -> Dict[str, Any]:
+        """단건 매칭 (exclude: 이미 배정된 발주서 인덱스)"""
+        ranked = self.candidates(receiver_name, product_name)
+        if exclude:
+            ranked = [c for c in ranked if c[0] not in exclude]
+        return self._result(ranked, ranked[0] if ranked else None)
+
+    def assign(self, deliveries: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        배치 일대일 매칭
+
+        모든 (배송, 후보) 쌍을 신뢰도 → 상품명 일치도 → 모호도 순으로 정렬하여
+        배송/발주서가 아직 배정되지 않은 경우에만 배정
+
+        Args:
+            deliveries: [{"recipient": ..., "product_name": ...}]
+
+        Returns:
+            deliveries와 같은 순서의 매칭 결과 리스트
+        """
+        ranked_per_delivery = [
+            self.candidates(d.get("recipient") or d.get("receiver_name"), d.get("product_name"))
+            for d in deliveries
+        ]
+        ambiguity = [self._ambiguity(ranked) for ranked in ranked_per_delivery]
+
+        edges = [
+            (-candidate[1], -candidate[2], ambiguity[d_idx], d_idx, candidate)
+            for d_idx, ranked in enumerate(ranked_per_delivery)
+            for candidate in ranked
+        ]
+        edges.sort(key=lambda e: e[:4])
+
+        chosen: Dict[int, Tuple[int, int, int]] = {}
+        used_orders: Set[int] = set()
+        for _, _, _, d_idx, candidate in edges:
+            if d_idx in chosen or candidate[0] in used_orders:
+                continue
+            chosen[d_idx] = candidate
+            used_orders.add(candidate[0])
+
+        return [
+            self._result(ranked, chosen.get(d_idx))
+            for d_idx, ranked in enumerate(ranked_per_delivery)
+        ]
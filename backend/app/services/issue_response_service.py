@@ -4,14 +4,18 @@ Issue Response Service
 """
 import json
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
 from openai import OpenAI
 from loguru import logger
 from sqlalchemy.orm import Session
 
+from ..core.pagination import keyset_page
 from ..models.issue_response import IssueResponse, IssueTemplate
 from ..config import settings
+from .ai_stream import strip_markdown, stream_chat_completion
+from .llm_gateway import get_llm_gateway
+from .policy_retriever import get_policy_retriever
 
 
 class IssueResponseService:
@@ -43,7 +47,9 @@ class IssueResponseService:
             logger.warning("OpenAI API key not configured for IssueResponseService")
             self.client = None
         else:
+            # 스트리밍용 클라이언트 (일반 호출은 RPM/TPM 예산을 공유하는 게이트웨이 사용)
             self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.gateway = get_llm_gateway()
 
     def _load_guide(self, issue_type: str) -> Optional[Dict]:
         """가이드라인 JSON 파일 로드"""
@@ -224,7 +230,7 @@ class IssueResponseService:
   "important_notes": "중요 참고사항"
 }}"""
 
-            response = self.client.chat.completions.create(
+            response = self.gateway.complete_sync(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -294,7 +300,7 @@ class IssueResponseService:
 
         # 가이드라인 로드
         guide = self._load_guide(issue.issue_type)
-        guide_context = self._build_guide_context(guide, issue.issue_subtype, response_type)
+        guide_context = self._build_guide_context(guide, issue.issue_subtype, response_type, self._issue_query(issue))
 
         # 템플릿 찾기
         template = self._find_template(guide, issue.issue_subtype, response_type)
@@ -315,7 +321,66 @@ class IssueResponseService:
                 seller_name=seller_name
             )
 
-        # DB 업데이트
+        return self._save_generated(issue, result, response_type, template)
+
+    def stream_response(
+        self,
+        issue_id: int,
+        response_type: str = "appeal",
+        additional_context: str = "",
+        seller_name: str = ""
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        AI 답변 토큰 스트리밍 (generate_response와 같은 프롬프트)
+
+        토큰을 받는 대로 {"type": "token", "text"} 이벤트로 내보내고,
+        완료되면 DB에 저장한 뒤 generate_response와 같은 결과를 {"type": "done", "data"}로 반환
+        AI를 사용할 수 없거나 생성에 실패하면 템플릿 답변을 done 이벤트로 반환
+
+        Raises:
+            ValueError: 문제를 찾을 수 없음 (스트리밍 시작 전)
+        """
+        issue = self.db.query(IssueResponse).filter(IssueResponse.id == issue_id).first()
+        if not issue:
+            raise ValueError(f"Issue not found: {issue_id}")
+
+        guide = self._load_guide(issue.issue_type)
+        guide_context = self._build_guide_context(guide, issue.issue_subtype, response_type, self._issue_query(issue))
+        template = self._find_template(guide, issue.issue_subtype, response_type)
+
+        def events() -> Iterator[Dict[str, Any]]:
+            result = None
+            if self.client:
+                try:
+                    for event in stream_chat_completion(
+                        self.client,
+                        **self._build_generation_request(
+                            issue, response_type, guide_context, template, additional_context, seller_name
+                        )
+                    ):
+                        if event["type"] == "token":
+                            yield event
+                        elif event["response_text"]:
+                            result = self._finalize_generation(
+                                event["response_text"], event["finish_reason"], guide_context, additional_context
+                            )
+                except Exception as e:
+                    logger.error(f"AI response streaming failed: {e}")
+
+            if result is None:
+                result = self._generate_from_template(issue, template, seller_name)
+            yield {"type": "done", "data": self._save_generated(issue, result, response_type, template)}
+
+        return events()
+
+    def _save_generated(
+        self,
+        issue: IssueResponse,
+        result: Dict[str, Any],
+        response_type: str,
+        template: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """생성 결과 DB 저장"""
         issue.generated_response = result.get("response_text", "")
         issue.response_type = response_type
         issue.confidence = result.get("confidence", 0)
@@ -332,54 +397,34 @@ class IssueResponseService:
             "template_used": template.get("name") if template else None
         }
 
+    def _issue_query(self, issue: IssueResponse) -> str:
+        """가이드 검색 질의 (요약 + 원본 내용)"""
+        return " ".join(part for part in (issue.summary, issue.original_content) if part)
+
     def _build_guide_context(
         self,
         guide: Optional[Dict],
         subtype: Optional[str],
-        response_type: str
+        response_type: str,
+        query: str = ""
     ) -> str:
-        """가이드라인 컨텍스트 구성"""
+        """
+        가이드라인 컨텍스트 구성
+
+        가이드 전체를 붙이지 않고 문제 내용과 관련도가 높은 청크만 토큰 예산 안에서 포함
+        (해당 세부 유형의 항목과 가이드 공통 항목(법규/실수)은 우선 포함)
+        """
         if not guide:
             return ""
 
-        context_parts = [f"[가이드라인: {guide.get('title', '')}]"]
-
-        # 세부 유형 정보
-        if subtype:
-            for st in guide.get("subtypes", []):
-                if st.get("id") == subtype:
-                    context_parts.append(f"\n[세부 유형: {st.get('name', '')}]")
-                    context_parts.append(f"설명: {st.get('description', '')}")
-
-                    if st.get("checklist"):
-                        context_parts.append("\n[체크리스트]")
-                        for item in st["checklist"]:
-                            context_parts.append(f"- {item}")
-
-                    if st.get("tips"):
-                        context_parts.append("\n[대응 팁]")
-                        for tip in st["tips"]:
-                            context_parts.append(f"- {tip}")
-
-                    if st.get("required_documents"):
-                        context_parts.append("\n[필요 서류]")
-                        for doc in st["required_documents"]:
-                            context_parts.append(f"- {doc}")
-                    break
-
-        # 법적 참조
-        if guide.get("legal_references"):
-            context_parts.append("\n[관련 법규]")
-            for ref in guide["legal_references"]:
-                context_parts.append(f"- {ref}")
-
-        # 흔한 실수
-        if guide.get("common_mistakes"):
-            context_parts.append("\n[피해야 할 실수]")
-            for mistake in guide["common_mistakes"]:
-                context_parts.append(f"- {mistake}")
-
-        return "\n".join(context_parts)
+        context = get_policy_retriever().build_context(
+            query=query,
+            sources=("guide",),
+            where={"guide": guide.get("type")},
+            prefer={"subtype": subtype, "scope": "guide"}
+        )
+        header = f"[가이드라인: {guide.get('title', '')}]"
+        return f"{header}\n\n{context}" if context else header
 
     def _find_template(
         self,
@@ -405,7 +450,7 @@ class IssueResponseService:
 
         return templates[0] if templates else None
 
-    def _generate_with_ai(
+    def _build_generation_request(
         self,
         issue: IssueResponse,
         response_type: str,
@@ -414,15 +459,14 @@ class IssueResponseService:
         additional_context: str,
         seller_name: str
     ) -> Dict[str, Any]:
-        """AI를 사용한 답변 생성"""
-        try:
-            response_type_names = {
-                "appeal": "이의제기서",
-                "statement": "소명서",
-                "report": "신고 답변서"
-            }
+        """답변 생성 요청 파라미터 (일반 호출/스트리밍 공용)"""
+        response_type_names = {
+            "appeal": "이의제기서",
+            "statement": "소명서",
+            "report": "신고 답변서"
+        }
 
-            system_prompt = f"""당신은 쿠팡 판매자를 위한 법무/CS 답변 작성 전문가입니다.
+        system_prompt = f"""당신은 쿠팡 판매자를 위한 법무/CS 답변 작성 전문가입니다.
 주어진 문제 상황에 대해 전문적이고 효과적인 {response_type_names.get(response_type, '답변')}을 작성해주세요.
 
 작성 지침:
@@ -434,11 +478,11 @@ class IssueResponseService:
 6. 감정적 표현 자제
 7. 마크다운 형식 사용하지 않기"""
 
-            template_text = ""
-            if template:
-                template_text = f"\n\n[참고 템플릿]\n{template.get('template', '')}"
+        template_text = ""
+        if template:
+            template_text = f"\n\n[참고 템플릿]\n{template.get('template', '')}"
 
-            user_prompt = f"""다음 문제에 대한 {response_type_names.get(response_type, '답변')}을 작성해주세요.
+        user_prompt = f"""다음 문제에 대한 {response_type_names.get(response_type, '답변')}을 작성해주세요.
 
 [문제 유형]: {self.ISSUE_TYPES.get(issue.issue_type, '기타')} - {issue.issue_subtype or '일반'}
 [심각도]: {issue.severity}
@@ -458,38 +502,63 @@ class IssueResponseService:
 위 정보를 바탕으로 답변을 작성해주세요.
 답변 마지막에 첨부 권장 서류 목록을 별도로 안내해주세요."""
 
-            response = self.client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1500
-            )
+        return {
+            "model": settings.OPENAI_MODEL,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 1500
+        }
 
-            response_text = response.choices[0].message.content.strip()
+    def _finalize_generation(
+        self,
+        response_text: str,
+        finish_reason: Optional[str],
+        guide_context: str,
+        additional_context: str
+    ) -> Dict[str, Any]:
+        """마크다운이 제거된 답변으로 첨부 서류 추천과 신뢰도 계산"""
+        # 첨부 서류 추천 추출
+        suggestions = self._extract_suggestions(response_text, guide_context)
 
-            # 마크다운 제거
-            response_text = response_text.replace('**', '')
-            response_text = response_text.replace('*', '')
-            response_text = response_text.replace('_', '')
+        # 신뢰도 계산
+        confidence = 85
+        if finish_reason == 'stop':
+            confidence += 5
+        if additional_context:
+            confidence += 5
 
-            # 첨부 서류 추천 추출
-            suggestions = self._extract_suggestions(response_text, guide_context)
+        return {
+            "response_text": response_text,
+            "confidence": min(100, confidence),
+            "suggestions": suggestions
+        }
 
-            # 신뢰도 계산
-            confidence = 85
-            if response.choices[0].finish_reason == 'stop':
-                confidence += 5
-            if additional_context:
-                confidence += 5
+    def _generate_with_ai(
+        self,
+        issue: IssueResponse,
+        response_type: str,
+        guide_context: str,
+        template: Optional[Dict],
+        additional_context: str,
+        seller_name: str
+    ) -> Dict[str, Any]:
+        """AI를 사용한 답변 생성"""
+        try:
+            response = self.gateway.complete_sync(
+                **self._build_generation_request(
+                    issue, response_type, guide_context, template, additional_context, seller_name
+                )
+            )
 
-            return {
-                "response_text": response_text,
-                "confidence": min(100, confidence),
-                "suggestions": suggestions
-            }
+            # 마크다운 제거
+            response_text = strip_markdown(response.choices[0].message.content)
+
+            return self._finalize_generation(
+                response_text, response.choices[0].finish_reason, guide_context, additional_context
+            )
 
         except Exception as e:
             logger.error(f"AI response generation failed: {e}")
@@ -559,17 +628,17 @@ class IssueResponseService:
         suggestions = []
 
         # 가이드 컨텍스트에서 필요 서류 추출
-        if "[필요 서류]" in guide_context:
+        if "[필요 서류" in guide_context:
             lines = guide_context.split("\n")
             in_docs = False
             for line in lines:
-                if "[필요 서류]" in line:
+                if line.startswith("[필요 서류"):
                     in_docs = True
                     continue
                 if in_docs:
                     if line.startswith("- "):
                         suggestions.append(line[2:])
-                    elif line.startswith("["):
+                    else:
                         break
 
         # 응답 텍스트에서 추가 추출
@@ -589,6 +658,17 @@ class IssueResponseService:
         offset: int = 0
     ) -> List[Dict]:
         """이전 대응 이력 조회"""
+        return self.get_history_page(coupang_account_id, issue_type, limit, offset)["data"]
+
+    def get_history_page(
+        self,
+        coupang_account_id: Optional[int] = None,
+        issue_type: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """이전 대응 이력 조회 (최신순, cursor 지정 시 키셋 페이지네이션)"""
         query = self.db.query(IssueResponse)
 
         if coupang_account_id:
@@ -597,11 +677,13 @@ class IssueResponseService:
         if issue_type:
             query = query.filter(IssueResponse.issue_type == issue_type)
 
-        query = query.order_by(IssueResponse.created_at.desc())
-        query = query.offset(offset).limit(limit)
-
-        issues = query.all()
-        return [issue.to_dict() for issue in issues]
+        issues, next_cursor = keyset_page(
+            query, IssueResponse.created_at, IssueResponse.id, limit, cursor=cursor, offset=offset
+        )
+        return {
+            "data": [issue.to_dict(include_payload=False) for issue in issues],
+            "next_cursor": next_cursor
+        }
 
     def get_issue(self, issue_id: int) -> Optional[Dict]:
         """특정 문제 조회"""
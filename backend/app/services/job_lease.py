@@ -0,0 +1,112 @@
+"""
+Job Lease Locks
+DB 기반 스케줄러 작업 리스 잠금
+
+여러 인스턴스(fly.io 머신)가 같은 스케줄을 갖고 있어도 작업별로 한 곳에서만 실행:
+- acquire: 만료된 리스만 조건부 UPDATE로 가져오고, 행이 없으면 INSERT (PK 충돌 시 실패)
+- renew: 실행 중 하트비트로 만료 시각 연장 (본인 토큰일 때만)
+- release: 실행 종료 시 즉시 만료 처리
+인스턴스가 죽으면 리스는 TTL 경과 후 다른 인스턴스가 가져감
+"""
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.scheduler_job import SchedulerJobLock
+
+
+def instance_id() -> str:
+    """현재 인스턴스 식별자 (fly.io 머신 ID 또는 호스트명 + PID)"""
+    machine = os.environ.get("FLY_MACHINE_ID") or socket.gethostname()
+    return f"{machine}:{os.getpid()}"
+
+
+class JobLease:
+    """작업 1개에 대한 리스 (실행 1회 단위)"""
+
+    def __init__(self, db: Session, job_id: str, ttl_seconds: int, owner: Optional[str] = None):
+        self.db = db
+        self.job_id = job_id
+        self.ttl_seconds = ttl_seconds
+        self.owner = owner or instance_id()
+        self.token = uuid.uuid4().hex
+        self.held = False
+
+    def acquire(self, now: Optional[datetime] = None) -> bool:
+        """리스 획득 (다른 인스턴스가 유효한 리스를 보유 중이면 False)"""
+        now = now or datetime.utcnow()
+        values = {
+            "owner": self.owner,
+            "token": self.token,
+            "acquired_at": now,
+            "heartbeat_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds)
+        }
+
+        claimed = self.db.query(SchedulerJobLock).filter(
+            SchedulerJobLock.job_id == self.job_id,
+            SchedulerJobLock.expires_at <= now
+        ).update(values, synchronize_session=False)
+
+        if claimed:
+            self.db.commit()
+            self.held = True
+            return True
+
+        try:
+            self.db.add(SchedulerJobLock(job_id=self.job_id, **values))
+            self.db.commit()
+            self.held = True
+        except IntegrityError:
+            # 이미 다른 인스턴스가 보유 중
+            self.db.rollback()
+            self.held = False
+        return self.held
+
+    def bind(self, db: Session) -> "JobLease":
+        """같은 리스를 다른 세션에서 다루는 사본 (하트비트 스레드용)"""
+        lease = JobLease(db, self.job_id, self.ttl_seconds, owner=self.owner)
+        lease.token = self.token
+        lease.held = self.held
+        return lease
+
+    def renew(self, now: Optional[datetime] = None) -> bool:
+        """만료 시각 연장 (리스를 잃었으면 False)"""
+        if not self.held:
+            return False
+        now = now or datetime.utcnow()
+        renewed = self.db.query(SchedulerJobLock).filter(
+            SchedulerJobLock.job_id == self.job_id,
+            SchedulerJobLock.token == self.token
+        ).update({
+            "heartbeat_at": now,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds)
+        }, synchronize_session=False)
+        self.db.commit()
+
+        if not renewed:
+            logger.warning(f"[LEASE] {self.job_id}: 리스를 잃었습니다 (owner={self.owner})")
+            self.held = False
+        return bool(renewed)
+
+    def release(self):
+        """리스 해제 (본인 토큰일 때만 즉시 만료)"""
+        if not self.held:
+            return
+        try:
+            self.db.query(SchedulerJobLock).filter(
+                SchedulerJobLock.job_id == self.job_id,
+                SchedulerJobLock.token == self.token
+            ).update({"token": None, "expires_at": datetime.utcnow()}, synchronize_session=False)
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"[LEASE] {self.job_id}: 리스 해제 실패: {e}")
+            self.db.rollback()
+        finally:
+            self.held = False
@@ -11,6 +11,7 @@ from sqlalchemy import func, and_
 from loguru import logger
 
 from ..models import Response, ResponseFeedback, LearningPattern, PromptImprovement, Inquiry
+from .pattern_rewriter import get_pattern_rewriter
 
 
 class LearningService:
@@ -85,6 +86,9 @@ class LearningService:
         """
         Apply learned patterns to improve text
 
+        Active patterns are compiled into one cached rewriter (longest match,
+        non-overlapping); usage counts are recorded in batches.
+
         Args:
             text: Original text
             category: Inquiry category
@@ -92,38 +96,13 @@ class LearningService:
         Returns:
             Improved text
         """
-        # Get active patterns
-        query = self.db.query(LearningPattern).filter(
-            LearningPattern.is_active == True,
-            LearningPattern.confidence_score >= 0.6
-        )
-
-        if category:
-            query = query.filter(
-                (LearningPattern.category == category) |
-                (LearningPattern.category.is_(None))
-            )
-
-        patterns = query.order_by(
-            LearningPattern.success_rate.desc()
-        ).all()
-
-        improved_text = text
-
-        for pattern in patterns:
-            if pattern.before_pattern in improved_text:
-                improved_text = improved_text.replace(
-                    pattern.before_pattern,
-                    pattern.after_pattern
-                )
+        rewriter = get_pattern_rewriter(self.db)
+        improved_text, applied = rewriter.apply(self.db, text, category)
 
-                # Update usage statistics
-                pattern.times_applied += 1
-                logger.debug(f"Applied pattern: {pattern.pattern_type}")
-
-        if improved_text != text:
-            self.db.commit()
-            logger.info(f"Applied {len([p for p in patterns if p.before_pattern in text])} patterns")
+        if applied:
+            logger.debug(f"Applied {applied} learned pattern replacements")
+            if rewriter.usage_flush_due():
+                rewriter.flush_usage(self.db)
 
         return improved_text
 
@@ -137,6 +116,9 @@ class LearningService:
         Returns:
             Insights dictionary
         """
+        # Record buffered pattern usage so times_applied is current
+        get_pattern_rewriter(self.db).flush_usage(self.db)
+
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
         feedbacks = self.db.query(ResponseFeedback).filter(
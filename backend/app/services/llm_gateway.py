@@ -0,0 +1,409 @@
+"""
+LLM Gateway
+OpenAI 호출 공용 게이트웨이 (RPM/TPM 예산, 429 시 동시 실행 한도 조절, 전용 이벤트 루프 스레드)
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
+
+from ..config import settings
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # 선택 의존성 (없으면 문자 수 기반 추정)
+    _ENCODING = None
+
+MESSAGE_OVERHEAD_TOKENS = 4
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int = 0) -> int:
+    """
+    요청 1건이 소비할 토큰 추정 (프롬프트 + 최대 완성 토큰)
+
+    tiktoken이 없으면 ASCII는 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰으로 계산
+    (한국어 문의/답변 기준으로 실제보다 약간 크게 잡힘)
+    """
+    prompt = 0
+    for message in messages:
+        content = message.get("content") or ""
+        if not isinstance(content, str):
+            content = str(content)
+        prompt += count_text_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+    return prompt + (max_tokens or 0)
+
+
+def count_text_tokens(text: str) -> int:
+    """텍스트 한 덩어리의 토큰 수 추정 (estimate_tokens와 같은 기준)"""
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+class RateBudget:
+    """
+    분당 한도 토큰 버킷 (용량 = 분당 한도, 초당 한도/60씩 충전)
+
+    per_minute가 0 이하이면 제한 없음
+    """
+
+    def __init__(self, per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.per_minute = per_minute
+        self.level = float(per_minute)
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.level = min(self.per_minute, self.level + (now - self._updated) * self.per_minute / 60.0)
+        self._updated = now
+
+    def wait_time(self, cost: float) -> float:
+        """cost만큼 쓸 수 있을 때까지 남은 시간(초)"""
+        if self.per_minute <= 0:
+            return 0.0
+        self._refill()
+        cost = min(cost, self.per_minute)  # 한도보다 큰 요청도 버킷이 가득 차면 보냄
+        if self.level >= cost:
+            return 0.0
+        return (cost - self.level) * 60.0 / self.per_minute
+
+    def take(self, cost: float):
+        if self.per_minute > 0:
+            self._refill()
+            self.level -= cost
+
+    def refund(self, amount: float):
+        """예약보다 적게 쓴 만큼 반환 (음수면 추가 차감)"""
+        if self.per_minute > 0:
+            self._refill()
+            self.level = min(self.per_minute, self.level + amount)
+
+    def sync(self, remaining: float):
+        """서버가 알려준 잔여량이 더 적으면 맞춤"""
+        if self.per_minute > 0:
+            self._refill()
+            self.level = min(self.level, remaining)
+
+
+def _header_seconds(headers, attempt: int, base_delay: float) -> float:
+    """재시도 대기 시간 (retry-after-ms / retry-after, 없으면 지수 백오프)"""
+    if headers is not None:
+        for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+            value = headers.get(name)
+            if value:
+                try:
+                    return max(0.0, float(value) * scale)
+                except ValueError:
+                    pass
+    return base_delay * (2 ** attempt)
+
+
+def _header_number(headers, name: str) -> Optional[float]:
+    value = headers.get(name) if headers is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class LLMGateway:
+    """
+    OpenAI 채팅 완성 게이트웨이
+
+    Args:
+        api_key / base_url: OpenAI 인증 정보 (base_url 생략 시 OPENAI_BASE_URL 환경 변수)
+        rpm / tpm: 분당 요청/토큰 한도 (0이면 제한 없음)
+        max_concurrency: 최대 동시 요청 수 (429 시 자동 축소 후 복구)
+        max_retries: 429/연결 오류/타임아웃/5xx 재시도 횟수 (SDK 자체 재시도는 끔)
+        backoff_seconds: retry-after 헤더가 없을 때 첫 재시도 대기 시간
+        client: AsyncOpenAI 클라이언트 (테스트용)
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        rpm: int = 500,
+        tpm: int = 90000,
+        max_concurrency: int = 16,
+        max_retries: int = 4,
+        backoff_seconds: float = 1.0,
+        client: Optional[AsyncOpenAI] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.client = client or AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+        self.requests = RateBudget(rpm, clock)
+        self.tokens = RateBudget(tpm, clock)
+        self.max_concurrency = max_concurrency
+        self.concurrency_limit = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._clock = clock
+
+        self.in_flight = 0
+        self.queued = 0
+        self._paused_until = 0.0
+        self._successes_since_increase = 0
+        self._throughput: Deque[Tuple[float, int]] = deque()
+        self._throughput_lock = threading.Lock()  # 게이트웨이 루프 스레드와 metrics() 호출 스레드가 공유
+        self.stats = {
+            "requests": 0,
+            "completed": 0,
+            "rate_limited": 0,
+            "transient_errors": 0,
+            "errors": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "estimated_tokens": 0,
+        }
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._condition: Optional[asyncio.Condition] = None
+        self._start_lock = threading.Lock()
+
+    # ==================== 이벤트 루프 ====================
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    ready = threading.Event()
+
+                    def run():
+                        asyncio.set_event_loop(loop)
+                        self._condition = asyncio.Condition()
+                        ready.set()
+                        loop.run_forever()
+
+                    self._thread = threading.Thread(target=run, name="llm-gateway", daemon=True)
+                    self._thread.start()
+                    ready.wait()
+                    self._loop = loop
+        return self._loop
+
+    def _submit(self, params: Dict[str, Any]):
+        return asyncio.run_coroutine_threadsafe(self._complete(params), self._ensure_loop())
+
+    # ==================== 공개 API ====================
+
+    def complete_sync(self, **params) -> Any:
+        """
+        채팅 완성 1건 (동기 코드용, 완료될 때까지 블록)
+
+        Args:
+            **params: chat.completions.create 인자 (model, messages, max_tokens 등)
+
+        Returns:
+            ChatCompletion
+        """
+        return self._submit(params).result()
+
+    async def complete(self, **params) -> Any:
+        """채팅 완성 1건 (어느 이벤트 루프에서든 await 가능)"""
+        return await asyncio.wrap_future(self._submit(params))
+
+    async def complete_many(self, requests: List[Dict[str, Any]]) -> List[Any]:
+        """
+        여러 요청을 예산이 허용하는 만큼 동시에 실행
+
+        Returns:
+            입력 순서대로 ChatCompletion 또는 실패한 요청의 예외
+        """
+        return await asyncio.gather(*(self.complete(**params) for params in requests), return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        """대기열/처리량 지표"""
+        now = self._clock()
+        with self._throughput_lock:
+            self._trim_throughput(now)
+            tokens_per_minute = sum(tokens for _, tokens in self._throughput)
+        return {
+            "queue_depth": self.queued,
+            "in_flight": self.in_flight,
+            "concurrency_limit": self.concurrency_limit,
+            "max_concurrency": self.max_concurrency,
+            "rpm_limit": self.requests.per_minute,
+            "tpm_limit": self.tokens.per_minute,
+            "requests_available": round(self.requests.level, 1) if self.requests.per_minute > 0 else None,
+            "tokens_available": round(self.tokens.level) if self.tokens.per_minute > 0 else None,
+            "tokens_per_minute": tokens_per_minute,
+            "paused_seconds": round(max(0.0, self._paused_until - now), 2),
+            **self.stats,
+        }
+
+    def close(self, timeout: float = 5.0):
+        """클라이언트 연결을 닫고 이벤트 루프 스레드 종료"""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.client.close(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"LLM gateway client close failed: {str(e)}")
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._loop = None
+        self._thread = None
+
+    # ==================== 내부 ====================
+
+    async def _complete(self, params: Dict[str, Any]) -> Any:
+        estimated = estimate_tokens(params.get("messages", []), params.get("max_tokens") or 0)
+        self.stats["requests"] += 1
+        self.stats["estimated_tokens"] += estimated
+
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(estimated)
+            try:
+                raw = await self.client.chat.completions.with_raw_response.create(**params)
+                completion = raw.parse()
+            except RateLimitError as e:
+                self._release()
+                self.tokens.refund(estimated)  # 거부된 요청은 TPM을 쓰지 않음 (재시도마다 다시 예약)
+                delay = self._on_rate_limited(getattr(e.response, "headers", None), attempt)
+                if attempt >= self.max_retries:
+                    self.stats["errors"] += 1
+                    raise
+                logger.warning(
+                    f"OpenAI rate limited (attempt {attempt + 1}), pausing {delay:.1f}s, "
+                    f"concurrency limit {self.concurrency_limit}"
+                )
+                continue
+            except (APIConnectionError, InternalServerError) as e:
+                # 연결 오류/타임아웃/5xx: 이 요청만 백오프 후 재시도 (게이트웨이 전체는 멈추지 않음)
+                self._release()
+                self.tokens.refund(estimated)
+                if attempt >= self.max_retries:
+                    self.stats["errors"] += 1
+                    raise
+                self.stats["transient_errors"] += 1
+                delay = _header_seconds(getattr(getattr(e, "response", None), "headers", None), attempt,
+                                        self.backoff_seconds)
+                logger.warning(f"OpenAI request failed (attempt {attempt + 1}), retrying in {delay:.1f}s: {str(e)}")
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                self._release()
+                self.tokens.refund(estimated)  # 처리되지 않은 요청의 예약 토큰 반환
+                self.stats["errors"] += 1
+                raise
+
+            self._release()
+            self._on_success(raw.headers, estimated, getattr(completion, "usage", None))
+            return completion
+
+    async def _acquire(self, estimated: int):
+        """동시 실행 슬롯과 RPM/TPM 예산을 확보할 때까지 대기"""
+        self.queued += 1
+        try:
+            async with self._condition:
+                while True:
+                    now = self._clock()
+                    wait = max(
+                        self._paused_until - now,
+                        self.requests.wait_time(1),
+                        self.tokens.wait_time(estimated)
+                    )
+                    if wait <= 0 and self.in_flight < self.concurrency_limit:
+                        self.requests.take(1)
+                        self.tokens.take(estimated)
+                        self.in_flight += 1
+                        return
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout=wait if wait > 0 else None)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            self.queued -= 1
+
+    def _release(self):
+        self.in_flight -= 1
+
+        async def notify():
+            async with self._condition:
+                self._condition.notify_all()
+
+        asyncio.ensure_future(notify())
+
+    def _on_rate_limited(self, headers, attempt: int) -> float:
+        self.stats["rate_limited"] += 1
+        delay = _header_seconds(headers, attempt, self.backoff_seconds)
+        self._paused_until = max(self._paused_until, self._clock() + delay)
+        self.concurrency_limit = max(1, self.concurrency_limit // 2)
+        self._successes_since_increase = 0
+        return delay
+
+    def _on_success(self, headers, estimated: int, usage):
+        self.stats["completed"] += 1
+
+        used = estimated
+        if usage is not None:
+            used = usage.total_tokens
+            self.stats["prompt_tokens"] += usage.prompt_tokens
+            self.stats["completion_tokens"] += usage.completion_tokens
+            self.tokens.refund(estimated - used)
+
+        remaining_requests = _header_number(headers, "x-ratelimit-remaining-requests")
+        if remaining_requests is not None:
+            self.requests.sync(remaining_requests)
+        remaining_tokens = _header_number(headers, "x-ratelimit-remaining-tokens")
+        if remaining_tokens is not None:
+            self.tokens.sync(remaining_tokens)
+
+        now = self._clock()
+        with self._throughput_lock:
+            self._throughput.append((now, used))
+            self._trim_throughput(now)
+
+        # 성공이 현재 한도만큼 이어지면 한도 1 증가
+        if self.concurrency_limit < self.max_concurrency:
+            self._successes_since_increase += 1
+            if self._successes_since_increase >= self.concurrency_limit:
+                self.concurrency_limit += 1
+                self._successes_since_increase = 0
+
+    def _trim_throughput(self, now: float):
+        """처리량 창 밖의 기록 제거 (_throughput_lock 보유 상태에서 호출)"""
+        while self._throughput and now - self._throughput[0][0] > THROUGHPUT_WINDOW_SECONDS:
+            self._throughput.popleft()
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> Optional[LLMGateway]:
+    """설정값으로 만든 공유 게이트웨이 (OpenAI API 키가 없으면 None)"""
+    global _gateway
+    if not settings.OPENAI_API_KEY:
+        return None
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway(
+                    api_key=settings.OPENAI_API_KEY,
+                    rpm=settings.OPENAI_RPM_LIMIT,
+                    tpm=settings.OPENAI_TPM_LIMIT,
+                    max_concurrency=settings.OPENAI_MAX_CONCURRENCY,
+                    max_retries=settings.OPENAI_MAX_RETRIES
+                )
+    return _gateway
+
+
+def close_llm_gateway():
+    global _gateway
+    with _gateway_lock:
+        gateway, _gateway = _gateway, None
+    if gateway is not None:
+        gateway.close()
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from .naverpay_scraper import NaverPayScraper, get_scraper, scrape_logger
 from .coupang_shipment_service import CoupangShipmentService
+from .dashboard_counters import DashboardSnapshot, get_dashboard_counters
 from ..models.naver_delivery_sync import (
     NaverDeliveryInfo,
     CoupangPendingOrder,
@@ -111,16 +112,14 @@ class NaverDeliverySyncService:
                 pending_orders = coupang_service.get_pending_orders(hours_back=24)
                 yield {"type": "status", "message": f"쿠팡 발주서 {len(pending_orders)}건 조회됨"}
 
-                # 4. 매칭 및 업로드
+                # 4. 매칭 및 업로드 (인덱스 기반 일괄 일대일 매칭)
                 matched_count = 0
                 uploaded_count = 0
 
-                for delivery in collected_deliveries:
-                    # 수취인 이름으로 매칭
-                    match_result = coupang_service.match_delivery_with_orders(
-                        receiver_name=delivery["recipient"]
-                    )
+                match_results = coupang_service.match_deliveries_batch(collected_deliveries)
+                upload_queue = []
 
+                for delivery, match_result in zip(collected_deliveries, match_results):
                     if match_result["matched"]:
                         matched_count += 1
                         matched_order = match_result["order"]
@@ -141,43 +140,50 @@ class NaverDeliverySyncService:
                                 "tracking_number": delivery["tracking_number"],
                                 "courier": delivery["courier"],
                                 "confidence": match_result["confidence"],
+                                "ambiguity": match_result["ambiguity"],
                                 "order_id": matched_order.get("order_id")
                             }
                         }
 
-                        # 자동 업로드
+                        # 자동 업로드 대상 수집
                         if auto_upload:
                             courier_code = get_coupang_courier_code(delivery["courier"])
                             if courier_code:
-                                upload_result = coupang_service.upload_invoice(
-                                    shipment_box_id=matched_order["shipment_box_id"],
-                                    order_id=matched_order["order_id"],
-                                    vendor_item_id=matched_order["vendor_item_id"],
-                                    courier_code=courier_code,
-                                    tracking_number=delivery["tracking_number"]
-                                )
-
-                                if upload_result["success"]:
-                                    uploaded_count += 1
-                                    await self._update_delivery_uploaded(
-                                        tracking_number=delivery["tracking_number"],
-                                        result=upload_result
-                                    )
-
-                                yield {
-                                    "type": "uploaded",
-                                    "data": {
-                                        "tracking_number": delivery["tracking_number"],
-                                        "success": upload_result["success"],
-                                        "error": upload_result.get("error")
-                                    }
-                                }
+                                upload_queue.append({
+                                    "shipment_box_id": matched_order["shipment_box_id"],
+                                    "order_id": matched_order["order_id"],
+                                    "vendor_item_id": matched_order["vendor_item_id"],
+                                    "courier_code": courier_code,
+                                    "tracking_number": delivery["tracking_number"]
+                                })
                             else:
                                 yield {
                                     "type": "warning",
                                     "message": f"택배사 코드를 찾을 수 없음: {delivery['courier']}"
                                 }
 
+                # 5. 자동 업로드 (병렬 일괄 전송)
+                if upload_queue:
+                    yield {"type": "status", "message": f"송장 {len(upload_queue)}건 업로드 중..."}
+                    batch_result = coupang_service.upload_invoices_batch(upload_queue)
+
+                    for upload_result in batch_result["details"]:
+                        if upload_result["success"]:
+                            uploaded_count += 1
+                            await self._update_delivery_uploaded(
+                                tracking_number=upload_result["tracking_number"],
+                                result=upload_result
+                            )
+
+                        yield {
+                            "type": "uploaded",
+                            "data": {
+                                "tracking_number": upload_result["tracking_number"],
+                                "success": upload_result["success"],
+                                "error": upload_result.get("error")
+                            }
+                        }
+
                 yield {
                     "type": "complete",
                     "data": {
@@ -304,7 +310,7 @@ class NaverDeliverySyncService:
             NaverDeliveryInfo.status == "pending"
         ).order_by(NaverDeliveryInfo.created_at.desc()).all()
 
-        return [d.to_dict() for d in deliveries]
+        return [d.to_dict(include_payload=False) for d in deliveries]
 
     def get_matched_deliveries(self, uploaded: bool = None) -> List[Dict]:
         """매칭된 배송 정보 조회"""
@@ -318,25 +324,18 @@ class NaverDeliverySyncService:
             query = query.filter(NaverDeliveryInfo.status == "matched")
 
         deliveries = query.order_by(NaverDeliveryInfo.created_at.desc()).all()
-        return [d.to_dict() for d in deliveries]
-
-    def get_delivery_stats(self) -> Dict:
-        """배송 동기화 통계"""
-        from sqlalchemy import func
-
-        total = self.db.query(func.count(NaverDeliveryInfo.id)).scalar() or 0
-        pending = self.db.query(func.count(NaverDeliveryInfo.id)).filter(
-            NaverDeliveryInfo.status == "pending"
-        ).scalar() or 0
-        matched = self.db.query(func.count(NaverDeliveryInfo.id)).filter(
-            NaverDeliveryInfo.status == "matched"
-        ).scalar() or 0
-        uploaded = self.db.query(func.count(NaverDeliveryInfo.id)).filter(
-            NaverDeliveryInfo.status == "uploaded"
-        ).scalar() or 0
-        failed = self.db.query(func.count(NaverDeliveryInfo.id)).filter(
-            NaverDeliveryInfo.status == "failed"
-        ).scalar() or 0
+        return [d.to_dict(include_payload=False) for d in deliveries]
+
+    def get_delivery_stats(self, snapshot: Optional[DashboardSnapshot] = None) -> Dict:
+        """배송 동기화 통계 (증분 카운터, ETag를 확인한 스냅샷이 있으면 그대로 사용)"""
+        if snapshot is None:
+            snapshot = get_dashboard_counters(self.db).snapshot(self.db, "naver_delivery")
+        counts = snapshot.values["naver_delivery"]
+        total = counts.get("total", 0)
+        pending = counts.get("status:pending", 0)
+        matched = counts.get("status:matched", 0)
+        uploaded = counts.get("status:uploaded", 0)
+        failed = counts.get("status:failed", 0)
 
         return {
             "total": total,
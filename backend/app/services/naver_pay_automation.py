@@ -4,7 +4,7 @@ https://pay.naver.com/pc/history 에서 주문 찾아서 반품 처리
 """
 import time
 import logging
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -303,6 +303,42 @@ class NaverPayAutomation:
             logger.error(f"반품 처리 중 오류: {str(e)}")
             return False
 
+    def process_single_return(self, product_name: str, receiver_name: str = "") -> Tuple[bool, Optional[str]]:
+        """
+        반품 단건 처리 (로그인 및 결제내역 이동 후 호출)
+
+        Args:
+            product_name: 상품명
+            receiver_name: 수령인 이름
+
+        Returns:
+            (성공 여부, 오류 메시지)
+        """
+        try:
+            if not product_name:
+                logger.warning("상품명이 없어 스킵")
+                return False, None
+
+            # 주문 검색
+            order = self.search_order(product_name, receiver_name, max_pages=10)
+
+            if not order:
+                error_msg = f"주문을 찾을 수 없음: {product_name[:30]}..."
+                logger.warning(error_msg)
+                return False, error_msg
+
+            # 반품 처리
+            if self.process_return(order["element"]):
+                logger.success(f"처리 완료: {product_name[:30]}...")
+                return True, None
+
+            return False, f"반품 처리 실패: {product_name[:30]}..."
+
+        except Exception as e:
+            error_msg = f"항목 처리 중 오류: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+
     def process_return_batch(
         self,
         return_items: List[Dict],
@@ -349,42 +385,19 @@ class NaverPayAutomation:
             errors = []
 
             for item in return_items:
-                try:
-                    product_name = item.get("product_name", "")
-                    receiver_name = item.get("receiver_name", "")
-
-                    if not product_name:
-                        logger.warning("상품명이 없어 스킵")
-                        failed += 1
-                        continue
-
-                    # 주문 검색
-                    order = self.search_order(product_name, receiver_name, max_pages=10)
-
-                    if not order:
-                        error_msg = f"주문을 찾을 수 없음: {product_name[:30]}..."
-                        logger.warning(error_msg)
-                        errors.append(error_msg)
-                        failed += 1
-                        continue
-
-                    # 반품 처리
-                    if self.process_return(order["element"]):
-                        processed += 1
-                        logger.success(f"처리 완료: {product_name[:30]}...")
-                    else:
-                        failed += 1
-                        error_msg = f"반품 처리 실패: {product_name[:30]}..."
+                success, error_msg = self.process_single_return(
+                    item.get("product_name", ""),
+                    item.get("receiver_name", "")
+                )
+                if success:
+                    processed += 1
+                else:
+                    failed += 1
+                    if error_msg:
                         errors.append(error_msg)
 
-                    # 다음 항목 처리 전 대기
-                    time.sleep(2)
-
-                except Exception as e:
-                    error_msg = f"항목 처리 중 오류: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    failed += 1
+                # 다음 항목 처리 전 대기
+                time.sleep(2)
 
             return {
                 "success": True,
@@ -0,0 +1,277 @@
+"""
+Naver Shopping Search Client
+네이버 쇼핑 검색 API 클라이언트 (공유 연결 풀, 검색어 캐시, 동시 실행/QPS 제한 대량 검색)
+"""
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from loguru import logger
+
+from ..config import settings
+from ..core.cache import get_cache
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+NAVER_SEARCH_API_URL = "https://openapi.naver.com/v1/search/shop.json"
+CACHE_TAG = "naver_shopping"
+MAX_RETRIES = 2
+
+# 상품명 정제 (모듈 로드 시 한 번만 컴파일)
+_BOLD_TAG = re.compile(r"</?b>")
+_SHOP_PREFIX = re.compile(r"^(\[[^\]]*\]|\([^)]*\))+\s*")  # [쿠오카], (센텀시티점), [쿠오카 공식] 등
+_LEADING_SYMBOLS = re.compile(r"^[\s\-_:]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class NaverShoppingError(Exception):
+    """네이버 쇼핑 API 오류 응답"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def clean_title(title: str) -> str:
+    """검색 결과 상품명에서 강조 태그와 상점명 접두사 제거"""
+    title = _BOLD_TAG.sub("", title or "")
+    title = _SHOP_PREFIX.sub("", title)
+    return _LEADING_SYMBOLS.sub("", title).strip()
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 검색어 정규화 (전각/반각 통일, 소문자, 공백 정리)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", query)).strip().lower()
+
+
+def _cache_key(query: str, display: int, start: int, sort: str) -> str:
+    digest = hashlib.md5(normalize_query(query).encode()).hexdigest()
+    return f"{CACHE_TAG}:{sort}:{start}:{display}:{digest}"
+
+
+def _parse_items(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "title": clean_title(item.get("title", "")),
+            "link": item.get("link", ""),
+            "image": item.get("image"),
+            "lprice": item.get("lprice", "0"),
+            "hprice": item.get("hprice", "0"),
+            "mallName": item.get("mallName", ""),
+            "productId": item.get("productId", ""),
+            "productType": item.get("productType", "1"),
+            "brand": item.get("brand"),
+            "maker": item.get("maker"),
+            "category1": item.get("category1"),
+            "category2": item.get("category2"),
+            "category3": item.get("category3"),
+            "category4": item.get("category4"),
+        }
+        for item in data.get("items", [])
+    ]
+
+
+class QpsPacer:
+    """
+    초당 요청 수 제한 (요청 시작 시각을 1/qps 간격으로 배치)
+
+    슬롯 계산과 갱신 사이에 await가 없으므로 같은 이벤트 루프 안에서는 잠금 없이 안전
+    """
+
+    def __init__(self, qps: float, clock: Callable[[], float] = time.monotonic, sleep=asyncio.sleep):
+        self.qps = qps
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot = 0.0
+
+    async def wait(self):
+        if self.qps <= 0:
+            return
+        now = self._clock()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1.0 / self.qps
+        if slot > now:
+            await self._sleep(slot - now)
+
+
+class NaverShoppingClient:
+    """
+    네이버 쇼핑 검색 클라이언트
+
+    Args:
+        client_id / client_secret: 네이버 Open API 키
+        qps: 초당 최대 요청 수 (0이면 제한 없음)
+        max_concurrency: 대량 검색 동시 요청 수
+        cache_ttl: 검색 결과 캐시 시간(초, 0이면 캐시 안 함)
+        transport: httpx 전송 계층 (테스트/프록시용)
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        qps: float = 8.0,
+        max_concurrency: int = 8,
+        cache_ttl: int = 600,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.headers = {
+            "X-Naver-Client-Id": client_id,
+            "X-Naver-Client-Secret": client_secret
+        }
+        self.pacer = QpsPacer(qps)
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop = None
+        self.stats = {"requests": 0, "cache_hits": 0, "retries": 0, "errors": 0}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """이벤트 루프별로 하나의 연결 풀 유지 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE and self.transport is None,
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency * 2,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                transport=self.transport
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None and not self._client.is_closed:
+            try:
+                await self._client.aclose()
+            except RuntimeError:
+                # 다른 이벤트 루프에서 만든 클라이언트
+                pass
+        self._client = None
+
+    async def _fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        client = self._get_client()
+        for attempt in range(MAX_RETRIES + 1):
+            await self.pacer.wait()
+            self.stats["requests"] += 1
+            response = await client.get(NAVER_SEARCH_API_URL, headers=self.headers, params=params)
+
+            if response.status_code == 429 and attempt < MAX_RETRIES:
+                self.stats["retries"] += 1
+                await asyncio.sleep(0.5 * (2 ** attempt))
+                continue
+            if response.status_code != 200:
+                self.stats["errors"] += 1
+                logger.error(f"Naver API error: {response.status_code} - {response.text}")
+                raise NaverShoppingError(response.status_code, f"네이버 API 오류: {response.text}")
+            return response.json()
+
+    async def search(self, query: str, display: int = 20, start: int = 1, sort: str = "sim") -> Dict[str, Any]:
+        """
+        단건 검색 (캐시 우선)
+
+        Returns:
+            {"total", "start", "display", "items", "query", "cached"}
+        """
+        key = _cache_key(query, display, start, sort)
+        cache = get_cache()
+        if self.cache_ttl > 0:
+            cached = cache.get(key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                return {**cached, "query": query, "cached": True}
+
+        data = await self._fetch({"query": query, "display": display, "start": start, "sort": sort})
+        items = _parse_items(data)
+        result = {
+            "total": data.get("total", 0),
+            "start": data.get("start", 1),
+            "display": data.get("display", len(items)),
+            "items": items,
+        }
+        if self.cache_ttl > 0:
+            cache.set(key, result, ttl=self.cache_ttl, tags=[CACHE_TAG])
+        return {**result, "query": query, "cached": False}
+
+    async def search_many(
+        self,
+        queries: List[str],
+        display: int = 5,
+        sort: str = "sim",
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 검색어를 병렬 검색 (정규화 기준 중복 검색어는 한 번만 조회)
+
+        Returns:
+            입력 순서대로 {"query", "success", "result", "error", "status_code"}
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        unique: Dict[str, str] = {}
+        for query in queries:
+            unique.setdefault(normalize_query(query), query)
+
+        async def run(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return {"success": True, "result": await self.search(query, display=display, sort=sort)}
+                except NaverShoppingError as e:
+                    return {"success": False, "error": e.detail, "status_code": e.status_code}
+                except httpx.TimeoutException:
+                    return {"success": False, "error": "네이버 API 응답 시간 초과", "status_code": 504}
+                except Exception as e:
+                    logger.error(f"Naver shopping bulk search error ({query}): {e}")
+                    return {"success": False, "error": str(e), "status_code": 500}
+
+        normalized = list(unique)
+        outcomes = await asyncio.gather(*(run(unique[n]) for n in normalized))
+        by_query = dict(zip(normalized, outcomes))
+
+        results = []
+        for query in queries:
+            outcome = by_query[normalize_query(query)]
+            result = outcome.get("result")
+            results.append({
+                "query": query,
+                "success": outcome["success"],
+                "result": {**result, "query": query} if result else None,
+                "error": outcome.get("error"),
+                "status_code": outcome.get("status_code")
+            })
+        return results
+
+
+_client: Optional[NaverShoppingClient] = None
+
+
+def get_naver_shopping_client(client_id: str, client_secret: str) -> NaverShoppingClient:
+    """설정값으로 만든 공유 클라이언트"""
+    global _client
+    if _client is None:
+        _client = NaverShoppingClient(
+            client_id,
+            client_secret,
+            qps=settings.NAVER_SHOPPING_QPS,
+            max_concurrency=settings.NAVER_SHOPPING_MAX_CONCURRENCY,
+            cache_ttl=settings.NAVER_SHOPPING_CACHE_TTL
+        )
+    return _client
+
+
+async def close_naver_shopping_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
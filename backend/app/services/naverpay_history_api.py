@@ -0,0 +1,489 @@
+"""
+네이버페이 주문내역 API 수집기
+- 주문내역 페이지가 호출하는 XHR(JSON) 요청을 캡처하여 그대로 재호출(페이지네이션)
+- 주문 상세는 세션 쿠키를 공유하는 요청 컨텍스트로 병렬 조회 (동시 실행 수 제한)
+- DOM 클릭/스크롤과 고정 sleep 없이 배송 정보 수집
+"""
+import asyncio
+import base64
+import json
+import logging
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+# 주문내역 목록 API로 간주할 URL 패턴 (pay.naver.com 계열의 JSON API)
+HISTORY_API_URL_PATTERN = re.compile(
+    r"https://[\w.-]*pay\.naver\.com/.*(api|orderApi).*(timeline|history|order|payment)",
+    re.IGNORECASE
+)
+
+# 주문번호만 있을 때 사용할 상세 페이지 URL
+ORDER_DETAIL_URL_TEMPLATE = "https://orders.pay.naver.com/order/status/{order_no}"
+
+# 재호출 시 그대로 전달할 요청 헤더 (쿠키는 요청 컨텍스트가 관리)
+_REPLAY_HEADERS = {"accept", "content-type", "referer", "origin"}
+
+# 응답 JSON 키 후보
+_ITEM_NAME_KEYS = ("productName", "productTitle", "itemName", "productNm")
+_ORDER_NO_KEYS = ("orderNo", "orderId", "productOrderNo", "productOrderId", "payId")
+_DETAIL_URL_KEYS = ("detailUrl", "orderDetailUrl", "orderStatusUrl", "linkUrl", "url")
+_ORDER_DATE_KEYS = ("orderDate", "orderDateTime", "payDate", "date", "createdAt")
+_RECIPIENT_KEYS = ("receiverName", "recipientName", "addresseeName", "receiver", "recipient")
+_COURIER_KEYS = ("deliveryCompanyName", "courierName", "deliveryCompany", "courier", "carrierName")
+_TRACKING_KEYS = ("invoiceNo", "invoiceNumber", "trackingNumber", "trackingNo", "deliveryNo")
+_HAS_NEXT_KEYS = ("hasNext", "hasMore", "hasNextPage", "more")
+_IS_LAST_KEYS = ("isLast", "last", "isLastPage")
+_CURSOR_KEYS = ("lastId", "nextCursor", "cursor", "lastOrderId", "searchAfter", "nextToken")
+_PAGE_KEYS = ("page", "pageNo", "pageNumber", "currentPage")
+
+_EMBEDDED_JSON_PATTERNS = (
+    re.compile(r'<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL),
+    re.compile(r"window\.__[A-Z_]+__\s*=\s*(\{.*?\})\s*;?\s*</script>", re.DOTALL),
+)
+
+
+@dataclass
+class CapturedRequest:
+    """캡처된 주문내역 API 요청과 응답"""
+    method: str
+    url: str
+    post_data: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    payload: Any = None
+
+
+@dataclass
+class HistoryEntry:
+    """주문내역 목록의 한 항목"""
+    product_name: str = ""
+    order_no: str = ""
+    detail_url: str = ""
+    order_date: Optional[str] = None
+    recipient: str = ""
+    courier: str = ""
+    tracking_number: str = ""
+
+    @property
+    def is_complete(self) -> bool:
+        return bool(self.recipient and self.tracking_number)
+
+
+# ========== JSON 파싱 유틸 ==========
+
+def _find_value(obj: Any, keys: Tuple[str, ...], max_depth: int = 6) -> Optional[Any]:
+    """중첩 JSON에서 후보 키 중 처음 발견되는 비어있지 않은 스칼라 값 반환 (얕은 곳 우선)"""
+    queue = [(obj, 0)]
+    while queue:
+        current, depth = queue.pop(0)
+        if isinstance(current, dict):
+            for key in keys:
+                value = current.get(key)
+                if value not in (None, "", [], {}) and not isinstance(value, (dict, list)):
+                    return value
+            if depth < max_depth:
+                queue.extend((v, depth + 1) for v in current.values() if isinstance(v, (dict, list)))
+        elif isinstance(current, list) and depth < max_depth:
+            queue.extend((v, depth + 1) for v in current if isinstance(v, (dict, list)))
+    return None
+
+
+def _find_str(obj: Any, keys: Tuple[str, ...]) -> str:
+    value = _find_value(obj, keys)
+    return str(value).strip() if value is not None else ""
+
+
+def _container_dicts(payload: Any) -> List[Dict]:
+    """페이지네이션 정보가 담길 수 있는 dict들 (최상위, result, data 등)"""
+    containers = []
+    queue = [(payload, 0)]
+    while queue:
+        current, depth = queue.pop(0)
+        if isinstance(current, dict):
+            containers.append(current)
+            if depth < 2:
+                queue.extend((v, depth + 1) for v in current.values() if isinstance(v, dict))
+    return containers
+
+
+def extract_items(payload: Any) -> List[Dict]:
+    """응답에서 주문 항목 리스트 추출 (상품명 키를 가진 dict 리스트 중 가장 얕은 것)"""
+    queue = [(payload, 0)]
+    while queue:
+        current, depth = queue.pop(0)
+        if isinstance(current, list):
+            dicts = [v for v in current if isinstance(v, dict)]
+            if dicts and any(_find_value(d, _ITEM_NAME_KEYS, max_depth=2) for d in dicts):
+                return dicts
+        if depth >= 4:
+            continue
+        if isinstance(current, dict):
+            queue.extend((v, depth + 1) for v in current.values() if isinstance(v, (dict, list)))
+    return []
+
+
+def extract_pagination(payload: Any) -> Dict[str, Any]:
+    """
+    페이지네이션 정보 추출
+
+    Returns:
+        {"has_next": bool, "cursor_key": str|None, "cursor": Any, "page_key": str|None, "page": int|None}
+    """
+    info = {"has_next": False, "cursor_key": None, "cursor": None, "page_key": None, "page": None}
+    for container in _container_dicts(payload):
+        for key in _HAS_NEXT_KEYS:
+            if isinstance(container.get(key), bool):
+                info["has_next"] = info["has_next"] or container[key]
+        for key in _IS_LAST_KEYS:
+            if isinstance(container.get(key), bool):
+                info["has_next"] = info["has_next"] or not container[key]
+        if info["cursor_key"] is None:
+            for key in _CURSOR_KEYS:
+                if container.get(key) not in (None, ""):
+                    info["cursor_key"], info["cursor"] = key, container[key]
+                    break
+        if info["page_key"] is None:
+            for key in _PAGE_KEYS:
+                if isinstance(container.get(key), int):
+                    info["page_key"], info["page"] = key, container[key]
+                    break
+        total_pages = container.get("totalPages") or container.get("totalPage")
+        if isinstance(total_pages, int) and info["page"] is not None:
+            info["has_next"] = info["has_next"] or info["page"] < total_pages
+    return info
+
+
+def _set_request_param(request: CapturedRequest, key: str, value: Any) -> CapturedRequest:
+    """요청 본문(JSON/폼) 또는 쿼리스트링의 파라미터 교체"""
+    if request.post_data:
+        try:
+            body = json.loads(request.post_data)
+            if isinstance(body, dict):
+                body[key] = value
+                return replace(request, post_data=json.dumps(body, ensure_ascii=False), payload=None)
+        except ValueError:
+            form = dict(parse_qsl(request.post_data, keep_blank_values=True))
+            if key in form:
+                form[key] = str(value)
+                return replace(request, post_data=urlencode(form), payload=None)
+
+    parsed = urlparse(request.url)
+    query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+    query[key] = str(value)
+    return replace(request, url=urlunparse(parsed._replace(query=urlencode(query))), payload=None)
+
+
+def _get_request_param(request: CapturedRequest, key: str) -> Optional[Any]:
+    if request.post_data:
+        try:
+            body = json.loads(request.post_data)
+            if isinstance(body, dict) and key in body:
+                return body[key]
+        except ValueError:
+            pass
+    return dict(parse_qsl(urlparse(request.url).query)).get(key)
+
+
+def next_page_request(request: CapturedRequest, payload: Any) -> Optional[CapturedRequest]:
+    """현재 요청/응답으로부터 다음 페이지 요청 생성 (없으면 None)"""
+    info = extract_pagination(payload)
+    if not info["has_next"]:
+        return None
+
+    if info["cursor_key"] is not None:
+        return _set_request_param(request, info["cursor_key"], info["cursor"])
+
+    page_key = info["page_key"]
+    current_page = info["page"]
+    if page_key is None:
+        for key in _PAGE_KEYS:
+            value = _get_request_param(request, key)
+            if value is not None:
+                page_key, current_page = key, value
+                break
+    if page_key is None:
+        return None
+    try:
+        return _set_request_param(request, page_key, int(current_page) + 1)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_entry(item: Dict) -> HistoryEntry:
+    """주문 항목 JSON → HistoryEntry"""
+    order_no = _find_str(item, _ORDER_NO_KEYS)
+    detail_url = ""
+    for key in _DETAIL_URL_KEYS:
+        value = _find_value(item, (key,), max_depth=2)
+        if isinstance(value, str) and "/order/" in value:
+            detail_url = value
+            break
+    if not detail_url and order_no:
+        detail_url = ORDER_DETAIL_URL_TEMPLATE.format(order_no=order_no)
+
+    order_date = _find_value(item, _ORDER_DATE_KEYS, max_depth=2)
+    return HistoryEntry(
+        product_name=_find_str(item, _ITEM_NAME_KEYS),
+        order_no=order_no,
+        detail_url=detail_url,
+        order_date=str(order_date) if order_date is not None else None,
+        recipient=clean_recipient(_find_str(item, _RECIPIENT_KEYS)),
+        courier=_find_str(item, _COURIER_KEYS),
+        tracking_number=_find_str(item, _TRACKING_KEYS),
+    )
+
+
+def clean_recipient(text: str) -> str:
+    """수령인 정리 ("배송지명" 및 괄호 내용 제거)"""
+    text = text.replace("배송지명", "").strip()
+    return re.sub(r"\([^)]*\)", "", text).strip()
+
+
+def parse_detail_document(body: str) -> Any:
+    """상세 응답 본문 파싱 (JSON 또는 HTML에 내장된 __NEXT_DATA__ 등)"""
+    try:
+        return json.loads(body)
+    except ValueError:
+        pass
+
+    embedded = []
+    for pattern in _EMBEDDED_JSON_PATTERNS:
+        for match in pattern.finditer(body):
+            try:
+                embedded.append(json.loads(match.group(1)))
+            except ValueError:
+                continue
+    return embedded
+
+
+def is_history_api_url(url: str) -> bool:
+    return bool(HISTORY_API_URL_PATTERN.search(url))
+
+
+def select_seed(candidates: List[CapturedRequest]) -> Optional[CapturedRequest]:
+    """캡처된 응답 중 주문 항목을 포함한 첫 번째 요청 선택"""
+    for candidate in candidates:
+        if extract_items(candidate.payload):
+            return candidate
+    return None
+
+
+def replay_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """재호출에 필요한 헤더만 추림"""
+    return {
+        k: v for k, v in headers.items()
+        if k.lower() in _REPLAY_HEADERS or k.lower().startswith("x-")
+    }
+
+
+# ========== 전송 계층 ==========
+
+class PlaywrightRequestTransport:
+    """Playwright 브라우저 컨텍스트의 요청 API 사용 (세션 쿠키 공유)"""
+
+    def __init__(self, request_context, timeout_ms: int = 15000):
+        self.request_context = request_context
+        self.timeout_ms = timeout_ms
+
+    async def fetch(
+        self,
+        method: str,
+        url: str,
+        data: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str]:
+        response = await self.request_context.fetch(
+            url,
+            method=method,
+            data=data,
+            headers=headers or {},
+            timeout=self.timeout_ms
+        )
+        return response.status, await response.text()
+
+
+class HarReplayTransport:
+    """
+    HAR 파일 재생 전송 계층 (오프라인 재현/테스트용)
+    요청은 (메서드, URL, 본문) 기준으로 녹화된 응답과 매칭
+    """
+
+    def __init__(self, har: Dict):
+        self.entries: Dict[Tuple[str, str, str], Tuple[int, str]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        for entry in har.get("log", {}).get("entries", []):
+            request = entry["request"]
+            response = entry["response"]
+            content = response.get("content", {})
+            text = content.get("text", "")
+            if content.get("encoding") == "base64":
+                text = base64.b64decode(text).decode("utf-8")
+            post_data = (request.get("postData") or {}).get("text")
+            key = (request["method"].upper(), request["url"], self._canonical(post_data))
+            self.entries[key] = (response.get("status", 200), text)
+
+    @classmethod
+    def from_file(cls, path: str) -> "HarReplayTransport":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def _canonical(post_data: Optional[str]) -> str:
+        if not post_data:
+            return ""
+        try:
+            return json.dumps(json.loads(post_data), sort_keys=True, ensure_ascii=False)
+        except ValueError:
+            return post_data
+
+    def seed(self) -> Optional[CapturedRequest]:
+        """녹화된 응답 중 첫 번째 주문내역 API 요청을 캡처 요청으로 반환"""
+        candidates = []
+        for (method, url, post_data), (_, text) in self.entries.items():
+            if not is_history_api_url(url):
+                continue
+            try:
+                payload = json.loads(text)
+            except ValueError:
+                continue
+            candidates.append(CapturedRequest(method=method, url=url, post_data=post_data or None, payload=payload))
+        return select_seed(candidates)
+
+    async def fetch(
+        self,
+        method: str,
+        url: str,
+        data: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str]:
+        self.requests.append((method.upper(), url))
+        return self.entries.get((method.upper(), url, self._canonical(data)), (404, ""))
+
+
+# ========== 수집기 ==========
+
+class NaverPayHistoryCollector:
+    """캡처된 주문내역 API 요청을 기반으로 전체 배송 정보 수집"""
+
+    def __init__(self, transport, max_concurrency: int = 5, max_pages: int = 50):
+        self.transport = transport
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_pages = max_pages
+        self.stats = {"pages": 0, "entries": 0, "skipped": 0, "detail_requests": 0, "deliveries": 0, "failed": 0}
+
+    async def fetch_entries(self, seed: CapturedRequest) -> List[HistoryEntry]:
+        """목록 API를 페이지네이션하며 모든 항목 수집 (첫 페이지는 캡처된 응답 재사용)"""
+        entries: List[HistoryEntry] = []
+        seen_keys = set()
+        request: Optional[CapturedRequest] = seed
+        payload = seed.payload
+
+        while request is not None and self.stats["pages"] < self.max_pages:
+            if payload is None:
+                status, body = await self.transport.fetch(
+                    request.method, request.url, request.post_data, replay_headers(request.headers)
+                )
+                if status >= 400:
+                    logger.warning(f"주문내역 API 응답 오류: HTTP {status} ({request.url})")
+                    break
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    logger.warning("주문내역 API 응답이 JSON이 아닙니다")
+                    break
+
+            self.stats["pages"] += 1
+            page_items = extract_items(payload)
+            new_count = 0
+            for item in page_items:
+                entry = parse_entry(item)
+                key = (entry.order_no or entry.detail_url or entry.product_name).strip()
+                if not key:
+                    # 식별할 수 없는 항목은 중복 판정도 할 수 없으므로 제외
+                    self.stats["skipped"] += 1
+                    logger.warning(f"주문번호/상세 URL/상품명이 없는 항목 제외: {str(item)[:200]}")
+                    continue
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                entries.append(entry)
+                new_count += 1
+
+            # 새 항목이 없으면 같은 페이지를 반복 중인 것으로 보고 종료
+            if new_count == 0:
+                break
+            request, payload = next_page_request(request, payload), None
+
+        self.stats["entries"] = len(entries)
+        return entries
+
+    async def _resolve_entry(self, entry: HistoryEntry, semaphore: asyncio.Semaphore) -> HistoryEntry:
+        """상세 페이지/API에서 수령인·택배사·송장번호 보완"""
+        if entry.is_complete or not entry.detail_url:
+            return entry
+
+        async with semaphore:
+            self.stats["detail_requests"] += 1
+            status, body = await self.transport.fetch("GET", entry.detail_url)
+
+        if status >= 400:
+            raise RuntimeError(f"상세 조회 실패: HTTP {status}")
+
+        detail = parse_detail_document(body)
+        return replace(
+            entry,
+            recipient=entry.recipient or clean_recipient(_find_str(detail, _RECIPIENT_KEYS)),
+            courier=entry.courier or _find_str(detail, _COURIER_KEYS),
+            tracking_number=entry.tracking_number or _find_str(detail, _TRACKING_KEYS),
+        )
+
+    async def collect(self, seed: CapturedRequest) -> AsyncGenerator[Dict, None]:
+        """
+        배송 정보 수집 (스트리밍)
+
+        Yields:
+            NaverPayScraper.scrape_deliveries와 동일한 형식의 진행/배송 메시지
+        """
+        entries = await self.fetch_entries(seed)
+        yield {
+            "type": "status",
+            "message": f"{len(entries)}개 상품 발견 ({self.stats['pages']}페이지), 상세 정보 수집 중..."
+        }
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [asyncio.ensure_future(self._resolve_entry(entry, semaphore)) for entry in entries]
+        processed_tracking_numbers = set()
+        done_count = 0
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                done_count += 1
+                try:
+                    entry = await next_done
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    logger.warning(f"상세 정보 수집 오류: {e}")
+                    continue
+
+                if not entry.tracking_number or entry.tracking_number in processed_tracking_numbers:
+                    continue
+                processed_tracking_numbers.add(entry.tracking_number)
+                self.stats["deliveries"] += 1
+
+                yield {"type": "status", "message": f"상품 {done_count}/{len(entries)} 처리 중..."}
+                yield {
+                    "type": "delivery",
+                    "data": {
+                        "recipient": entry.recipient,
+                        "courier": entry.courier,
+                        "tracking_number": entry.tracking_number,
+                        "product_name": entry.product_name[:100] if entry.product_name else "",
+                        "order_date": entry.order_date
+                    }
+                }
+        finally:
+            for task in tasks:
+                task.cancel()
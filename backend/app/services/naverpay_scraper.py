@@ -14,11 +14,41 @@ KST = timezone(timedelta(hours=9))
 from dataclasses import dataclass
 from pathlib import Path
 
+from .naverpay_history_api import (
+    CapturedRequest,
+    NaverPayHistoryCollector,
+    PlaywrightRequestTransport,
+    is_history_api_url,
+    select_seed
+)
+
 logger = logging.getLogger(__name__)
 
 # 쿠키 저장 경로 (서버 배포 시 /data 볼륨 사용)
 COOKIE_STORAGE_PATH = os.environ.get('COOKIE_STORAGE_PATH', '/data/naver_cookies.json')
 
+# 스크래핑 모드 ("network": 주문내역 API 재호출, "dom": 화면 클릭)
+SCRAPE_MODES = ("network", "dom")
+SCRAPE_MODE = os.environ.get('NAVERPAY_SCRAPE_MODE', 'network')
+# 주문 상세 동시 조회 수
+DETAIL_FETCH_CONCURRENCY = int(os.environ.get('NAVERPAY_DETAIL_CONCURRENCY', '5'))
+# 주문내역 API 응답 캡처 대기 시간 (ms)
+API_CAPTURE_TIMEOUT_MS = 15000
+
+
+def resolve_scrape_mode(mode: Optional[str] = None) -> str:
+    """
+    스크래핑 모드 확인 (미지정 시 NAVERPAY_SCRAPE_MODE 환경변수)
+
+    Raises:
+        ValueError: 지원하지 않는 모드
+    """
+    resolved = (mode if mode is not None else SCRAPE_MODE).strip().lower()
+    if resolved not in SCRAPE_MODES:
+        raise ValueError(f"지원하지 않는 스크래핑 모드: {resolved!r} (network/dom)")
+    return resolved
+
+
 # 스크래핑 로그 저장
 class ScrapeLogger:
     """스크래핑 로그 수집기"""
@@ -311,9 +341,142 @@ class NaverPayScraper:
                 "message": str(e)
             }
 
-    async def scrape_deliveries(self) -> AsyncGenerator[Dict, None]:
+    async def scrape_deliveries(self, mode: Optional[str] = None) -> AsyncGenerator[Dict, None]:
         """
         배송중인 상품 정보 스크래핑 (스트리밍)
+
+        Args:
+            mode: "network" (주문내역 API 재호출) 또는 "dom" (화면 클릭).
+                  기본값은 NAVERPAY_SCRAPE_MODE 환경변수.
+                  network 모드에서 API 응답을 찾지 못하면 dom 모드로 자동 전환
+
+        Yields:
+            배송 정보 또는 진행 상황 메시지
+
+        Raises:
+            ValueError: 지원하지 않는 모드
+        """
+        mode = resolve_scrape_mode(mode)
+
+        if mode == "network":
+            fallback = False
+            async for result in self._scrape_deliveries_network():
+                if result["type"] == "fallback":
+                    fallback = True
+                    yield {"type": "status", "message": result["message"]}
+                    break
+                yield result
+            if not fallback:
+                return
+
+        async for result in self._scrape_deliveries_dom():
+            yield result
+
+    async def _capture_history_response(self, response) -> Optional[CapturedRequest]:
+        """주문내역 API 응답 캡처"""
+        try:
+            if 'json' not in (response.headers.get('content-type') or ''):
+                return None
+            request = response.request
+            return CapturedRequest(
+                method=request.method,
+                url=request.url,
+                post_data=request.post_data,
+                headers=dict(request.headers),
+                payload=await response.json()
+            )
+        except Exception as e:
+            logger.debug(f"주문내역 API 응답 캡처 실패: {e}")
+            return None
+
+    async def _scrape_deliveries_network(self) -> AsyncGenerator[Dict, None]:
+        """
+        배송중인 상품 정보 스크래핑 (네트워크 모드)
+        - 배송중 페이지 로드 시 호출되는 주문내역 API 응답을 가로챔
+        - 같은 요청을 세션 쿠키로 재호출하며 페이지네이션
+        - 주문 상세는 제한된 동시성으로 병렬 조회
+
+        Yields:
+            배송 정보 또는 진행 상황 메시지 (API를 찾지 못하면 "fallback")
+        """
+        scrape_logger.info("=== 배송 정보 수집 시작 (네트워크 모드) ===")
+
+        if not self.is_logged_in:
+            scrape_logger.error("로그인되지 않은 상태입니다")
+            yield {"type": "error", "message": "로그인이 필요합니다"}
+            return
+
+        delivery_url = 'https://pay.naver.com/pc/history?subFilter=deliveringFilter&page=1'
+        pending_captures: List[asyncio.Future] = []
+
+        def on_response(response):
+            if is_history_api_url(response.url):
+                pending_captures.append(asyncio.ensure_future(self._capture_history_response(response)))
+
+        try:
+            yield {"type": "status", "message": "배송중 목록 페이지로 이동 중..."}
+            self.page.on('response', on_response)
+            try:
+                await self.page.goto(delivery_url, wait_until='domcontentloaded', timeout=30000)
+                await self.page.wait_for_load_state('networkidle', timeout=API_CAPTURE_TIMEOUT_MS)
+            except Exception as nav_error:
+                scrape_logger.warning(f"네비게이션 대기 종료: {nav_error}")
+            finally:
+                self.page.remove_listener('response', on_response)
+
+            current_url = self.page.url
+            if 'nidlogin.login' in current_url or 'nid.naver.com' in current_url:
+                scrape_logger.error("세션 만료: 로그인 페이지로 리다이렉트됨")
+                self.is_logged_in = False
+                yield {"type": "error", "message": "네이버 로그인 세션이 만료되었습니다. 다시 로그인해주세요."}
+                return
+
+            captured = [c for c in await asyncio.gather(*pending_captures) if c is not None]
+            seed = select_seed(captured)
+            scrape_logger.info(f"주문내역 API 응답 {len(captured)}개 캡처")
+
+            if seed is None:
+                scrape_logger.warning("주문내역 API 응답을 찾지 못함, 화면 수집으로 전환")
+                yield {"type": "fallback", "message": "주문내역 API를 찾지 못해 화면 수집으로 전환합니다..."}
+                return
+
+            scrape_logger.info(f"주문내역 API: {seed.method} {seed.url[:80]}")
+            yield {"type": "status", "message": "주문내역 API로 상품 정보 수집 중..."}
+
+            collector = NaverPayHistoryCollector(
+                PlaywrightRequestTransport(self.context.request),
+                max_concurrency=DETAIL_FETCH_CONCURRENCY
+            )
+            delivered = 0
+            async for result in collector.collect(seed):
+                if result["type"] == "delivery":
+                    delivered += 1
+                yield result
+
+            scrape_logger.info(f"네트워크 수집 통계: {collector.stats}")
+
+            if delivered == 0 and collector.stats["entries"] > 0:
+                scrape_logger.warning("API 응답에서 송장정보를 찾지 못함, 화면 수집으로 전환")
+                yield {"type": "fallback", "message": "API 응답에 송장정보가 없어 화면 수집으로 전환합니다..."}
+                return
+
+            if collector.stats["entries"] == 0:
+                yield {"type": "status", "message": "배송중인 상품을 찾을 수 없습니다."}
+
+            scrape_logger.info(f"수집 완료: {delivered}건")
+            yield {
+                "type": "complete",
+                "message": f"수집 완료: {delivered}건",
+                "total": delivered
+            }
+
+        except Exception as e:
+            scrape_logger.error(f"스크래핑 오류: {e}")
+            yield {"type": "error", "message": str(e)}
+
+    async def _scrape_deliveries_dom(self) -> AsyncGenerator[Dict, None]:
+        """
+        배송중인 상품 정보 스크래핑 (화면 클릭 모드)
         - 배송중 페이지로 이동
         - 각 상품을 클릭하여 상세 페이지에서 수령인 확인
         - 배송조회 버튼 클릭하여 택배사/송장번호 추출
@@ -559,15 +722,18 @@ class NaverPayScraper:
             scrape_logger.error(f"스크래핑 오류: {e}")
             yield {"type": "error", "message": str(e)}
 
-    async def scrape_deliveries_sync(self) -> List[Dict]:
+    async def scrape_deliveries_sync(self, mode: Optional[str] = None) -> List[Dict]:
         """
         배송중인 상품 정보 스크래핑 (동기식 결과 반환)
 
+        Args:
+            mode: 스크래핑 모드 ("network" 또는 "dom", 기본값은 환경변수)
+
         Returns:
             배송 정보 리스트
         """
         deliveries = []
-        async for result in self.scrape_deliveries():
+        async for result in self.scrape_deliveries(mode=mode):
             if result["type"] == "delivery":
                 deliveries.append(result["data"])
         return deliveries
@@ -0,0 +1,289 @@
+"""
+Learned Pattern Rewriter
+학습 패턴 일괄 치환기 (엔진별 컴파일 캐시, 한 번에 치환, 적용 횟수 일괄 기록)
+"""
+import atexit
+import re
+import threading
+import time
+import weakref
+from collections import Counter
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from loguru import logger
+from sqlalchemy import bindparam, event, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..config import settings
+from ..models import LearningPattern
+
+MIN_CONFIDENCE = 0.6
+_CHANGED_KEY = "learning_patterns_changed"
+_USAGE_FLUSH_OPTION = "learning_usage_flush"
+
+
+def _trie_regex(words: List[str]) -> str:
+    """
+    문자열 목록 → 트라이 구조 정규식
+
+    분기 지점에서만 그룹을 만들고, 끝나는 지점은 greedy optional로 감싸
+    같은 위치에서 가장 긴 패턴이 먼저 일치함
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: Dict) -> str:
+        parts = []
+        # 분기 없는 구간은 반복문으로 이어 붙여 재귀 깊이를 분기 수로 제한
+        while len(node) == 1 and "" not in node:
+            ch, node = next(iter(node.items()))
+            parts.append(re.escape(ch))
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if branches:
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            parts.append(f"(?:{body})?" if "" in node else body)
+        return "".join(parts)
+
+    return build(trie)
+
+
+class CompiledPatternSet:
+    """
+    한 카테고리에 적용할 패턴 집합
+
+    Args:
+        rules: before_pattern → (after_pattern, pattern_id)
+    """
+
+    def __init__(self, rules: Dict[str, Tuple[str, int]]):
+        self.rules = rules
+        self.regex: Optional[Pattern] = re.compile(_trie_regex(list(rules))) if rules else None
+
+    def apply(self, text: str) -> Tuple[str, Counter]:
+        """치환 결과와 패턴 ID별 적용 횟수"""
+        applied: Counter = Counter()
+        if self.regex is None or not text:
+            return text, applied
+
+        def replace(match):
+            after, pattern_id = self.rules[match.group(0)]
+            applied[pattern_id] += 1
+            return after
+
+        return self.regex.sub(replace, text), applied
+
+
+class PatternRewriter:
+    """
+    엔진별 학습 패턴 치환기 (컴파일 캐시 + 적용 횟수 버퍼)
+    """
+
+    def __init__(self, bind):
+        self._bind = weakref.ref(bind)
+        self._lock = threading.Lock()
+        self._rows: Optional[List[Tuple[int, str, str, Optional[str]]]] = None
+        self._compiled: Dict[Optional[str], CompiledPatternSet] = {}
+        self._loaded_at = 0.0
+        self.version = 0
+
+        self._usage: Counter = Counter()
+        self._usage_since: Optional[float] = None
+        self.stats = {"compiles": 0, "applied": 0, "flushed": 0}
+
+    def invalidate(self):
+        """다음 치환 때 패턴을 다시 읽어 컴파일"""
+        with self._lock:
+            self._rows = None
+            self._compiled = {}
+            self.version += 1
+
+    def _load(self, db: Session):
+        rows = db.query(
+            LearningPattern.id,
+            LearningPattern.before_pattern,
+            LearningPattern.after_pattern,
+            LearningPattern.category
+        ).filter(
+            LearningPattern.is_active == True,
+            LearningPattern.confidence_score >= MIN_CONFIDENCE
+        ).order_by(
+            LearningPattern.success_rate.desc(),
+            LearningPattern.id
+        ).all()
+        self._rows = [tuple(row) for row in rows]
+        self._compiled = {}
+        self._loaded_at = time.monotonic()
+
+    def pattern_set(self, db: Session, category: Optional[str] = None) -> CompiledPatternSet:
+        """카테고리에 적용할 컴파일된 패턴 집합 (필요하면 다시 읽어 컴파일)"""
+        with self._lock:
+            if self._rows is None or time.monotonic() - self._loaded_at > settings.LEARNING_PATTERN_RELOAD_SECONDS:
+                self._load(db)
+            compiled = self._compiled.get(category)
+            if compiled is None:
+                rules: Dict[str, Tuple[str, int]] = {}
+                if category:
+                    # 카테고리 전용 패턴을 먼저 넣어 공용 패턴보다 우선 (그 안에서는 success_rate 순)
+                    candidates = [row for row in self._rows if row[3] == category]
+                    candidates += [row for row in self._rows if row[3] is None]
+                else:
+                    candidates = self._rows  # 카테고리 미지정: 모든 활성 패턴
+                for pattern_id, before, after, _ in candidates:
+                    if before:
+                        rules.setdefault(before, (after, pattern_id))
+                compiled = CompiledPatternSet(rules)
+                self._compiled[category] = compiled
+                self.stats["compiles"] += 1
+                logger.debug(f"Compiled {len(rules)} learned patterns (category={category})")
+            return compiled
+
+    def apply(self, db: Session, text: str, category: Optional[str] = None) -> Tuple[str, int]:
+        """
+        학습 패턴 치환
+
+        Returns:
+            (치환된 텍스트, 적용 횟수)
+        """
+        improved, applied = self.pattern_set(db, category).apply(text)
+        if applied:
+            count = sum(applied.values())
+            with self._lock:
+                self._usage.update(applied)
+                if self._usage_since is None:
+                    self._usage_since = time.monotonic()
+                self.stats["applied"] += count
+            return improved, count
+        return improved, 0
+
+    @property
+    def pending_usage(self) -> int:
+        return sum(self._usage.values())
+
+    def usage_flush_due(self) -> bool:
+        """적용 횟수 기록 시점 여부 (건수 또는 경과 시간 기준)"""
+        return bool(self._usage) and (
+            self.pending_usage >= settings.LEARNING_USAGE_FLUSH_BATCH
+            or time.monotonic() - (self._usage_since or 0) >= settings.LEARNING_USAGE_FLUSH_INTERVAL
+        )
+
+    def flush_usage(self, db: Session) -> int:
+        """
+        누적된 적용 횟수를 times_applied에 더해 커밋
+
+        Returns:
+            기록한 패턴 수
+        """
+        with self._lock:
+            usage, self._usage, self._usage_since = self._usage, Counter(), None
+        if not usage:
+            return 0
+
+        try:
+            db.execute(
+                update(LearningPattern.__table__)
+                .where(LearningPattern.__table__.c.id == bindparam("pattern_id"))
+                .values(times_applied=LearningPattern.__table__.c.times_applied + bindparam("applied")),
+                [{"pattern_id": pattern_id, "applied": applied} for pattern_id, applied in usage.items()],
+                execution_options={_USAGE_FLUSH_OPTION: True}
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            with self._lock:
+                self._usage.update(usage)
+                self._usage_since = self._usage_since or time.monotonic()
+            logger.error(f"Failed to record learned pattern usage: {str(e)}")
+            return 0
+
+        self.stats["flushed"] += len(usage)
+        return len(usage)
+
+    def close(self) -> int:
+        """남은 적용 횟수를 별도 세션으로 기록 (앱 종료 시)"""
+        bind = self._bind()
+        if bind is None or not self._usage:
+            return 0
+        db = sessionmaker(autocommit=False, autoflush=False, bind=bind)()
+        try:
+            return self.flush_usage(db)
+        finally:
+            db.close()
+
+
+_registry = weakref.WeakKeyDictionary()  # 엔진 → PatternRewriter
+_registry_lock = threading.Lock()
+
+
+def get_pattern_rewriter(db: Session) -> PatternRewriter:
+    """세션이 연결된 엔진의 치환기"""
+    bind = db.get_bind()
+    rewriter = _registry.get(bind)
+    if rewriter is None:
+        with _registry_lock:
+            rewriter = _registry.get(bind)
+            if rewriter is None:
+                rewriter = PatternRewriter(bind)
+                _registry[bind] = rewriter
+    return rewriter
+
+
+def close_pattern_rewriters():
+    """모든 치환기의 남은 적용 횟수 기록 (앱 종료 훅)"""
+    with _registry_lock:
+        rewriters = list(_registry.values())
+    for rewriter in rewriters:
+        try:
+            flushed = rewriter.close()
+            if flushed:
+                logger.info(f"Recorded usage of {flushed} learned patterns on shutdown")
+        except Exception as e:
+            logger.error(f"Failed to record learned pattern usage: {str(e)}")
+
+
+atexit.register(close_pattern_rewriters)
+
+
+def _registered(session) -> Optional[PatternRewriter]:
+    try:
+        return _registry.get(session.get_bind())
+    except Exception:
+        return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    if any(
+        isinstance(obj, LearningPattern)
+        for objects in (session.new, session.dirty, session.deleted)
+        for obj in objects
+    ):
+        session.info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop(_CHANGED_KEY, None):
+        rewriter = _registered(session)
+        if rewriter is not None:
+            rewriter.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop(_CHANGED_KEY, None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_writes(orm_execute_state):
+    """query.update()/delete()로 패턴을 바꾸면 커밋 시 다시 컴파일 (적용 횟수 기록은 제외)"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.execution_options.get(_USAGE_FLUSH_OPTION):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is LearningPattern:
+        orm_execute_state.session.info[_CHANGED_KEY] = True
@@ -0,0 +1,316 @@
+"""
+Policy Context Retriever
+정책/FAQ/가이드 청크를 BM25로 검색해 토큰 예산 안의 프롬프트 컨텍스트로 조립
+"""
+import json
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..config import settings
+from .llm_gateway import count_text_tokens
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREFERRED_BONUS = 1.0  # prefer 조건에 맞는 청크 가산점
+MIN_RELATIVE_SCORE = 0.3  # 최고 점수 대비 이 비율 미만인 청크는 제외 (흔한 음절만 겹친 청크)
+
+_TERM = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+# 가이드 세부 유형 항목 -> 청크 제목
+GUIDE_SUBTYPE_SECTIONS = (
+    ("checklist", "체크리스트"),
+    ("tips", "대응 팁"),
+    ("required_documents", "필요 서류"),
+)
+GUIDE_SECTIONS = (
+    ("legal_references", "관련 법규"),
+    ("common_mistakes", "피해야 할 실수"),
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """색인/질의 공용 토큰화 (한글 음절 bigram + 영문/숫자 단어)"""
+    terms = []
+    for word in _TERM.findall(text.lower()):
+        if word[0] >= "가" and len(word) > 1:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            terms.append(word)
+    return terms
+
+
+@dataclass
+class KnowledgeChunk:
+    """
+    검색 단위
+
+    Attributes:
+        source: policy / faq / guide
+        title: 프롬프트에 표시할 제목
+        text: 본문
+        tags: 필터/우선 조건용 태그 (category, guide, subtype 등)
+        keywords: 색인에만 추가하는 검색어 (FAQ/세부 유형 keywords)
+    """
+    source: str
+    title: str
+    text: str
+    tags: Dict[str, str] = field(default_factory=dict)
+    keywords: Tuple[str, ...] = ()
+    tokens: int = 0
+
+    def __post_init__(self):
+        self.tokens = count_text_tokens(self.render())
+
+    def render(self) -> str:
+        return f"[{self.title}]\n{self.text}"
+
+    def index_text(self) -> str:
+        return " ".join((self.title, self.text) + self.keywords)
+
+
+def _bullets(items: Iterable) -> List[str]:
+    return [f"- {item}" for item in items]
+
+
+def load_policy_chunks(path: Path) -> List[KnowledgeChunk]:
+    """정책 파일 -> 섹션별 청크 (refund_policy.json -> category=refund)"""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    category = path.stem.replace("_policy", "")
+    chunks = []
+    for key, section in data.get("sections", {}).items():
+        lines = []
+        for name, value in section.items():
+            if name == "title":
+                continue
+            lines.extend(_bullets(value) if isinstance(value, list) else [str(value)])
+        chunks.append(KnowledgeChunk(
+            source="policy",
+            title=f"{data.get('title', path.stem)} - {section.get('title', key)}",
+            text="\n".join(lines),
+            tags={"category": category, "section": key}
+        ))
+    return chunks
+
+
+def load_faq_chunks(path: Path) -> List[KnowledgeChunk]:
+    """FAQ 파일 -> 항목별 청크"""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [
+        KnowledgeChunk(
+            source="faq",
+            title=f"FAQ: {faq.get('question', '')}",
+            text=faq.get("answer", ""),
+            tags={"category": faq.get("category", "general")},
+            keywords=tuple(faq.get("keywords", []))
+        )
+        for faq in data.get("faqs", [])
+    ]
+
+
+def load_guide_chunks(path: Path) -> List[KnowledgeChunk]:
+    """문제 대응 가이드 -> 세부 유형별 설명/체크리스트/팁/서류 + 법규/실수 청크"""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    guide = data.get("type", path.stem)
+    chunks = []
+    for subtype in data.get("subtypes", []):
+        tags = {"guide": guide, "subtype": subtype.get("id", "")}
+        keywords = tuple(subtype.get("keywords", []))
+        name = subtype.get("name", "")
+        chunks.append(KnowledgeChunk(
+            source="guide",
+            title=f"세부 유형: {name}",
+            text=f"설명: {subtype.get('description', '')}",
+            tags=tags,
+            keywords=keywords
+        ))
+        for key, label in GUIDE_SUBTYPE_SECTIONS:
+            if subtype.get(key):
+                chunks.append(KnowledgeChunk(
+                    source="guide",
+                    title=f"{label} ({name})",
+                    text="\n".join(_bullets(subtype[key])),
+                    tags=tags,
+                    keywords=keywords
+                ))
+    for key, label in GUIDE_SECTIONS:
+        if data.get(key):
+            chunks.append(KnowledgeChunk(
+                source="guide",
+                title=label,
+                text="\n".join(_bullets(data[key])),
+                tags={"guide": guide, "scope": "guide"}
+            ))
+    return chunks
+
+
+LOADERS: Dict[str, Callable[[Path], List[KnowledgeChunk]]] = {
+    "policy": load_policy_chunks,
+    "faq": load_faq_chunks,
+    "guide": load_guide_chunks,
+}
+
+
+class BM25Index:
+    """청크 목록에 대한 BM25 역색인"""
+
+    def __init__(self, documents: Sequence[List[str]]):
+        self.size = len(documents)
+        self.lengths = [len(terms) for terms in documents]
+        self.avg_length = (sum(self.lengths) / self.size) if self.size else 0.0
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for doc_id, terms in enumerate(documents):
+            for term, tf in Counter(terms).items():
+                self.postings.setdefault(term, []).append((doc_id, tf))
+        self.idf = {
+            term: math.log(1 + (self.size - len(posting) + 0.5) / (len(posting) + 0.5))
+            for term, posting in self.postings.items()
+        }
+
+    def scores(self, query_terms: Iterable[str]) -> Dict[int, float]:
+        """질의 토큰에 대한 문서별 점수 (겹치는 토큰이 없는 문서는 제외)"""
+        scores: Dict[int, float] = {}
+        for term in set(query_terms):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = self.idf[term]
+            for doc_id, tf in posting:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[doc_id] / self.avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+
+class PolicyRetriever:
+    """
+    지식 베이스 청크 검색기
+
+    Args:
+        directories: 출처(policy/faq/guide)별 JSON 디렉토리 (기본값: 설정의 지식 베이스 경로)
+    """
+
+    def __init__(self, directories: Optional[Dict[str, Path]] = None):
+        self.directories = directories or {
+            "policy": settings.POLICIES_DIR,
+            "faq": settings.FAQ_DIR,
+            "guide": settings.ISSUE_GUIDES_DIR,
+        }
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self.chunks: List[KnowledgeChunk] = []
+        self._index = BM25Index([])
+
+    def _files(self) -> List[Tuple[str, Path]]:
+        files = []
+        for source, directory in self.directories.items():
+            directory = Path(directory)
+            if directory.is_dir():
+                files.extend((source, path) for path in sorted(directory.glob("*.json")))
+        return files
+
+    def _ensure_index(self):
+        """파일 목록/수정 시각이 바뀌었으면 색인 재구성"""
+        files = self._files()
+        signature = tuple((str(path), path.stat().st_mtime_ns) for _, path in files)
+        if signature == self._signature:
+            return
+        with self._lock:
+            if signature == self._signature:
+                return
+            chunks = []
+            for source, path in files:
+                try:
+                    chunks.extend(LOADERS[source](path))
+                except Exception as e:
+                    logger.error(f"Error indexing knowledge file {path}: {str(e)}")
+            self._index = BM25Index([tokenize(chunk.index_text()) for chunk in chunks])
+            self.chunks = chunks
+            self._signature = signature
+            logger.debug(f"Knowledge index built: {len(chunks)} chunks from {len(files)} files")
+
+    def search(
+        self,
+        query: str,
+        sources: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, str]] = None,
+        prefer: Optional[Dict[str, str]] = None
+    ) -> List[Tuple[float, KnowledgeChunk]]:
+        """
+        관련도 순 청크 목록
+
+        Args:
+            query: 문의/문제 내용
+            sources: 검색할 출처 (None이면 전체)
+            where: 모든 태그가 일치하는 청크만 검색
+            prefer: 태그가 하나라도 일치하면 가산점 (질의와 겹치지 않아도 포함)
+
+        Returns:
+            (점수, 청크) 목록 (점수 내림차순, 같은 점수는 원본 순서,
+            prefer에 맞지 않으면서 최고 점수 대비 너무 낮은 청크는 제외)
+        """
+        self._ensure_index()
+        chunks, index = self.chunks, self._index
+        scores = index.scores(tokenize(query or ""))
+
+        ranked = []
+        for doc_id, chunk in enumerate(chunks):
+            if sources and chunk.source not in sources:
+                continue
+            if where and any(chunk.tags.get(k) != v for k, v in where.items()):
+                continue
+            score = scores.get(doc_id, 0.0)
+            preferred = bool(prefer) and any(v and chunk.tags.get(k) == v for k, v in prefer.items())
+            if preferred:
+                score += PREFERRED_BONUS
+            if score > 0:
+                ranked.append((score, doc_id, preferred, chunk))
+
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        cutoff = ranked[0][0] * MIN_RELATIVE_SCORE if ranked else 0.0
+        return [(score, chunk) for score, _, preferred, chunk in ranked if preferred or score >= cutoff]
+
+    def build_context(
+        self,
+        query: str,
+        sources: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, str]] = None,
+        prefer: Optional[Dict[str, str]] = None,
+        budget_tokens: Optional[int] = None,
+        top_k: Optional[int] = None
+    ) -> str:
+        """
+        토큰 예산 안에서 관련도 높은 청크를 조립한 프롬프트 컨텍스트
+
+        예산을 넘는 청크는 건너뛰고 다음(더 작은) 청크를 계속 시도
+        """
+        budget = settings.POLICY_CONTEXT_TOKEN_BUDGET if budget_tokens is None else budget_tokens
+        limit = top_k or settings.POLICY_CONTEXT_TOP_K
+
+        selected, used = [], 0
+        for _, chunk in self.search(query, sources=sources, where=where, prefer=prefer):
+            if used + chunk.tokens > budget:
+                continue
+            selected.append(chunk.render())
+            used += chunk.tokens
+            if len(selected) >= limit:
+                break
+
+        logger.debug(f"Retrieved {len(selected)} context chunks ({used}/{budget} tokens)")
+        return "\n\n".join(selected)
+
+
+_retriever: Optional[PolicyRetriever] = None
+
+
+def get_policy_retriever() -> PolicyRetriever:
+    """공유 검색기 (설정의 지식 베이스 경로)"""
+    global _retriever
+    if _retriever is None:
+        _retriever = PolicyRetriever()
+    return _retriever
@@ -0,0 +1,363 @@
+"""
+Product Catalog Mirror
+쿠팡 등록상품 카탈로그 로컬 미러
+
+상품 목록/상세 API를 매번 호출하지 않도록 계정별 등록상품과 옵션(vendorItemId)을
+DB에 보관하고 증분 동기화:
+- 목록 페이지를 받을 때마다 upsert (신규/상태 변경/오래된 상품만 상세 조회 대상)
+- 상세 조회는 필요한 상품만 제한된 동시성으로 수행
+- sellerProductId → vendorItemId, vendorItemId → 상품 역방향 조회는 인덱스로 처리
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from ..models.product_catalog import CatalogProduct, CatalogSyncState, CatalogVendorItem
+
+# SQLite IN 절 변수 제한을 넘지 않도록 나눠서 조회
+_IN_CHUNK = 500
+
+# 목록 API status 파라미터 → 응답 statusName
+STATUS_NAMES = {
+    "IN_REVIEW": "심사중",
+    "SAVED": "임시저장",
+    "APPROVING": "승인대기중",
+    "APPROVED": "승인완료",
+    "PARTIAL_APPROVED": "부분승인완료",
+    "DENIED": "승인반려",
+    "DELETED": "상품삭제",
+}
+
+
+def _chunks(values: List[Any], size: int = _IN_CHUNK) -> Iterable[List[Any]]:
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+class ProductCatalog:
+    """계정별 등록상품 카탈로그 미러"""
+
+    DETAIL_TTL = timedelta(days=7)  # vendorItem 목록 재확인 주기
+    DATE_LISTING_TTL = timedelta(hours=6)  # 날짜별 목록 재조회 주기
+    DATE_SETTLE_PERIOD = timedelta(days=2)  # 이 기간이 지난 날짜의 목록은 더 바뀌지 않는 것으로 간주
+    DETAIL_MAX_WORKERS = 4
+
+    def __init__(self, db: Session, coupang_account_id: Optional[int] = None, client=None):
+        self.db = db
+        self.coupang_account_id = coupang_account_id
+        self.client = client
+        self.stats = {"listed": 0, "inserted": 0, "detail_requests": 0, "detail_failed": 0}
+
+    # ==================== 목록 동기화 ====================
+
+    def _needs_detail(self, product: CatalogProduct, now: datetime) -> bool:
+        if not product.detail_synced_at or not product.vendor_item_count:
+            return True
+        return now - product.detail_synced_at > self.DETAIL_TTL
+
+    def upsert_products(
+        self,
+        products: List[Dict[str, Any]],
+        page_token: Optional[str] = None,
+        commit: bool = True
+    ) -> List[int]:
+        """
+        목록 API 상품들을 미러에 반영
+
+        Returns:
+            vendorItem 목록을 (재)조회해야 하는 sellerProductId 리스트
+        """
+        now = datetime.utcnow()
+        by_id = {}
+        for product in products:
+            seller_product_id = product.get("sellerProductId")
+            if seller_product_id:
+                by_id[int(seller_product_id)] = product
+
+        if not by_id:
+            return []
+
+        existing: Dict[int, CatalogProduct] = {}
+        for chunk in _chunks(list(by_id)):
+            for row in self.db.query(CatalogProduct).filter(
+                CatalogProduct.coupang_account_id == self.coupang_account_id,
+                CatalogProduct.seller_product_id.in_(chunk)
+            ):
+                existing[int(row.seller_product_id)] = row
+
+        needs_detail = []
+        for seller_product_id, product in by_id.items():
+            row = existing.get(seller_product_id)
+            status_name = product.get("statusName")
+
+            if row is None:
+                row = CatalogProduct(
+                    coupang_account_id=self.coupang_account_id,
+                    seller_product_id=seller_product_id,
+                    vendor_item_count=0
+                )
+                self.db.add(row)
+                self.stats["inserted"] += 1
+            elif status_name and row.status_name and status_name != row.status_name:
+                # 상태가 바뀐 상품은 옵션 구성이 바뀌었을 수 있음
+                row.detail_synced_at = None
+
+            row.seller_product_name = product.get("sellerProductName") or row.seller_product_name
+            row.status_name = status_name or row.status_name
+            row.product_created_at = product.get("createdAt") or row.product_created_at
+            row.last_seen_token = str(page_token) if page_token else None
+            row.last_seen_at = now
+
+            if self._needs_detail(row, now):
+                needs_detail.append(seller_product_id)
+
+        self.stats["listed"] += len(by_id)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return needs_detail
+
+    def _get_state(self, scope: str) -> CatalogSyncState:
+        state = self.db.query(CatalogSyncState).filter(
+            CatalogSyncState.coupang_account_id == self.coupang_account_id,
+            CatalogSyncState.scope == scope
+        ).first()
+        if state is None:
+            state = CatalogSyncState(coupang_account_id=self.coupang_account_id, scope=scope, product_count=0)
+            self.db.add(state)
+        return state
+
+    def sync_all(self, status: str = "APPROVED", max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """
+        전체 목록 동기화 (중단된 동기화는 마지막 페이지 토큰부터 재개)
+        """
+        state = self._get_state("all")
+        next_token = int(state.last_token) if state.last_token and not state.completed_at else None
+        if next_token is None:
+            state.started_at = datetime.utcnow()
+            state.product_count = 0
+        state.completed_at = None
+        self.db.commit()
+
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            result = self.client.get_all_products(status=status, max_per_page=100, next_token=next_token)
+            if result.get("code") != "SUCCESS":
+                logger.error(f"[CATALOG] Listing failed: {result.get('message')}")
+                break
+
+            products = result.get("data", []) or []
+            pages += 1
+            self.sync_details(self.upsert_products(products, page_token=next_token, commit=False))
+
+            state.product_count = (state.product_count or 0) + len(products)
+            next_token_str = (result.get("nextToken") or "").strip()
+            next_token = int(next_token_str) if next_token_str else None
+            state.last_token = str(next_token) if next_token else None
+            if next_token is None:
+                state.completed_at = datetime.utcnow()
+            self.db.commit()
+
+            if next_token is None:
+                break
+
+        return {"pages": pages, "completed": state.completed_at is not None, **self.stats}
+
+    def list_products_created_on(self, created_at: str, status: str = "APPROVED") -> List[Dict[str, Any]]:
+        """
+        특정 날짜 등록상품 목록 (최근에 동기화했거나 이미 확정된 날짜면 미러에서 조회)
+
+        Returns:
+            목록 API와 같은 키(sellerProductId, sellerProductName, createdAt, statusName)의 상품 리스트
+        """
+        scope = f"date:{created_at}:{status}"
+        state = self._get_state(scope)
+        now = datetime.utcnow()
+
+        fresh = False
+        if state.completed_at:
+            day_end = datetime.strptime(created_at, "%Y-%m-%d") + timedelta(days=1)
+            settled = state.completed_at - day_end >= self.DATE_SETTLE_PERIOD
+            fresh = settled or now - state.completed_at < self.DATE_LISTING_TTL
+
+        if not fresh:
+            products = self.client.get_all_products_by_date(created_at=created_at, status=status)
+            self.upsert_products(products, commit=False)
+            state.product_count = len(products)
+            state.started_at = now
+            state.completed_at = now
+            self.db.commit()
+
+        return self.products_created_on(created_at, status=status)
+
+    # ==================== 상세(vendorItem) 동기화 ====================
+
+    def _fetch_vendor_items(self, seller_product_id: int) -> Tuple[int, Optional[List[Dict[str, Any]]], Optional[str]]:
+        """상품 상세에서 옵션 목록 조회 (워커 스레드에서 실행, DB 접근 없음)"""
+        try:
+            result = self.client.get_product_detail(seller_product_id)
+        except Exception as e:
+            return seller_product_id, None, str(e)
+
+        if result.get("code") != "SUCCESS":
+            return seller_product_id, None, result.get("message") or "상품 상세 조회 실패"
+
+        items = []
+        for item in (result.get("data") or {}).get("items", []) or []:
+            vendor_item_id = item.get("vendorItemId")
+            if vendor_item_id:
+                items.append({"vendor_item_id": int(vendor_item_id), "item_name": item.get("itemName")})
+        return seller_product_id, items, None
+
+    def sync_details(self, seller_product_ids: List[int]) -> int:
+        """
+        상품들의 vendorItem 목록을 상세 API로 (재)동기화
+
+        Returns:
+            동기화된 상품 수
+        """
+        seller_product_ids = list(dict.fromkeys(int(pid) for pid in seller_product_ids))
+        if not seller_product_ids or self.client is None:
+            return 0
+
+        workers = min(self.DETAIL_MAX_WORKERS, len(seller_product_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = list(pool.map(self._fetch_vendor_items, seller_product_ids))
+        self.stats["detail_requests"] += len(seller_product_ids)
+
+        products: Dict[int, CatalogProduct] = {}
+        for chunk in _chunks(seller_product_ids):
+            for row in self.db.query(CatalogProduct).filter(
+                CatalogProduct.coupang_account_id == self.coupang_account_id,
+                CatalogProduct.seller_product_id.in_(chunk)
+            ):
+                products[int(row.seller_product_id)] = row
+
+        now = datetime.utcnow()
+        synced = 0
+        for seller_product_id, items, error in fetched:
+            if items is None:
+                self.stats["detail_failed"] += 1
+                logger.warning(f"[CATALOG] Detail fetch failed for {seller_product_id}: {error}")
+                continue
+
+            self.db.query(CatalogVendorItem).filter(
+                CatalogVendorItem.coupang_account_id == self.coupang_account_id,
+                CatalogVendorItem.seller_product_id == seller_product_id
+            ).delete(synchronize_session=False)
+            for item in items:
+                self.db.add(CatalogVendorItem(
+                    coupang_account_id=self.coupang_account_id,
+                    seller_product_id=seller_product_id,
+                    vendor_item_id=item["vendor_item_id"],
+                    item_name=item["item_name"]
+                ))
+
+            row = products.get(seller_product_id)
+            if row is None:
+                row = CatalogProduct(coupang_account_id=self.coupang_account_id, seller_product_id=seller_product_id)
+                self.db.add(row)
+            row.vendor_item_count = len(items)
+            row.detail_synced_at = now
+            synced += 1
+
+        self.db.commit()
+        return synced
+
+    # ==================== 조회 ====================
+
+    def vendor_item_ids_many(self, seller_product_ids: List[int], fetch_missing: bool = True) -> Dict[int, List[int]]:
+        """
+        sellerProductId → vendorItemId 목록 (미러에 없거나 오래된 상품만 상세 조회)
+        """
+        seller_product_ids = list(dict.fromkeys(int(pid) for pid in seller_product_ids))
+        now = datetime.utcnow()
+
+        fresh = set()
+        for chunk in _chunks(seller_product_ids):
+            for row in self.db.query(CatalogProduct).filter(
+                CatalogProduct.coupang_account_id == self.coupang_account_id,
+                CatalogProduct.seller_product_id.in_(chunk)
+            ):
+                if not self._needs_detail(row, now):
+                    fresh.add(int(row.seller_product_id))
+
+        missing = [pid for pid in seller_product_ids if pid not in fresh]
+        if missing and fetch_missing:
+            self.sync_details(missing)
+
+        result: Dict[int, List[int]] = {pid: [] for pid in seller_product_ids}
+        for chunk in _chunks(seller_product_ids):
+            for item in self.db.query(CatalogVendorItem).filter(
+                CatalogVendorItem.coupang_account_id == self.coupang_account_id,
+                CatalogVendorItem.seller_product_id.in_(chunk)
+            ).order_by(CatalogVendorItem.id):
+                result[int(item.seller_product_id)].append(int(item.vendor_item_id))
+        return result
+
+    def vendor_item_ids(self, seller_product_id: int) -> List[int]:
+        """sellerProductId의 vendorItemId 목록"""
+        return self.vendor_item_ids_many([seller_product_id]).get(int(seller_product_id), [])
+
+    def products_created_on(self, created_at: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """미러에서 특정 날짜(yyyy-MM-dd) 등록상품 조회 (status 지정 시 해당 상태만)"""
+        query = self.db.query(CatalogProduct).filter(
+            CatalogProduct.coupang_account_id == self.coupang_account_id,
+            CatalogProduct.product_created_at >= created_at,
+            CatalogProduct.product_created_at < f"{created_at}~"
+        )
+        if status:
+            query = query.filter(CatalogProduct.status_name == STATUS_NAMES.get(status, status))
+        rows = query.order_by(CatalogProduct.seller_product_id).all()
+
+        return [
+            {
+                "sellerProductId": int(row.seller_product_id),
+                "sellerProductName": row.seller_product_name,
+                "createdAt": row.product_created_at,
+                "statusName": row.status_name
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def lookup_vendor_items(
+        db: Session,
+        vendor_item_ids: Iterable[Any],
+        coupang_account_id: Optional[int] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        vendorItemId → 상품 정보 역방향 조회 (발주서/반품 등 옵션 ID만 있는 곳에서 사용)
+
+        Returns:
+            {vendor_item_id: {"seller_product_id", "seller_product_name", "item_name"}}
+        """
+        ids = []
+        for value in vendor_item_ids:
+            try:
+                ids.append(int(value))
+            except (TypeError, ValueError):
+                continue
+        ids = list(dict.fromkeys(ids))
+
+        found: Dict[int, Dict[str, Any]] = {}
+        for chunk in _chunks(ids):
+            query = db.query(CatalogVendorItem, CatalogProduct.seller_product_name).outerjoin(
+                CatalogProduct,
+                (CatalogProduct.coupang_account_id == CatalogVendorItem.coupang_account_id)
+                & (CatalogProduct.seller_product_id == CatalogVendorItem.seller_product_id)
+            ).filter(CatalogVendorItem.vendor_item_id.in_(chunk))
+            if coupang_account_id is not None:
+                query = query.filter(CatalogVendorItem.coupang_account_id == coupang_account_id)
+
+            for item, product_name in query:
+                found[int(item.vendor_item_id)] = {
+                    "seller_product_id": int(item.seller_product_id),
+                    "seller_product_name": product_name,
+                    "item_name": item.item_name
+                }
+        return found
@@ -0,0 +1,355 @@
+"""
+Product Page Extractor
+상품 페이지 상품명/대표 이미지 추출 (head 우선 스트리밍, 사이트별 규칙, URL 기준 캐시)
+"""
+import asyncio
+import hashlib
+import html
+import re
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+import httpx
+from bs4 import BeautifulSoup
+from loguru import logger
+
+from ..config import settings
+from ..core.cache import get_cache
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+CACHE_TAG = "product_page"
+HEAD_MAX_BYTES = 256 * 1024  # </head>를 못 찾아도 여기까지만 head로 간주
+BODY_MAX_BYTES = 3 * 1024 * 1024  # 본문 선택자가 필요할 때 읽는 최대 크기
+
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+# 추적용 쿼리 파라미터 (캐시 키에서 제외)
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "n_media", "n_query", "n_rank", "n_ad", "nacn", "nv_", "spm")
+
+_HEAD_END = re.compile(rb"</head\s*>", re.IGNORECASE)
+_META_TAG = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+_ATTRIBUTE = re.compile(r"""([\w:.-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+_TITLE_TAG = re.compile(r"<title[^>]*>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w-]+)""", re.IGNORECASE)
+
+# 상품명 정제
+_SITE_SUFFIX = re.compile(
+    r"\s*[-|:]\s*(11번가|쿠팡|G마켓|옥션|인터파크|위메프|티몬|SSG|롯데ON|네이버쇼핑).*$", re.IGNORECASE
+)
+_SHOP_PREFIX = re.compile(r"^(\[[^\]]*\]|\([^)]*\))+\s*")  # [쿠오카], (센텀시티점), [쿠오카 공식] 등
+_LEADING_SYMBOLS = re.compile(r"^[\s\-_:]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class SiteRule:
+    """
+    사이트별 추출 규칙
+
+    Attributes:
+        source: 응답에 표시할 사이트 이름 (None이면 도메인)
+        domains: 도메인에 포함되면 이 규칙 적용
+        name_selectors: og:title이 없을 때 본문에서 찾을 상품명 선택자
+        image_selectors: og:image가 없을 때 본문에서 찾을 이미지 선택자
+        use_title_tag: og:title이 없으면 <title> 사용
+        guess_image: 선택자로도 못 찾으면 src에 product/item/goods가 들어간 첫 이미지 사용
+    """
+    source: Optional[str]
+    domains: Tuple[str, ...]
+    name_selectors: Tuple[str, ...] = ()
+    image_selectors: Tuple[str, ...] = ()
+    use_title_tag: bool = False
+    guess_image: bool = False
+
+
+SITE_RULES: List[SiteRule] = [
+    SiteRule("11번가", ("11st.co.kr",),
+             name_selectors=("h1.title", "h2.title", ".prd_name"),
+             image_selectors=(".img_full img", "#prdImg", ".c_product_img img")),
+    SiteRule("쿠팡", ("coupang.com",),
+             name_selectors=("h1.prod-buy-header__title", "h2.prod-buy-header__title"),
+             image_selectors=(".prod-image__detail img", ".prod-image img")),
+    SiteRule("네이버스마트스토어", ("smartstore.naver.com", "brand.naver.com", "shopping.naver.com"),
+             name_selectors=("h3.product_name", ".productName", "h2._3oDjSvLwcS"),
+             image_selectors=('img[alt="대표이미지"]', "._3X6PiBgKq9 img", ".bd_2DO68 img", "._1LY7DqCnwR img")),
+    SiteRule("네이버쇼핑", ("naver.com",),
+             name_selectors=("h3.product_name", ".productName", "h2._3oDjSvLwcS")),
+    SiteRule("G마켓", ("gmarket.co.kr",), name_selectors=("h1.itemtit", ".item_tit")),
+    SiteRule("옥션", ("auction.co.kr",), name_selectors=("h1.itemtit", ".item_tit")),
+    SiteRule("인터파크", ("interpark.com",)),
+    SiteRule("위메프", ("wemakeprice.com",)),
+    SiteRule("티몬", ("tmon.co.kr",)),
+    SiteRule("SSG", ("ssg.com",)),
+    SiteRule("롯데ON", ("lotteon.com",)),
+]
+
+# 등록되지 않은 사이트
+GENERIC_RULE = SiteRule(None, (), name_selectors=("h1",), use_title_tag=True, guess_image=True)
+
+
+def register_site(rule: SiteRule):
+    """사이트 규칙 추가 (기존 규칙보다 먼저 검사)"""
+    SITE_RULES.insert(0, rule)
+
+
+def match_site(domain: str) -> SiteRule:
+    for rule in SITE_RULES:
+        if any(d in domain for d in rule.domains):
+            return rule
+    return GENERIC_RULE
+
+
+# extract-product-name 응답의 사이트 이름 (기존 응답 호환: 스마트스토어 상품명도 "네이버쇼핑")
+NAME_SOURCE_ALIASES = {"네이버스마트스토어": "네이버쇼핑"}
+
+
+class PageMetadata(NamedTuple):
+    source: str
+    product_name: Optional[str] = None
+    image_url: Optional[str] = None
+    error: Optional[str] = None
+
+
+def canonical_url(url: str) -> str:
+    """캐시 키용 URL 정규화 (스킴/호스트 소문자, fragment·추적 파라미터 제거, 쿼리 정렬)"""
+    parsed = urlparse(url.strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunparse((
+        (parsed.scheme or "https").lower(),
+        parsed.netloc.lower(),
+        parsed.path or "/",
+        parsed.params,
+        urlencode(query),
+        ""
+    ))
+
+
+def clean_product_name(name: str) -> str:
+    """사이트명 접미사, 상점명 접두사, 중복 공백 제거"""
+    name = _SITE_SUFFIX.sub("", name.strip())
+    name = _SHOP_PREFIX.sub("", name)
+    name = _LEADING_SYMBOLS.sub("", name)
+    return _WHITESPACE.sub(" ", name).strip()
+
+
+def scan_head(head: str) -> Dict[str, str]:
+    """head 구간의 meta property/name → content 와 <title>"""
+    found: Dict[str, str] = {}
+    for tag in _META_TAG.findall(head):
+        attrs = {m.group(1).lower(): m.group(2) or m.group(3) or m.group(4) or "" for m in _ATTRIBUTE.finditer(tag)}
+        key = (attrs.get("property") or attrs.get("name") or "").lower()
+        content = attrs.get("content")
+        if key and content and key not in found:
+            found[key] = html.unescape(content).strip()
+    title = _TITLE_TAG.search(head)
+    if title:
+        found["title"] = html.unescape(title.group(1)).strip()
+    return found
+
+
+def _charset(response: httpx.Response, data: bytes) -> str:
+    if response.charset_encoding:
+        return response.charset_encoding
+    match = _META_CHARSET.search(data[:4096])
+    return match.group(1).decode() if match else "utf-8"
+
+
+def _decode(data: bytes, encoding: str) -> str:
+    try:
+        return data.decode(encoding, errors="replace")
+    except LookupError:
+        return data.decode("utf-8", errors="replace")
+
+
+def _select_text(soup: BeautifulSoup, selectors: Tuple[str, ...]) -> Optional[str]:
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element:
+            text = element.get_text(strip=True)
+            if text:
+                return text
+    return None
+
+
+def _select_image(soup: BeautifulSoup, rule: SiteRule) -> Optional[str]:
+    for selector in rule.image_selectors:
+        element = soup.select_one(selector)
+        if element and element.get("src"):
+            return element["src"]
+    if rule.guess_image:
+        for img in soup.find_all("img"):
+            src = img.get("src") or img.get("data-src")
+            if src and any(word in src.lower() for word in ("product", "item", "goods")):
+                return src
+    return None
+
+
+def extract_from_html(head: str, body: Optional[str], rule: SiteRule) -> Tuple[Optional[str], Optional[str]]:
+    """head 스캔 결과 우선, 없으면 본문 선택자 (body가 None이면 head만 사용)"""
+    meta = scan_head(head)
+    name = meta.get("og:title") or (meta.get("title") if rule.use_title_tag else None)
+    image = meta.get("og:image")
+
+    if body is not None and (not name or not image):
+        soup = BeautifulSoup(body, HTML_PARSER)
+        if not name:
+            name = _select_text(soup, rule.name_selectors)
+        if not image:
+            image = _select_image(soup, rule)
+    return name, image
+
+
+class ProductPageExtractor:
+    """
+    상품 페이지 메타데이터 추출기
+
+    Args:
+        max_concurrency: 일괄 추출 동시 요청 수
+        cache_ttl: URL별 결과 캐시 시간(초, 0이면 캐시 안 함)
+        transport: httpx 전송 계층 (테스트/벤치마크용)
+    """
+
+    def __init__(self, max_concurrency: int = 8, cache_ttl: int = 3600, transport=None):
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop = None
+        self.stats = {"fetches": 0, "head_only": 0, "full_body": 0, "bytes": 0, "cache_hits": 0}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """이벤트 루프별로 하나의 연결 풀 유지"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                headers=REQUEST_HEADERS,
+                timeout=httpx.Timeout(15.0, connect=5.0),
+                limits=httpx.Limits(max_connections=self.max_concurrency * 2),
+                transport=self.transport
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None and not self._client.is_closed:
+            try:
+                await self._client.aclose()
+            except RuntimeError:
+                pass
+        self._client = None
+
+    async def _fetch(self, url: str, rule: SiteRule, source: str) -> PageMetadata:
+        self.stats["fetches"] += 1
+        async with self._get_client().stream("GET", url) as response:
+            if response.status_code != 200:
+                return PageMetadata(source, error=f"페이지 로드 실패 (상태 코드: {response.status_code})")
+
+            buffer = bytearray()
+            chunks = response.aiter_bytes()
+            head_end = None
+            async for chunk in chunks:
+                search_from = max(0, len(buffer) - 8)
+                buffer += chunk
+                match = _HEAD_END.search(buffer, search_from)
+                if match:
+                    head_end = match.end()
+                    break
+                if len(buffer) >= HEAD_MAX_BYTES:
+                    break
+
+            encoding = _charset(response, bytes(buffer[:4096]))
+            head = _decode(bytes(buffer[:head_end or len(buffer)]), encoding)
+            name, image = extract_from_html(head, None, rule)
+
+            needs_body = (not name and (rule.name_selectors or rule.use_title_tag)) or \
+                         (not image and (rule.image_selectors or rule.guess_image))
+            if needs_body:
+                async for chunk in chunks:
+                    buffer += chunk
+                    if len(buffer) >= BODY_MAX_BYTES:
+                        break
+                self.stats["full_body"] += 1
+                name, image = extract_from_html(head, _decode(bytes(buffer), encoding), rule)
+            else:
+                self.stats["head_only"] += 1
+            self.stats["bytes"] += len(buffer)
+            base_url = str(response.url)
+
+        return PageMetadata(
+            source,
+            product_name=clean_product_name(name) if name else None,
+            image_url=urljoin(base_url, image) if image else None
+        )
+
+    async def extract(self, url: str) -> PageMetadata:
+        """URL 하나 추출 (정규화 URL 기준 캐시)"""
+        domain = urlparse(url).netloc.lower()
+        rule = match_site(domain)
+        source = rule.source or domain
+
+        key = f"{CACHE_TAG}:" + hashlib.md5(canonical_url(url).encode()).hexdigest()
+        cache = get_cache()
+        if self.cache_ttl > 0:
+            cached = cache.get(key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                return PageMetadata(*cached)
+
+        try:
+            result = await self._fetch(url, rule, source)
+        except httpx.TimeoutException:
+            logger.error(f"Timeout fetching URL: {url}")
+            return PageMetadata("unknown", error="페이지 로드 시간 초과")
+        except Exception as e:
+            logger.error(f"Error extracting product page {url}: {e}")
+            return PageMetadata("unknown", error=str(e))
+
+        if self.cache_ttl > 0 and not result.error:
+            cache.set(key, tuple(result), ttl=self.cache_ttl, tags=[CACHE_TAG])
+        return result
+
+    async def extract_many(self, urls: List[str], max_concurrency: Optional[int] = None) -> List[Tuple[str, PageMetadata]]:
+        """여러 URL 일괄 추출 (입력 순서 유지, 같은 URL은 한 번만 요청)"""
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        unique = list(dict.fromkeys(urls))
+
+        async def run(url: str) -> PageMetadata:
+            async with semaphore:
+                return await self.extract(url)
+
+        results = dict(zip(unique, await asyncio.gather(*(run(url) for url in unique))))
+        return [(url, results[url]) for url in urls]
+
+
+_extractor: Optional[ProductPageExtractor] = None
+
+
+def get_product_page_extractor() -> ProductPageExtractor:
+    global _extractor
+    if _extractor is None:
+        _extractor = ProductPageExtractor(
+            max_concurrency=settings.PRODUCT_PAGE_MAX_CONCURRENCY,
+            cache_ttl=settings.PRODUCT_PAGE_CACHE_TTL
+        )
+    return _extractor
+
+
+async def close_product_page_extractor():
+    global _extractor
+    if _extractor is not None:
+        await _extractor.aclose()
+        _extractor = None
@@ -9,6 +9,10 @@ from sqlalchemy import func, and_
 from loguru import logger
 
 from ..models import Inquiry, Response, ActivityLog
+from .dashboard_counters import DashboardSnapshot, get_dashboard_counters
+
+# Counter groups backing the real-time dashboard (also used for its ETag)
+DASHBOARD_GROUPS = ('inquiries', 'responses', 'activity_logs')
 
 
 class ReportingService:
@@ -126,31 +130,44 @@ class ReportingService:
 
         return report
 
-    def get_real_time_dashboard(self) -> Dict:
+    def get_real_time_dashboard(self, snapshot: Optional[DashboardSnapshot] = None) -> Dict:
         """
         Get real-time dashboard statistics
 
+        Counts come from the incremental dashboard counters instead of
+        per-request COUNT queries.
+
+        Args:
+            snapshot: Counter snapshot already used for the ETag check (taken if omitted)
+
         Returns:
             Dashboard data
         """
         now = datetime.utcnow()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        today = now.date().isoformat()
+        if snapshot is None:
+            snapshot = get_dashboard_counters(self.db).snapshot(self.db, *DASHBOARD_GROUPS)
+
+        pending_approval = (
+            snapshot.get('responses', 'status:pending_approval') + snapshot.get('responses', 'status:draft')
+        )
+        requires_human = snapshot.get('inquiries', 'requires_human_open')
 
         return {
             'timestamp': now.isoformat(),
             'today': {
-                'inquiries': self._count_inquiries(today_start, now),
-                'responses': self._count_responses(today_start, now),
-                'auto_approved': self._count_auto_approved(today_start, now),
-                'pending_approval': self._count_pending_approval()
+                'inquiries': snapshot.get('inquiries', f'created:{today}'),
+                'responses': snapshot.get('responses', f'created:{today}'),
+                'auto_approved': snapshot.get('responses', f'auto_approved:{today}'),
+                'pending_approval': pending_approval
             },
             'pending': {
-                'inquiries': self._count_pending_inquiries(),
-                'responses': self._count_pending_approval(),
-                'requires_human': self._count_requires_human()
+                'inquiries': snapshot.get('inquiries', 'status:pending'),
+                'responses': pending_approval,
+                'requires_human': requires_human
             },
             'recent_activity': self._get_recent_activity(limit=10),
-            'alerts': self._get_active_alerts()
+            'alerts': self._get_active_alerts(requires_human, pending_approval)
         }
 
     def _get_inquiry_stats(self, start: datetime, end: datetime) -> Dict:
@@ -338,25 +355,24 @@ class ReportingService:
     def _get_recent_activity(self, limit: int = 10) -> List[Dict]:
         """Get recent activity logs"""
         logs = self.db.query(ActivityLog).order_by(
-            ActivityLog.created_at.desc()
+            ActivityLog.timestamp.desc()
         ).limit(limit).all()
 
         return [
             {
                 'action': log.action,
                 'actor': log.actor,
-                'created_at': log.created_at.isoformat(),
+                'created_at': log.timestamp.isoformat() if log.timestamp else None,
                 'status': log.status
             }
             for log in logs
         ]
 
-    def _get_active_alerts(self) -> List[Dict]:
+    def _get_active_alerts(self, pending_human: int, pending_approval: int) -> List[Dict]:
         """Get active alerts"""
         alerts = []
 
         # Check for pending human reviews
-        pending_human = self._count_requires_human()
         if pending_human > 5:
             alerts.append({
                 'level': 'warning',
@@ -364,7 +380,6 @@ class ReportingService:
             })
 
         # Check for pending approvals
-        pending_approval = self._count_pending_approval()
         if pending_approval > 10:
             alerts.append({
                 'level': 'info',
@@ -405,19 +420,3 @@ class ReportingService:
                 Response.auto_approved == True
             )
         ).count()
-
-    def _count_pending_inquiries(self) -> int:
-        return self.db.query(Inquiry).filter(
-            Inquiry.status == 'pending'
-        ).count()
-
-    def _count_pending_approval(self) -> int:
-        return self.db.query(Response).filter(
-            Response.status.in_(['pending_approval', 'draft'])
-        ).count()
-
-    def _count_requires_human(self) -> int:
-        return self.db.query(Inquiry).filter(
-            Inquiry.requires_human == True,
-            Inquiry.status != 'processed'
-        ).count()
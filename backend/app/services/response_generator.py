@@ -5,13 +5,14 @@ Generates responses to customer inquiries using templates and knowledge base
 import json
 import re
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Iterator, Optional, List, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from loguru import logger
 
 from ..models import Inquiry, Response, KnowledgeBase
 from ..config import settings
+from .policy_retriever import get_policy_retriever
 
 
 class ResponseGenerator:
@@ -170,6 +171,25 @@ class ResponseGenerator:
             logger.error(f"Error reading policy: {str(e)}")
             return {}
 
+    def _policy_context(self, inquiry: Inquiry) -> str:
+        """
+        Build the policy/FAQ context for an AI prompt
+
+        Only the chunks most relevant to the inquiry text are included, within
+        POLICY_CONTEXT_TOKEN_BUDGET; chunks for the inquiry's category are preferred.
+
+        Args:
+            inquiry: Inquiry object
+
+        Returns:
+            Context text (empty if nothing relevant)
+        """
+        return get_policy_retriever().build_context(
+            query=inquiry.inquiry_text or "",
+            sources=("policy", "faq"),
+            prefer={"category": inquiry.classified_category}
+        )
+
     def _prepare_template_variables(
         self,
         inquiry: Inquiry,
@@ -413,9 +433,7 @@ class ResponseGenerator:
 
         try:
             # Load policy context
-            category = inquiry.classified_category or "general"
-            policy_info = self._load_policy(category)
-            policy_text = json.dumps(policy_info, ensure_ascii=False, indent=2) if policy_info else ""
+            policy_text = self._policy_context(inquiry)
 
             # Generate with AI
             ai_generator = AIResponseGenerator()
@@ -428,24 +446,7 @@ class ResponseGenerator:
                 logger.error("AI generation failed")
                 return None
 
-            # Calculate confidence
-            confidence = result.get("confidence", 75.0)
-
-            # Create Response object
-            response = Response(
-                inquiry_id=inquiry.id,
-                response_text=result["response_text"],
-                original_response=result["response_text"],
-                confidence_score=confidence,
-                template_used="ai_generated",
-                generation_method="ai",
-                status="draft"
-            )
-
-            self.db.add(response)
-            self.db.commit()
-            self.db.refresh(response)
-
+            response = self._save_ai_response(inquiry, result)
             logger.success(f"AI response generated for inquiry {inquiry.id}")
             return response
 
@@ -453,6 +454,52 @@ class ResponseGenerator:
             logger.error(f"Error in AI generation: {str(e)}")
             return None
 
+    def stream_ai_response(self, inquiry: Inquiry) -> Iterator[Dict]:
+        """
+        Stream an AI response token by token and save it once complete
+
+        Args:
+            inquiry: Inquiry object
+
+        Yields:
+            AIResponseGenerator.stream_response events; the final "done" event
+            also carries the saved response_id
+        """
+        from .ai_response_generator import AIResponseGenerator
+
+        policy_text = self._policy_context(inquiry)
+
+        for event in AIResponseGenerator().stream_response(inquiry=inquiry, policy_context=policy_text):
+            if event["type"] == "done":
+                if not event["response_text"]:
+                    yield {"type": "error", "message": "AI generation returned an empty response"}
+                    return
+                response = self._save_ai_response(inquiry, event)
+                logger.success(f"AI response streamed for inquiry {inquiry.id}")
+                event = {**event, "response_id": response.id}
+            yield event
+
+    def _save_ai_response(self, inquiry: Inquiry, result: Dict) -> Response:
+        """Create the draft Response for an AI generation result"""
+        # Calculate confidence
+        confidence = result.get("confidence", 75.0)
+
+        # Create Response object
+        response = Response(
+            inquiry_id=inquiry.id,
+            response_text=result["response_text"],
+            original_response=result["response_text"],
+            confidence_score=confidence,
+            template_used="ai_generated",
+            generation_method="ai",
+            status="draft"
+        )
+
+        self.db.add(response)
+        self.db.commit()
+        self.db.refresh(response)
+        return response
+
     def _generate_hybrid(self, inquiry: Inquiry) -> Optional[Response]:
         """
         Generate response using hybrid approach (template + AI)
@@ -477,9 +524,7 @@ class ResponseGenerator:
             logger.info("Template confidence low, enhancing with AI")
 
             try:
-                category = inquiry.classified_category or "general"
-                policy_info = self._load_policy(category)
-                policy_text = json.dumps(policy_info, ensure_ascii=False) if policy_info else ""
+                policy_text = self._policy_context(inquiry)
 
                 ai_generator = AIResponseGenerator()
                 enhanced = ai_generator.enhance_template_response(
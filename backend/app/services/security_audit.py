@@ -4,22 +4,31 @@ Security and Audit Logging Service
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from sqlalchemy import func, desc, and_, or_
 from loguru import logger
 import hashlib
 import json
 
-from ..models.user import AuditLog, User
+from ..models.user import AuditLog, AuditLogSummary, User
+from .audit_writer import AuditLogWriter, get_audit_writer, hour_bucket, is_security_event
 
 
 class SecurityAuditService:
     """
     Comprehensive audit logging and security monitoring
+
+    Writes go through the shared AuditLogWriter (buffered, group-committed);
+    aggregates are read from the hourly audit_log_summary table.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, writer: Optional[AuditLogWriter] = None):
         self.db = db
-        self.security_events = []  # In-memory for real-time monitoring
+        self.writer = writer or get_audit_writer(db.get_bind())
+
+    @property
+    def security_events(self) -> List[Dict]:
+        """Real-time security event stream (recorded when queued, before the DB write)"""
+        return list(self.writer.security_events)
 
     def log_action(
         self,
@@ -46,51 +55,38 @@ class SecurityAuditService:
             status: Action status ('success', 'failed', 'blocked')
 
         Returns:
-            Created audit log entry
+            Queued audit log entry (not yet persisted, so id is None)
         """
-        audit_log = AuditLog(
-            user_id=user_id,
-            action=action,
-            resource_type=resource_type,
+        record = self.writer.enqueue(
+            user_id,
+            action,
+            resource_type,
             resource_id=resource_id,
             details=details,
             ip_address=ip_address,
             user_agent=user_agent,
-            timestamp=datetime.utcnow()
+            status=status
         )
 
-        self.db.add(audit_log)
-        self.db.commit()
-
-        # Add to real-time monitoring if security-relevant
-        if self._is_security_event(action, status):
-            self.security_events.append({
-                'user_id': user_id,
-                'action': action,
-                'timestamp': datetime.utcnow(),
-                'status': status,
-                'ip_address': ip_address
-            })
-
         logger.info(f"Audit log: User {user_id} - {action} on {resource_type}:{resource_id}")
-        return audit_log
+        return AuditLog(**record)
 
     def _is_security_event(self, action: str, status: str) -> bool:
         """Determine if an action is security-relevant"""
-        security_actions = [
-            'user.login',
-            'user.logout',
-            'user.login_failed',
-            'user.password_change',
-            'user.role_change',
-            'permission.grant',
-            'permission.revoke',
-            'data.export',
-            'data.delete',
-            'settings.change'
-        ]
+        return is_security_event(action, status)
+
+    def get_recent_security_events(self, minutes: int = 60) -> List[Dict]:
+        """
+        Get security events from the in-memory stream
+
+        Args:
+            minutes: Time window to look back
 
-        return action in security_actions or status in ['failed', 'blocked']
+        Returns:
+            Security events, newest first
+        """
+        since = datetime.utcnow() - timedelta(minutes=minutes)
+        return [e for e in reversed(self.writer.security_events) if e['timestamp'] >= since]
 
     def get_user_activity(
         self,
@@ -109,6 +105,7 @@ class SecurityAuditService:
         Returns:
             List of activity records
         """
+        self.writer.flush()
         start_date = datetime.utcnow() - timedelta(days=days)
 
         logs = self.db.query(AuditLog).filter(
@@ -150,6 +147,7 @@ class SecurityAuditService:
         Returns:
             Audit trail
         """
+        self.writer.flush()
         logs = self.db.query(AuditLog).filter(
             and_(
                 AuditLog.resource_type == resource_type,
@@ -180,30 +178,36 @@ class SecurityAuditService:
         """
         Detect suspicious activity patterns
 
+        Counts come from hourly summary buckets, so the window starts at the
+        top of the hour `hours` ago.
+
         Args:
             hours: Time window to analyze
 
         Returns:
             List of suspicious activities
         """
-        start_time = datetime.utcnow() - timedelta(hours=hours)
+        self.writer.flush()
+        start_bucket = hour_bucket(datetime.utcnow() - timedelta(hours=hours))
+        in_window = AuditLogSummary.bucket_start >= start_bucket
+        total = func.sum(AuditLogSummary.count)
         suspicious = []
 
         # Pattern 1: Multiple failed login attempts
         failed_logins = self.db.query(
-            AuditLog.user_id,
-            AuditLog.ip_address,
-            func.count(AuditLog.id).label('attempt_count')
+            AuditLogSummary.user_id,
+            AuditLogSummary.ip_address,
+            total.label('attempt_count')
         ).filter(
             and_(
-                AuditLog.action == 'user.login_failed',
-                AuditLog.timestamp >= start_time
+                AuditLogSummary.action == 'user.login_failed',
+                in_window
             )
         ).group_by(
-            AuditLog.user_id,
-            AuditLog.ip_address
+            AuditLogSummary.user_id,
+            AuditLogSummary.ip_address
         ).having(
-            func.count(AuditLog.id) >= 5  # 5+ failed attempts
+            total >= 5  # 5+ failed attempts
         ).all()
 
         for user_id, ip_address, count in failed_logins:
@@ -218,17 +222,17 @@ class SecurityAuditService:
 
         # Pattern 2: Unusual data export volume
         exports = self.db.query(
-            AuditLog.user_id,
-            func.count(AuditLog.id).label('export_count')
+            AuditLogSummary.user_id,
+            total.label('export_count')
         ).filter(
             and_(
-                AuditLog.action == 'data.export',
-                AuditLog.timestamp >= start_time
+                AuditLogSummary.action == 'data.export',
+                in_window
             )
         ).group_by(
-            AuditLog.user_id
+            AuditLogSummary.user_id
         ).having(
-            func.count(AuditLog.id) >= 10  # 10+ exports
+            total >= 10  # 10+ exports
         ).all()
 
         for user_id, count in exports:
@@ -243,15 +247,16 @@ class SecurityAuditService:
             })
 
         # Pattern 3: Access from multiple IPs in short time
+        distinct_ips = func.count(func.distinct(AuditLogSummary.ip_address))
         multi_ip_users = self.db.query(
-            AuditLog.user_id,
-            func.count(func.distinct(AuditLog.ip_address)).label('ip_count')
+            AuditLogSummary.user_id,
+            distinct_ips.label('ip_count')
         ).filter(
-            AuditLog.timestamp >= start_time
+            in_window
         ).group_by(
-            AuditLog.user_id
+            AuditLogSummary.user_id
         ).having(
-            func.count(func.distinct(AuditLog.ip_address)) >= 5  # 5+ different IPs
+            distinct_ips >= 5  # 5+ different IPs
         ).all()
 
         for user_id, ip_count in multi_ip_users:
@@ -266,22 +271,25 @@ class SecurityAuditService:
             })
 
         # Pattern 4: After-hours activity
-        after_hours = self.db.query(AuditLog).filter(
+        bucket_hour = func.extract('hour', AuditLogSummary.bucket_start)
+        after_hours = self.db.query(
+            func.coalesce(total, 0)
+        ).filter(
             and_(
-                AuditLog.timestamp >= start_time,
+                in_window,
                 or_(
-                    func.extract('hour', AuditLog.timestamp) < 6,  # Before 6 AM
-                    func.extract('hour', AuditLog.timestamp) >= 22  # After 10 PM
+                    bucket_hour < 6,  # Before 6 AM
+                    bucket_hour >= 22  # After 10 PM
                 )
             )
-        ).all()
+        ).scalar()
 
-        if len(after_hours) > 20:
+        if after_hours > 20:
             suspicious.append({
                 'type': 'after_hours_activity',
                 'severity': 'low',
-                'count': len(after_hours),
-                'description': f'{len(after_hours)} actions performed outside business hours'
+                'count': after_hours,
+                'description': f'{after_hours} actions performed outside business hours'
             })
 
         logger.info(f"Detected {len(suspicious)} suspicious activity patterns")
@@ -297,60 +305,39 @@ class SecurityAuditService:
         Returns:
             Security dashboard data
         """
-        start_date = datetime.utcnow() - timedelta(days=days)
-
-        # Total actions
-        total_actions = self.db.query(func.count(AuditLog.id)).filter(
-            AuditLog.timestamp >= start_date
-        ).scalar()
-
-        # Failed logins
-        failed_logins = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.action == 'user.login_failed',
-                AuditLog.timestamp >= start_date
-            )
-        ).scalar()
-
-        # Successful logins
-        successful_logins = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.action == 'user.login',
-                AuditLog.timestamp >= start_date
-            )
-        ).scalar()
-
-        # Data exports
-        data_exports = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.action == 'data.export',
-                AuditLog.timestamp >= start_date
-            )
-        ).scalar()
-
-        # Permission changes
-        permission_changes = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.action.in_(['permission.grant', 'permission.revoke', 'user.role_change']),
-                AuditLog.timestamp >= start_date
-            )
-        ).scalar()
+        self.writer.flush()
+        start_bucket = hour_bucket(datetime.utcnow() - timedelta(days=days))
+        in_window = AuditLogSummary.bucket_start >= start_bucket
+        total = func.sum(AuditLogSummary.count)
+
+        # Action counts (one grouped query over the summary buckets)
+        action_counts = dict(
+            self.db.query(AuditLogSummary.action, total).filter(in_window).group_by(AuditLogSummary.action).all()
+        )
+        total_actions = sum(action_counts.values())
+        failed_logins = action_counts.get('user.login_failed', 0)
+        successful_logins = action_counts.get('user.login', 0)
+        data_exports = action_counts.get('data.export', 0)
+        permission_changes = sum(
+            action_counts.get(action, 0)
+            for action in ('permission.grant', 'permission.revoke', 'user.role_change')
+        )
 
         # Active users
         active_users = self.db.query(
-            func.count(func.distinct(AuditLog.user_id))
+            func.count(func.distinct(AuditLogSummary.user_id))
         ).filter(
-            AuditLog.timestamp >= start_date
+            in_window
         ).scalar()
 
         # Most active users
         top_users = self.db.query(
-            AuditLog.user_id,
-            func.count(AuditLog.id).label('action_count')
+            AuditLogSummary.user_id,
+            total.label('action_count')
         ).filter(
-            AuditLog.timestamp >= start_date
+            in_window
         ).group_by(
-            AuditLog.user_id
+            AuditLogSummary.user_id
         ).order_by(
             desc('action_count')
         ).limit(5).all()
@@ -395,6 +382,7 @@ class SecurityAuditService:
         Returns:
             Compliance report
         """
+        self.writer.flush()
         logs = self.db.query(AuditLog).filter(
             and_(
                 AuditLog.timestamp >= start_date,
@@ -469,6 +457,7 @@ class SecurityAuditService:
         Returns:
             Matching audit logs
         """
+        self.writer.flush()
         query = self.db.query(AuditLog)
 
         # Apply filters
@@ -514,7 +503,3 @@ class SecurityAuditService:
             })
 
         return results
-
-
-# Add missing import for 'or_'
-from sqlalchemy import or_
@@ -183,81 +183,122 @@ class SpecialFormAutomation:
 
             # 1. AI 답변 생성 (없으면)
             if not ai_response:
-                self.log("AI 답변 생성 중...")
-                ai_result = self.ai_generator.generate_response_from_text(
-                    inquiry_text=inquiry.inquiry_content,
-                    customer_name=inquiry.customer_name
-                )
-                if ai_result and ai_result.get("response_text"):
-                    ai_response = ai_result["response_text"]
-                    result["steps"].append({"step": "ai_response", "status": "success"})
-                    self.log(f"AI 답변 생성 완료 ({len(ai_response)}자)")
-                else:
+                ai_response = await self.generate_answer(inquiry)
+                if not ai_response:
                     result["status"] = "failed"
                     result["message"] = "AI 답변 생성 실패"
                     result["steps"].append({"step": "ai_response", "status": "failed"})
                     return result
+                result["steps"].append({"step": "ai_response", "status": "success"})
             else:
                 result["steps"].append({"step": "ai_response", "status": "provided"})
 
-            # 2. 특수 링크 추출
-            special_link = inquiry.special_link or self.extract_special_link(
-                inquiry.special_reply_content
-            )
+            # 2~4. 링크 이동 후 양식 입력/제출
+            return await self.submit_special_form(inquiry, ai_response, result)
 
-            if not special_link:
-                result["status"] = "failed"
-                result["message"] = "특수 양식 링크를 찾을 수 없습니다"
-                result["steps"].append({"step": "link_extract", "status": "failed"})
-                self.log("특수 양식 링크를 찾을 수 없습니다", 'error')
-                return result
+        except Exception as e:
+            self.log(f"특수 양식 처리 오류: {e}", 'error')
+            result["status"] = "error"
+            result["message"] = str(e)
+            return result
 
-            self.log(f"특수 링크 발견: {special_link}")
-            result["steps"].append({
-                "step": "link_extract",
-                "status": "success",
-                "link": special_link
-            })
+    async def generate_answer(self, inquiry: SpecialFormInquiry) -> Optional[str]:
+        """
+        AI 답변 생성
 
-            # 3. 링크 페이지로 이동
-            self.log("특수 양식 페이지로 이동 중...")
-            if not await self.client.navigate_to_url(special_link):
-                result["status"] = "failed"
-                result["message"] = "특수 양식 페이지 이동 실패"
-                result["steps"].append({"step": "navigate", "status": "failed"})
-                return result
-
-            await asyncio.sleep(3)
-            result["steps"].append({"step": "navigate", "status": "success"})
-
-            # 4. 양식 분석 및 입력
-            form_result = await self._fill_special_form(ai_response)
-
-            if form_result.get("success"):
-                result["status"] = "submitted"
-                result["message"] = "특수 양식 답변 제출 완료"
-                result["ai_response"] = ai_response
-                result["steps"].append({"step": "form_submit", "status": "success"})
-                self.log(f"문의 {inquiry.inquiry_id} 답변 제출 완료!", 'success')
-            else:
-                result["status"] = "failed"
-                result["message"] = form_result.get("error", "양식 제출 실패")
-                result["steps"].append({
-                    "step": "form_submit",
-                    "status": "failed",
-                    "error": form_result.get("error")
-                })
-                self.log(f"문의 {inquiry.inquiry_id} 양식 제출 실패: {form_result.get('error')}", 'error')
+        생성기는 동기 API 호출이므로 스레드에서 실행 (다른 문의의 브라우저 작업과 겹쳐서 진행)
+        """
+        self.log(f"문의 {inquiry.inquiry_id} AI 답변 생성 중...")
+        ai_result = await asyncio.to_thread(
+            self.ai_generator.generate_response_from_text,
+            inquiry_text=inquiry.inquiry_content,
+            customer_name=inquiry.customer_name
+        )
+        if ai_result and ai_result.get("response_text"):
+            ai_response = ai_result["response_text"]
+            self.log(f"문의 {inquiry.inquiry_id} AI 답변 생성 완료 ({len(ai_response)}자)")
+            return ai_response
+        return None
 
+    async def submit_special_form(
+        self,
+        inquiry: SpecialFormInquiry,
+        ai_response: str,
+        result: Dict,
+        page=None
+    ) -> Dict:
+        """
+        특수 링크로 이동해 답변 입력 및 제출
+
+        Args:
+            page: 사용할 브라우저 페이지 (없으면 로그인한 기본 페이지)
+        """
+        page = page or self.client.page
+
+        # 2. 특수 링크 추출
+        special_link = inquiry.special_link or self.extract_special_link(
+            inquiry.special_reply_content
+        )
+
+        if not special_link:
+            result["status"] = "failed"
+            result["message"] = "특수 양식 링크를 찾을 수 없습니다"
+            result["steps"].append({"step": "link_extract", "status": "failed"})
+            self.log("특수 양식 링크를 찾을 수 없습니다", 'error')
             return result
 
-        except Exception as e:
-            self.log(f"특수 양식 처리 오류: {e}", 'error')
-            result["status"] = "error"
-            result["message"] = str(e)
+        self.log(f"특수 링크 발견: {special_link}")
+        result["steps"].append({
+            "step": "link_extract",
+            "status": "success",
+            "link": special_link
+        })
+
+        # 3. 링크 페이지로 이동
+        self.log("특수 양식 페이지로 이동 중...")
+        if not await self._navigate(page, special_link):
+            result["status"] = "failed"
+            result["message"] = "특수 양식 페이지 이동 실패"
+            result["steps"].append({"step": "navigate", "status": "failed"})
             return result
 
-    async def _fill_special_form(self, response_text: str) -> Dict:
+        await asyncio.sleep(3)
+        result["steps"].append({"step": "navigate", "status": "success"})
+
+        # 4. 양식 분석 및 입력
+        form_result = await self._fill_special_form(ai_response, page)
+
+        if form_result.get("success"):
+            result["status"] = "submitted"
+            result["message"] = "특수 양식 답변 제출 완료"
+            result["ai_response"] = ai_response
+            result["steps"].append({"step": "form_submit", "status": "success"})
+            self.log(f"문의 {inquiry.inquiry_id} 답변 제출 완료!", 'success')
+        else:
+            result["status"] = "failed"
+            result["message"] = form_result.get("error", "양식 제출 실패")
+            result["steps"].append({
+                "step": "form_submit",
+                "status": "failed",
+                "error": form_result.get("error")
+            })
+            self.log(f"문의 {inquiry.inquiry_id} 양식 제출 실패: {form_result.get('error')}", 'error')
+
+        return result
+
+    async def _navigate(self, page, url: str) -> bool:
+        """기본 페이지는 클라이언트 이동 로직, 추가 페이지는 직접 이동"""
+        if page is self.client.page:
+            return await self.client.navigate_to_url(url)
+        try:
+            await page.goto(url, wait_until='networkidle')
+            await asyncio.sleep(2)
+            return True
+        except Exception as e:
+            self.log(f"URL 이동 실패: {e}", 'error')
+            return False
+
+    async def _fill_special_form(self, response_text: str, page=None) -> Dict:
         """
         특수 양식 입력 및 제출
 
@@ -267,9 +308,8 @@ class SpecialFormAutomation:
         - 라디오 버튼/체크박스
         - 제출 버튼
         """
+        page = page or self.client.page
         try:
-            page = self.client.page
-
             # 페이지 로딩 대기
             await asyncio.sleep(2)
 
@@ -317,7 +357,7 @@ class SpecialFormAutomation:
                 self.log(f"답변 입력 완료 ({len(response_text)}자)")
             else:
                 self.log("텍스트 입력 영역을 찾을 수 없습니다", 'warning')
-                await self.client._save_screenshot("special_form_no_textarea")
+                await self.client._save_screenshot("special_form_no_textarea", page)
 
             await asyncio.sleep(1)
 
@@ -393,84 +433,171 @@ class SpecialFormAutomation:
                 return {"success": True, "warning": "제출 결과 미확인"}
             else:
                 self.log("제출 버튼을 찾을 수 없습니다", 'error')
-                await self.client._save_screenshot("special_form_no_submit")
+                await self.client._save_screenshot("special_form_no_submit", page)
                 return {"success": False, "error": "제출 버튼을 찾을 수 없음"}
 
         except Exception as e:
             self.log(f"양식 처리 오류: {e}", 'error')
-            await self.client._save_screenshot("special_form_exception")
+            await self.client._save_screenshot("special_form_exception", page)
             return {"success": False, "error": str(e)}
 
     async def process_batch(
         self,
-        inquiries: List[SpecialFormInquiry]
+        inquiries: List[SpecialFormInquiry],
+        prefetch: int = 3,
+        pages: int = 1,
+        delay: float = 2.0
     ) -> AsyncGenerator[Dict, None]:
         """
-        다건의 특수 양식 문의 일괄 처리 (스트리밍)
+        다건의 특수 양식 문의 일괄 처리 (스트리밍, 파이프라인)
+
+        AI 답변 생성과 브라우저 제출을 겹쳐서 진행:
+        - AI 단계: 브라우저 단계보다 최대 prefetch건 앞서 답변을 동시에 생성
+        - 브라우저 단계: 로그인된 컨텍스트의 페이지 pages개가 준비된 답변을 순서대로 가져가 제출
+          (페이지마다 제출 후 delay초 대기)
 
         Args:
             inquiries: 특수 양식 문의 리스트
+            prefetch: 미리 생성해 둘 AI 답변 수
+            pages: 동시에 사용할 브라우저 페이지 수
+            delay: 페이지별 제출 간 대기 시간(초)
 
         Yields:
-            각 문의 처리 결과
+            status / stage(단계별 시작·완료) / progress / success / failed / error / complete
         """
         total = len(inquiries)
-        self.log(f"총 {total}개 특수 양식 문의 처리 시작")
+        prefetch = max(1, prefetch)
+        pages = max(1, min(pages, total or 1))
+        self.log(f"총 {total}개 특수 양식 문의 처리 시작 (AI 선생성 {prefetch}건, 페이지 {pages}개)")
 
         yield {
             "type": "status",
             "message": f"총 {total}개 특수 양식 문의 처리 시작",
-            "total": total
+            "total": total,
+            "prefetch": prefetch,
+            "pages": pages
         }
 
         self.update_status("processing", 0, total)
 
-        success_count = 0
-        failed_count = 0
+        events: asyncio.Queue = asyncio.Queue()
+        ready: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+        ai_slots = asyncio.Semaphore(prefetch)
+        counts = {"ai_ready": 0, "done": 0, "success": 0, "failed": 0}
 
-        for idx, inquiry in enumerate(inquiries):
-            try:
-                self.update_status("processing", idx + 1, total, inquiry_id=inquiry.inquiry_id)
-
-                yield {
+        async def generate(idx: int, inquiry: SpecialFormInquiry) -> Optional[str]:
+            async with ai_slots:
+                events.put_nowait({"type": "stage", "stage": "ai_response", "state": "started",
+                                   "index": idx, "inquiry_id": inquiry.inquiry_id})
+                try:
+                    answer = await self.generate_answer(inquiry)
+                except Exception as e:
+                    self.log(f"문의 {inquiry.inquiry_id} AI 답변 생성 오류: {e}", 'error')
+                    answer = None
+                counts["ai_ready"] += 1
+                events.put_nowait({"type": "stage", "stage": "ai_response",
+                                   "state": "completed" if answer else "failed",
+                                   "index": idx, "inquiry_id": inquiry.inquiry_id,
+                                   "ai_ready": counts["ai_ready"], "total": total})
+                return answer
+
+        async def produce():
+            # ready 큐 크기가 prefetch이므로 브라우저 단계보다 그 이상 앞서 나가지 않음
+            for idx, inquiry in enumerate(inquiries):
+                await ready.put((idx, inquiry, asyncio.ensure_future(generate(idx, inquiry))))
+            for _ in range(pages):
+                await ready.put(None)
+
+        async def submit(worker: int, page):
+            while True:
+                item = await ready.get()
+                if item is None:
+                    return
+                idx, inquiry, answer_task = item
+                result = {"inquiry_id": inquiry.inquiry_id, "status": "pending", "message": "", "steps": []}
+                try:
+                    answer = await answer_task
+                    if not answer:
+                        result["status"] = "failed"
+                        result["message"] = "AI 답변 생성 실패"
+                        result["steps"].append({"step": "ai_response", "status": "failed"})
+                    else:
+                        result["steps"].append({"step": "ai_response", "status": "success"})
+                        events.put_nowait({"type": "stage", "stage": "browser", "state": "started",
+                                           "index": idx, "inquiry_id": inquiry.inquiry_id, "page": worker})
+                        await self.submit_special_form(inquiry, answer, result, page=page)
+                        events.put_nowait({"type": "stage", "stage": "browser",
+                                           "state": "completed" if result["status"] == "submitted" else "failed",
+                                           "index": idx, "inquiry_id": inquiry.inquiry_id, "page": worker})
+                except Exception as e:
+                    self.log(f"문의 {inquiry.inquiry_id} 처리 중 예외: {e}", 'error')
+                    result["status"] = "error"
+                    result["message"] = str(e)
+
+                counts["done"] += 1
+                submitted = result["status"] == "submitted"
+                counts["success" if submitted else "failed"] += 1
+                self.update_status("processing", counts["done"], total, inquiry_id=inquiry.inquiry_id)
+                events.put_nowait({
                     "type": "progress",
-                    "current": idx + 1,
+                    "current": counts["done"],
                     "total": total,
-                    "inquiry_id": inquiry.inquiry_id
-                }
-
-                result = await self.process_special_inquiry(inquiry)
-
-                if result["status"] == "submitted":
-                    success_count += 1
-                    yield {"type": "success", "data": result}
+                    "inquiry_id": inquiry.inquiry_id,
+                    "ai_ready": counts["ai_ready"]
+                })
+                if result["status"] == "error":
+                    events.put_nowait({"type": "error", "index": idx, "inquiry_id": inquiry.inquiry_id,
+                                       "error": result["message"], "data": result})
                 else:
-                    failed_count += 1
-                    yield {"type": "failed", "data": result}
+                    events.put_nowait({"type": "success" if submitted else "failed", "index": idx, "data": result})
 
-                # 다음 문의 처리 전 대기 (너무 빠른 연속 요청 방지)
-                await asyncio.sleep(2)
+                # 같은 페이지의 다음 제출 전 대기 (너무 빠른 연속 요청 방지)
+                if result["steps"] and result["steps"][-1]["step"] != "ai_response":
+                    await asyncio.sleep(delay)
 
-            except Exception as e:
-                failed_count += 1
-                self.log(f"문의 {inquiry.inquiry_id} 처리 중 예외: {e}", 'error')
-                yield {
-                    "type": "error",
-                    "inquiry_id": inquiry.inquiry_id,
-                    "error": str(e)
-                }
+        browser_pages = [self.client.page]
+        try:
+            for _ in range(pages - 1):
+                browser_pages.append(await self.client.context.new_page())
+        except Exception as e:
+            self.log(f"추가 브라우저 페이지 생성 실패, {len(browser_pages)}개로 진행: {e}", 'warning')
+
+        tasks = [asyncio.ensure_future(produce())]
+        tasks += [asyncio.ensure_future(submit(i, page)) for i, page in enumerate(browser_pages)]
+        workers = asyncio.gather(*tasks)
+        try:
+            while not (workers.done() and events.empty()):
+                getter = asyncio.ensure_future(events.get())
+                await asyncio.wait({getter, workers}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            workers.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            while not ready.empty():
+                item = ready.get_nowait()
+                if item is not None:
+                    item[2].cancel()
+            for page in browser_pages[1:]:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
 
         self.update_status("completed", total, total)
 
         yield {
             "type": "complete",
-            "message": f"처리 완료: 성공 {success_count}개, 실패 {failed_count}개",
-            "success": success_count,
-            "failed": failed_count,
+            "message": f"처리 완료: 성공 {counts['success']}개, 실패 {counts['failed']}개",
+            "success": counts["success"],
+            "failed": counts["failed"],
             "total": total
         }
 
-        self.log(f"일괄 처리 완료: 성공 {success_count}개, 실패 {failed_count}개", 'success')
+        self.log(f"일괄 처리 완료: 성공 {counts['success']}개, 실패 {counts['failed']}개", 'success')
 
     async def close(self):
         """리소스 정리"""
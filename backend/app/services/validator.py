@@ -4,7 +4,8 @@ Multi-stage validation system for generated responses
 """
 import re
 import json
-from typing import Dict, List, Tuple, Optional
+import hashlib
+from typing import Dict, Iterable, List, Tuple, Optional, Union
 from sqlalchemy.orm import Session
 from loguru import logger
 
@@ -19,8 +20,14 @@ class ResponseValidator:
     2. Content validation
     3. Risk assessment
     4. Confidence scoring
+
+    Results are memoized per response by a fingerprint of the validation
+    inputs, so unchanged responses are not re-validated.
     """
 
+    # Bump whenever a check below changes so stored fingerprints are invalidated
+    RULESET_VERSION = "1"
+
     # Forbidden words/phrases
     FORBIDDEN_WORDS = [
         "100% 보장", "절대", "반드시", "무조건",
@@ -41,10 +48,33 @@ class ResponseValidator:
     def __init__(self, db: Session):
         self.db = db
 
+    def fingerprint(self, response: Response, inquiry: Inquiry) -> str:
+        """
+        Fingerprint of everything the checks read
+
+        Args:
+            response: Response object
+            inquiry: Related inquiry object
+
+        Returns:
+            SHA-256 hex digest
+        """
+        payload = json.dumps([
+            self.RULESET_VERSION,
+            settings.MAX_RESPONSE_LENGTH,
+            response.response_text,
+            inquiry.keywords,
+            inquiry.classified_category,
+            inquiry.risk_level,
+            inquiry.complexity_score
+        ], ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
     def validate_response(
         self,
         response: Response,
-        inquiry: Optional[Inquiry] = None
+        inquiry: Optional[Inquiry] = None,
+        force: bool = False
     ) -> Dict[str, any]:
         """
         Perform complete validation on a response
@@ -52,17 +82,80 @@ class ResponseValidator:
         Args:
             response: Response object to validate
             inquiry: Related inquiry object (optional, loaded if not provided)
+            force: Re-run the checks even if the fingerprint is unchanged
 
         Returns:
             Validation result dictionary
         """
-        logger.info(f"Validating response {response.id}")
-
         if not inquiry:
             inquiry = self.db.query(Inquiry).filter(
                 Inquiry.id == response.inquiry_id
             ).first()
 
+        fingerprint = self.fingerprint(response, inquiry)
+        if not force and response.validation_fingerprint == fingerprint:
+            logger.debug(f"Response {response.id} unchanged since last validation")
+            return self._stored_result(response)
+
+        logger.info(f"Validating response {response.id}")
+        result = self._evaluate(response, inquiry, fingerprint)
+        self.db.commit()
+
+        logger.info(f"Validation complete: {result}")
+        return result
+
+    def validate_many(
+        self,
+        responses: Iterable[Union[Response, int]],
+        force: bool = False
+    ) -> Dict[int, Dict]:
+        """
+        Validate many responses at once
+
+        Inquiries are loaded in one query, unchanged responses reuse their
+        stored result, and all changed rows are written in a single commit.
+
+        Args:
+            responses: Response objects or IDs
+            force: Re-run the checks even if fingerprints are unchanged
+
+        Returns:
+            Validation result per response ID
+        """
+        responses = list(responses)
+        ids = [r for r in responses if isinstance(r, int)]
+        if ids:
+            loaded = {r.id: r for r in self.db.query(Response).filter(Response.id.in_(ids)).all()}
+            responses = [loaded[r] if isinstance(r, int) else r for r in responses if not isinstance(r, int) or r in loaded]
+
+        inquiry_ids = {r.inquiry_id for r in responses}
+        inquiries = {
+            i.id: i for i in self.db.query(Inquiry).filter(Inquiry.id.in_(inquiry_ids)).all()
+        } if inquiry_ids else {}
+
+        results = {}
+        changed = 0
+        for response in responses:
+            inquiry = inquiries.get(response.inquiry_id)
+            if inquiry is None:
+                logger.warning(f"Response {response.id} has no inquiry; skipping validation")
+                continue
+
+            fingerprint = self.fingerprint(response, inquiry)
+            if not force and response.validation_fingerprint == fingerprint:
+                results[response.id] = self._stored_result(response)
+            else:
+                results[response.id] = self._evaluate(response, inquiry, fingerprint)
+                changed += 1
+
+        if changed:
+            self.db.commit()
+
+        logger.info(f"Validated {len(results)} responses ({changed} re-validated, {len(results) - changed} unchanged)")
+        return results
+
+    def _evaluate(self, response: Response, inquiry: Inquiry, fingerprint: str) -> Dict:
+        """Run all checks and store the outcome on the response (caller commits)"""
         # Stage 1: Format validation
         format_result = self._validate_format(response)
 
@@ -100,15 +193,14 @@ class ResponseValidator:
         response.content_check_passed = content_result["passed"]
         response.confidence_score = final_confidence
         response.risk_level = risk_result["level"]
+        response.validation_fingerprint = fingerprint
 
         if validation_passed:
             response.status = "pending_approval"
         else:
             response.status = "draft"
 
-        self.db.commit()
-
-        result = {
+        return {
             "passed": validation_passed,
             "confidence": final_confidence,
             "risk_level": risk_result["level"],
@@ -125,8 +217,26 @@ class ResponseValidator:
             )
         }
 
-        logger.info(f"Validation complete: {result}")
-        return result
+    def _stored_result(self, response: Response) -> Dict:
+        """Rebuild the validation result from the columns saved by the last run"""
+        issues = json.loads(response.validation_issues) if response.validation_issues else []
+        return {
+            "passed": bool(response.validation_passed),
+            "confidence": response.confidence_score,
+            "risk_level": response.risk_level,
+            "issues": issues,
+            "details": {
+                "format": {"passed": response.format_check_passed},
+                "content": {"passed": response.content_check_passed},
+                "risk": {"level": response.risk_level}
+            },
+            "requires_human": self._requires_human_approval(
+                bool(response.validation_passed),
+                response.confidence_score or 0,
+                response.risk_level
+            ),
+            "cached": True
+        }
 
     def _validate_format(self, response: Response) -> Dict:
         """
@@ -346,16 +346,17 @@ class WingPlaywrightClient:
             return os.path.join(WING_COOKIE_DIR, f'wing_cookies_{self.account_id}.json')
         return os.path.join(WING_COOKIE_DIR, 'wing_cookies_default.json')
 
-    async def _save_screenshot(self, name: str):
-        """스크린샷 저장 (디버깅용)"""
+    async def _save_screenshot(self, name: str, page=None):
+        """스크린샷 저장 (디버깅용, page를 주면 해당 페이지)"""
+        page = page or self.page
         try:
-            if self.page:
+            if page:
                 timestamp = datetime.now(KST).strftime("%Y%m%d_%H%M%S")
                 screenshot_dir = os.environ.get('SCREENSHOT_DIR', '/data/screenshots')
                 os.makedirs(screenshot_dir, exist_ok=True)
 
                 path = os.path.join(screenshot_dir, f'{name}_{timestamp}.png')
-                await self.page.screenshot(path=path)
+                await page.screenshot(path=path)
                 self.log(f"스크린샷 저장: {path}")
         except Exception as e:
             self.log(f"스크린샷 저장 실패: {e}", 'error')
@@ -17,8 +17,119 @@ from selenium.common.exceptions import (
 from loguru import logger
 import time
 from typing import List, Dict, Optional
-from openai import OpenAI
 from ..config import settings
+from .ai_stream import strip_markdown
+from .llm_gateway import get_llm_gateway
+
+
+# 미답변 문의 셀/상품명/문의내용 셀렉터 변형 (앞쪽이 기본, 페이지 버전별로 마지막 성공 변형을 우선 시도)
+INQUIRY_SELECTOR_VARIANTS = [
+    {
+        "cell": "td.replying-no-comments, td[class*='replying-no-comments']",
+        "product": "div.text-wrapper.product-name a span[title], div.product-name a span[title]",
+        "inquiry": "span.inquiry-content",
+    },
+    {
+        "cell": "td.replying-no-comments, td[class*='replying-no-comments']",
+        "product": "div.text-wrapper a span",
+        "inquiry": "span.inquiry-content",
+    },
+    {
+        "cell": "td.replying-no-comments, td[class*='replying-no-comments']",
+        "product": "div.text-wrapper a span",
+        "inquiry": "div > span",
+    },
+]
+
+# 현재 탭의 미답변 문의를 한 번의 execute_script로 추출
+# - 행(tr)과 답변 버튼에 내용 기반의 안정적인 식별자(data-cs-row-id / data-cs-answer)를 부여
+# - 페이지 버전은 Vue scoped 속성(data-v-xxxx)으로 판별
+_EXTRACT_INQUIRIES_JS = """
+const variants = arguments[0];
+const hash = (text) => {
+    let h = 5381;
+    for (let i = 0; i < text.length; i++) { h = ((h << 5) + h + text.charCodeAt(i)) >>> 0; }
+    return h.toString(16);
+};
+const cellSelectors = [...new Set(variants.map(v => v.cell))];
+const cells = [];
+cellSelectors.forEach(sel => document.querySelectorAll(sel).forEach(c => { if (!cells.includes(c)) cells.push(c); }));
+
+let pageVersion = 'unknown';
+if (cells.length) {
+    const scoped = Array.from(cells[0].attributes).find(a => a.name.startsWith('data-v-'));
+    if (scoped) pageVersion = scoped.name;
+}
+
+const variantHits = variants.map(() => 0);
+const seen = {};
+const items = [];
+cells.forEach(cell => {
+    for (let vi = 0; vi < variants.length; vi++) {
+        const v = variants[vi];
+        if (!cell.matches(v.cell)) continue;
+        const productEl = cell.querySelector(v.product);
+        const inquiryEl = cell.querySelector(v.inquiry);
+        const productName = productEl ? (productEl.getAttribute('title') || productEl.innerText || '').trim() : '';
+        const inquiry = inquiryEl ? (inquiryEl.innerText || '').trim() : '';
+        if (!productName || !inquiry) continue;
+
+        const row = cell.closest('tr');
+        if (!row) break;
+        const button = Array.from(row.querySelectorAll('button')).find(b =>
+            (b.innerText || '').includes('답변') || (b.className || '').includes('wing-web-component'));
+        if (!button) break;
+
+        const base = hash(productName + '\u0001' + inquiry);
+        seen[base] = (seen[base] || 0) + 1;
+        const rowId = seen[base] > 1 ? base + '-' + seen[base] : base;
+        row.setAttribute('data-cs-row-id', rowId);
+        button.setAttribute('data-cs-answer', rowId);
+
+        variantHits[vi] += 1;
+        items.push({row_id: rowId, product_name: productName, inquiry: inquiry, variant: vi});
+        break;
+    }
+});
+return {page_version: pageVersion, cell_count: cells.length, variant_hits: variantHits, items: items};
+"""
+
+# 문의 테이블 상태 서명 (로딩 중이면 null, 아니면 "행 수:행 내용 해시" 또는 "empty")
+# Vue가 tbody를 제자리에서 갱신해도 행 수나 내용이 바뀌면 서명이 달라짐
+_TABLE_SIGNATURE_JS = """
+if (document.readyState !== 'complete') return null;
+const loading = Array.from(document.querySelectorAll('.loading, [class*="spinner"], [class*="loading-"]'))
+    .some(el => el.offsetParent !== null);
+if (loading) return null;
+const rows = document.querySelectorAll('table tbody tr');
+if (!rows.length) return document.querySelector('[class*="empty"], [class*="no-data"]') ? 'empty' : null;
+let h = 5381;
+rows.forEach(row => {
+    const text = row.innerText || '';
+    for (let i = 0; i < text.length; i++) { h = ((h << 5) + h + text.charCodeAt(i)) >>> 0; }
+});
+return rows.length + ':' + h.toString(16);
+"""
+
+# 텍스트로 탭을 찾아 클릭
+_CLICK_TAB_JS = """
+const tabName = arguments[0];
+const groups = [
+    document.querySelectorAll('[data-v-7fedaa82]'),
+    document.querySelectorAll("[role='tab']"),
+    document.querySelectorAll('button, a'),
+];
+for (const group of groups) {
+    for (const tab of group) {
+        const text = (tab.innerText || '').trim();
+        if (!text || !(text.includes(tabName) || tabName.includes(text))) continue;
+        tab.scrollIntoView({block: 'center'});
+        tab.click();
+        return true;
+    }
+}
+return false;
+"""
 
 
 class WingWebAutomationV3:
@@ -35,6 +146,12 @@ class WingWebAutomationV3:
         "24시간 이내"
     ]
 
+    # 탭 전환 후 목록 서명이 그대로일 때 같은 내용으로 보고 진행하기까지의 시간(초)
+    TABLE_SETTLE_SECONDS = 1.0
+
+    # 페이지 버전(data-v-xxxx)별 마지막으로 성공한 셀렉터 변형 인덱스
+    _selector_cache: Dict[str, int] = {}
+
     def __init__(self, username: str, password: str, headless: bool = False, max_rounds: int = 100):
         """
         초기화
@@ -51,7 +168,8 @@ class WingWebAutomationV3:
         self.max_rounds = max_rounds
         self.driver = None
         self.wait = None
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+        self.llm_gateway = get_llm_gateway()
+        self._last_page_version: Optional[str] = None
 
         # 통계
         self.total_rounds = 0
@@ -171,13 +289,57 @@ class WingWebAutomationV3:
         try:
             logger.info("📋 고객문의 페이지로 이동...")
             self.driver.get("https://wing.coupang.com/tenants/cs/product/inquiries")
-            time.sleep(3)
+            self._wait_for_inquiry_table()
             logger.success("✅ 고객문의 페이지 이동 완료")
             return True
         except Exception as e:
             logger.error(f"❌ 페이지 이동 오류: {str(e)}")
             return False
 
+    def _table_signature(self) -> Optional[str]:
+        """현재 문의 테이블 상태 서명 (로딩 중이면 None)"""
+        return self.driver.execute_script(_TABLE_SIGNATURE_JS)
+
+    def _wait_for_inquiry_table(
+        self,
+        timeout: float = 10,
+        previous: Optional[str] = None,
+        settle: Optional[float] = None
+    ) -> bool:
+        """
+        문의 테이블 로딩 완료까지 대기 (고정 sleep 대신 조건 대기)
+
+        Args:
+            timeout: 최대 대기 시간(초)
+            previous: 탭 전환 전 테이블 서명 (지정하면 서명이 바뀔 때까지 대기하되,
+                같은 서명이 settle초 동안 유지되면 내용이 같은 목록으로 보고 완료)
+            settle: 서명이 바뀌지 않을 때 완료로 보는 유지 시간(초)
+
+        Returns:
+            bool: 시간 내 로딩 완료 여부
+        """
+        settle = self.TABLE_SETTLE_SECONDS if settle is None else settle
+        state = {"signature": None, "since": 0.0}
+
+        def ready(driver) -> bool:
+            signature = self._table_signature()
+            if signature is None:
+                state["signature"] = None
+                return False
+            now = time.monotonic()
+            if signature != state["signature"]:
+                state.update(signature=signature, since=now)
+            if previous is None or signature != previous:
+                return True
+            return now - state["since"] >= settle
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(ready)
+            return True
+        except TimeoutException:
+            logger.debug("    문의 테이블 로딩 대기 시간 초과, 현재 상태로 진행")
+            return False
+
     def click_tab(self, tab_name: str, retry: int = 3) -> bool:
         """
         특정 시간대 탭 클릭
@@ -193,166 +355,84 @@ class WingWebAutomationV3:
             try:
                 logger.info(f"  🔍 '{tab_name}' 탭 찾는 중... (시도 {attempt + 1}/{retry})")
 
-                # 다양한 방법으로 탭 찾기
-                tabs = []
-
-                # 방법 1: data-v-* 속성이 있는 버튼/링크
-                tabs = self.driver.find_elements(By.CSS_SELECTOR, "[data-v-7fedaa82]")
-
-                # 방법 2: role="tab" 속성
-                if not tabs:
-                    tabs = self.driver.find_elements(By.CSS_SELECTOR, "[role='tab']")
-
-                # 방법 3: 모든 버튼과 링크
-                if not tabs:
-                    tabs = self.driver.find_elements(By.TAG_NAME, "button")
-                    tabs += self.driver.find_elements(By.TAG_NAME, "a")
-
-                # 텍스트가 일치하는 탭 찾기
-                for tab in tabs:
-                    try:
-                        tab_text = tab.text.strip()
-                        if tab_name in tab_text or tab_text in tab_name:
-                            # 스크롤하여 보이게 하기
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", tab)
-                            time.sleep(0.5)
-
-                            # 클릭 시도
-                            try:
-                                tab.click()
-                            except ElementClickInterceptedException:
-                                # JavaScript로 클릭
-                                self.driver.execute_script("arguments[0].click();", tab)
-
-                            time.sleep(2)
-                            logger.success(f"  ✅ '{tab_name}' 탭 클릭 완료")
-                            return True
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception as e:
-                        logger.debug(f"    탭 클릭 시도 중 오류: {str(e)}")
-                        continue
+                previous = self._table_signature()
+                if self.driver.execute_script(_CLICK_TAB_JS, tab_name):
+                    self._wait_for_inquiry_table(previous=previous)
+                    logger.success(f"  ✅ '{tab_name}' 탭 클릭 완료")
+                    return True
 
                 logger.warning(f"  ⚠️  '{tab_name}' 탭을 찾을 수 없음")
-                time.sleep(1)
+                self._wait_for_inquiry_table(timeout=1)
 
             except Exception as e:
                 logger.error(f"  ❌ 탭 클릭 오류: {str(e)}")
-                time.sleep(1)
+                self._wait_for_inquiry_table(timeout=1)
 
         return False
 
+    def _ordered_selector_variants(self, page_version: Optional[str]) -> List[Dict]:
+        """캐시된 변형을 앞으로 정렬한 셀렉터 변형 목록 (원래 인덱스 포함)"""
+        variants = [dict(v, index=i) for i, v in enumerate(INQUIRY_SELECTOR_VARIANTS)]
+        preferred = self._selector_cache.get(page_version) if page_version else None
+        if preferred is not None:
+            variants.sort(key=lambda v: v["index"] != preferred)
+        return variants
+
+    def _extract_inquiries(self) -> Dict:
+        """
+        미답변 문의 일괄 추출 (execute_script 1회)
+
+        Returns:
+            Dict: {"page_version", "cell_count", "items": [{row_id, product_name, inquiry}]}
+        """
+        variants = self._ordered_selector_variants(self._last_page_version)
+        result = self.driver.execute_script(_EXTRACT_INQUIRIES_JS, variants) or {}
+
+        page_version = result.get("page_version") or "unknown"
+        self._last_page_version = page_version
+
+        hits = result.get("variant_hits") or []
+        if hits and max(hits) > 0:
+            best = variants[hits.index(max(hits))]["index"]
+            if self._selector_cache.get(page_version) != best:
+                logger.debug(f"    셀렉터 변형 캐시 갱신: {page_version} → {best}")
+            self._selector_cache[page_version] = best
+
+        return result
+
+    def _resolve_answer_button(self, row_id: str):
+        """행 식별자로 답변 버튼 조회 (목록이 다시 그려졌으면 재추출 후 조회)"""
+        selector = f"button[data-cs-answer='{row_id}']"
+        buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+        if not buttons:
+            self._extract_inquiries()
+            buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+        return buttons[0] if buttons else None
+
     def get_unanswered_inquiries_in_current_tab(self) -> List[Dict]:
         """
         현재 탭의 미답변 문의 수집
         사용자가 제공한 HTML 구조에 맞춰 구현
 
         Returns:
-            List[Dict]: 문의 정보 리스트
+            List[Dict]: 문의 정보 리스트 (row_id로 답변 버튼을 다시 찾음)
         """
-        inquiries = []
-
         try:
             logger.info("    📥 미답변 문의 수집 중...")
-            time.sleep(2)
-
-            # 사용자 제공 HTML 구조에 따라 미답변 문의 찾기
-            # <td data-v-7fedaa82="" class="middle-horizontal-padding small-vertical-padding vertical-align replying-no-comments">
+            self._wait_for_inquiry_table()
 
-            # 방법 1: replying-no-comments 클래스로 찾기 (미답변 문의)
-            unanswered_cells = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "td.replying-no-comments, td[class*='replying-no-comments']"
-            )
-
-            logger.info(f"    📊 총 {len(unanswered_cells)}개 미답변 셀 발견")
+            # <td data-v-7fedaa82="" class="... replying-no-comments"> 셀을 한 번에 추출
+            result = self._extract_inquiries()
+            logger.info(f"    📊 총 {result.get('cell_count', 0)}개 미답변 셀 발견")
 
-            for idx, cell in enumerate(unanswered_cells):
-                try:
-                    # 1. 상품명 찾기
-                    # <div class="text-wrapper product-name"><a><span title="상품명">상품명</span></a></div>
-                    product_name = None
-                    try:
-                        product_elem = cell.find_element(
-                            By.CSS_SELECTOR,
-                            "div.text-wrapper.product-name a span[title], div.product-name a span[title]"
-                        )
-                        product_name = product_elem.get_attribute("title") or product_elem.text
-                    except:
-                        try:
-                            product_elem = cell.find_element(By.CSS_SELECTOR, "div.text-wrapper a span")
-                            product_name = product_elem.get_attribute("title") or product_elem.text
-                        except:
-                            logger.debug(f"      셀 {idx}: 상품명 없음, 건너뛰기")
-                            continue
-
-                    if not product_name or not product_name.strip():
-                        logger.debug(f"      셀 {idx}: 상품명이 비어있음")
-                        continue
-
-                    # 2. 문의 내용 찾기
-                    # <div><span class="inquiry-content">고객 문의 내용</span></div>
-                    inquiry_text = None
-                    try:
-                        inquiry_elem = cell.find_element(By.CSS_SELECTOR, "span.inquiry-content")
-                        inquiry_text = inquiry_elem.text.strip()
-                    except:
-                        try:
-                            # 대안: div 안의 span
-                            inquiry_elem = cell.find_element(By.CSS_SELECTOR, "div > span")
-                            inquiry_text = inquiry_elem.text.strip()
-                        except:
-                            logger.debug(f"      셀 {idx}: 문의내용 없음")
-                            continue
-
-                    if not inquiry_text or not inquiry_text.strip():
-                        logger.debug(f"      셀 {idx}: 문의내용이 비어있음")
-                        continue
-
-                    # 3. 답변하기 버튼 찾기
-                    # <button data-v-7fedaa82="" type="button" class="wing-web-component">답변하기</button>
-                    answer_button = None
-
-                    # 부모 row 찾기 (td의 부모 tr)
-                    try:
-                        row = cell.find_element(By.XPATH, "./ancestor::tr[1]")
-
-                        # row에서 답변하기 버튼 찾기
-                        buttons = row.find_elements(By.TAG_NAME, "button")
-                        for btn in buttons:
-                            btn_text = btn.text.strip()
-                            btn_class = btn.get_attribute("class") or ""
-
-                            if "답변하기" in btn_text or "답변" in btn_text:
-                                answer_button = btn
-                                break
-                            elif "wing-web-component" in btn_class:
-                                answer_button = btn
-                                break
-                    except:
-                        logger.debug(f"      셀 {idx}: 답변하기 버튼 없음")
-                        continue
-
-                    if not answer_button:
-                        logger.debug(f"      셀 {idx}: 답변하기 버튼을 찾을 수 없음")
-                        continue
-
-                    # 유효한 문의 추가
-                    inquiries.append({
-                        "product_name": product_name.strip(),
-                        "inquiry": inquiry_text.strip(),
-                        "answer_button": answer_button,
-                        "cell": cell
-                    })
-
-                    logger.info(f"      ✅ 문의 {len(inquiries)}: {product_name[:30]}...")
-
-                except StaleElementReferenceException:
-                    logger.debug(f"      셀 {idx}: Stale element, 건너뛰기")
-                    continue
-                except Exception as e:
-                    logger.debug(f"      셀 {idx}: 오류 - {str(e)}")
-                    continue
+            inquiries = []
+            for item in result.get("items", []):
+                inquiries.append({
+                    "row_id": item["row_id"],
+                    "product_name": item["product_name"],
+                    "inquiry": item["inquiry"]
+                })
+                logger.info(f"      ✅ 문의 {len(inquiries)}: {item['product_name'][:30]}...")
 
             logger.success(f"    ✅ 총 {len(inquiries)}개 미답변 문의 수집 완료")
             return inquiries
@@ -375,7 +455,7 @@ class WingWebAutomationV3:
         try:
             logger.info("      🤖 ChatGPT 답변 생성 중...")
 
-            if not self.openai_client:
+            if not self.llm_gateway:
                 logger.warning("      ⚠️  OpenAI API 키 없음, 기본 답변 사용")
                 return f"안녕하세요. '{product_name}' 관련 문의 주셔서 감사합니다. 빠른 시일 내에 확인 후 답변 드리겠습니다. 감사합니다."
 
@@ -398,7 +478,7 @@ class WingWebAutomationV3:
 답변:
 """
 
-            response = self.openai_client.chat.completions.create(
+            response = self.llm_gateway.complete_sync(
                 model=settings.OPENAI_MODEL,
                 messages=[
                     {
@@ -411,10 +491,8 @@ class WingWebAutomationV3:
                 temperature=0.7
             )
 
-            answer = response.choices[0].message.content.strip()
-
             # 마크다운 제거
-            answer = answer.replace('**', '').replace('__', '').replace('*', '').replace('_', '')
+            answer = strip_markdown(response.choices[0].message.content)
 
             logger.success(f"      ✅ ChatGPT 답변 생성 완료 ({len(answer)}자)")
             return answer
@@ -437,10 +515,15 @@ class WingWebAutomationV3:
         try:
             product_name = inquiry_data["product_name"]
             inquiry_text = inquiry_data["inquiry"]
-            answer_button = inquiry_data["answer_button"]
+            answer_button = inquiry_data.get("answer_button") or self._resolve_answer_button(inquiry_data["row_id"])
 
             logger.info(f"    💬 답변 작성: {product_name[:40]}...")
 
+            if answer_button is None:
+                logger.error("      ❌ 답변하기 버튼을 찾을 수 없음 (목록 변경됨)")
+                self.failed_count += 1
+                return False
+
             # 1. 답변하기 버튼 클릭
             logger.info("      🖱️  답변하기 버튼 클릭...")
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", answer_button)
@@ -0,0 +1,4 @@
+"""
+Load benchmarks against a local Coupang API stand-in server
+로컬 쿠팡 API 대역 서버 기반 부하 벤치마크
+"""
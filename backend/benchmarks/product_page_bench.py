@@ -0,0 +1,116 @@
+"""
+Product Page Extraction Benchmark
+상품 페이지 상품명/이미지 추출 벤치마크
+
+저장해 둔 상품 페이지(fixtures/product_pages)로 두 방식을 비교:
+- legacy: 전체 응답을 받아 html.parser로 트리 생성 후 og 메타 태그 검색 (기존 라우터 방식)
+- streaming: ProductPageExtractor (head까지만 읽고 스캔, 필요할 때만 본문을 lxml로 파싱)
+실제 상품 페이지 크기를 흉내 내기 위해 <!-- BODY-REPEAT-START/END --> 구간을 --repeat배로 늘리고,
+응답은 --chunk-kb 단위로 나눠 스트리밍
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.product_page_bench --repeat 200 --iterations 50
+"""
+import argparse
+import asyncio
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+from bs4 import BeautifulSoup
+
+from app.services.product_page_extractor import ProductPageExtractor
+
+from .stand_in_server import percentile
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "product_pages"
+FIXTURE_HOSTS = {
+    "coupang.html": "www.coupang.com",
+    "11st.html": "www.11st.co.kr",
+    "gmarket_no_og.html": "item.gmarket.co.kr",
+}
+_REPEAT_BLOCK = re.compile(rb"<!-- BODY-REPEAT-START -->(.*?)<!-- BODY-REPEAT-END -->", re.DOTALL)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="상품 페이지 추출 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="본문 반복 구간 배수 (페이지 크기)")
+    parser.add_argument("--iterations", type=int, default=30, help="페이지별 반복 횟수")
+    parser.add_argument("--chunk-kb", type=int, default=16, help="스트리밍 청크 크기(KB)")
+    return parser.parse_args(argv)
+
+
+def load_page(name: str, repeat: int) -> bytes:
+    raw = (FIXTURE_DIR / name).read_bytes()
+    return _REPEAT_BLOCK.sub(lambda m: m.group(1) * repeat, raw)
+
+
+def legacy_extract(body: bytes) -> Dict:
+    """기존 방식: 전체 디코드 + html.parser 트리"""
+    soup = BeautifulSoup(body.decode("utf-8", errors="replace"), "html.parser")
+    title = soup.find("meta", property="og:title")
+    image = soup.find("meta", property="og:image")
+    return {
+        "name": title.get("content") if title else None,
+        "image": image.get("content") if image else None,
+    }
+
+
+def make_transport(pages: Dict[str, bytes], chunk_size: int) -> httpx.MockTransport:
+    async def stream(body: bytes):
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = pages[request.url.host]
+        content_type = "text/html" if b"euc-kr" in body[:300] else "text/html; charset=utf-8"
+        return httpx.Response(200, headers={"Content-Type": content_type}, content=stream(body))
+
+    return httpx.MockTransport(handler)
+
+
+async def streaming_run(pages: Dict[str, bytes], host: str, iterations: int, chunk_size: int) -> Dict:
+    extractor = ProductPageExtractor(cache_ttl=0, transport=make_transport(pages, chunk_size))
+    samples = []
+    result = None
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        result = await extractor.extract(f"https://{host}/products/1")
+        samples.append((time.perf_counter() - t0) * 1000)
+    await extractor.aclose()
+    return {
+        "samples": samples,
+        "bytes": extractor.stats["bytes"] // iterations,
+        "head_only": extractor.stats["head_only"] == iterations,
+        "result": result,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    pages = {host: load_page(name, args.repeat) for name, host in FIXTURE_HOSTS.items()}
+
+    for name, host in FIXTURE_HOSTS.items():
+        body = pages[host]
+
+        legacy = []
+        for _ in range(args.iterations):
+            t0 = time.perf_counter()
+            legacy_extract(body)
+            legacy.append((time.perf_counter() - t0) * 1000)
+
+        streamed = asyncio.run(streaming_run(pages, host, args.iterations, args.chunk_kb * 1024))
+        print(
+            f"{name:<20} size {len(body) // 1024:>6}KB | "
+            f"legacy p50 {percentile(legacy, 50):>8.2f}ms p95 {percentile(legacy, 95):>8.2f}ms | "
+            f"streaming p50 {percentile(streamed['samples'], 50):>8.2f}ms p95 {percentile(streamed['samples'], 95):>8.2f}ms "
+            f"read {streamed['bytes'] // 1024:>6}KB head_only={streamed['head_only']} | "
+            f"{streamed['result'].product_name}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+"""
+Rate Limiter Microbenchmark
+요청 제한기 요청당 오버헤드 마이크로벤치마크
+
+RateLimiter.is_allowed 호출 비용을 저장소별로 측정:
+- memory: 프로세스 내 dict
+- sqlite: 임시 파일 (같은 머신 워커 공유 구성)
+클라이언트 수를 늘려도 클라이언트당 상태가 윈도우 수(3)만큼의 실수로 고정되는지 함께 보고
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.rate_limit_bench --requests 100000 --clients 1000
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from app.middleware.rate_limit import DEFAULT_ROUTE_POLICIES, RateLimiter
+from app.middleware.rate_limit_store import InMemoryRateLimitStore, SQLiteRateLimitStore
+
+from .stand_in_server import percentile
+
+PATHS = ["/api/inquiries/list", "/api/automation/stats", "/api/responses/submit-bulk"]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="요청 제한기 마이크로벤치마크")
+    parser.add_argument("--stores", nargs="+", choices=["memory", "sqlite"], default=["memory", "sqlite"])
+    parser.add_argument("--requests", type=int, default=50000, help="store별 is_allowed 호출 수")
+    parser.add_argument("--clients", type=int, default=1000, help="서로 다른 클라이언트 수")
+    return parser.parse_args(argv)
+
+
+def run_store(name: str, store, requests: int, clients: int) -> Dict:
+    limiter = RateLimiter(route_policies=DEFAULT_ROUTE_POLICIES, store=store)
+    samples = []
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    for i in range(requests):
+        t0 = time.perf_counter()
+        limiter.is_allowed(f"ip:10.0.{i % clients // 256}.{i % 256}", PATHS[i % len(PATHS)])
+        samples.append((time.perf_counter() - t0) * 1_000_000)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "store": name,
+        "requests": requests,
+        "clients": clients,
+        "ops_per_sec": round(requests / elapsed),
+        "mean_us": round(sum(samples) / len(samples), 2),
+        "p95_us": round(percentile(samples, 95), 2),
+        "p99_us": round(percentile(samples, 99), 2),
+        "peak_kb": round(peak / 1024, 1),
+        "keys": len(store) if isinstance(store, InMemoryRateLimitStore) else None
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.stores:
+            if name == "memory":
+                store = InMemoryRateLimitStore()
+            else:
+                store = SQLiteRateLimitStore(os.path.join(tmp, "rate_limits.db"))
+            result = run_store(name, store, args.requests, args.clients)
+            print(
+                f"{result['store']:<8} {result['ops_per_sec']:>9} ops/s  "
+                f"mean {result['mean_us']:>8}us  p95 {result['p95_us']:>8}us  p99 {result['p99_us']:>8}us  "
+                f"peak {result['peak_kb']:>8}KB  keys {result['keys']}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
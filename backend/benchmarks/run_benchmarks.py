@@ -0,0 +1,277 @@
+"""
+End-to-end Load Benchmarks
+로컬 대역 서버를 상대로 실제 서비스 코드를 실행하는 부하 벤치마크
+
+측정 대상:
+- auto_mode: AutoModeService.run_full_cycle (문의 수집 → AI 답변 → 제출)
+- coupon_bulk_cold / coupon_bulk_warm: CouponAutoSyncService.apply_coupons_to_all_products
+  (cold: 빈 카탈로그 미러, warm: 미러가 채워진 두 번째 실행)
+- returns: AutoReturnCollector.collect_returns
+- invoices: CoupangShipmentService.get_pending_orders + upload_invoices_batch
+
+시나리오별로 items/sec, 대역 서버 기준 p95 지연, 요청 수, DB 쓰기 문장 수를 보고하고
+--baseline 결과 대비 --max-regression 이상 나빠지면 종료 코드 1을 반환 (회귀 게이트)
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.run_benchmarks --products 1000 --latency-ms 20 --json results.json
+    python -m benchmarks.run_benchmarks --baseline results.json --max-regression 0.2
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .stand_in_server import CoupangStandInServer
+
+SCENARIOS = ["auto_mode", "coupon_bulk_cold", "coupon_bulk_warm", "returns", "invoices"]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="쿠팡 API 대역 서버 기반 부하 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--products", type=int, default=500, help="등록상품 수")
+    parser.add_argument("--items-per-product", type=int, default=2, help="상품당 옵션 수")
+    parser.add_argument("--inquiries", type=int, default=20, help="유형별 미답변 문의 수")
+    parser.add_argument("--returns", type=int, default=50, help="cancelType별 반품 요청 수")
+    parser.add_argument("--orders", type=int, default=100, help="발주서 수")
+    parser.add_argument("--latency-ms", type=float, default=10, help="대역 서버 응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=5, help="응답 지연 편차")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--failure-ratio", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--max-regression", type=float, default=0.2,
+        help="허용 회귀 비율 (items/sec 감소, p95/DB 쓰기 증가 기준, 기본 0.2 = 20%%)"
+    )
+    return parser.parse_args(argv)
+
+
+def configure_environment(server: CoupangStandInServer, db_path: str):
+    """app 임포트 전에 설정 주입 (settings는 임포트 시점에 환경변수를 읽음)"""
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["COUPANG_API_BASE_URL"] = server.base_url
+    os.environ["OPENAI_API_KEY"] = "stand-in"
+    os.environ["OPENAI_BASE_URL"] = f"{server.base_url}/v1"
+    os.environ["DEBUG"] = "false"
+
+
+class WriteCounter:
+    """엔진 레벨 INSERT/UPDATE/DELETE 문장 수 집계"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip()[:6].upper() in ("INSERT", "UPDATE", "DELETE"):
+            self.count += 1
+
+
+def run_scenario(
+    name: str,
+    func: Callable[[], Dict[str, int]],
+    server: CoupangStandInServer,
+    writes: WriteCounter
+) -> Dict[str, Any]:
+    """시나리오 1개 실행 후 측정값 반환"""
+    server.reset_stats()
+    writes_before = writes.count
+    started = time.perf_counter()
+    error = None
+    outcome = {"items": 0, "errors": 0}
+
+    try:
+        outcome = func()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    elapsed = time.perf_counter() - started
+    stats = server.stats()
+    return {
+        "scenario": name,
+        "items": outcome["items"],
+        "errors": outcome["errors"] + (1 if error else 0),
+        "error": error,
+        "seconds": round(elapsed, 3),
+        "items_per_sec": round(outcome["items"] / elapsed, 2) if elapsed > 0 else 0.0,
+        "p95_ms": stats["p95_ms"],
+        "requests": stats["requests"],
+        "status_counts": stats["status_counts"],
+        "db_writes": writes.count - writes_before,
+        "routes": stats["routes"]
+    }
+
+
+def build_scenarios(server: CoupangStandInServer) -> Dict[str, Callable[[], Dict[str, int]]]:
+    """실제 서비스 객체로 시나리오 함수 구성 (configure_environment 이후 호출)"""
+    from app.database import SessionLocal, init_db
+    from app.models import CoupangAccount, CouponAutoSyncConfig
+    from app.models.auto_return_config import AutoReturnConfig
+    from app.services.auto_mode_service import AutoModeService
+    from app.services.auto_return_collector import AutoReturnCollector
+    from app.services.coupang_shipment_service import CoupangShipmentService
+    from app.services.coupon_auto_sync_service import CouponAutoSyncService
+
+    # 서비스 모듈 임포트로 모든 모델이 등록된 뒤에 테이블 생성
+    init_db()
+    db = SessionLocal()
+    account = CoupangAccount(
+        name="benchmark",
+        vendor_id=server.vendor_id,
+        wing_username="benchmark",
+        is_active=True
+    )
+    account.access_key = server.access_key
+    account.secret_key = server.secret_key
+    db.add(account)
+    db.commit()
+
+    db.add(CouponAutoSyncConfig(
+        coupang_account_id=account.id,
+        is_enabled=True,
+        instant_coupon_enabled=True,
+        instant_coupon_id=1,
+        instant_coupon_auto_create=False
+    ))
+    db.commit()
+
+    def auto_mode():
+        result = AutoModeService().run_full_cycle(account, auto_submit=True)
+        return {"items": result["collected"], "errors": result["failed"] + len(result["errors"])}
+
+    def coupon_bulk():
+        result = CouponAutoSyncService(db).apply_coupons_to_all_products(account.id, skip_applied=False)
+        if not result.get("success"):
+            raise RuntimeError(result.get("message"))
+        results = result["results"]
+        return {"items": results["total_items"], "errors": results["instant_failed"] + len(results["errors"])}
+
+    def returns():
+        config = AutoReturnConfig(enabled=True, fetch_enabled=True, fetch_lookback_hours=1)
+        db.add(config)
+        db.commit()
+        result = AutoReturnCollector(db).collect_returns(config=config, triggered_by="benchmark")
+        return {"items": result.get("total_fetched", 0), "errors": 0 if result.get("success") else 1}
+
+    def invoices():
+        CoupangShipmentService._completed_invoices.clear()
+        service = CoupangShipmentService(db, server.access_key, server.secret_key, server.vendor_id)
+        orders = service.get_pending_orders(hours_back=24)
+        batch = [
+            {
+                "shipment_box_id": str(order["shipmentBoxId"]),
+                "order_id": str(order["orderId"]),
+                "vendor_item_id": str(order["orderItems"][0]["vendorItemId"]),
+                "courier_code": "EPOST",
+                "tracking_number": f"6{order['shipmentBoxId']:011d}"
+            }
+            for order in orders
+        ]
+        result = service.upload_invoices_batch(batch)
+        return {"items": len(batch), "errors": result.get("failed", 0)}
+
+    return {
+        "auto_mode": auto_mode,
+        "coupon_bulk_cold": coupon_bulk,
+        "coupon_bulk_warm": coupon_bulk,
+        "returns": returns,
+        "invoices": invoices
+    }
+
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], max_regression: float) -> List[str]:
+    """기준 결과 대비 회귀 항목 목록"""
+    previous = {r["scenario"]: r for r in baseline}
+    regressions = []
+
+    for result in results:
+        base = previous.get(result["scenario"])
+        if not base:
+            continue
+        name = result["scenario"]
+
+        if base["items_per_sec"] and result["items_per_sec"] < base["items_per_sec"] * (1 - max_regression):
+            regressions.append(f"{name}: items/sec {base['items_per_sec']} -> {result['items_per_sec']}")
+        if base["p95_ms"] and result["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms -> {result['p95_ms']}ms")
+        if result["db_writes"] > base["db_writes"] * (1 + max_regression):
+            regressions.append(f"{name}: DB writes {base['db_writes']} -> {result['db_writes']}")
+        if result["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {result['errors']}")
+
+    return regressions
+
+
+def print_report(results: List[Dict[str, Any]]):
+    header = f"{'scenario':<18}{'items':>8}{'sec':>9}{'items/s':>10}{'p95 ms':>9}{'reqs':>7}{'writes':>8}{'errors':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['scenario']:<18}{r['items']:>8}{r['seconds']:>9.2f}{r['items_per_sec']:>10.1f}"
+            f"{r['p95_ms']:>9.1f}{r['requests']:>7}{r['db_writes']:>8}{r['errors']:>8}"
+        )
+        if r["error"]:
+            print(f"    ! {r['error']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    server = CoupangStandInServer(
+        products=args.products,
+        items_per_product=args.items_per_product,
+        online_inquiries=args.inquiries,
+        callcenter_inquiries=args.inquiries,
+        returns=args.returns,
+        orders=args.orders,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit_ratio,
+        failure_ratio=args.failure_ratio,
+        seed=args.seed
+    )
+
+    with server, tempfile.TemporaryDirectory(prefix="cs-bench-") as tmp_dir:
+        configure_environment(server, os.path.join(tmp_dir, "benchmark.db"))
+
+        from loguru import logger
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+        from app.database import engine
+
+        scenarios = build_scenarios(server)
+        writes = WriteCounter(engine)
+        results = [run_scenario(name, scenarios[name], server, writes) for name in args.scenarios]
+        engine.dispose()
+
+    print_report(results)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_to_baseline(results, baseline, args.max_regression)
+        if regressions:
+            print("\n성능 회귀 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"\n기준 대비 회귀 없음 (허용 {args.max_regression:.0%})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
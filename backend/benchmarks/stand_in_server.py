@@ -0,0 +1,566 @@
+"""
+Coupang Open API Stand-in Server
+로컬 쿠팡 API 대역 서버 (부하 벤치마크/통합 테스트용)
+
+실제 서비스 코드가 사용하는 쿠팡 엔드포인트만 구현:
+- HMAC 서명 검증 (CEA algorithm=HmacSHA256, signed-date 허용 오차 5분)
+- 상품 목록 nextToken 페이지네이션, 문의 pageNum 페이지네이션
+- 응답 지연(latency + jitter), 429 / 5xx 주입 (seed로 재현 가능)
+- OpenAI 호환 /v1/chat/completions (OPENAI_BASE_URL로 연결, stream=True면 SSE 청크)
+
+사용 예:
+    with CoupangStandInServer(products=500, latency_ms=20) as server:
+        settings.COUPANG_API_BASE_URL = server.base_url
+"""
+import hashlib
+import hmac
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote
+
+SIGNED_DATE_FORMAT = "%y%m%dT%H%M%SZ"
+SIGNED_DATE_TOLERANCE = timedelta(minutes=5)
+DEFAULT_COMPLETION_TEXT = "안녕하세요, 고객님. 문의 주셔서 감사합니다. 확인 후 빠르게 처리해 드리겠습니다."
+
+_AUTH_PATTERN = re.compile(
+    r"CEA algorithm=HmacSHA256, access-key=(?P<access_key>[^,]+), "
+    r"signed-date=(?P<signed_date>[^,]+), signature=(?P<signature>[0-9a-f]+)"
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수 (빈 리스트면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+class CoupangStandInServer:
+    """쿠팡 Open API 대역 서버 (ThreadingHTTPServer, 임의 포트)"""
+
+    def __init__(
+        self,
+        access_key: str = "stand-in-access",
+        secret_key: str = "stand-in-secret",
+        vendor_id: str = "A00000001",
+        products: int = 200,
+        items_per_product: int = 2,
+        online_inquiries: int = 20,
+        callcenter_inquiries: int = 20,
+        returns: int = 50,
+        orders: int = 50,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        rate_limit_ratio: float = 0.0,
+        failure_ratio: float = 0.0,
+        coupon_polls_until_done: int = 1,
+        completion_text: str = DEFAULT_COMPLETION_TEXT,
+        seed: int = 0
+    ):
+        """
+        Args:
+            products: 등록상품 수 (상품당 옵션 items_per_product개)
+            online_inquiries / callcenter_inquiries: 미답변 문의 수
+            returns: 반품/취소 요청 수 (cancelType별)
+            orders: 상품준비중 발주서 수
+            latency_ms / jitter_ms: 응답 지연 (기본값 + 0~jitter 균등분포)
+            rate_limit_ratio: 429 응답 비율 (0~1)
+            failure_ratio: 500 응답 비율 (0~1)
+            coupon_polls_until_done: 즉시할인 요청이 DONE이 되기까지 필요한 상태 조회 횟수
+            completion_text: /v1/chat/completions 답변 (stream=True면 공백 단위 청크로 전송)
+            seed: 지연/오류 주입 난수 시드
+        """
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.vendor_id = vendor_id
+        self.products = products
+        self.items_per_product = items_per_product
+        self.online_inquiries = online_inquiries
+        self.callcenter_inquiries = callcenter_inquiries
+        self.returns = returns
+        self.orders = orders
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_ratio = rate_limit_ratio
+        self.failure_ratio = failure_ratio
+        self.coupon_polls_until_done = coupon_polls_until_done
+        self.completion_text = completion_text
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # 상태
+        self._coupon_requests: Dict[str, Dict[str, Any]] = {}
+        self._next_requested_id = 1
+        self._uploaded_invoices: Dict[str, str] = {}
+        self._answered: set = set()
+
+        # 통계 (route -> [지연 ms]), 상태코드별 건수
+        self._latencies: Dict[str, List[float]] = {}
+        self._status_counts: Dict[int, int] = {}
+
+        vid = re.escape(vendor_id)
+        self._routes: List[Tuple[str, "re.Pattern", str, Callable]] = [
+            ("GET", re.compile(rf"^/v2/providers/openapi/apis/api/v5/vendors/{vid}/onlineInquiries$"),
+             "online_inquiries", self._online_inquiries),
+            ("POST", re.compile(rf"^/v2/providers/openapi/apis/api/v4/vendors/{vid}/onlineInquiries/(\d+)/replies$"),
+             "online_reply", self._online_reply),
+            ("GET", re.compile(rf"^/v2/providers/openapi/apis/api/v5/vendors/{vid}/callCenterInquiries$"),
+             "callcenter_inquiries", self._callcenter_inquiries),
+            ("POST", re.compile(rf"^/v2/providers/openapi/apis/api/v4/vendors/{vid}/callCenterInquiries/(\w+)/replies$"),
+             "callcenter_reply", self._callcenter_reply),
+            ("POST", re.compile(rf"^/v2/providers/openapi/apis/api/v4/vendors/{vid}/callCenterInquiries/(\w+)/confirms$"),
+             "callcenter_confirm", self._ok),
+            ("GET", re.compile(rf"^/v2/providers/openapi/apis/api/v6/vendors/{vid}/returnRequests$"),
+             "return_requests", self._return_requests),
+            ("GET", re.compile(rf"^/v2/providers/openapi/apis/api/v5/vendors/{vid}/ordersheets$"),
+             "ordersheets", self._ordersheets),
+            ("POST", re.compile(rf"^/v2/providers/openapi/apis/api/v4/vendors/{vid}/orders/invoices$"),
+             "invoices", self._invoices),
+            ("GET", re.compile(r"^/v2/providers/seller_api/apis/api/v1/marketplace/seller-products$"),
+             "seller_products", self._seller_products),
+            ("GET", re.compile(r"^/v2/providers/seller_api/apis/api/v1/marketplace/seller-products/(\d+)$"),
+             "seller_product_detail", self._seller_product_detail),
+            ("POST", re.compile(rf"^/v2/providers/fms/apis/api/v1/vendors/{vid}/coupons/(\d+)/items$"),
+             "instant_coupon_items", self._instant_coupon_items),
+            ("GET", re.compile(rf"^/v2/providers/fms/apis/api/v1/vendors/{vid}/requested/(\w+)$"),
+             "instant_coupon_status", self._instant_coupon_status),
+            ("PUT", re.compile(r"^/v2/providers/marketplace_openapi/apis/api/v1/coupon-items$"),
+             "download_coupon_items", self._download_coupon_items),
+        ]
+
+    # ==================== 수명 주기 ====================
+
+    def start(self) -> str:
+        """서버 시작 (127.0.0.1 임의 포트) 후 base URL 반환"""
+        stand_in = self
+
+        class Handler(_StandInHandler):
+            server_app = stand_in
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "CoupangStandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ==================== 통계 ====================
+
+    def reset_stats(self):
+        with self._lock:
+            self._latencies.clear()
+            self._status_counts.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """route별 요청 수 / p95 지연, 상태코드별 건수"""
+        with self._lock:
+            routes = {
+                route: {
+                    "requests": len(values),
+                    "p95_ms": round(percentile(values, 95), 2)
+                }
+                for route, values in self._latencies.items()
+            }
+            all_values = [v for values in self._latencies.values() for v in values]
+            return {
+                "requests": len(all_values),
+                "p95_ms": round(percentile(all_values, 95), 2),
+                "status_counts": dict(self._status_counts),
+                "routes": routes
+            }
+
+    def _record(self, route: str, status: int, elapsed_ms: float):
+        with self._lock:
+            self._latencies.setdefault(route, []).append(elapsed_ms)
+            self._status_counts[status] = self._status_counts.get(status, 0) + 1
+
+    # ==================== 요청 처리 ====================
+
+    def handle(self, method: str, raw_path: str, headers, body: bytes) -> Tuple[int, Any]:
+        """요청 1건 처리 (핸들러 스레드에서 호출)"""
+        started = time.perf_counter()
+        route_name, status, payload = self._route(method, raw_path, headers, body)
+        self._record(route_name, status, (time.perf_counter() - started) * 1000)
+        return status, payload
+
+    def _route(self, method: str, raw_path: str, headers, body: bytes) -> Tuple[str, int, Any]:
+        path, _, query = raw_path.partition("?")
+
+        if path == "/v1/chat/completions" and method == "POST":
+            status, payload = self._inject() or self._chat_completion(body)
+            return "openai_chat", status, payload
+
+        for route_method, pattern, name, handler in self._routes:
+            match = pattern.match(path)
+            if match and route_method == method:
+                break
+        else:
+            return "unmatched", 404, {"code": 404, "message": f"No stand-in route for {method} {path}"}
+
+        auth_error = self._verify_signature(method, path, query, headers.get("Authorization", ""))
+        if auth_error:
+            return name, 401, {"code": 401, "message": auth_error}
+
+        injected = self._inject()
+        if injected:
+            return (name,) + injected
+
+        params = {k: v[-1] for k, v in parse_qs(query, keep_blank_values=True).items()}
+        data = json.loads(body) if body else {}
+        status, payload = handler(match, params, data)
+        return name, status, payload
+
+    def _verify_signature(self, method: str, path: str, query: str, authorization: str) -> Optional[str]:
+        """CEA HMAC 서명 검증 (오류 메시지 또는 None)"""
+        match = _AUTH_PATTERN.match(authorization)
+        if not match:
+            return "Invalid Authorization header"
+        if match.group("access_key") != self.access_key:
+            return "Unknown access key"
+
+        try:
+            signed_at = datetime.strptime(match.group("signed_date"), SIGNED_DATE_FORMAT)
+        except ValueError:
+            return "Invalid signed-date"
+        if abs(datetime.utcnow() - signed_at) > SIGNED_DATE_TOLERANCE:
+            return "signed-date is out of the allowed window"
+
+        # 클라이언트는 서명 후 requests가 재인코딩할 수 있으므로 디코딩된 형태도 허용
+        for candidate in {query, unquote(query)}:
+            message = match.group("signed_date") + method + path + candidate
+            expected = hmac.new(self.secret_key.encode("utf-8"), message.encode("utf-8"), hashlib.sha256).hexdigest()
+            if hmac.compare_digest(expected, match.group("signature")):
+                return None
+        return "Signature mismatch"
+
+    def _inject(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """지연 적용 후 429 / 500 주입 여부 결정"""
+        with self._lock:
+            delay_ms = self.latency_ms + (self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+            roll = self._random.random()
+        if delay_ms:
+            time.sleep(delay_ms / 1000.0)
+        if roll < self.rate_limit_ratio:
+            return 429, {"code": 429, "message": "Too Many Requests"}
+        if roll < self.rate_limit_ratio + self.failure_ratio:
+            return 500, {"code": 500, "message": "Injected failure"}
+        return None
+
+    @staticmethod
+    def _ok(match, params, data) -> Tuple[int, Dict[str, Any]]:
+        return 200, {"code": 200, "message": "OK", "data": None}
+
+    # ==================== 문의 ====================
+
+    @staticmethod
+    def _page(items: List[Any], params: Dict[str, str]) -> Tuple[List[Any], Dict[str, int]]:
+        page_num = int(params.get("pageNum") or 1)
+        page_size = int(params.get("pageSize") or 50)
+        start = (page_num - 1) * page_size
+        total_pages = max((len(items) + page_size - 1) // page_size, 1)
+        return items[start:start + page_size], {
+            "currentPage": page_num,
+            "totalPages": total_pages,
+            "totalElements": len(items),
+            "countPerPage": page_size
+        }
+
+    def _online_inquiries(self, match, params, data):
+        inquiries = [
+            {
+                "inquiryId": 500000 + i,
+                "productId": 1000 + i % max(self.products, 1),
+                "productTitle": f"벤치마크 상품 {i % max(self.products, 1)}",
+                "content": f"배송은 언제 되나요? (문의 {i})",
+                "customerName": f"고객{i}",
+                "inquiryAt": "2024-05-01 10:00:00",
+                "commentDtoList": []
+            }
+            for i in range(self.online_inquiries)
+            if 500000 + i not in self._answered
+        ]
+        content, pagination = self._page(inquiries, params)
+        return 200, {"code": 200, "message": "OK", "data": {"content": content, "pagination": pagination}}
+
+    def _online_reply(self, match, params, data):
+        with self._lock:
+            self._answered.add(int(match.group(1)))
+        return 200, {"code": 200, "message": "OK", "data": None}
+
+    def _callcenter_inquiries(self, match, params, data):
+        wanted = params.get("partnerCounselingStatus")
+        inquiries = [
+            {
+                "inquiryId": str(700000 + i),
+                "content": f"반품 접수 확인 부탁드립니다 (문의 {i})",
+                "buyerName": f"구매자{i}",
+                "csPartnerCounselingStatus": "requestAnswer",
+                "replies": [{
+                    "answerId": 900000 + i,
+                    "partnerTransferStatus": "requestAnswer",
+                    "needAnswer": True,
+                    "content": "판매자 확인이 필요합니다."
+                }]
+            }
+            for i in range(self.callcenter_inquiries)
+            if str(700000 + i) not in self._answered
+        ] if wanted in (None, "NO_ANSWER", "NONE") else []
+        content, pagination = self._page(inquiries, params)
+        return 200, {"code": 200, "message": "OK", "data": {"content": content, "pagination": pagination}}
+
+    def _callcenter_reply(self, match, params, data):
+        with self._lock:
+            self._answered.add(match.group(1))
+        return 200, {"code": 200, "message": "OK", "data": None}
+
+    # ==================== 반품 / 발주서 ====================
+
+    def _return_requests(self, match, params, data):
+        cancel_type = params.get("cancelType", "RETURN")
+        offset = 0 if cancel_type == "RETURN" else self.returns
+        created_at = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        requests_ = []
+        for i in range(offset, offset + self.returns):
+            seller_product_id = 1000 + i % max(self.products, 1)
+            requests_.append({
+                "receiptId": 300000 + i,
+                "orderId": 400000 + i,
+                "paymentId": 410000 + i,
+                "receiptType": cancel_type,
+                "receiptStatus": "RETURNS_UNCHECKED",
+                "createdAt": created_at,
+                "modifiedAt": created_at,
+                "requesterName": f"반품고객{i}",
+                "requesterPhoneNumber": "010-0000-0000",
+                "requesterAddress": "서울특별시 중구 세종대로 110",
+                "requesterAddressDetail": f"{i}호",
+                "requesterZipCode": "04524",
+                "cancelReasonCategory1": "고객변심",
+                "cancelReasonCategory2": "단순변심",
+                "cancelCountSum": 1,
+                "returnItems": [{
+                    "vendorItemId": seller_product_id * 10,
+                    "vendorItemName": f"벤치마크 상품 {i % max(self.products, 1)} 옵션0",
+                    "cancelCount": 1,
+                    "purchaseCount": 1,
+                    "shipmentBoxId": 600000 + i
+                }]
+            })
+        return 200, {"code": 200, "message": "OK", "data": requests_}
+
+    def _ordersheets(self, match, params, data):
+        ordered_at = datetime.now().strftime("%Y-%m-%dT%H:%M:%S") + "+09:00"
+        orders = [
+            {
+                "shipmentBoxId": 600000 + i,
+                "orderId": 400000 + i,
+                "orderedAt": ordered_at,
+                "status": params.get("status", "INSTRUCT"),
+                "receiver": {"name": f"수령인{i}", "safeNumber": "0502-0000-0000", "addr1": "서울특별시", "addr2": f"{i}호"},
+                "orderItems": [{
+                    "vendorItemId": (1000 + i % max(self.products, 1)) * 10,
+                    "vendorItemName": f"벤치마크 상품 {i % max(self.products, 1)} 옵션0",
+                    "shippingCount": 1,
+                    "orderPrice": {"units": 10000}
+                }]
+            }
+            for i in range(self.orders)
+        ]
+        return 200, {"code": 200, "message": "OK", "data": orders}
+
+    def _invoices(self, match, params, data):
+        response_list = []
+        for dto in data.get("orderSheetInvoiceApplyDtos", []):
+            box_id = str(dto.get("shipmentBoxId"))
+            with self._lock:
+                previous = self._uploaded_invoices.get(box_id)
+                if previous is None:
+                    self._uploaded_invoices[box_id] = dto.get("invoiceNumber")
+            response_list.append({
+                "shipmentBoxId": dto.get("shipmentBoxId"),
+                "succeed": previous is None,
+                "resultCode": "OK" if previous is None else "ALREADY_UPLOADED",
+                "resultMessage": "" if previous is None else "이미 등록된 송장입니다."
+            })
+        return 200, {"code": 200, "message": "OK", "data": {"responseCode": 0, "responseList": response_list}}
+
+    # ==================== 상품 ====================
+
+    def _product(self, index: int) -> Dict[str, Any]:
+        created = datetime(2024, 1, 1) + timedelta(days=index % 30, minutes=index)
+        return {
+            "sellerProductId": 1000 + index,
+            "sellerProductName": f"벤치마크 상품 {index}",
+            "createdAt": created.strftime("%Y-%m-%dT%H:%M:%S"),
+            "statusName": "승인완료"
+        }
+
+    def _seller_products(self, match, params, data):
+        per_page = min(int(params.get("maxPerPage") or 100), 100)
+        created_at = params.get("createdAt")
+        if created_at:
+            indexes = [i for i in range(self.products) if self._product(i)["createdAt"].startswith(created_at)]
+        else:
+            indexes = list(range(self.products))
+
+        # nextToken은 다음 페이지 첫 항목의 1-based 위치
+        start = int(params.get("nextToken") or 1) - 1
+        page = indexes[start:start + per_page]
+        next_token = str(start + per_page + 1) if start + per_page < len(indexes) else ""
+        return 200, {
+            "code": "SUCCESS",
+            "message": "",
+            "nextToken": next_token,
+            "data": [self._product(i) for i in page]
+        }
+
+    def _seller_product_detail(self, match, params, data):
+        seller_product_id = int(match.group(1))
+        index = seller_product_id - 1000
+        if not 0 <= index < self.products:
+            return 404, {"code": "ERROR", "message": "상품을 찾을 수 없습니다."}
+        product = self._product(index)
+        product["items"] = [
+            {"vendorItemId": seller_product_id * 10 + n, "itemName": f"옵션{n}"}
+            for n in range(self.items_per_product)
+        ]
+        return 200, {"code": "SUCCESS", "message": "", "data": product}
+
+    # ==================== 쿠폰 ====================
+
+    def _instant_coupon_items(self, match, params, data):
+        with self._lock:
+            requested_id = str(self._next_requested_id)
+            self._next_requested_id += 1
+            self._coupon_requests[requested_id] = {"items": len(data.get("vendorItems", [])), "polls": 0}
+        return 200, {"code": 200, "message": "OK", "data": {"success": True, "content": {"requestedId": requested_id}}}
+
+    def _instant_coupon_status(self, match, params, data):
+        requested_id = match.group(1)
+        with self._lock:
+            request = self._coupon_requests.get(requested_id)
+            if request is None:
+                return 404, {"code": 404, "message": "요청을 찾을 수 없습니다."}
+            request["polls"] += 1
+            done = request["polls"] >= self.coupon_polls_until_done
+        content = {"requestedId": requested_id, "status": "DONE" if done else "REQUESTED"}
+        return 200, {"code": 200, "message": "OK", "data": {"success": True, "content": content}}
+
+    def _download_coupon_items(self, match, params, data):
+        return 200, [{"requestResultStatus": "SUCCESS", "body": {"couponId": data.get("couponId")}, "errorCode": None}]
+
+    # ==================== OpenAI ====================
+
+    def _chat_completion(self, body: bytes) -> Tuple[int, Any]:
+        request = json.loads(body or b"{}")
+        model = request.get("model", "stand-in")
+        usage = {"prompt_tokens": 120, "completion_tokens": 40, "total_tokens": 160}
+        if request.get("stream"):
+            include_usage = (request.get("stream_options") or {}).get("include_usage")
+            return 200, SSEStream(self._completion_chunks(model, usage if include_usage else None))
+
+        return 200, {
+            "id": "chatcmpl-stand-in",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": self.completion_text},
+                "finish_reason": "stop"
+            }],
+            "usage": usage
+        }
+
+    def _completion_chunks(self, model: str, usage: Optional[Dict[str, int]]) -> List[Dict[str, Any]]:
+        """stream=True 응답 청크 (공백 단위로 나눈 답변 + 종료 청크 + 사용량 청크)"""
+        base = {"id": "chatcmpl-stand-in", "object": "chat.completion.chunk", "created": int(time.time()), "model": model}
+        pieces = re.findall(r"\S+\s*|\s+", self.completion_text)
+        chunks = [{**base, "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}]}]
+        chunks += [
+            {**base, "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+            for piece in pieces
+        ]
+        chunks.append({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        if usage:
+            chunks.append({**base, "choices": [], "usage": usage})
+        return chunks
+
+
+class SSEStream:
+    """text/event-stream 응답 본문 (청크마다 data 프레임, 마지막에 [DONE])"""
+
+    def __init__(self, chunks: List[Dict[str, Any]]):
+        self.chunks = chunks
+
+    def frames(self):
+        for chunk in self.chunks:
+            yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8")
+        yield b"data: [DONE]\n\n"
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """HTTP 핸들러 (CoupangStandInServer.handle 위임)"""
+
+    server_app: CoupangStandInServer = None
+    protocol_version = "HTTP/1.1"
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, payload = self.server_app.handle(self.command, self.path, self.headers, body)
+
+        if isinstance(payload, SSEStream):
+            # 길이를 모르는 스트림이므로 연결 종료로 본문 끝을 알림
+            self.send_response(status)
+            self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for frame in payload.frames():
+                self.wfile.write(frame)
+                self.wfile.flush()
+            self.close_connection = True
+            return
+
+        encoded = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PUT = _dispatch
+
+    def log_message(self, format, *args):
+        pass
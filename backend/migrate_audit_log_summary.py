@@ -0,0 +1,73 @@
+"""
+감사 로그 시간 단위 요약 테이블 마이그레이션
+보안 대시보드/이상 탐지가 audit_logs 원본을 매번 GROUP BY 하지 않도록
+audit_log_summary 테이블을 만들고 기존 로그로 채움
+"""
+import sqlite3
+import os
+from datetime import datetime
+
+DATABASE_PATH = "database/coupang_cs.db"
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print(f"[{datetime.now()}] 마이그레이션 시작: audit_log_summary 테이블 생성")
+
+    if not os.path.exists(DATABASE_PATH):
+        print(f"[ERROR] 데이터베이스 파일이 없습니다: {DATABASE_PATH}")
+        return
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='audit_log_summary'")
+        if cursor.fetchone():
+            print("[SKIP] 테이블 이미 존재: audit_log_summary")
+            return
+
+        cursor.execute("""
+            CREATE TABLE audit_log_summary (
+                id INTEGER PRIMARY KEY,
+                bucket_start DATETIME NOT NULL,
+                user_id INTEGER,
+                ip_address VARCHAR(50),
+                action VARCHAR(100) NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_summary_id ON audit_log_summary(id)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_summary_bucket_action ON audit_log_summary(bucket_start, action)"
+        )
+        print("[OK] 테이블 생성: audit_log_summary")
+
+        # 기존 감사 로그를 시간 단위로 집계해 채움
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='audit_logs'")
+        if cursor.fetchone():
+            cursor.execute("""
+                INSERT INTO audit_log_summary (bucket_start, user_id, ip_address, action, count)
+                SELECT strftime('%Y-%m-%d %H:00:00.000000', timestamp), user_id, ip_address, action, COUNT(*)
+                FROM audit_logs
+                WHERE timestamp IS NOT NULL
+                GROUP BY strftime('%Y-%m-%d %H:00:00.000000', timestamp), user_id, ip_address, action
+            """)
+            print(f"[OK] 기존 로그 집계: {cursor.rowcount}개 버킷")
+        else:
+            print("[WARN] audit_logs 테이블이 없어 집계를 건너뜁니다")
+
+        conn.commit()
+        print(f"\n[SUCCESS] 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"[ERROR] 마이그레이션 실패: {str(e)}")
+        conn.rollback()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,54 @@
+"""
+자동 반품 병렬 처리 설정 마이그레이션
+auto_return_configs 테이블에 process_workers 컬럼 추가
+"""
+import sqlite3
+import os
+from datetime import datetime
+
+DATABASE_PATH = "database/coupang_cs.db"
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print(f"[{datetime.now()}] 마이그레이션 시작: AutoReturnConfig 테이블에 process_workers 추가")
+
+    if not os.path.exists(DATABASE_PATH):
+        print(f"[ERROR] 데이터베이스 파일이 없습니다: {DATABASE_PATH}")
+        return
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(auto_return_configs)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+
+        if "process_workers" in existing_columns:
+            print("[SKIP] 컬럼 이미 존재: process_workers")
+        else:
+            cursor.execute(
+                "ALTER TABLE auto_return_configs ADD COLUMN process_workers INTEGER NOT NULL DEFAULT 1"
+            )
+            print("[OK] 컬럼 추가: process_workers (INTEGER, 기본값 1)")
+
+        # 워커 선점 상태 조회용 인덱스
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_return_logs_status_updated_at ON return_logs(status, updated_at)"
+        )
+        print("[OK] 인덱스 생성: idx_return_logs_status_updated_at")
+
+        conn.commit()
+        print("\n[SUCCESS] 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"[ERROR] 마이그레이션 실패: {str(e)}")
+        conn.rollback()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
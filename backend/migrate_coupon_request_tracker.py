@@ -0,0 +1,91 @@
+"""
+쿠폰 비동기 요청 추적 마이그레이션
+- coupon_request_statuses 테이블 생성
+- bulk_apply_progress 테이블에 instant_pending / instant_unknown 컬럼 추가
+"""
+import sqlite3
+import os
+from datetime import datetime
+
+DATABASE_PATH = "database/coupang_cs.db"
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print(f"[{datetime.now()}] 마이그레이션 시작: 쿠폰 요청 상태 추적")
+
+    if not os.path.exists(DATABASE_PATH):
+        print(f"[ERROR] 데이터베이스 파일이 없습니다: {DATABASE_PATH}")
+        return
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS coupon_request_statuses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                coupang_account_id INTEGER NOT NULL,
+                coupon_type VARCHAR(50) NOT NULL DEFAULT 'instant',
+                request_id VARCHAR(100) NOT NULL,
+                coupon_id INTEGER,
+                vendor_item_ids JSON,
+                item_count INTEGER DEFAULT 0,
+                bulk_progress_id INTEGER,
+                tracking_id INTEGER,
+                apply_log_id INTEGER,
+                status VARCHAR(20) DEFAULT 'REQUESTED',
+                success_count INTEGER DEFAULT 0,
+                failed_count INTEGER DEFAULT 0,
+                failed_vendor_items JSON,
+                error_message TEXT,
+                poll_count INTEGER DEFAULT 0,
+                next_poll_at DATETIME,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                resolved_at DATETIME,
+                FOREIGN KEY (coupang_account_id) REFERENCES coupang_accounts(id),
+                FOREIGN KEY (bulk_progress_id) REFERENCES bulk_apply_progress(id),
+                FOREIGN KEY (tracking_id) REFERENCES product_coupon_trackings(id),
+                FOREIGN KEY (apply_log_id) REFERENCES coupon_apply_logs(id)
+            )
+        """)
+        print("[OK] 테이블 생성: coupon_request_statuses")
+
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_coupon_request_statuses_coupang_account_id "
+            "ON coupon_request_statuses(coupang_account_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_coupon_request_statuses_request_id "
+            "ON coupon_request_statuses(request_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_coupon_request_status_next_poll "
+            "ON coupon_request_statuses(status, next_poll_at)"
+        )
+        print("[OK] 인덱스 생성: coupon_request_statuses")
+
+        cursor.execute("PRAGMA table_info(bulk_apply_progress)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+
+        for column in ("instant_pending", "instant_unknown"):
+            if column in existing_columns:
+                print(f"[SKIP] 컬럼 이미 존재: {column}")
+            else:
+                cursor.execute(f"ALTER TABLE bulk_apply_progress ADD COLUMN {column} INTEGER DEFAULT 0")
+                print(f"[OK] 컬럼 추가: {column} (INTEGER, 기본값 0)")
+
+        conn.commit()
+        print("\n[SUCCESS] 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"[ERROR] 마이그레이션 실패: {str(e)}")
+        conn.rollback()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
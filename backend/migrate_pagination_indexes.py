@@ -0,0 +1,59 @@
+"""
+키셋 페이지네이션 인덱스 마이그레이션
+- 목록 조회의 (created_at, id) 정렬/커서 탐색용 복합 인덱스 생성
+  (return_logs, product_coupon_trackings, coupon_apply_logs, issue_responses)
+"""
+import sqlite3
+import os
+from datetime import datetime
+
+DATABASE_PATH = "database/coupang_cs.db"
+
+INDEXES = [
+    ("return_logs", "idx_return_logs_created_id", "created_at, id"),
+    ("return_logs", "idx_return_logs_status_created_id", "status, created_at, id"),
+    ("product_coupon_trackings", "idx_coupon_tracking_account_created_id", "coupang_account_id, created_at, id"),
+    ("coupon_apply_logs", "idx_coupon_apply_log_account_created_id", "coupang_account_id, created_at, id"),
+    ("issue_responses", "idx_issue_responses_created_id", "created_at, id"),
+]
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print(f"[{datetime.now()}] 마이그레이션 시작: 키셋 페이지네이션 인덱스")
+
+    if not os.path.exists(DATABASE_PATH):
+        print(f"[ERROR] 데이터베이스 파일이 없습니다: {DATABASE_PATH}")
+        return
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        for table, index_name, columns in INDEXES:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,)
+            )
+            if not cursor.fetchone():
+                print(f"[SKIP] 테이블 없음: {table}")
+                continue
+
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({columns})")
+            print(f"[OK] 인덱스 생성: {index_name} ({table})")
+
+        # naverpay_deliveries는 기존 idx_collected_at (SQLite 인덱스는 rowid=id 포함)으로 충분
+        cursor.execute("ANALYZE")
+        conn.commit()
+        print("\n[SUCCESS] 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"[ERROR] 마이그레이션 실패: {str(e)}")
+        conn.rollback()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
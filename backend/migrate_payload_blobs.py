@@ -0,0 +1,140 @@
+"""
+원본 페이로드 압축 보관 마이그레이션
+return_logs.raw_data 등 큰 JSON 컬럼을 payload_blobs 테이블(압축, 내용 주소 기반 중복 제거)로 옮기고
+원래 행에는 digest만 남김 (목록/통계 쿼리가 읽는 행 크기 축소)
+
+다시 실행하면 남은 JSON만 옮기고, 어느 행도 참조하지 않는 blob을 정리함
+"""
+import sys
+import os
+import json
+import sqlite3
+from datetime import datetime
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.models.payload_blob import CODEC, compress_payload, encode_payload
+
+DATABASE_PATH = "database/coupang_cs.db"
+BATCH_SIZE = 500
+
+# (테이블, 기존 JSON 컬럼, digest 컬럼)
+PAYLOAD_COLUMNS = [
+    ("return_logs", "raw_data", "raw_data_ref"),
+    ("auto_return_execution_logs", "details", "details_ref"),
+    ("auto_return_execution_logs", "config_snapshot", "config_snapshot_ref"),
+    ("issue_responses", "ai_analysis", "ai_analysis_ref"),
+    ("naver_delivery_info", "upload_result", "upload_result_ref"),
+]
+
+
+def table_columns(cursor, table):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+
+def move_payloads(cursor, table, column, ref_column):
+    """JSON 컬럼 값을 압축 blob으로 옮기고 digest 기록 (옮긴 행 수, 새 blob 수)"""
+    moved = created = 0
+    while True:
+        cursor.execute(
+            f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL LIMIT ?",
+            (BATCH_SIZE,)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return moved, created
+
+        for row_id, value in rows:
+            payload = json.loads(value) if isinstance(value, (str, bytes)) else value
+            if payload is None:  # JSON null로 저장된 값
+                cursor.execute(f"UPDATE {table} SET {column} = NULL WHERE id = ?", (row_id,))
+                continue
+            digest, raw = encode_payload(payload)
+            codec, data = compress_payload(raw)
+            cursor.execute(
+                "INSERT OR IGNORE INTO payload_blobs (digest, codec, raw_size, data, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, codec, len(raw), data, datetime.utcnow().isoformat(" "))
+            )
+            created += cursor.rowcount
+            cursor.execute(
+                f"UPDATE {table} SET {ref_column} = ?, {column} = NULL WHERE id = ?",
+                (digest, row_id)
+            )
+            moved += 1
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print(f"[{datetime.now()}] 마이그레이션 시작: payload_blobs 압축 보관")
+
+    if not os.path.exists(DATABASE_PATH):
+        print(f"[ERROR] 데이터베이스 파일이 없습니다: {DATABASE_PATH}")
+        return
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS payload_blobs (
+                digest VARCHAR(64) NOT NULL PRIMARY KEY,
+                codec VARCHAR(10) NOT NULL,
+                raw_size INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                created_at DATETIME
+            )
+        """)
+        print(f"[OK] 테이블 확인: payload_blobs (codec={CODEC})")
+
+        references = []
+        for table, column, ref_column in PAYLOAD_COLUMNS:
+            columns = table_columns(cursor, table)
+            if not columns:
+                print(f"[SKIP] 테이블 없음: {table}")
+                continue
+
+            if ref_column not in columns:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {ref_column} VARCHAR(64)")
+                print(f"[OK] 컬럼 추가: {table}.{ref_column}")
+            references.append((table, ref_column))
+
+            if column in columns:
+                moved, created = move_payloads(cursor, table, column, ref_column)
+                conn.commit()
+                print(f"[OK] {table}.{column}: {moved}개 행 이동, 새 blob {created}개")
+            else:
+                print(f"[SKIP] 기존 컬럼 없음: {table}.{column}")
+
+        # 어느 행도 참조하지 않는 blob 정리 (값이 바뀌어 더 이상 쓰지 않는 페이로드)
+        if references:
+            referenced = " UNION ".join(
+                f"SELECT {ref_column} FROM {table} WHERE {ref_column} IS NOT NULL"
+                for table, ref_column in references
+            )
+            cursor.execute(f"DELETE FROM payload_blobs WHERE digest NOT IN ({referenced})")
+            print(f"[OK] 참조 없는 blob 정리: {cursor.rowcount}개")
+
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM payload_blobs")
+        count, raw_size, stored_size = cursor.fetchone()
+        print(f"[OK] payload_blobs: {count}개, 원본 {raw_size:,}B → 압축 {stored_size:,}B")
+
+        conn.commit()
+
+        # 비운 JSON 컬럼이 차지하던 페이지 반환
+        cursor.execute("VACUUM")
+        print(f"\n[SUCCESS] 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"[ERROR] 마이그레이션 실패: {str(e)}")
+        conn.rollback()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
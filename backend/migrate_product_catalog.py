@@ -0,0 +1,98 @@
+"""
+상품 카탈로그 미러 마이그레이션
+catalog_products / catalog_vendor_items / catalog_sync_states 테이블 생성
+"""
+import sqlite3
+import os
+from datetime import datetime
+
+DATABASE_PATH = "database/coupang_cs.db"
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print(f"[{datetime.now()}] 마이그레이션 시작: 상품 카탈로그 미러")
+
+    if not os.path.exists(DATABASE_PATH):
+        print(f"[ERROR] 데이터베이스 파일이 없습니다: {DATABASE_PATH}")
+        return
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS catalog_products (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                coupang_account_id INTEGER NOT NULL,
+                seller_product_id BIGINT NOT NULL,
+                seller_product_name VARCHAR(500),
+                status_name VARCHAR(50),
+                product_created_at VARCHAR(30),
+                last_seen_token VARCHAR(50),
+                last_seen_at DATETIME,
+                detail_synced_at DATETIME,
+                vendor_item_count INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (coupang_account_id) REFERENCES coupang_accounts(id),
+                CONSTRAINT uq_catalog_product_account_seller UNIQUE (coupang_account_id, seller_product_id)
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_catalog_product_account_created "
+            "ON catalog_products(coupang_account_id, product_created_at)"
+        )
+        print("[OK] 테이블 생성: catalog_products")
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS catalog_vendor_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                coupang_account_id INTEGER NOT NULL,
+                seller_product_id BIGINT NOT NULL,
+                vendor_item_id BIGINT NOT NULL,
+                item_name VARCHAR(500),
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (coupang_account_id) REFERENCES coupang_accounts(id),
+                CONSTRAINT uq_catalog_vendor_item_account_item UNIQUE (coupang_account_id, vendor_item_id)
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_catalog_vendor_item_account_product "
+            "ON catalog_vendor_items(coupang_account_id, seller_product_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_catalog_vendor_items_vendor_item_id "
+            "ON catalog_vendor_items(vendor_item_id)"
+        )
+        print("[OK] 테이블 생성: catalog_vendor_items")
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS catalog_sync_states (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                coupang_account_id INTEGER NOT NULL,
+                scope VARCHAR(50) NOT NULL,
+                last_token VARCHAR(50),
+                product_count INTEGER DEFAULT 0,
+                started_at DATETIME,
+                completed_at DATETIME,
+                FOREIGN KEY (coupang_account_id) REFERENCES coupang_accounts(id),
+                CONSTRAINT uq_catalog_sync_state_account_scope UNIQUE (coupang_account_id, scope)
+            )
+        """)
+        print("[OK] 테이블 생성: catalog_sync_states")
+
+        conn.commit()
+        print("\n[SUCCESS] 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"[ERROR] 마이그레이션 실패: {str(e)}")
+        conn.rollback()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,74 @@
+"""
+스케줄러 작업 리스/실행 이력 마이그레이션
+- scheduler_job_locks 테이블 생성 (인스턴스 간 작업 중복 실행 방지)
+- scheduler_job_runs 테이블 생성 (작업별 실행 이력)
+"""
+import sqlite3
+import os
+from datetime import datetime
+
+DATABASE_PATH = "database/coupang_cs.db"
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print(f"[{datetime.now()}] 마이그레이션 시작: 스케줄러 작업 리스/실행 이력")
+
+    if not os.path.exists(DATABASE_PATH):
+        print(f"[ERROR] 데이터베이스 파일이 없습니다: {DATABASE_PATH}")
+        return
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scheduler_job_locks (
+                job_id VARCHAR(100) PRIMARY KEY,
+                owner VARCHAR(200),
+                token VARCHAR(50),
+                acquired_at DATETIME,
+                heartbeat_at DATETIME,
+                expires_at DATETIME
+            )
+        """)
+        print("[OK] 테이블 생성: scheduler_job_locks")
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scheduler_job_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id VARCHAR(100) NOT NULL,
+                owner VARCHAR(200),
+                status VARCHAR(20) NOT NULL,
+                items_processed INTEGER DEFAULT 0,
+                error_message TEXT,
+                started_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                finished_at DATETIME,
+                duration_seconds FLOAT
+            )
+        """)
+        print("[OK] 테이블 생성: scheduler_job_runs")
+
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_scheduler_job_runs_id ON scheduler_job_runs(id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scheduler_job_run_job_started "
+            "ON scheduler_job_runs(job_id, started_at)"
+        )
+        print("[OK] 인덱스 생성: scheduler_job_runs")
+
+        conn.commit()
+        print("\n[SUCCESS] 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"[ERROR] 마이그레이션 실패: {str(e)}")
+        conn.rollback()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,46 @@
+"""
+응답 검증 지문 컬럼 추가 마이그레이션
+검증 입력(응답 문구, 문의 분류/위험도, 규칙 버전)이 바뀌지 않은 응답의 재검증을 건너뛰기 위한 컬럼
+"""
+import sqlite3
+import os
+from datetime import datetime
+
+DATABASE_PATH = "database/coupang_cs.db"
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print(f"[{datetime.now()}] 마이그레이션 시작: responses 테이블에 validation_fingerprint 추가")
+
+    if not os.path.exists(DATABASE_PATH):
+        print(f"[ERROR] 데이터베이스 파일이 없습니다: {DATABASE_PATH}")
+        return
+
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(responses)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+
+        if "validation_fingerprint" not in existing_columns:
+            cursor.execute("ALTER TABLE responses ADD COLUMN validation_fingerprint VARCHAR(64)")
+            print("[OK] 컬럼 추가: validation_fingerprint (VARCHAR(64))")
+        else:
+            print("[SKIP] 컬럼 이미 존재: validation_fingerprint")
+
+        conn.commit()
+        print(f"\n[SUCCESS] 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"[ERROR] 마이그레이션 실패: {str(e)}")
+        conn.rollback()
+        raise
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
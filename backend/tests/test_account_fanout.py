@@ -0,0 +1,123 @@
+"""
+Account Fan-out Executor Tests
+계정별 병렬 실행기 테스트
+"""
+import threading
+import time
+
+import pytest
+
+from app.services import account_fanout
+from app.services.account_fanout import run_per_account, running_accounts, summarize
+
+
+class FakeSession:
+    """세션 수명만 기록하는 가짜 세션"""
+
+    opened = 0
+    closed = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        with FakeSession.lock:
+            FakeSession.opened += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        with FakeSession.lock:
+            FakeSession.closed += 1
+
+
+@pytest.fixture(autouse=True)
+def reset_sessions():
+    FakeSession.opened = FakeSession.closed = 0
+
+
+@pytest.mark.unit
+def test_slow_account_does_not_delay_others():
+    """Test that accounts run concurrently with their own sessions and keep input order"""
+    def work(db, account_id):
+        time.sleep(0.3 if account_id == 1 else 0.05)
+        return account_id * 10
+
+    started = time.monotonic()
+    results = run_per_account([1, 2, 3, 4], work, max_workers=4, session_factory=FakeSession)
+    elapsed = time.monotonic() - started
+
+    assert [r["result"] for r in results] == [10, 20, 30, 40]
+    assert elapsed < 0.3 + 0.05 * 3
+    assert FakeSession.opened == FakeSession.closed == 4
+
+
+@pytest.mark.unit
+def test_timeout_and_failure_are_isolated():
+    """Test per-account timeout and error capture without failing the whole run"""
+    release = threading.Event()
+
+    def work(db, account_id):
+        if account_id == 1:
+            release.wait(2)
+        if account_id == 2:
+            raise RuntimeError("인증 실패")
+        return "ok"
+
+    try:
+        results = run_per_account([1, 2, 3], work, timeout=0.2, max_workers=3, session_factory=FakeSession)
+    finally:
+        release.set()
+
+    assert results[0]["timed_out"] is True
+    assert results[1] == {**results[1], "success": False, "error": "인증 실패", "timed_out": False}
+    assert results[2]["result"] == "ok"
+
+    summary = summarize(results)
+    assert summary["succeeded"] == 1
+    assert summary["failed"] == 1
+    assert summary["timed_out"] == 1
+    assert summary["failed_accounts"] == [1, 2]
+
+
+def _wait_until_idle(label, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while running_accounts(label) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return not running_accounts(label)
+
+
+@pytest.mark.unit
+def test_account_still_running_after_deadline_is_skipped(monkeypatch):
+    """Test that a worker that outlives its deadline keeps its account busy and does not block other jobs"""
+    monkeypatch.setattr(account_fanout.settings, "ACCOUNT_FANOUT_MAX_WORKERS", 1)
+    release = threading.Event()
+
+    def hang(db, account_id):
+        release.wait(5)
+        return "late"
+
+    try:
+        first = run_per_account([1], hang, timeout=0.1, session_factory=FakeSession, label="hang-sync")
+        assert first[0]["timed_out"] is True
+        assert running_accounts("hang-sync") == {1}
+
+        # 같은 작업의 다음 실행은 아직 도는 계정을 건너뛰고, 슬롯이 막혀도 무한 대기하지 않음
+        started = time.monotonic()
+        second = run_per_account([1, 2], lambda db, account_id: "ok", timeout=0.2,
+                                 session_factory=FakeSession, label="hang-sync")
+        assert time.monotonic() - started < 1
+        assert second[0] == {**second[0], "success": False, "skipped": True, "timed_out": False}
+        assert second[1]["timed_out"] is True
+        assert summarize(second)["skipped"] == 1
+
+        # 다른 작업은 자기 한도를 써서 바로 실행
+        other = run_per_account([1], lambda db, account_id: "ok", timeout=1,
+                                session_factory=FakeSession, label="hang-poll")
+        assert other[0]["result"] == "ok"
+    finally:
+        release.set()
+
+    assert _wait_until_idle("hang-sync")
+    third = run_per_account([1], lambda db, account_id: "ok", timeout=1,
+                            session_factory=FakeSession, label="hang-sync")
+    assert third[0]["result"] == "ok"
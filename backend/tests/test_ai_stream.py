@@ -0,0 +1,87 @@
+"""
+AI Answer Streaming Tests
+AI 답변 토큰 스트리밍 테스트
+"""
+from datetime import datetime
+
+import pytest
+from openai import OpenAI
+
+from app.config import settings
+from app.models import Inquiry, Response
+from app.models.issue_response import IssueResponse
+from app.services.ai_stream import MarkdownStreamCleaner, strip_markdown
+from app.services.issue_response_service import IssueResponseService
+from app.services.response_generator import ResponseGenerator
+from benchmarks.stand_in_server import CoupangStandInServer
+
+STREAMED_TEXT = "  **안녕하세요**, 고객님.\n 요청하신 _반품_ 건은 확인 후 처리하겠습니다.  \n감사합니다.\n "
+
+
+@pytest.fixture
+def openai_stand_in(monkeypatch):
+    with CoupangStandInServer(completion_text=STREAMED_TEXT) as server:
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "stand-in")
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{server.base_url}/v1")
+        yield server
+
+
+@pytest.mark.unit
+def test_incremental_cleaner_matches_batch_strip():
+    """Test that feeding any split of the text yields the same result as strip_markdown"""
+    samples = [STREAMED_TEXT, "**", "  \n ", "a __b__ c * ", "_x_\n\n_y_"]
+    for text in samples:
+        for split in range(len(text) + 1):
+            cleaner = MarkdownStreamCleaner()
+            emitted = cleaner.feed(text[:split]) + cleaner.feed(text[split:])
+            assert emitted == cleaner.finish() == strip_markdown(text)
+
+        cleaner = MarkdownStreamCleaner()
+        emitted = "".join(cleaner.feed(ch) for ch in text)
+        assert emitted == cleaner.finish() == strip_markdown(text)
+
+
+@pytest.mark.unit
+def test_issue_response_streams_tokens_and_persists(test_db, openai_stand_in):
+    """Test that issue answers stream as tokens and the final text is saved"""
+    issue = IssueResponse(issue_type="other", original_content="상품 노출이 제한되었습니다.", summary="노출 제한")
+    test_db.add(issue)
+    test_db.commit()
+
+    service = IssueResponseService(test_db)
+    service.client = OpenAI(api_key="stand-in", base_url=f"{openai_stand_in.base_url}/v1")
+    events = list(service.stream_response(issue.id, response_type="appeal"))
+
+    tokens = [e["text"] for e in events if e["type"] == "token"]
+    done = events[-1]
+    assert len(tokens) > 5
+    assert done["type"] == "done"
+    assert done["data"]["generated_response"] == "".join(tokens) == strip_markdown(STREAMED_TEXT)
+
+    test_db.refresh(issue)
+    assert issue.generated_response == strip_markdown(STREAMED_TEXT)
+    assert issue.response_type == "appeal"
+    assert issue.confidence == 90
+
+
+@pytest.mark.unit
+def test_inquiry_response_stream_saves_draft(test_db, openai_stand_in):
+    """Test that a streamed inquiry answer is saved as a draft Response once complete"""
+    inquiry = Inquiry(
+        coupang_inquiry_id="STREAM_INQ_1",
+        vendor_id="VENDOR_TEST",
+        inquiry_text="반품하고 싶어요",
+        inquiry_date=datetime.utcnow()
+    )
+    test_db.add(inquiry)
+    test_db.commit()
+
+    events = list(ResponseGenerator(test_db).stream_ai_response(inquiry))
+    done = events[-1]
+    assert done["type"] == "done"
+    assert done["tokens_used"] == 160
+
+    response = test_db.query(Response).filter(Response.id == done["response_id"]).first()
+    assert response.response_text == "".join(e["text"] for e in events if e["type"] == "token")
+    assert response.generation_method == "ai" and response.status == "draft"
+    assert response.confidence_score == 85
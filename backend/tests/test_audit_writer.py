@@ -0,0 +1,156 @@
+"""
+Audit Log Writer Tests
+감사 로그 버퍼 기록기 테스트
+"""
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import AuditLog, AuditLogSummary
+from app.services.audit_writer import AuditLogWriter
+from app.services.security_audit import SecurityAuditService
+
+
+@pytest.fixture
+def writer(test_db):
+    writer = AuditLogWriter(sessionmaker(bind=test_db.get_bind()), batch_size=50, flush_interval=60)
+    yield writer
+    writer.close()
+
+
+@pytest.mark.unit
+def test_log_action_is_buffered_until_flush(test_db, writer):
+    """Test that log_action returns without writing and flush writes rows plus hourly summary"""
+    service = SecurityAuditService(test_db, writer=writer)
+    for i in range(3):
+        log = service.log_action(1, "inquiry.view", "inquiry", resource_id=i, ip_address="10.0.0.1")
+    service.log_action(2, "inquiry.view", "inquiry", ip_address="10.0.0.2")
+
+    assert log.id is None
+    assert test_db.query(AuditLog).count() == 0
+    assert writer.flush() == 4
+    assert test_db.query(AuditLog).count() == 4
+
+    service.log_action(1, "inquiry.view", "inquiry", ip_address="10.0.0.1")
+    writer.flush()
+    summary = {
+        (row.user_id, row.ip_address): row.count
+        for row in test_db.query(AuditLogSummary).filter(AuditLogSummary.action == "inquiry.view")
+    }
+    assert summary == {(1, "10.0.0.1"): 4, (2, "10.0.0.2"): 1}
+    assert writer.stats["batches"] == 2
+
+
+@pytest.mark.unit
+def test_security_events_and_detection(test_db, writer):
+    """Test that security events are streamed on enqueue and detection reads the summary"""
+    service = SecurityAuditService(test_db, writer=writer)
+    for _ in range(5):
+        service.log_action(7, "user.login_failed", "user", ip_address="1.2.3.4", status="failed")
+    service.log_action(7, "user.login", "user", ip_address="1.2.3.4")
+    service.log_action(8, "inquiry.view", "inquiry")
+
+    assert writer.pending == 7
+    assert len(service.security_events) == 6
+    assert len(service.get_recent_security_events(minutes=5)) == 6
+
+    suspicious = service.detect_suspicious_activity(hours=1)
+    assert writer.pending == 0
+    failed = [s for s in suspicious if s["type"] == "multiple_failed_logins"]
+    assert failed and failed[0]["count"] == 5 and failed[0]["ip_address"] == "1.2.3.4"
+
+    dashboard = service.get_security_dashboard(days=1)
+    assert dashboard["total_actions"] == 7
+    assert dashboard["failed_logins"] == 5
+    assert dashboard["successful_logins"] == 1
+    assert dashboard["active_users"] == 2
+    assert dashboard["top_users"][0]["user_id"] == 7
+
+
+@pytest.mark.unit
+def test_background_thread_flushes_on_batch_size(test_db):
+    """Test that reaching the batch size wakes the writer thread and close drains the rest"""
+    writer = AuditLogWriter(sessionmaker(bind=test_db.get_bind()), batch_size=3, flush_interval=60)
+    for i in range(3):
+        writer.enqueue(1, "inquiry.view", "inquiry", resource_id=i)
+
+    deadline = time.monotonic() + 5
+    while writer.stats["written"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.stats["written"] == 3
+
+    writer.enqueue(1, "inquiry.view", "inquiry", timestamp=datetime.utcnow())
+    writer.close()
+    assert writer.stats["written"] == 4
+    assert test_db.query(AuditLog).count() == 4
+
+
+@pytest.mark.unit
+def test_unwritable_record_is_dropped_without_blocking_others(test_db, writer):
+    """Test that a record that can never be written is isolated and dropped while the rest of its batch is written"""
+    for i in range(5):
+        writer.enqueue(1, "inquiry.view", "inquiry", resource_id=i)
+    writer.enqueue(1, None, "inquiry")  # action은 NOT NULL
+    for i in range(5, 9):
+        writer.enqueue(1, "inquiry.view", "inquiry", resource_id=i)
+
+    assert writer.flush() == 9
+    assert writer.pending == 0
+    assert writer.stats["dropped"] == 1
+    assert test_db.query(AuditLog).count() == 9
+
+    writer.enqueue(1, "inquiry.view", "inquiry")
+    assert writer.flush() == 1
+
+
+@pytest.mark.unit
+def test_transient_failures_are_retried_then_dropped(test_db):
+    """Test that a transient DB error keeps the batch for a bounded number of retries"""
+    from sqlalchemy.exc import OperationalError
+
+    working = sessionmaker(bind=test_db.get_bind())
+    outage = {"left": 3}
+
+    def session_factory():
+        if outage["left"]:
+            outage["left"] -= 1
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        return working()
+
+    writer = AuditLogWriter(session_factory, batch_size=10, flush_interval=60, max_retries=2)
+    writer.enqueue(1, "inquiry.view", "inquiry")
+    assert writer.flush() == 0
+    assert writer.flush() == 0
+    assert writer.pending == 1
+
+    # 세 번째 연속 실패에서 한도 초과로 버리고, 이후 로그는 정상 기록
+    assert writer.flush() == 0
+    assert writer.pending == 0
+    assert writer.stats["dropped"] == 1
+    writer.enqueue(1, "inquiry.view", "inquiry")
+    assert writer.flush() == 1
+
+
+@pytest.mark.unit
+def test_full_buffer_sheds_load_instead_of_writing_inline(test_db):
+    """Test that a full buffer never writes on the caller thread and keeps security events"""
+    calls = []
+    working = sessionmaker(bind=test_db.get_bind())
+
+    def session_factory():
+        calls.append(1)
+        return working()
+
+    writer = AuditLogWriter(session_factory, batch_size=100, flush_interval=60, max_pending=3)
+    writer._ensure_thread = lambda: None
+    for i in range(5):
+        writer.enqueue(1, "inquiry.view", "inquiry", resource_id=i)
+    writer.enqueue(1, "user.login_failed", "user", status="failed")
+
+    assert calls == []
+    assert writer.pending == 3
+    assert writer.stats["dropped"] == 3
+    assert [r["action"] for r in writer._buffer] == ["inquiry.view", "inquiry.view", "user.login_failed"]
+    writer.close()
@@ -0,0 +1,120 @@
+"""
+Auto Return Worker Pool Tests
+자동 반품 병렬 워커 처리 테스트
+"""
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.auto_return_config import AutoReturnConfig
+from app.models.auto_return_log import AutoReturnExecutionLog
+from app.models.naver_account import NaverAccount
+from app.models.return_log import ReturnLog
+from app.services.auto_return_processor import AutoReturnProcessor
+
+
+class FakeNaverPayAutomation:
+    """브라우저 없이 처리 호출만 기록하는 자동화 스텁"""
+
+    processed = []
+    lock = threading.Lock()
+
+    def __init__(self, config):
+        self.driver = object()
+
+    def login(self, username, password):
+        return True
+
+    def navigate_to_payment_history(self):
+        return True
+
+    def process_single_return(self, product_name, receiver_name=""):
+        time.sleep(0.005)
+        with self.lock:
+            self.processed.append(product_name)
+        if product_name.endswith("-7"):
+            return False, f"주문을 찾을 수 없음: {product_name}"
+        return True, None
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def file_session_factory(tmp_path):
+    """Multi-connection SQLite database for concurrent workers"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'workers.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30}
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    yield factory
+    engine.dispose()
+
+
+@pytest.mark.unit
+def test_worker_pool_claims_each_return_once(file_session_factory):
+    """Test that parallel workers never process the same return twice"""
+    db = file_session_factory()
+    config = AutoReturnConfig(**{
+        **AutoReturnConfig.get_default_config(),
+        "enabled": True,
+        "process_batch_size": 18,
+        "process_workers": 3,
+        "auto_process_statuses": [],
+        "exclude_statuses": [],
+    })
+    db.add(config)
+    main = NaverAccount(name="main", client_id="cid", client_secret_encrypted="x", naver_username="seller", is_default=True)
+    main.naver_password = "secret"
+    other = NaverAccount(name="other", client_id="cid2", client_secret_encrypted="x", naver_username="other")
+    other.naver_password = "secret"
+    no_password = NaverAccount(name="api-only", client_id="cid3", client_secret_encrypted="x", naver_username="api")
+    db.add_all([other, no_password, main])
+    for n in range(20):
+        db.add(ReturnLog(
+            coupang_receipt_id=n,
+            coupang_order_id=f"O{n}",
+            product_name=f"상품-{n}",
+            receiver_name="홍길동",
+            receipt_type="RETURN",
+            receipt_status="RETURNS_UNCHECKED",
+            status="pending",
+            naver_processed=False
+        ))
+    db.commit()
+
+    FakeNaverPayAutomation.processed = []
+    processor = AutoReturnProcessor(
+        db,
+        session_factory=file_session_factory,
+        automation_factory=FakeNaverPayAutomation
+    )
+    result = processor.process_pending_returns(config=config, triggered_by="manual")
+
+    processed = FakeNaverPayAutomation.processed
+    assert len(processed) == 18
+    assert len(set(processed)) == 18
+    assert result["processed"] == 17
+    assert result["failed"] == 1
+    assert len(result["workers"]) == 3
+    # 반품 로그에 계정 정보가 없으므로 모든 워커가 기본 계정으로 처리
+    assert {w["naver_account_id"] for w in result["workers"]} == {main.id}
+
+    db.expire_all()
+    statuses = [r.status for r in db.query(ReturnLog).all()]
+    assert statuses.count("completed") == 17
+    assert statuses.count("failed") == 1
+    assert statuses.count("pending") == 2
+    assert statuses.count("processing") == 0
+
+    execution_log = db.query(AutoReturnExecutionLog).one()
+    assert execution_log.success_count == 17
+    assert execution_log.failed_count == 1
+    assert execution_log.details["mode"] == "worker_pool"
+    db.close()
@@ -130,3 +130,196 @@ def test_cache_invalidate():
     assert cache.get("user:1") is None
     assert cache.get("user:2") is None
     assert cache.get("product:1") == "data3"
+
+
+@pytest.mark.unit
+def test_cache_invalidate_prefix_without_colon_uses_first_segment():
+    """Test that a bare prefix like "inquiry" removes keys by first segment only"""
+    cache = InMemoryCache()
+
+    cache.set("inquiry:get_inquiry:abc", 1)
+    cache.set("inquiry:list:def", 2)
+    cache.set("inquiry_stats:1", 3)
+    cache.set("inquiry", 4)
+    cache.set("product:inquiry:1", 5)
+
+    assert cache.invalidate_prefix("inquiry") == 4
+    assert cache.get("product:inquiry:1") == 5
+    assert set(cache._head_index) == {"product"}
+
+
+@pytest.mark.unit
+def test_cache_is_bounded_lru():
+    """Test that the least recently used entry is evicted at the size bound"""
+    cache = InMemoryCache(max_entries=3, stripes=1)
+
+    cache.set("a:1", 1)
+    cache.set("a:2", 2)
+    cache.set("a:3", 3)
+    cache.get("a:1")  # 최근 사용으로 갱신
+    cache.set("a:4", 4)
+
+    assert cache.get("a:2") is None
+    assert cache.get("a:1") == 1
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["size"] == 3
+
+
+@pytest.mark.unit
+def test_cache_byte_bound():
+    """Test eviction by estimated size"""
+    cache = InMemoryCache(max_bytes=3000, stripes=1)
+
+    for i in range(10):
+        cache.set(f"blob:{i}", "x" * 1000)
+
+    stats = cache.get_stats()
+    assert stats["bytes"] <= 3000
+    assert stats["size"] < 10
+    assert cache.get("blob:9") is not None
+
+
+@pytest.mark.unit
+def test_cache_invalidate_tag_and_nested_prefix():
+    """Test tag invalidation and prefixes that end mid-segment"""
+    cache = InMemoryCache()
+
+    cache.set("response:GET:/api/returns/list:page=1", 1, tags=["returns"])
+    cache.set("response:GET:/api/returns/stats:", 2, tags=["returns"])
+    cache.set("response:GET:/api/inquiries:", 3)
+
+    assert cache.invalidate_prefix("response:GET:/api/returns/list") == 1
+    assert cache.invalidate_tag("returns") == 1
+    assert cache.get("response:GET:/api/inquiries:") == 3
+    assert cache.get_stats()["size"] == 1
+
+
+@pytest.mark.unit
+def test_cached_single_flight():
+    """Test that concurrent callers of a cold key compute it once"""
+    import threading
+
+    calls = {"count": 0}
+    started = threading.Barrier(8)
+
+    @cached(ttl=60, key_prefix="flight")
+    def slow(x):
+        calls["count"] += 1
+        time.sleep(0.2)
+        return x + 1
+
+    results = []
+
+    def call():
+        started.wait()
+        results.append(slow(1))
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [2] * 8
+    assert calls["count"] == 1
+
+
+@pytest.mark.unit
+def test_cached_stale_while_revalidate():
+    """Test that an expired value is served while a background refresh runs"""
+    calls = {"count": 0}
+
+    @cached(ttl=1, key_prefix="swr", stale_ttl=30)
+    def version():
+        calls["count"] += 1
+        return calls["count"]
+
+    assert version() == 1
+    time.sleep(1.1)
+
+    assert version() == 1  # stale 값 즉시 반환
+    for _ in range(50):
+        if calls["count"] == 2:
+            break
+        time.sleep(0.02)
+    time.sleep(0.05)
+    assert version() == 2
+
+
+class RedisStandIn:
+    """redis-py 클라이언트의 캐시 사용 부분만 구현한 로컬 대역"""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+            self.sets.pop(key, None)
+            self.ttls.pop(key, None)
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def ttl(self, key):
+        if key not in self.data and key not in self.sets:
+            return -2
+        return self.ttls.get(key, -1)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def persist(self, key):
+        self.ttls.pop(key, None)
+
+    def scan_iter(self, match):
+        import fnmatch
+        return [key for key in list(self.data) if fnmatch.fnmatchcase(key, match)]
+
+
+@pytest.mark.unit
+def test_redis_second_tier_is_shared():
+    """Test that a second process sees values and invalidations through the Redis tier"""
+    from app.core.cache import RedisCacheTier
+
+    redis = RedisStandIn()
+    worker_a = InMemoryCache(l2=RedisCacheTier(client=redis))
+    worker_b = InMemoryCache(l2=RedisCacheTier(client=redis))
+
+    worker_a.set("stats:dashboard", {"pending": 3}, tags=["dashboard"])
+    assert worker_b.get("stats:dashboard") == {"pending": 3}
+
+    # 무효화는 2차 캐시에도 반영 (다른 워커의 1차 캐시는 TTL로 정리)
+    assert worker_a.invalidate_tag("dashboard") == 1
+    assert redis.data == {}
+    assert InMemoryCache(l2=RedisCacheTier(client=redis)).get("stats:dashboard") is None
+
+
+@pytest.mark.unit
+def test_redis_promoted_entries_keep_tags():
+    """Test that entries promoted from Redis keep their tags and tag sets expire with their entries"""
+    from app.core.cache import RedisCacheTier
+
+    redis = RedisStandIn()
+    worker_a = InMemoryCache(l2=RedisCacheTier(client=redis))
+    worker_b = InMemoryCache(l2=RedisCacheTier(client=redis))
+
+    worker_a.set("stats:dashboard", {"pending": 3}, ttl=60, tags=["dashboard"])
+    worker_a.set("stats:returns", {"pending": 1}, ttl=30, tags=["dashboard"])
+    assert 60 <= redis.ttl("cache:tag:dashboard") <= 61
+
+    assert worker_b.get("stats:dashboard") == {"pending": 3}  # 2차 캐시에서 1차 캐시로 승격
+    assert worker_b.invalidate_tag("dashboard") == 2
+    assert worker_b.get_stats()["size"] == 0
+    assert worker_b.get("stats:dashboard") is None
@@ -0,0 +1,149 @@
+"""
+Coupang Invoice Batch Upload Tests
+쿠팡 송장 병렬 일괄 업로드 테스트
+"""
+import threading
+
+import pytest
+
+from app.models.naver_delivery_sync import CoupangPendingOrder
+from app.services.coupang_shipment_service import CoupangShipmentService
+
+
+def _invoice(n):
+    return {
+        "shipment_box_id": str(1000 + n),
+        "order_id": str(2000 + n),
+        "vendor_item_id": str(3000 + n),
+        "courier_code": "CJGLS",
+        "tracking_number": f"6000000000{n:02d}"
+    }
+
+
+@pytest.fixture
+def shipment_service(test_db, monkeypatch):
+    """Shipment service with pending orders and no real HTTP"""
+    for n in range(6):
+        test_db.add(CoupangPendingOrder(
+            shipment_box_id=str(1000 + n),
+            order_id=str(2000 + n),
+            vendor_item_id=str(3000 + n),
+            receiver_name="테스트",
+            status="INSTRUCT",
+            is_invoice_uploaded=False
+        ))
+    test_db.commit()
+
+    monkeypatch.setattr(CoupangShipmentService, "UPLOAD_BACKOFF_BASE", 0)
+    monkeypatch.setattr(CoupangShipmentService, "_completed_invoices", type(CoupangShipmentService._completed_invoices)())
+    return CoupangShipmentService(db=test_db, access_key="ak", secret_key="sk", vendor_id="A000")
+
+
+@pytest.mark.unit
+def test_batch_upload_retries_transient_failures(shipment_service, test_db, monkeypatch):
+    """Test transient retry, permanent failure and single bulk DB update"""
+    calls = {}
+    lock = threading.Lock()
+
+    def fake_post(invoice):
+        with lock:
+            calls[invoice["tracking_number"]] = calls.get(invoice["tracking_number"], 0) + 1
+            attempt = calls[invoice["tracking_number"]]
+        if invoice["shipment_box_id"] == "1001" and attempt == 1:
+            return {"success": False, "status_code": 503, "response": None, "error": "busy", "transient": True}
+        if invoice["shipment_box_id"] == "1002":
+            return {"success": False, "status_code": 200, "response": None, "error": "INVALID", "transient": False}
+        return {"success": True, "status_code": 200, "response": {}, "error": None, "transient": False}
+
+    monkeypatch.setattr(shipment_service, "_post_invoice", fake_post)
+    commits = {"count": 0}
+    original_commit = test_db.commit
+
+    def counting_commit():
+        commits["count"] += 1
+        original_commit()
+
+    monkeypatch.setattr(test_db, "commit", counting_commit)
+
+    invoices = [_invoice(n) for n in range(4)]
+    result = shipment_service.upload_invoices_batch(invoices, max_workers=4)
+
+    assert result["success"] == 3
+    assert result["failed"] == 1
+    assert result["retried"] == 1
+    assert [d["tracking_number"] for d in result["details"]] == [i["tracking_number"] for i in invoices]
+    assert calls[_invoice(1)["tracking_number"]] == 2
+    assert calls[_invoice(2)["tracking_number"]] == 1
+    assert commits["count"] == 1
+
+    uploaded = {
+        o.shipment_box_id for o in test_db.query(CoupangPendingOrder).filter(
+            CoupangPendingOrder.is_invoice_uploaded == True
+        )
+    }
+    assert uploaded == {"1000", "1001", "1003"}
+
+
+@pytest.mark.unit
+def test_batch_upload_never_double_posts(shipment_service, monkeypatch):
+    """Test idempotency: duplicates and already-uploaded invoices are not re-sent"""
+    posted = []
+
+    def fake_post(invoice):
+        posted.append(invoice["tracking_number"])
+        return {"success": True, "status_code": 200, "response": {}, "error": None, "transient": False}
+
+    monkeypatch.setattr(shipment_service, "_post_invoice", fake_post)
+
+    first = shipment_service.upload_invoices_batch([_invoice(0), _invoice(0), _invoice(1)])
+    assert first["success"] == 2
+    assert first["skipped"] == 1
+    assert sorted(posted) == sorted([_invoice(0)["tracking_number"], _invoice(1)["tracking_number"]])
+
+    posted.clear()
+    second = shipment_service.upload_invoices_batch([_invoice(0), _invoice(1), _invoice(4)])
+    assert posted == [_invoice(4)["tracking_number"]]
+    assert second["skipped"] == 2
+    assert second["success"] == 3
+
+
+@pytest.mark.unit
+def test_retry_only_treats_explicit_duplicate_errors_as_success(shipment_service, monkeypatch):
+    """Test that an unrelated error containing "이미지" is not mistaken for an already-uploaded invoice"""
+    responses = {
+        "1000": ["busy", "이미 등록된 송장입니다"],
+        "1001": ["busy", "이미지 처리 오류"],
+    }
+
+    def fake_post(invoice):
+        error = responses[invoice["shipment_box_id"]].pop(0)
+        return {"success": False, "status_code": 200, "response": None, "error": error, "transient": error == "busy"}
+
+    monkeypatch.setattr(shipment_service, "_post_invoice", fake_post)
+    result = shipment_service.upload_invoices_batch([_invoice(0), _invoice(1)], max_workers=1)
+
+    assert result["success"] == 1
+    assert result["failed"] == 1
+    assert [d["success"] for d in result["details"]] == [True, False]
+
+
+@pytest.mark.unit
+def test_non_json_response_is_a_failed_upload(shipment_service, monkeypatch):
+    """Test that a non-JSON 200 body fails that invoice instead of aborting the batch"""
+
+    class HtmlResponse:
+        status_code = 200
+        text = "<html>maintenance</html>"
+
+        def json(self):
+            raise ValueError("Expecting value")
+
+    class FakeSession:
+        def post(self, *args, **kwargs):
+            return HtmlResponse()
+
+    monkeypatch.setattr(shipment_service, "_get_http_session", lambda: FakeSession())
+    result = shipment_service.upload_invoices_batch([_invoice(0)])
+
+    assert result["failed"] == 1
+    assert "Invalid JSON" in result["details"][0]["error"]
@@ -0,0 +1,110 @@
+"""
+Coupon Request Tracker Tests
+쿠폰 비동기 요청 상태 추적기 테스트
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.coupon_config import BulkApplyProgress, CouponRequestStatus, ProductCouponTracking
+from app.services.coupon_request_tracker import CouponRequestTracker, extract_requested_id
+
+
+class FakeCouponClient:
+    """requestedId별로 정해진 상태를 돌려주는 가짜 클라이언트"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+
+    def get_instant_coupon_request_status(self, requested_id):
+        self.calls.append(requested_id)
+        status = self.statuses[requested_id]
+        if isinstance(status, Exception):
+            raise status
+        return {"code": 200, "data": {"content": status}}
+
+
+@pytest.fixture
+def progress(test_db):
+    progress = BulkApplyProgress(coupang_account_id=1, status="applying", total_days=1)
+    test_db.add(progress)
+    test_db.commit()
+    return progress
+
+
+@pytest.mark.unit
+def test_resolves_done_fail_and_unknown(test_db, progress):
+    """Test that timeouts become UNKNOWN instead of being counted as success"""
+    client = FakeCouponClient({
+        "r-done": {"status": "DONE"},
+        "r-fail": {"status": "FAIL", "failedVendorItems": [{"vendorItemId": 2}]},
+        "r-slow": {"status": "REQUESTED"},
+    })
+    tracker = CouponRequestTracker(test_db, client, coupang_account_id=1)
+    tracker.register("r-done", [1, 2, 3], progress=progress)
+    tracker.register("r-fail", [1, 2], progress=progress)
+    tracker.register("r-slow", [5, 6, 7, 8], progress=progress)
+    assert progress.instant_pending == 9
+
+    now = datetime.utcnow() + timedelta(seconds=tracker.INITIAL_DELAY_SECONDS)
+    outcomes = tracker.poll_due(now=now)
+    assert {o["request_id"]: o["status"] for o in outcomes} == {"r-done": "DONE", "r-fail": "FAIL"}
+
+    # 미완료 요청은 백오프 후에만 다시 조회
+    assert tracker.poll_due(now=now) == []
+    for _ in range(tracker.MAX_POLLS):
+        now += timedelta(seconds=tracker.MAX_DELAY_SECONDS)
+        outcomes = tracker.poll_due(now=now)
+        if outcomes:
+            break
+
+    assert outcomes[0]["status"] == "UNKNOWN"
+    assert client.calls.count("r-slow") == tracker.MAX_POLLS
+    assert tracker.pending_count() == 0
+
+    test_db.refresh(progress)
+    assert progress.instant_success == 4
+    assert progress.instant_failed == 1
+    assert progress.instant_unknown == 4
+    assert progress.instant_pending == 0
+
+
+@pytest.mark.unit
+def test_updates_product_tracking(test_db):
+    """Test that resolution updates ProductCouponTracking and is applied once"""
+    now = datetime.utcnow()
+    tracking = ProductCouponTracking(
+        coupang_account_id=1,
+        seller_product_id=100,
+        product_created_at=now,
+        coupon_apply_scheduled_at=now,
+        status="processing"
+    )
+    test_db.add(tracking)
+    test_db.commit()
+
+    client = FakeCouponClient({"r-1": {"status": "DONE"}})
+    tracker = CouponRequestTracker(test_db, client, coupang_account_id=1)
+    tracker.register("r-1", [10], tracking=tracking)
+
+    later = now + timedelta(minutes=1)
+    assert len(tracker.poll_due(now=later)) == 1
+    assert tracker.poll_due(now=later) == []
+
+    test_db.refresh(tracking)
+    assert tracking.status == "completed"
+    assert tracking.instant_coupon_applied is True
+
+    request = test_db.query(CouponRequestStatus).one()
+    assert request.status == "DONE"
+    assert request.success_count == 1
+
+
+@pytest.mark.unit
+def test_extract_requested_id():
+    """Test requestedId extraction from apply responses"""
+    ok = {"code": 200, "data": {"success": True, "content": {"requestedId": 123}}}
+    assert extract_requested_id(ok) == "123"
+    assert extract_requested_id({"code": 400, "message": "bad"}) is None
+    assert extract_requested_id(None) is None
@@ -0,0 +1,155 @@
+"""
+Dashboard Counter Tests
+대시보드 증분 카운터 테스트
+"""
+import pytest
+
+from app.models.return_log import ReturnLog
+from app.services.auto_return_collector import AutoReturnCollector
+from app.services.dashboard_counters import get_dashboard_counters
+
+
+def make_return(i: int, status: str = "pending") -> ReturnLog:
+    return ReturnLog(
+        coupang_receipt_id=2000 + i,
+        coupang_order_id=f"ORDER-{i}",
+        product_name=f"상품 {i}",
+        receipt_type="RETURN",
+        receipt_status="RETURNS_UNCHECKED",
+        status=status
+    )
+
+
+def exact_statistics(db):
+    """카운터를 거치지 않은 COUNT 기준값"""
+    return {
+        "total": db.query(ReturnLog).count(),
+        "pending": db.query(ReturnLog).filter(
+            ReturnLog.status == "pending", ReturnLog.naver_processed == False
+        ).count(),
+        "processed": db.query(ReturnLog).filter(ReturnLog.naver_processed == True).count(),
+        "failed": db.query(ReturnLog).filter(ReturnLog.status == "failed").count(),
+    }
+
+
+@pytest.fixture
+def counters(test_db):
+    counters = get_dashboard_counters(test_db)
+    counters.snapshot(test_db, "return_logs")  # 초기 재계산
+    return counters
+
+
+@pytest.mark.unit
+def test_inserts_and_transitions_apply_on_commit(test_db, counters):
+    """Test that insert and status-change deltas are applied only when committed"""
+    for i in range(3):
+        test_db.add(make_return(i))
+    test_db.flush()
+    assert counters.snapshot(test_db, "return_logs").get("return_logs", "total") == 0
+    test_db.commit()
+
+    log = test_db.query(ReturnLog).first()
+    log.status = "failed"
+    test_db.commit()
+    log = test_db.query(ReturnLog).order_by(ReturnLog.id.desc()).first()
+    log.naver_processed = True
+    test_db.commit()
+
+    stats = AutoReturnCollector(test_db).get_statistics()
+    assert {k: stats[k] for k in ("total", "pending", "processed", "failed")} == exact_statistics(test_db)
+    assert stats["recent_24h"] == 3
+    assert counters.groups["return_logs"].dirty is False
+
+
+@pytest.mark.unit
+def test_rollback_discards_deltas(test_db, counters):
+    """Test that a rolled back transaction leaves the counters untouched"""
+    test_db.add(make_return(1))
+    test_db.flush()
+    test_db.rollback()
+
+    snapshot = counters.snapshot(test_db, "return_logs")
+    assert snapshot.get("return_logs", "total") == 0
+    assert snapshot.get("return_logs", "status:pending") == 0
+
+
+@pytest.mark.unit
+def test_bulk_update_marks_group_for_reconcile(test_db, counters):
+    """Test that query.update() invalidates the group and the next read reconciles"""
+    for i in range(4):
+        test_db.add(make_return(i))
+    test_db.commit()
+
+    test_db.query(ReturnLog).filter(ReturnLog.coupang_receipt_id < 2002).update(
+        {"status": "failed"}, synchronize_session=False
+    )
+    test_db.commit()
+    assert counters.groups["return_logs"].dirty is True
+
+    snapshot = counters.snapshot(test_db, "return_logs")
+    assert snapshot.get("return_logs", "status:failed") == 2
+    assert snapshot.get("return_logs", "status:pending") == 2
+
+
+@pytest.mark.unit
+def test_expired_attribute_change_is_reconciled(test_db, counters):
+    """Test that a change whose previous value is unknown falls back to reconcile"""
+    test_db.add(make_return(1))
+    test_db.commit()
+
+    log = test_db.query(ReturnLog).first()
+    test_db.expire(log, ["status"])
+    log.status = "completed"
+    test_db.commit()
+
+    snapshot = counters.snapshot(test_db, "return_logs")
+    assert snapshot.get("return_logs", "status:completed") == 1
+    assert snapshot.get("return_logs", "status:pending") == 0
+
+
+@pytest.mark.unit
+def test_etag_changes_only_on_write(test_db, counters):
+    """Test that the ETag is stable between reads and changes after a write"""
+    first = counters.snapshot(test_db, "return_logs").etag
+    assert counters.snapshot(test_db, "return_logs").etag == first
+
+    test_db.add(make_return(1))
+    test_db.commit()
+    assert counters.snapshot(test_db, "return_logs").etag != first
+
+
+@pytest.mark.unit
+def test_etag_is_derived_from_values_across_workers(test_db, counters):
+    """Test that independent counter instances (other workers, restarts) agree on the ETag for the same data"""
+    from app.services.dashboard_counters import DashboardCounters
+
+    test_db.add(make_return(1))
+    test_db.commit()
+
+    other_worker = DashboardCounters()
+    assert other_worker.snapshot(test_db, "return_logs").etag == counters.snapshot(test_db, "return_logs").etag
+
+    # 값이 다르면 같은 "변경 횟수"라도 ETag가 다름
+    fresh = DashboardCounters()
+    fresh_etag = fresh.snapshot(test_db, "return_logs").etag
+    test_db.add(make_return(2))
+    test_db.commit()
+    assert counters.snapshot(test_db, "return_logs").etag != fresh_etag
+
+
+@pytest.mark.unit
+def test_not_modified_skips_building_the_body(client, test_db, monkeypatch):
+    """Test that a matching If-None-Match returns 304 before the statistics body is built"""
+    from app.services.naver_delivery_sync_service import NaverDeliverySyncService
+
+    first = client.get("/api/delivery-sync/stats")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("body built for a 304 response")
+
+    monkeypatch.setattr(NaverDeliverySyncService, "get_delivery_stats", fail)
+    second = client.get("/api/delivery-sync/stats", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
@@ -0,0 +1,65 @@
+"""
+Delivery Order Matcher Tests
+배송 ↔ 발주서 매칭 인덱스 테스트
+"""
+import pytest
+
+from app.services.delivery_order_matcher import OrderMatchIndex
+
+
+ORDERS = [
+    {"order_id": "1", "receiver_name": "신*희", "product_name": "무선 충전기 15W"},
+    {"order_id": "2", "receiver_name": "홍길동", "product_name": "스테인리스 텀블러"},
+    {"order_id": "3", "receiver_name": "홍길동", "product_name": "캠핑 의자"},
+    {"order_id": "4", "receiver_name": "김철수", "product_name": "우산"},
+]
+
+
+@pytest.mark.unit
+def test_masked_and_exact_match():
+    """Test masked-name bucket and exact-name lookup"""
+    index = OrderMatchIndex(ORDERS)
+
+    masked = index.match("신동희")
+    assert masked["matched"] is True
+    assert masked["order"]["order_id"] == "1"
+    assert masked["confidence"] == 100
+    assert masked["ambiguity"] == 0
+
+    partial = index.match("철수")
+    assert partial["order"]["order_id"] == "4"
+    assert partial["confidence"] == 70
+
+    assert index.match("박영수")["matched"] is False
+
+
+@pytest.mark.unit
+def test_product_tokens_break_ties():
+    """Test that product-name tokens rank same-name candidates"""
+    index = OrderMatchIndex(ORDERS)
+
+    result = index.match("홍길동", product_name="캠핑 의자 접이식")
+    assert result["order"]["order_id"] == "3"
+    assert result["ambiguity"] == 0
+
+    tied = index.match("홍길동")
+    assert tied["candidates"] == 2
+    assert tied["ambiguity"] == 0.5
+
+
+@pytest.mark.unit
+def test_batch_assignment_is_one_to_one():
+    """Test that the same order is never assigned twice in a batch"""
+    index = OrderMatchIndex(ORDERS)
+    deliveries = [
+        {"recipient": "홍길동", "product_name": "텀블러"},
+        {"recipient": "홍길동", "product_name": "텀블러"},
+        {"recipient": "홍길동", "product_name": "텀블러"},
+    ]
+
+    results = index.assign(deliveries)
+    assigned = [r["order"]["order_id"] for r in results if r["matched"]]
+
+    assert sorted(assigned) == ["2", "3"]
+    assert results[0]["order"]["order_id"] == "2"
+    assert sum(1 for r in results if not r["matched"]) == 1
@@ -0,0 +1,184 @@
+"""
+LLM Gateway Tests
+OpenAI 게이트웨이 테스트
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from app.services.ai_response_generator import AIResponseGenerator
+from app.services.llm_gateway import LLMGateway, RateBudget, estimate_tokens
+
+
+def completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 1,
+        "model": "test",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+    }
+
+
+def make_gateway(handler, **kwargs) -> LLMGateway:
+    client = AsyncOpenAI(
+        api_key="test",
+        base_url="http://llm.test/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return LLMGateway(client=client, **kwargs)
+
+
+def request(content: str) -> dict:
+    return {"model": "test", "messages": [{"role": "user", "content": content}], "max_tokens": 50}
+
+
+@pytest.mark.unit
+def test_estimate_tokens_and_rate_budget():
+    """Test prompt token estimation and token-bucket wait/refund/sync math"""
+    assert estimate_tokens([{"role": "user", "content": "abcdefgh"}], max_tokens=10) == 2 + 4 + 10
+    assert estimate_tokens([{"role": "user", "content": "안녕하세요"}]) == 5 + 4
+
+    now = [0.0]
+    budget = RateBudget(600, clock=lambda: now[0])  # 10 tokens/sec
+    assert budget.wait_time(600) == 0
+    budget.take(600)
+    assert budget.wait_time(100) == pytest.approx(10.0)
+    now[0] = 5.0
+    assert budget.wait_time(100) == pytest.approx(5.0)
+    budget.refund(50)
+    assert budget.wait_time(100) == 0
+    budget.sync(20)
+    assert budget.level == 20
+    assert RateBudget(0).wait_time(10 ** 9) == 0
+
+
+@pytest.mark.unit
+def test_complete_many_runs_concurrently_in_order():
+    """Test that a batch runs up to the concurrency limit and keeps input order"""
+    active = {"now": 0, "peak": 0}
+
+    async def handler(req: httpx.Request) -> httpx.Response:
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.02)
+        active["now"] -= 1
+        return httpx.Response(200, json=completion(json.loads(req.content)["messages"][0]["content"]))
+
+    gateway = make_gateway(handler, rpm=0, tpm=0, max_concurrency=5)
+    try:
+        results = asyncio.run(gateway.complete_many([request(str(i)) for i in range(20)]))
+        metrics = gateway.metrics()
+    finally:
+        gateway.close()
+
+    assert [r.choices[0].message.content for r in results] == [str(i) for i in range(20)]
+    assert active["peak"] == 5
+    assert metrics["completed"] == 20 and metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+    assert metrics["tokens_per_minute"] == 20 * 15
+
+
+@pytest.mark.unit
+def test_rate_limit_backs_off_and_halves_concurrency():
+    """Test that a 429 pauses per retry-after, halves the limit and the request still succeeds"""
+    calls = []
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"retry-after-ms": "50"}, json={"error": {"message": "slow down"}})
+        return httpx.Response(200, json=completion("ok"), headers={"x-ratelimit-remaining-tokens": "100"})
+
+    gateway = make_gateway(handler, rpm=0, tpm=10000, max_concurrency=8)
+    try:
+        result = gateway.complete_sync(**request("hi"))
+        metrics = gateway.metrics()
+    finally:
+        gateway.close()
+
+    assert result.choices[0].message.content == "ok"
+    assert len(calls) == 2
+    assert metrics["rate_limited"] == 1
+    assert metrics["concurrency_limit"] == 4
+    assert metrics["tokens_available"] <= 101
+
+
+@pytest.mark.unit
+def test_rate_limited_attempt_does_not_consume_tpm():
+    """Test that a request rejected with 429 and then answered is charged against TPM only once"""
+    calls = []
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"retry-after-ms": "0"}, json={"error": {"message": "slow down"}})
+        return httpx.Response(200, json=completion("ok"))
+
+    gateway = make_gateway(handler, rpm=0, tpm=600, max_concurrency=8, clock=lambda: 0.0)
+    try:
+        result = gateway.complete_sync(**request("hi"))
+        metrics = gateway.metrics()
+    finally:
+        gateway.close()
+
+    assert result.choices[0].message.content == "ok"
+    assert len(calls) == 2
+    assert metrics["tokens_available"] == 600 - 15  # 실제 사용량(usage.total_tokens)만 차감
+
+
+@pytest.mark.unit
+def test_connection_errors_and_5xx_are_retried():
+    """Test that connection errors and 5xx responses are retried with backoff like the SDK default"""
+    calls = []
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection reset")
+        if len(calls) == 2:
+            return httpx.Response(503, json={"error": {"message": "overloaded"}})
+        return httpx.Response(200, json=completion("ok"))
+
+    gateway = make_gateway(handler, rpm=0, tpm=600, max_retries=2, backoff_seconds=0.01, clock=lambda: 0.0)
+    try:
+        result = gateway.complete_sync(**request("hi"))
+        metrics = gateway.metrics()
+    finally:
+        gateway.close()
+
+    assert result.choices[0].message.content == "ok"
+    assert len(calls) == 3
+    assert metrics["transient_errors"] == 2
+    assert metrics["concurrency_limit"] == metrics["max_concurrency"]  # 429가 아니므로 한도 유지
+    assert metrics["tokens_available"] == 600 - 15
+
+
+@pytest.mark.unit
+def test_generate_many_from_text_uses_gateway():
+    """Test that bulk text generation returns results in order with None for failed or malformed completions"""
+    def handler(req: httpx.Request) -> httpx.Response:
+        text = json.loads(req.content)["messages"][1]["content"]
+        if "실패" in text:
+            return httpx.Response(400, json={"error": {"message": "bad request"}})
+        if "사용량" in text:
+            return httpx.Response(200, json={**completion("내용"), "usage": None})
+        return httpx.Response(200, json=completion("**안녕하세요**, 고객님. 감사합니다."))
+
+    gateway = make_gateway(handler, rpm=0, tpm=0, max_concurrency=4)
+    generator = AIResponseGenerator()
+    generator.client = object()
+    generator.gateway = gateway
+    try:
+        results = asyncio.run(generator.generate_many_from_text(["배송 문의", "실패 문의", "교환 문의", "사용량 없음"]))
+    finally:
+        gateway.close()
+
+    assert results[1] is None
+    assert results[3] is None  # 비정상 응답 하나가 배치 전체를 실패시키지 않음
+    assert results[0]["response_text"] == results[2]["response_text"] == "안녕하세요, 고객님. 감사합니다."
+    assert results[0]["confidence"] == 85
@@ -0,0 +1,110 @@
+"""
+Naver Shopping Client Tests
+네이버 쇼핑 검색 클라이언트 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.cache import get_cache
+from app.services.naver_shopping_client import (
+    CACHE_TAG,
+    NaverShoppingClient,
+    QpsPacer,
+    clean_title,
+    normalize_query,
+)
+
+
+def make_client(handler, **kwargs) -> NaverShoppingClient:
+    get_cache().invalidate_tag(CACHE_TAG)
+    return NaverShoppingClient("id", "secret", transport=httpx.MockTransport(handler), **kwargs)
+
+
+def search_payload(query: str) -> dict:
+    return {
+        "total": 1,
+        "start": 1,
+        "display": 1,
+        "items": [{"title": f"[공식몰] <b>{query}</b>", "link": "https://example.com/1", "lprice": "1000"}]
+    }
+
+
+@pytest.mark.unit
+def test_clean_title_and_normalize_query():
+    """Test title cleanup and cache-key normalization"""
+    assert clean_title("[쿠오카 공식](센텀시티점) - <b>텀블러</b> 500ml") == "텀블러 500ml"
+    assert normalize_query("  Ｔｕｍｂｌｅｒ   500ML ") == "tumbler 500ml"
+
+
+@pytest.mark.unit
+def test_search_is_cached_by_normalized_query():
+    """Test that repeated searches differing only in case/spacing hit the cache"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["query"])
+        return httpx.Response(200, json=search_payload(request.url.params["query"]))
+
+    client = make_client(handler, qps=0)
+
+    async def run():
+        first = await client.search("Tumbler 500ml")
+        second = await client.search("  tumbler   500ML")
+        await client.aclose()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert calls == ["Tumbler 500ml"]
+    assert first["items"][0]["title"] == "Tumbler 500ml" and first["cached"] is False
+    assert second["cached"] is True and second["query"] == "  tumbler   500ML"
+
+
+@pytest.mark.unit
+def test_search_many_dedupes_and_reports_per_query_errors():
+    """Test bulk search order, de-duplication, 429 retry and per-query failure"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["query"]
+        calls.append(query)
+        if query == "limited" and calls.count("limited") == 1:
+            return httpx.Response(429, text="quota")
+        if query == "broken":
+            return httpx.Response(400, text="bad query")
+        return httpx.Response(200, json=search_payload(query))
+
+    client = make_client(handler, qps=0, max_concurrency=4)
+
+    async def run():
+        results = await client.search_many(["a", "A ", "limited", "broken", "b"])
+        await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert [r["query"] for r in results] == ["a", "A ", "limited", "broken", "b"]
+    assert [r["success"] for r in results] == [True, True, True, False, True]
+    assert results[1]["result"]["query"] == "A "
+    assert results[3]["status_code"] == 400
+    assert calls.count("a") + calls.count("A ") == 1
+    assert client.stats["retries"] == 1
+
+
+@pytest.mark.unit
+def test_qps_pacer_spaces_request_starts():
+    """Test that the pacer schedules starts 1/qps apart without real sleeping"""
+    clock = [100.0]
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(round(seconds, 3))
+
+    pacer = QpsPacer(4, clock=lambda: clock[0], sleep=fake_sleep)
+
+    async def run():
+        for _ in range(4):
+            await pacer.wait()
+
+    asyncio.run(run())
+    assert slept == [0.25, 0.5, 0.75]
@@ -0,0 +1,120 @@
+"""
+NaverPay History API Collector Tests
+네이버페이 주문내역 API 수집기 테스트 (HAR 재생)
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.services.naverpay_history_api import (
+    CapturedRequest,
+    HarReplayTransport,
+    NaverPayHistoryCollector,
+    next_page_request,
+)
+from app.services.naverpay_scraper import resolve_scrape_mode
+
+
+HAR_PATH = Path(__file__).parent / "fixtures" / "naverpay_history.har"
+
+
+def _collect(collector, seed):
+    async def run():
+        return [result async for result in collector.collect(seed)]
+    return asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_har_collects_all_pages_and_details():
+    """Test pagination via captured request and concurrent detail resolution"""
+    transport = HarReplayTransport.from_file(str(HAR_PATH))
+    seed = transport.seed()
+    assert seed is not None
+
+    collector = NaverPayHistoryCollector(transport, max_concurrency=2)
+    results = _collect(collector, seed)
+
+    deliveries = {r["data"]["tracking_number"]: r["data"] for r in results if r["type"] == "delivery"}
+
+    assert set(deliveries) == {"612345678901", "6091234567890", "255512340000"}
+    assert deliveries["612345678901"]["recipient"] == "홍길동"
+    assert deliveries["612345678901"]["courier"] == "CJ대한통운"
+    assert deliveries["6091234567890"]["recipient"] == "이영희"
+    assert deliveries["255512340000"]["product_name"] == "캠핑 의자"
+
+    # 첫 페이지는 캡처된 응답을 재사용, 중복 항목은 한 번만 상세 조회
+    assert collector.stats["pages"] == 2
+    assert collector.stats["entries"] == 3
+    assert collector.stats["detail_requests"] == 2
+    assert collector.stats["failed"] == 0
+
+
+@pytest.mark.unit
+def test_detail_concurrency_is_bounded():
+    """Test that detail requests never exceed max_concurrency"""
+    transport = HarReplayTransport.from_file(str(HAR_PATH))
+    in_flight = {"current": 0, "peak": 0}
+    original_fetch = transport.fetch
+
+    async def slow_fetch(method, url, data=None, headers=None):
+        in_flight["current"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        await asyncio.sleep(0.01)
+        try:
+            return await original_fetch(method, url, data, headers)
+        finally:
+            in_flight["current"] -= 1
+
+    transport.fetch = slow_fetch
+    collector = NaverPayHistoryCollector(transport, max_concurrency=1)
+    _collect(collector, transport.seed())
+
+    assert in_flight["peak"] == 1
+
+
+@pytest.mark.unit
+def test_next_page_request_page_number():
+    """Test page-number pagination in the query string"""
+    request = CapturedRequest(method="GET", url="https://pay.naver.com/api/history/list?page=1&size=20")
+    payload = {"result": {"items": [{"productName": "상품"}], "page": 1, "totalPages": 3}}
+
+    next_request = next_page_request(request, payload)
+
+    assert next_request is not None
+    assert "page=2" in next_request.url
+    assert next_page_request(request, {"result": {"page": 3, "totalPages": 3}}) is None
+
+
+@pytest.mark.unit
+def test_entries_without_dedupe_key_are_skipped():
+    """Test that items with no order number, detail URL or product name are dropped instead of deduplicated together"""
+    seed = CapturedRequest(
+        method="GET",
+        url="https://pay.naver.com/api/history/list?page=1",
+        payload={"result": {"items": [
+            {"productName": "  ", "receiverName": "홍길동", "invoiceNo": "111"},
+            {"productName": "", "receiverName": "이영희", "invoiceNo": "222"},
+            {"productName": "텐트", "receiverName": "김철수", "invoiceNo": "333"},
+        ]}}
+    )
+    collector = NaverPayHistoryCollector(HarReplayTransport({}))
+
+    entries = asyncio.run(collector.fetch_entries(seed))
+
+    assert [e.product_name for e in entries] == ["텐트"]
+    assert collector.stats["skipped"] == 2
+
+
+@pytest.mark.unit
+def test_unknown_scrape_mode_is_rejected(client):
+    """Test that an unknown scrape mode returns 400 instead of falling back to DOM scraping"""
+    assert resolve_scrape_mode("Network") == "network"
+    with pytest.raises(ValueError):
+        resolve_scrape_mode("dmo")
+
+    response = client.post("/api/naverpay/scrape", params={"mode": "dmo"})
+    assert response.status_code == 400
+
+    response = client.get("/api/naverpay/scrape/stream", params={"mode": ""})
+    assert response.status_code == 400
@@ -0,0 +1,101 @@
+"""
+Keyset Pagination Tests
+키셋 페이지네이션 테스트
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.pagination import InvalidCursorError, count_total, keyset_page
+from app.models.issue_response import IssueResponse
+from app.models.return_log import ReturnLog
+
+
+def add_return_logs(db, count):
+    for i in range(count):
+        db.add(ReturnLog(
+            coupang_receipt_id=1000 + i,
+            coupang_order_id=f"ORDER-{i}",
+            product_name=f"상품 {i}",
+            receipt_type="RETURN",
+            receipt_status="RETURNS_UNCHECKED",
+            status="pending" if i % 2 else "completed"
+        ))
+    db.commit()
+
+
+def walk(query, sort_column, id_column, limit, descending=True):
+    """커서를 따라 끝까지 조회"""
+    ids, cursor = [], None
+    while True:
+        page, cursor = keyset_page(query, sort_column, id_column, limit, cursor=cursor, descending=descending)
+        ids.extend(row.id for row in page)
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.unit
+def test_cursor_walk_with_identical_server_timestamps(test_db):
+    """Test that rows sharing a server-default timestamp are neither skipped nor repeated"""
+    add_return_logs(test_db, 25)
+
+    query = test_db.query(ReturnLog)
+    ids = walk(query, ReturnLog.created_at, ReturnLog.id, 7)
+
+    expected = [log.id for log in query.order_by(ReturnLog.created_at.desc(), ReturnLog.id.desc())]
+    assert ids == expected
+    assert len(set(ids)) == 25
+
+    filtered = query.filter(ReturnLog.status == "pending")
+    assert walk(filtered, ReturnLog.created_at, ReturnLog.id, 4) == [
+        log.id for log in filtered.order_by(ReturnLog.created_at.desc(), ReturnLog.id.desc())
+    ]
+
+
+@pytest.mark.unit
+def test_cursor_walk_with_microseconds_and_nulls(test_db):
+    """Test ordering with sub-second timestamps and NULL sort values in both directions"""
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    stamps = [base, base, base + timedelta(microseconds=500), None, base - timedelta(days=1), None]
+    for i, stamp in enumerate(stamps):
+        issue = IssueResponse(issue_type="other", original_content=f"내용 {i}")
+        test_db.add(issue)
+        test_db.flush()
+        issue.created_at = stamp
+    test_db.commit()
+
+    query = test_db.query(IssueResponse)
+    desc_ids = walk(query, IssueResponse.created_at, IssueResponse.id, 2)
+    asc_ids = walk(query, IssueResponse.created_at, IssueResponse.id, 2, descending=False)
+
+    assert desc_ids == [3, 2, 1, 5, 6, 4]
+    assert asc_ids == [4, 6, 5, 1, 2, 3]
+
+
+@pytest.mark.unit
+def test_offset_compatibility_and_bad_cursor(test_db):
+    """Test that offset still applies without a cursor and invalid cursors are rejected"""
+    add_return_logs(test_db, 10)
+    query = test_db.query(ReturnLog)
+
+    page, cursor = keyset_page(query, ReturnLog.created_at, ReturnLog.id, 3, offset=8)
+    assert [log.id for log in page] == [2, 1]
+    assert cursor is None
+
+    with pytest.raises(InvalidCursorError):
+        keyset_page(query, ReturnLog.created_at, ReturnLog.id, 3, cursor="not-a-cursor")
+
+
+@pytest.mark.unit
+def test_count_modes(test_db):
+    """Test exact, cached and skipped total counts"""
+    add_return_logs(test_db, 4)
+    query = test_db.query(ReturnLog).filter(ReturnLog.status == "pending")
+
+    assert count_total(query, "exact") == 2
+    assert count_total(query, "cached") == 2
+    assert count_total(query, "none") is None
+
+    add_return_logs(test_db, 2)
+    assert count_total(query, "exact") == 3
+    assert count_total(query, "cached") == 2  # TTL 동안 재사용
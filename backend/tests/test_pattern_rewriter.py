@@ -0,0 +1,97 @@
+"""
+Learned Pattern Rewriter Tests
+학습 패턴 일괄 치환기 테스트
+"""
+import pytest
+from sqlalchemy import event
+
+from app.models import LearningPattern
+from app.services.learning import LearningService
+from app.services.pattern_rewriter import get_pattern_rewriter
+
+
+def add_pattern(db, before, after, category=None, confidence=0.8, success_rate=0.0, is_active=True):
+    pattern = LearningPattern(
+        pattern_type="phrase_replacement",
+        category=category,
+        before_pattern=before,
+        after_pattern=after,
+        confidence_score=confidence,
+        success_rate=success_rate,
+        is_active=is_active
+    )
+    db.add(pattern)
+    db.commit()
+    return pattern
+
+
+@pytest.mark.unit
+def test_rewriter_applies_longest_non_overlapping_matches(test_db):
+    """Test that the compiled rewriter prefers the longest match, category patterns and skips inactive ones"""
+    add_pattern(test_db, "확인", "검토")
+    add_pattern(test_db, "확인하겠습니다", "확인 후 안내드리겠습니다")
+    add_pattern(test_db, "고객님", "고객님께서", category="refund")
+    add_pattern(test_db, "고객님", "회원님", success_rate=0.9)
+    add_pattern(test_db, "죄송", "송구", confidence=0.3)
+    add_pattern(test_db, "감사", "고맙", is_active=False)
+
+    service = LearningService(test_db)
+    text = "고객님, 확인하겠습니다. 재확인 부탁드립니다. 죄송합니다. 감사합니다."
+
+    assert service.apply_learned_patterns(text, "refund") == (
+        "고객님께서, 확인 후 안내드리겠습니다. 재검토 부탁드립니다. 죄송합니다. 감사합니다."
+    )
+    assert service.apply_learned_patterns(text, "shipping").startswith("회원님, 확인 후 안내드리겠습니다.")
+    get_pattern_rewriter(test_db).flush_usage(test_db)
+
+
+@pytest.mark.unit
+def test_rewriter_caches_compiled_patterns_until_they_change(test_db):
+    """Test that patterns are loaded once and recompiled only after a pattern change is committed"""
+    add_pattern(test_db, "빠르게", "신속하게")
+    service = LearningService(test_db)
+    statements = []
+    engine = test_db.get_bind()
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        assert service.apply_learned_patterns("빠르게 처리") == "신속하게 처리"
+        loaded = len(statements)
+        for _ in range(20):
+            service.apply_learned_patterns("빠르게 처리")
+        assert len(statements) == loaded
+
+        add_pattern(test_db, "처리", "처리해 드리겠습니다")
+        assert service.apply_learned_patterns("빠르게 처리") == "신속하게 처리해 드리겠습니다"
+    finally:
+        get_pattern_rewriter(test_db).flush_usage(test_db)
+        event.remove(engine, "before_cursor_execute", count)
+
+
+@pytest.mark.unit
+def test_rewriter_records_usage_in_batches(test_db, monkeypatch):
+    """Test that times_applied is updated with one batched write once the flush threshold is reached"""
+    monkeypatch.setattr("app.services.pattern_rewriter.settings.LEARNING_USAGE_FLUSH_BATCH", 5)
+    first = add_pattern(test_db, "문의", "질문")
+    second = add_pattern(test_db, "답변", "안내")
+    service = LearningService(test_db)
+
+    service.apply_learned_patterns("문의 답변 문의")
+    test_db.refresh(first)
+    assert first.times_applied == 0
+    assert get_pattern_rewriter(test_db).pending_usage == 3
+
+    service.apply_learned_patterns("문의 답변")
+    test_db.refresh(first)
+    test_db.refresh(second)
+    assert (first.times_applied, second.times_applied) == (3, 2)
+    assert get_pattern_rewriter(test_db).pending_usage == 0
+
+    service.apply_learned_patterns("답변")
+    insights = service.get_learning_insights()
+    assert insights["total_feedbacks"] == 0
+    test_db.refresh(second)
+    assert second.times_applied == 3
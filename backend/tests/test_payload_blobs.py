@@ -0,0 +1,207 @@
+"""
+Payload Blob Tests
+원본 페이로드 압축 보관 테스트
+"""
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import migrate_payload_blobs
+from app.database import Base
+from app.models import PayloadBlob, ReturnLog
+from app.models.issue_response import IssueResponse
+from app.models.payload_blob import delete_orphan_blobs, reference_columns
+
+
+def make_return_log(receipt_id: int, raw_data=None) -> ReturnLog:
+    return ReturnLog(
+        coupang_receipt_id=receipt_id,
+        coupang_order_id=f"order-{receipt_id}",
+        product_name="상품",
+        receipt_type="RETURN",
+        receipt_status="RETURNS_UNCHECKED",
+        raw_data=raw_data
+    )
+
+
+def payload(receipt_id: int) -> dict:
+    return {"receiptId": receipt_id, "returnItems": [{"vendorItemName": "반품 상품 " * 40}]}
+
+
+@pytest.mark.unit
+def test_payloads_are_compressed_and_deduplicated(test_db):
+    """Test that identical payloads share one compressed blob and rows only keep the digest"""
+    first = make_return_log(1, payload(1))
+    second = make_return_log(2, dict(reversed(list(payload(1).items()))))  # 키 순서만 다름
+    test_db.add_all([first, second, make_return_log(3)])
+    test_db.commit()
+
+    blobs = test_db.query(PayloadBlob).all()
+    assert len(blobs) == 1
+    assert blobs[0].codec in ("gzip", "zstd")
+    assert len(blobs[0].data) < blobs[0].raw_size
+    assert first.raw_data_ref == second.raw_data_ref == blobs[0].digest
+
+    test_db.expire_all()
+    assert test_db.get(ReturnLog, first.id).raw_data == payload(1)
+    assert test_db.query(ReturnLog).filter(ReturnLog.coupang_receipt_id == 3).one().raw_data is None
+
+    # 같은 내용을 다시 넣으면 행이 바뀌지 않음
+    first.raw_data = payload(1)
+    assert first not in test_db.dirty
+
+
+@pytest.mark.unit
+def test_payloads_load_lazily_on_detail_access(test_db):
+    """Test that list queries do not read payload blobs until the archived attribute is accessed"""
+    for i in range(5):
+        test_db.add(IssueResponse(issue_type="reseller", original_content=f"신고 {i}", ai_analysis={"summary": f"요약 {i}"}))
+    test_db.commit()
+    test_db.expire_all()
+
+    statements = []
+    engine = test_db.get_bind()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        rows = [issue.to_dict(include_payload=False) for issue in test_db.query(IssueResponse).all()]
+        assert len(rows) == 5 and "ai_analysis" not in rows[0]
+        assert not any("payload_blobs" in s for s in statements)
+
+        issue = test_db.query(IssueResponse).filter(IssueResponse.original_content == "신고 3").one()
+        assert issue.to_dict()["ai_analysis"] == {"summary": "요약 3"}
+        assert sum("payload_blobs" in s for s in statements) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.mark.unit
+def test_migration_moves_inline_json_to_blobs(tmp_path, monkeypatch):
+    """Test that the migration moves existing inline JSON into payload blobs and clears the hot column"""
+    db_path = tmp_path / "coupang_cs.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine, tables=[ReturnLog.__table__])
+    engine.dispose()
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("ALTER TABLE return_logs ADD COLUMN raw_data JSON")
+    for receipt_id in (1, 2, 3):
+        conn.execute(
+            "INSERT INTO return_logs (coupang_receipt_id, coupang_order_id, product_name, receipt_type, "
+            "receipt_status, status, raw_data) VALUES (?, 'o', '상품', 'RETURN', 'RETURNS_UNCHECKED', 'pending', ?)",
+            (receipt_id, json.dumps(payload(1 if receipt_id < 3 else 3), ensure_ascii=False))
+        )
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(migrate_payload_blobs, "DATABASE_PATH", str(db_path))
+    migrate_payload_blobs.migrate()
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM return_logs WHERE raw_data IS NOT NULL").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM payload_blobs").fetchone()[0] == 2
+    conn.close()
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    db = sessionmaker(bind=engine)()
+    try:
+        logs = db.query(ReturnLog).order_by(ReturnLog.coupang_receipt_id).all()
+        assert [log.raw_data for log in logs] == [payload(1), payload(1), payload(3)]
+    finally:
+        db.close()
+        engine.dispose()
+
+
+@pytest.mark.unit
+def test_concurrent_sessions_writing_same_payload_both_commit(tmp_path):
+    """Test that a blob committed by another session just before this session writes its blobs is not a conflict"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'race.db'}", connect_args={"timeout": 5})
+    Base.metadata.create_all(bind=engine, tables=[ReturnLog.__table__, PayloadBlob.__table__])
+    factory = sessionmaker(bind=engine)
+    shared = {"saved": 0, "updated": 0}
+    other = factory()
+    fired = []
+
+    def commit_other_first(conn, cursor, statement, parameters, context, executemany):
+        # 첫 세션이 blob을 기록하기 직전(쓰기 잠금을 잡기 전)에 다른 세션이 같은 blob을 커밋
+        if "payload_blobs" in statement and not fired:
+            fired.append(True)
+            other.add(make_return_log(2, shared))
+            other.commit()
+
+    first = factory()
+    event.listen(engine, "before_cursor_execute", commit_other_first)
+    try:
+        first.add(make_return_log(1, shared))
+        first.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", commit_other_first)
+
+    assert fired
+    check = factory()
+    try:
+        assert check.query(ReturnLog).count() == 2
+        assert check.query(PayloadBlob).count() == 1
+        assert [log.raw_data for log in check.query(ReturnLog)] == [shared, shared]
+    finally:
+        for session in (first, other, check):
+            session.close()
+        engine.dispose()
+
+
+@pytest.mark.unit
+def test_orphaned_blobs_are_cleaned_up(test_db):
+    """Test that blobs replaced on re-sync are deleted once unreferenced, while shared and recent ones stay"""
+    first = make_return_log(1, payload(1))
+    second = make_return_log(2, payload(2))
+    third = make_return_log(3, payload(2))
+    test_db.add_all([first, second, third])
+    test_db.commit()
+    old_digest = first.raw_data_ref
+
+    first.raw_data = payload(10)  # 동기화로 원본이 바뀜 → 이전 blob은 참조 없음
+    second.raw_data = payload(20)  # payload(2) blob은 third가 계속 참조
+    test_db.commit()
+
+    assert delete_orphan_blobs(test_db) == 0  # 유예 기간 안
+    assert delete_orphan_blobs(test_db, grace_period=timedelta(0)) == 1
+    test_db.commit()
+
+    remaining = {blob.digest for blob in test_db.query(PayloadBlob)}
+    assert old_digest not in remaining
+    assert remaining == {first.raw_data_ref, second.raw_data_ref, third.raw_data_ref}
+    assert {column.class_.__tablename__ for column in reference_columns()} == {
+        "return_logs", "auto_return_execution_logs", "issue_responses", "naver_delivery_info"
+    }
+
+
+@pytest.mark.unit
+def test_rereferenced_blob_is_not_cleaned_up(test_db):
+    """Test that re-referencing an existing blob refreshes its timestamp so a concurrent cleanup keeps it"""
+    log = make_return_log(1, payload(1))
+    test_db.add(log)
+    test_db.commit()
+    digest = log.raw_data_ref
+
+    log.raw_data = payload(2)
+    test_db.commit()
+    test_db.query(PayloadBlob).update({PayloadBlob.created_at: datetime.utcnow() - timedelta(days=2)})
+    test_db.commit()
+
+    log.raw_data = payload(1)  # 정리 전에 예전 값으로 되돌아옴
+    test_db.commit()
+    test_db.expire_all()
+    assert test_db.get(PayloadBlob, digest).created_at > datetime.utcnow() - timedelta(hours=1)
+
+    assert delete_orphan_blobs(test_db) == 1  # 참조가 끊긴 payload(2) blob만 삭제
+    test_db.commit()
+    assert test_db.get(PayloadBlob, digest) is not None
+    test_db.expire_all()
+    assert test_db.get(ReturnLog, log.id).raw_data == payload(1)
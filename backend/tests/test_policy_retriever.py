@@ -0,0 +1,92 @@
+"""
+Policy Retriever Tests
+정책/FAQ/가이드 컨텍스트 검색 테스트
+"""
+import json
+import os
+import time
+
+import pytest
+
+from app.models.issue_response import IssueResponse
+from app.services.issue_response_service import IssueResponseService
+from app.services.policy_retriever import PolicyRetriever
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def knowledge_dirs(tmp_path):
+    policy_dir = tmp_path / "policies"
+    faq_dir = tmp_path / "faq"
+    policy_dir.mkdir()
+    faq_dir.mkdir()
+    write_json(policy_dir / "refund_policy.json", {
+        "title": "환불 정책",
+        "sections": {
+            "refund_period": {"title": "환불 가능 기간", "content": "상품 수령 후 7일 이내 환불 요청 가능합니다."},
+            "refund_amount": {"title": "환불 금액", "deductions": ["고객 변심: 왕복 배송비 차감"] * 40}
+        }
+    })
+    write_json(policy_dir / "shipping_policy.json", {
+        "title": "배송 정책",
+        "sections": {
+            "address_change": {"title": "배송지 변경", "content": "발송 전까지 배송지 변경이 가능합니다."}
+        }
+    })
+    write_json(faq_dir / "common_qa.json", {"faqs": [
+        {"category": "stock", "question": "재고가 있나요?", "answer": "상품 페이지에서 확인 가능합니다.", "keywords": ["재고", "품절"]}
+    ]})
+    return {"policy": policy_dir, "faq": faq_dir}
+
+
+@pytest.mark.unit
+def test_retriever_ranks_relevant_chunks_within_budget(knowledge_dirs):
+    """Test that only relevant chunks are assembled and oversized chunks are skipped by the token budget"""
+    retriever = PolicyRetriever(knowledge_dirs)
+
+    context = retriever.build_context("환불은 며칠 이내에 가능한가요", prefer={"category": "refund"}, budget_tokens=100)
+
+    assert context.startswith("[환불 정책 - 환불 가능 기간]")
+    assert "환불 금액" not in context  # preferred, but larger than the budget
+    assert "재고" not in context and "배송지" not in context
+
+    results = retriever.search("품절 상품 재고 문의")
+    assert results[0][1].title == "FAQ: 재고가 있나요?"
+
+
+@pytest.mark.unit
+def test_retriever_rebuilds_index_when_files_change(knowledge_dirs):
+    """Test that the index is rebuilt after a knowledge file is modified"""
+    retriever = PolicyRetriever(knowledge_dirs)
+    assert retriever.search("교환 신청") == []
+
+    path = knowledge_dirs["policy"] / "exchange_policy.json"
+    write_json(path, {"title": "교환 정책", "sections": {"period": {"title": "교환 신청", "content": "7일 이내"}}})
+    future = time.time() + 10
+    os.utime(path, (future, future))
+
+    assert [chunk.title for _, chunk in retriever.search("교환 신청")] == ["교환 정책 - 교환 신청"]
+
+
+@pytest.mark.unit
+def test_guide_context_is_limited_to_issue_guide_and_subtype(test_db):
+    """Test that the issue guide context only includes chunks of the issue's guide, led by its subtype"""
+    issue = IssueResponse(
+        issue_type="reseller",
+        issue_subtype="parallel_import_dispute",
+        original_content="병행수입 상품에 대한 판매 중단 신고가 접수되었습니다"
+    )
+    test_db.add(issue)
+    test_db.commit()
+
+    service = IssueResponseService(test_db)
+    guide = service.get_guide("reseller")
+    context = service._build_guide_context(guide, issue.issue_subtype, "appeal", service._issue_query(issue))
+
+    assert context.startswith(f"[가이드라인: {guide['title']}]")
+    assert "[필요 서류 (병행수입 분쟁)]" in context
+    assert "상표권" not in context  # ip_infringement 가이드 내용 제외
+    assert "수입 신고필증" in service._extract_suggestions("", context)
@@ -0,0 +1,103 @@
+"""
+Product Catalog Mirror Tests
+상품 카탈로그 미러 테스트
+"""
+import pytest
+
+from app.services.product_catalog import ProductCatalog
+
+
+class FakeCatalogClient:
+    """2페이지 상품 목록과 상세를 돌려주는 가짜 클라이언트"""
+
+    def __init__(self):
+        self.pages = {
+            None: {"code": "SUCCESS", "nextToken": "2", "data": [
+                {"sellerProductId": 1, "sellerProductName": "무선 충전기", "createdAt": "2024-05-01T10:00:00", "statusName": "승인완료"},
+                {"sellerProductId": 2, "sellerProductName": "텀블러", "createdAt": "2024-05-02T09:00:00", "statusName": "승인완료"},
+            ]},
+            2: {"code": "SUCCESS", "nextToken": "", "data": [
+                {"sellerProductId": 3, "sellerProductName": "캠핑 의자", "createdAt": "2024-05-02T11:00:00", "statusName": "승인완료"},
+            ]},
+        }
+        self.denied = [
+            {"sellerProductId": 4, "sellerProductName": "반려 상품", "createdAt": "2024-05-02T12:00:00", "statusName": "승인반려"},
+        ]
+        self.detail_calls = []
+        self.date_calls = []
+
+    def get_all_products(self, status="APPROVED", max_per_page=100, next_token=None):
+        return self.pages[next_token]
+
+    def get_all_products_by_date(self, created_at, status="APPROVED"):
+        self.date_calls.append(created_at)
+        products = self.denied if status == "DENIED" else [p for page in self.pages.values() for p in page["data"]]
+        return [p for p in products if p["createdAt"].startswith(created_at)]
+
+    def get_product_detail(self, seller_product_id):
+        self.detail_calls.append(seller_product_id)
+        return {"code": "SUCCESS", "data": {"items": [
+            {"vendorItemId": seller_product_id * 100 + n, "itemName": f"옵션{n}"} for n in range(2)
+        ]}}
+
+
+@pytest.mark.unit
+def test_second_sync_makes_no_detail_calls(test_db):
+    """Test incremental sync: an unchanged catalog needs no detail requests"""
+    client = FakeCatalogClient()
+    catalog = ProductCatalog(test_db, coupang_account_id=1, client=client)
+
+    result = catalog.sync_all()
+    assert result["completed"] is True
+    assert sorted(client.detail_calls) == [1, 2, 3]
+
+    client.detail_calls.clear()
+    catalog.sync_all()
+    assert client.detail_calls == []
+
+    assert catalog.vendor_item_ids_many([1, 3]) == {1: [100, 101], 3: [300, 301]}
+    assert client.detail_calls == []
+
+
+@pytest.mark.unit
+def test_lazy_lookup_and_reverse_index(test_db):
+    """Test lazy detail fetch for unknown products and vendorItemId reverse lookup"""
+    client = FakeCatalogClient()
+    catalog = ProductCatalog(test_db, coupang_account_id=1, client=client)
+    catalog.upsert_products(client.pages[None]["data"])
+
+    assert catalog.vendor_item_ids(2) == [200, 201]
+    assert catalog.vendor_item_ids(2) == [200, 201]
+    assert client.detail_calls == [2]
+
+    found = ProductCatalog.lookup_vendor_items(test_db, ["201", 999])
+    assert found == {201: {"seller_product_id": 2, "seller_product_name": "텀블러", "item_name": "옵션1"}}
+
+
+@pytest.mark.unit
+def test_date_listing_served_from_mirror(test_db):
+    """Test that a recently listed date is answered from the mirror"""
+    client = FakeCatalogClient()
+    catalog = ProductCatalog(test_db, coupang_account_id=1, client=client)
+
+    first = catalog.list_products_created_on("2024-05-02")
+    second = catalog.list_products_created_on("2024-05-02")
+
+    assert [p["sellerProductId"] for p in first] == [2, 3]
+    assert second == first
+    assert client.date_calls == ["2024-05-02"]
+
+
+@pytest.mark.unit
+def test_date_listing_is_scoped_by_status(test_db):
+    """Test that a date listed for one status is not served for another status"""
+    client = FakeCatalogClient()
+    catalog = ProductCatalog(test_db, coupang_account_id=1, client=client)
+
+    approved = catalog.list_products_created_on("2024-05-02")
+    denied = catalog.list_products_created_on("2024-05-02", status="DENIED")
+
+    assert [p["sellerProductId"] for p in approved] == [2, 3]
+    assert [p["sellerProductId"] for p in denied] == [4]
+    assert client.date_calls == ["2024-05-02", "2024-05-02"]
+    assert [p["sellerProductId"] for p in catalog.list_products_created_on("2024-05-02")] == [2, 3]
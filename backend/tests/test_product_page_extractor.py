@@ -0,0 +1,145 @@
+"""
+Product Page Extractor Tests
+상품 페이지 추출기 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.cache import get_cache
+from app.services.product_page_extractor import (
+    CACHE_TAG,
+    SITE_RULES,
+    ProductPageExtractor,
+    SiteRule,
+    canonical_url,
+    match_site,
+    register_site,
+)
+
+HEAD = (
+    b"<html><head><meta charset='utf-8'><title>ignored</title>"
+    b"<meta property=\"og:title\" content=\"[\xea\xb3\xb5\xec\x8b\x9d] Tumbler &amp; Lid - 11\xeb\xb2\x88\xea\xb0\x80\">"
+    b"<meta content='/img/tumbler.jpg' property='og:image'></head>"
+)
+BODY = b"<body>" + b"<p>review</p>" * 2000 + b"</body></html>"
+
+
+def chunked_transport(pages, pulled):
+    """페이지를 1KB 청크로 스트리밍하고 읽힌 청크 수를 기록"""
+    async def stream(url, body):
+        for i in range(0, len(body), 1024):
+            pulled[url] = pulled.get(url, 0) + 1
+            yield body[i:i + 1024]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        return httpx.Response(200, headers={"Content-Type": "text/html"}, content=stream(url, pages[url]))
+
+    return httpx.MockTransport(handler)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.unit
+def test_head_only_extraction_stops_reading_early():
+    """Test that og meta tags are read from the head without downloading the body"""
+    get_cache().invalidate_tag(CACHE_TAG)
+    url = "https://www.11st.co.kr/products/1"
+    pulled = {}
+    extractor = ProductPageExtractor(transport=chunked_transport({url: HEAD + BODY}, pulled))
+
+    async def go():
+        page = await extractor.extract(url)
+        await extractor.aclose()
+        return page
+
+    page = run(go())
+    assert page.source == "11번가"
+    assert page.product_name == "Tumbler & Lid"
+    assert page.image_url == "https://www.11st.co.kr/img/tumbler.jpg"
+    assert pulled[url] == 1
+    assert extractor.stats["head_only"] == 1
+
+
+@pytest.mark.unit
+def test_body_selectors_used_when_head_lacks_meta():
+    """Test the site selector fallback when og tags are missing"""
+    get_cache().invalidate_tag(CACHE_TAG)
+    url = "https://item.gmarket.co.kr/Item?goodscode=1"
+    html = (
+        "<html><head><meta charset='euc-kr'><title>G마켓</title></head>"
+        "<body><h1 class='itemtit'>[농협] 유기농 현미 10kg</h1></body></html>"
+    ).encode("euc-kr")
+    extractor = ProductPageExtractor(transport=chunked_transport({url: html}, {}))
+
+    async def go():
+        page = await extractor.extract(url)
+        await extractor.aclose()
+        return page
+
+    page = run(go())
+    assert page.source == "G마켓"
+    assert page.product_name == "유기농 현미 10kg"
+    assert extractor.stats["full_body"] == 1
+
+
+@pytest.mark.unit
+def test_batch_uses_canonical_url_cache():
+    """Test that tracking parameters and fragments share one cached fetch"""
+    get_cache().invalidate_tag(CACHE_TAG)
+    base = "https://www.coupang.com/vp/products/9?itemId=1"
+    urls = [base, "https://WWW.coupang.com/vp/products/9?utm_source=x&itemId=1#review"]
+    assert canonical_url(urls[0]) == canonical_url(urls[1])
+
+    pages = {u: HEAD + BODY for u in urls}
+    pulled = {}
+    extractor = ProductPageExtractor(max_concurrency=1, transport=chunked_transport(pages, pulled))
+
+    async def go():
+        results = await extractor.extract_many(urls + [base])
+        await extractor.aclose()
+        return results
+
+    results = run(go())
+    assert [url for url, _ in results] == urls + [base]
+    assert all(page.product_name == "Tumbler & Lid" for _, page in results)
+    assert extractor.stats["fetches"] == 1 and extractor.stats["cache_hits"] == 1
+
+
+@pytest.mark.unit
+def test_site_registry():
+    """Test rule lookup order and registering a new site"""
+    assert match_site("smartstore.naver.com").source == "네이버스마트스토어"
+    assert match_site("search.shopping.naver.com").source == "네이버스마트스토어"
+    assert match_site("m.naver.com").source == "네이버쇼핑"
+    assert match_site("example.com").source is None
+
+    rule = SiteRule("무신사", ("musinsa.com",), name_selectors=("h2.product_title",))
+    register_site(rule)
+    try:
+        assert match_site("www.musinsa.com") is rule
+    finally:
+        SITE_RULES.remove(rule)
+
+
+@pytest.mark.unit
+def test_smartstore_source_names_match_previous_responses(client, monkeypatch):
+    """Test that product-name keeps "네이버쇼핑" and product-image keeps "네이버스마트스토어" for smartstore URLs"""
+    from app.routers import naver_shopping
+    from app.services.product_page_extractor import PageMetadata
+
+    class StubExtractor:
+        async def extract(self, url):
+            return PageMetadata("네이버스마트스토어", product_name="텀블러", image_url="https://img.test/1.jpg")
+
+    monkeypatch.setattr(naver_shopping, "get_product_page_extractor", lambda: StubExtractor())
+    url = "https://smartstore.naver.com/shop/products/1"
+
+    name = client.get("/api/naver-shopping/extract-product-name", params={"url": url}).json()
+    image = client.get("/api/naver-shopping/extract-product-image", params={"url": url}).json()
+    assert name["source"] == "네이버쇼핑"
+    assert image["source"] == "네이버스마트스토어"
@@ -0,0 +1,85 @@
+"""
+Query Profiler Tests
+쿼리 프로파일러 테스트
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.core.query_profiler import QueryProfiler, extract_columns, fingerprint
+from app.models.return_log import ReturnLog
+
+
+@pytest.fixture
+def profiler(test_db):
+    profiler = QueryProfiler(threshold_ms=0, top_n=10).install(test_db.get_bind())
+    yield profiler
+    profiler.uninstall()
+
+
+@pytest.mark.unit
+def test_fingerprint_normalizes_literals_and_in_lists():
+    """Test that statements differing only in literals share a fingerprint"""
+    a = fingerprint("SELECT * FROM inquiries WHERE status = 'pending' AND id IN (?, ?, ?)")
+    b = fingerprint("SELECT *  FROM inquiries\n WHERE status = 'done' AND id IN (?)")
+    assert a == b == "SELECT * FROM inquiries WHERE status = ? AND id IN (...)"
+
+
+@pytest.mark.unit
+def test_full_scan_is_flagged_and_index_recommended(test_db, profiler):
+    """Test EXPLAIN capture, full-scan flag and a composite index proposal"""
+    test_db.query(ReturnLog).filter(
+        ReturnLog.receipt_type == "RETURN",
+        ReturnLog.coupang_created_at >= datetime(2024, 1, 1)
+    ).all()
+
+    slow = [q for q in profiler.slow_queries() if "FROM return_logs" in q["fingerprint"]]
+    assert slow and slow[0]["full_scans"] == ["return_logs"]
+    assert slow[0]["watched_full_scans"] == ["return_logs"]
+    assert slow[0]["plan"]
+
+    recommendations = profiler.recommend_indexes()
+    assert recommendations[0]["columns"] == ["receipt_type", "coupang_created_at"]
+    assert recommendations[0]["watched"] is True
+
+    # 추천 인덱스를 만들면 더 이상 추천하지 않음
+    test_db.execute(text(recommendations[0]["sql"]))
+    test_db.commit()
+    assert profiler.recommend_indexes() == []
+
+
+@pytest.mark.unit
+def test_slow_table_is_bounded():
+    """Test that only the slowest top-N fingerprints are kept"""
+    profiler = QueryProfiler(threshold_ms=0, top_n=3, explain=False)
+    for i in range(6):
+        profiler.record_slow(f"SELECT * FROM table_{chr(97 + i)}", (), elapsed_ms=i * 10)
+
+    kept = [q["fingerprint"] for q in profiler.slow_queries()]
+    assert kept == ["SELECT * FROM table_f", "SELECT * FROM table_e", "SELECT * FROM table_d"]
+    assert profiler.summary()["slow_statements"] == 6
+
+
+@pytest.mark.unit
+def test_slow_query_report_keeps_only_parameter_types():
+    """Test that bind values such as customer names never reach the slow-query report"""
+    profiler = QueryProfiler(threshold_ms=0, explain=False)
+    profiler.record_slow("SELECT * FROM return_logs WHERE receiver_name = ? AND id = ?", ("홍길동", 7), elapsed_ms=5)
+    profiler.record_slow("INSERT INTO inquiries (customer_name, phone) VALUES (?, ?)",
+                         [("김철수", "010-1234-5678"), ("이영희", None)], elapsed_ms=5, executemany=True)
+
+    report = {q["fingerprint"].split()[0]: q for q in profiler.slow_queries()}
+    assert report["SELECT"]["parameter_types"] == "(str, int)"
+    assert report["INSERT"]["parameter_types"] == "2 x (str, str)"
+    assert "홍길동" not in str(report) and "010-1234-5678" not in str(report)
+
+
+@pytest.mark.unit
+def test_extract_columns():
+    """Test classification of equality, range and order columns"""
+    columns = extract_columns(
+        "SELECT inquiries.id FROM inquiries WHERE inquiries.status = ? AND inquiries.created_at >= ? "
+        "ORDER BY inquiries.created_at DESC LIMIT ?"
+    )
+    assert columns == {"inquiries": {"equality": ["status"], "range": ["created_at"], "order": ["created_at"]}}
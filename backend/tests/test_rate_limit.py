@@ -0,0 +1,255 @@
+"""
+GCRA Rate Limiter Tests
+GCRA 요청 제한기 테스트
+"""
+import pytest
+
+from app.middleware.rate_limit import BULK_POLICY, DEFAULT_ROUTE_POLICIES, RateLimiter
+from app.middleware.rate_limit_store import (
+    InMemoryRateLimitStore,
+    RedisRateLimitStore,
+    SQLiteRateLimitStore,
+    create_rate_limit_store,
+)
+
+
+@pytest.mark.unit
+def test_burst_then_exact_retry_after():
+    """Test that the full minute burst is allowed and the denial reports when a slot frees up"""
+    limiter = RateLimiter(requests_per_minute=6, requests_per_hour=1000, requests_per_day=10000)
+    now = 1_000_000.0
+
+    results = [limiter.is_allowed("ip:1", now=now) for _ in range(6)]
+    assert all(allowed for allowed, _ in results)
+    assert [info["remaining_minute"] for _, info in results] == [5, 4, 3, 2, 1, 0]
+
+    allowed, info = limiter.is_allowed("ip:1", now=now)
+    assert allowed is False
+    assert info["reason"] == "rate_limit_minute"
+    assert info["retry_after_seconds"] == 10  # 60초 / 6회
+
+    assert limiter.is_allowed("ip:1", now=now + 10)[0] is True
+    assert limiter.is_allowed("ip:2", now=now)[0] is True
+
+
+@pytest.mark.unit
+def test_burst_allows_full_limit_despite_float_rounding():
+    """Test that a limit whose interval is not exact (7 per minute) still admits the full burst"""
+    limiter = RateLimiter(requests_per_minute=7, requests_per_hour=1000, requests_per_day=10000)
+    now = 1_000_000.0
+
+    results = [limiter.is_allowed("ip:1", now=now)[0] for _ in range(8)]
+    assert results == [True] * 7 + [False]
+
+
+@pytest.mark.unit
+def test_windows_are_all_or_nothing():
+    """Test that a request denied by the hour window does not consume minute capacity"""
+    limiter = RateLimiter(requests_per_minute=10, requests_per_hour=3, requests_per_day=10000)
+    now = 1_000_000.0
+
+    for _ in range(3):
+        assert limiter.is_allowed("ip:1", now=now)[0] is True
+    before = limiter.store.peek(limiter._windows("ip:1", limiter.default_policy), now=now)
+
+    allowed, info = limiter.is_allowed("ip:1", now=now)
+    assert allowed is False
+    assert info["reason"] == "rate_limit_hour"
+    assert limiter.store.peek(limiter._windows("ip:1", limiter.default_policy), now=now) == before
+
+
+@pytest.mark.unit
+def test_route_policies():
+    """Test that bulk endpoints get the strict policy and other paths the default"""
+    limiter = RateLimiter(route_policies=DEFAULT_ROUTE_POLICIES)
+
+    assert limiter.policy_for("/api/promotion/sync/3/bulk-apply") is BULK_POLICY
+    assert limiter.policy_for("/api/responses/submit-bulk") is BULK_POLICY
+    assert limiter.policy_for("/api/special-form/batch") is BULK_POLICY
+    assert limiter.policy_for("/api/automation/stats").name == "polling"
+    assert limiter.policy_for("/api/batch/jobs").name == "default"
+
+    # 경로 세그먼트 경계
+    assert limiter.policy_for("/api/coupons/bulk") is BULK_POLICY
+    assert limiter.policy_for("/api/naver-shopping/search/bulk") is BULK_POLICY
+    assert limiter.policy_for("/api/naver").name == "polling"
+    assert limiter.policy_for("/api/naver/products").name == "polling"
+    assert limiter.policy_for("/api/naver-accounts/1").name == "polling"
+    assert limiter.policy_for("/api/returns/list").name == "polling"
+    # 기존 "/api/naver" 접두사 제외 범위 유지 (naverpay, naver-shopping 등)
+    assert limiter.policy_for("/api/naverpay/deliveries").name == "polling"
+    assert limiter.policy_for("/api/naver-shopping/search").name == "polling"
+    assert limiter.policy_for("/api/naver-review/reviews").name == "polling"
+    assert limiter.policy_for("/api/accounts-export").name == "default"
+    assert limiter.policy_for("/api/returns/list-export").name == "default"
+
+    # 정책별로 카운터가 분리됨
+    now = 1_000_000.0
+    for _ in range(BULK_POLICY.requests_per_minute):
+        assert limiter.is_allowed("ip:1", "/api/responses/submit-bulk", now=now)[0] is True
+    assert limiter.is_allowed("ip:1", "/api/responses/submit-bulk", now=now)[0] is False
+    assert limiter.is_allowed("ip:1", "/api/inquiries/list", now=now)[0] is True
+
+
+@pytest.mark.unit
+def test_memory_store_drops_idle_clients():
+    """Test that per-client state stays bounded once clients go idle"""
+    store = InMemoryRateLimitStore()
+    limiter = RateLimiter(store=store)
+    now = 1_000_000.0
+
+    for i in range(100):
+        limiter.is_allowed(f"ip:{i}", now=now)
+    assert len(store) == 300  # 클라이언트당 윈도우 3개
+
+    store.SWEEP_EVERY = 1
+    limiter.is_allowed("ip:new", now=now + 86400)
+    assert len(store) == 3
+
+
+@pytest.mark.unit
+def test_sqlite_store_is_shared_between_workers(tmp_path):
+    """Test that two limiters on the same SQLite file share one budget"""
+    path = str(tmp_path / "rate_limits.db")
+    worker_a = RateLimiter(requests_per_minute=4, store=SQLiteRateLimitStore(path))
+    worker_b = RateLimiter(requests_per_minute=4, store=SQLiteRateLimitStore(path))
+    now = 1_000_000.0
+
+    assert worker_a.is_allowed("ip:1", now=now)[0] is True
+    assert worker_b.is_allowed("ip:1", now=now)[0] is True
+    assert worker_a.is_allowed("ip:1", now=now)[0] is True
+    assert worker_b.is_allowed("ip:1", now=now)[0] is True
+    assert worker_a.is_allowed("ip:1", now=now)[0] is False
+
+
+@pytest.mark.unit
+def test_sqlite_store_lock_fails_open(tmp_path):
+    """Test that a locked SQLite store lets the request through instead of returning 500"""
+    import sqlite3
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.middleware.rate_limit import RateLimitMiddleware
+
+    path = str(tmp_path / "rate_limits.db")
+    store = SQLiteRateLimitStore(path, timeout=0.1)
+
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, store=store)
+
+    @app.get("/api/inquiries/list")
+    def inquiries():
+        return {"ok": True}
+
+    locker = sqlite3.connect(path, isolation_level=None)
+    locker.execute("BEGIN IMMEDIATE")
+    try:
+        response = TestClient(app).get("/api/inquiries/list")
+    finally:
+        locker.execute("ROLLBACK")
+        locker.close()
+
+    assert response.status_code == 200
+    assert "X-RateLimit-Policy" not in response.headers
+
+
+class RedisStandIn:
+    """redis-py 클라이언트의 요청 제한 저장소 사용 부분만 구현한 로컬 대역 (Lua는 lupa로 실행)"""
+
+    def __init__(self):
+        self.data = {}
+        self.px = {}
+        self.fail = False
+
+    def register_script(self, source):
+        lupa = pytest.importorskip("lupa")
+        runtime = lupa.LuaRuntime()
+        function = runtime.eval(f"function(KEYS, ARGV, redis) {source} end")
+        redis_api = runtime.table_from({"call": self._call})
+
+        def run(keys, args):
+            if self.fail:
+                raise ConnectionError("redis unavailable")
+            reply = function(runtime.table_from(keys), runtime.table_from([str(a) for a in args]), redis_api)
+            # Redis처럼 Lua 숫자는 정수, 문자열은 bytes로 변환
+            return [
+                value.encode() if isinstance(value, str) else int(value)
+                for value in (reply[i] for i in range(1, len(reply) + 1))
+            ]
+        return run
+
+    def _call(self, command, *args):
+        if command == "GET":
+            value = self.data.get(args[0])
+            return value.decode() if value is not None else False
+        if command == "SET":
+            key, value, _, px = args
+            self.data[key] = value.encode()
+            self.px[key] = int(px)
+            return "OK"
+        raise NotImplementedError(command)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def ping(self):
+        return True
+
+
+@pytest.mark.unit
+def test_redis_store_matches_memory_store():
+    """Test that the Redis GCRA script admits and denies exactly like the in-memory store"""
+    redis = RedisStandIn()
+    redis_limiter = RateLimiter(requests_per_minute=7, requests_per_hour=9, store=RedisRateLimitStore(None, client=redis))
+    memory_limiter = RateLimiter(requests_per_minute=7, requests_per_hour=9, store=InMemoryRateLimitStore())
+    now = 1_000_000.0
+
+    for offset in (0, 0, 0, 0, 0, 0, 0, 0, 8.6, 30, 60, 61):
+        assert redis_limiter.is_allowed("ip:1", now=now + offset) == memory_limiter.is_allowed("ip:1", now=now + offset)
+
+    windows = redis_limiter._windows("ip:1", redis_limiter.default_policy)
+    assert redis_limiter.store.peek(windows, now=now + 61) == memory_limiter.store.peek(windows, now=now + 61)
+
+
+@pytest.mark.unit
+def test_redis_store_keys_expire_with_tat():
+    """Test that Redis keys get a TTL covering only the time until their TAT"""
+    redis = RedisStandIn()
+    limiter = RateLimiter(requests_per_minute=6, requests_per_hour=60, store=RedisRateLimitStore(None, client=redis))
+
+    for _ in range(3):
+        assert limiter.is_allowed("ip:1", now=1_000_000.0)[0] is True
+
+    minute_key, hour_key, day_key = [w.key for w in limiter._windows("ip:1", limiter.default_policy)]
+    assert redis.px[minute_key] == 30_000  # 3회 × 10초
+    assert redis.px[hour_key] == 180_000  # 3회 × 60초
+    assert 0 < redis.px[day_key] <= 86_400_000
+
+
+@pytest.mark.unit
+def test_redis_store_errors_fail_open():
+    """Test that Redis errors let requests through and an unreachable Redis falls back to memory"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.middleware.rate_limit import RateLimitMiddleware
+
+    redis = RedisStandIn()
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, store=RedisRateLimitStore(None, client=redis))
+
+    @app.get("/api/inquiries/list")
+    def inquiries():
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert client.get("/api/inquiries/list").headers["X-RateLimit-Policy"] == "default"
+
+    redis.fail = True
+    response = client.get("/api/inquiries/list")
+    assert response.status_code == 200
+    assert "X-RateLimit-Policy" not in response.headers
+
+    store = create_rate_limit_store("redis", redis_url="redis://127.0.0.1:1/0")
+    assert isinstance(store, InMemoryRateLimitStore)
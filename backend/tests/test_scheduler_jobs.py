@@ -0,0 +1,84 @@
+"""
+Scheduler Job Lease and Run History Tests
+스케줄러 작업 리스 잠금 및 실행 이력 테스트
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.scheduler_job import SchedulerJobRun
+from app.scheduler import AutomationScheduler
+from app.services.job_lease import JobLease
+
+
+@pytest.mark.unit
+def test_lease_is_exclusive_until_expiry(test_db):
+    """Test that a second instance cannot take a live lease but can take an expired one"""
+    now = datetime.utcnow()
+    first = JobLease(test_db, "auto_fetch_returns", ttl_seconds=60, owner="machine-a:1")
+    second = JobLease(test_db, "auto_fetch_returns", ttl_seconds=60, owner="machine-b:1")
+
+    assert first.acquire(now=now) is True
+    assert second.acquire(now=now + timedelta(seconds=30)) is False
+
+    # 만료 후에는 다른 인스턴스가 가져가고, 기존 보유자는 갱신 불가
+    assert second.acquire(now=now + timedelta(seconds=61)) is True
+    assert first.renew() is False
+
+    second.release()
+    assert first.acquire() is True
+
+
+@pytest.fixture
+def scheduler(test_db):
+    return AutomationScheduler(session_factory=lambda: test_db)
+
+
+@pytest.mark.unit
+def test_run_job_records_history(test_db, scheduler):
+    """Test that runs record outcome, items and duration, and failures are captured"""
+    scheduler.run_job("auto_collect", lambda: 7)
+
+    def broken():
+        raise RuntimeError("쿠팡 API 오류")
+
+    scheduler.run_job("auto_collect", broken)
+
+    runs = test_db.query(SchedulerJobRun).order_by(SchedulerJobRun.id).all()
+    assert [(r.status, r.items_processed) for r in runs] == [("success", 7), ("failed", 0)]
+    assert runs[1].error_message == "쿠팡 API 오류"
+    assert runs[0].duration_seconds is not None
+
+    history = scheduler.get_job_history("auto_collect")
+    assert [h["status"] for h in history] == ["failed", "success"]
+
+
+@pytest.mark.unit
+def test_run_job_skips_when_another_instance_holds_lease(test_db, scheduler):
+    """Test skip-if-running across replicas"""
+    JobLease(test_db, "auto_apply_coupons", ttl_seconds=300, owner="other-machine:1").acquire()
+    calls = []
+
+    run = scheduler.run_job("auto_apply_coupons", lambda: calls.append(1))
+
+    assert calls == []
+    assert run["status"] == "skipped"
+
+
+@pytest.mark.unit
+def test_naverpay_scrape_failure_is_recorded_as_failed(test_db, scheduler, monkeypatch):
+    """Test that a failing NaverPay scrape alerts and is recorded as a failed run"""
+    alerts = []
+
+    async def broken_scraper():
+        raise RuntimeError("브라우저 시작 실패")
+
+    monkeypatch.setattr("app.services.naverpay_scraper.get_scraper", broken_scraper)
+    monkeypatch.setattr(scheduler, "_send_alert", lambda message, level="info": alerts.append(level))
+
+    scheduler.run_job("auto_scrape_naverpay", scheduler.auto_scrape_naverpay)
+
+    run = test_db.query(SchedulerJobRun).one()
+    assert run.status == "failed"
+    assert run.error_message == "브라우저 시작 실패"
+    assert alerts == ["error"]
@@ -0,0 +1,93 @@
+"""
+Special Form Pipeline Tests
+특수 양식 일괄 처리 파이프라인 테스트
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.special_form_automation import SpecialFormAutomation, SpecialFormInquiry
+
+
+class TimedAutomation(SpecialFormAutomation):
+    """AI 생성/브라우저 제출을 지연으로 대신하고 동시 실행 수를 기록"""
+
+    def __init__(self, ai_seconds: float, browser_seconds: float, fail_ids=()):
+        super().__init__(account_id=1, wing_username="user", wing_password="pw")
+        self.client = SimpleNamespace(page="page-0", context=SimpleNamespace(new_page=self._new_page))
+        self.ai_seconds = ai_seconds
+        self.browser_seconds = browser_seconds
+        self.fail_ids = set(fail_ids)
+        self.active_ai = 0
+        self.max_active_ai = 0
+        self.pages_used = set()
+        self.opened = 0
+
+    async def _new_page(self):
+        self.opened += 1
+        return SimpleNamespace(name=f"page-{self.opened}", close=self._close_page)
+
+    async def _close_page(self):
+        pass
+
+    async def generate_answer(self, inquiry):
+        self.active_ai += 1
+        self.max_active_ai = max(self.max_active_ai, self.active_ai)
+        await asyncio.sleep(self.ai_seconds)
+        self.active_ai -= 1
+        return None if inquiry.inquiry_id in self.fail_ids else f"answer {inquiry.inquiry_id}"
+
+    async def submit_special_form(self, inquiry, ai_response, result, page=None):
+        self.pages_used.add(getattr(page, "name", page))
+        await asyncio.sleep(self.browser_seconds)
+        result["status"] = "submitted"
+        result["ai_response"] = ai_response
+        return result
+
+
+def make_inquiries(count: int):
+    return [
+        SpecialFormInquiry(
+            inquiry_id=str(i),
+            inquiry_content="문의",
+            customer_name="고객",
+            special_reply_content="https://coupa.ng/abc"
+        )
+        for i in range(count)
+    ]
+
+
+def collect(automation, inquiries, **kwargs):
+    async def run():
+        return [event async for event in automation.process_batch(inquiries, delay=0, **kwargs)]
+    return asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_ai_generation_overlaps_browser_stage():
+    """Test that upcoming answers are generated while earlier ones are submitted"""
+    automation = TimedAutomation(ai_seconds=0.1, browser_seconds=0.1)
+    started = time.perf_counter()
+    events = collect(automation, make_inquiries(6), prefetch=3)
+    elapsed = time.perf_counter() - started
+
+    assert events[-1]["type"] == "complete" and events[-1]["success"] == 6
+    assert elapsed < 1.0  # 순차 처리면 6 × (0.1 + 0.1) = 1.2초
+    assert 1 < automation.max_active_ai <= 3
+    stages = {(e["stage"], e["state"]) for e in events if e["type"] == "stage"}
+    assert ("ai_response", "completed") in stages and ("browser", "completed") in stages
+
+
+@pytest.mark.unit
+def test_multiple_pages_and_failed_answers():
+    """Test extra pages of the logged-in context and per-inquiry AI failures"""
+    automation = TimedAutomation(ai_seconds=0.01, browser_seconds=0.05, fail_ids={"2"})
+    events = collect(automation, make_inquiries(5), prefetch=4, pages=2)
+
+    finished = {e["data"]["inquiry_id"]: e["type"] for e in events if e["type"] in ("success", "failed")}
+    assert finished == {"0": "success", "1": "success", "2": "failed", "3": "success", "4": "success"}
+    assert automation.pages_used == {"page-0", "page-1"}
+    assert [e["current"] for e in events if e["type"] == "progress"] == [1, 2, 3, 4, 5]
+    assert events[-1]["failed"] == 1
@@ -0,0 +1,81 @@
+"""
+Coupang API Stand-in Server Tests
+쿠팡 API 대역 서버 테스트
+"""
+import pytest
+import requests
+
+from app.services.coupon_api_client import CouponAPIClient
+from benchmarks.stand_in_server import CoupangStandInServer, percentile
+
+
+@pytest.fixture
+def stand_in():
+    with CoupangStandInServer(products=250, items_per_product=3) as server:
+        yield server
+
+
+def make_client(server, secret_key=None):
+    client = CouponAPIClient(server.access_key, secret_key or server.secret_key, server.vendor_id)
+    client.BASE_URL = server.base_url
+    return client
+
+
+@pytest.mark.unit
+def test_next_token_pagination_and_detail(stand_in):
+    """Test that the real client pages through the catalog via nextToken"""
+    client = make_client(stand_in)
+
+    seen, next_token = [], None
+    while True:
+        page = client.get_all_products(next_token=next_token)
+        assert page["code"] == "SUCCESS"
+        seen.extend(p["sellerProductId"] for p in page["data"])
+        if not page["nextToken"]:
+            break
+        next_token = int(page["nextToken"])
+
+    assert len(seen) == len(set(seen)) == 250
+    assert client.get_vendor_item_ids(seen[0]) == [seen[0] * 10, seen[0] * 10 + 1, seen[0] * 10 + 2]
+    assert stand_in.stats()["routes"]["seller_products"]["requests"] == 3
+
+
+@pytest.mark.unit
+def test_rejects_bad_signature(stand_in):
+    """Test HMAC verification with a wrong secret key"""
+    client = make_client(stand_in, secret_key="wrong-secret")
+
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        client.get_all_products()
+    assert exc_info.value.response.status_code == 401
+
+
+@pytest.mark.unit
+def test_injects_rate_limits(stand_in):
+    """Test 429 injection and the instant coupon request lifecycle"""
+    client = make_client(stand_in)
+    stand_in.coupon_polls_until_done = 2
+
+    requested = client.apply_instant_coupon_to_items(coupon_id=1, vendor_item_ids=[10010, 10011])
+    requested_id = requested["data"]["content"]["requestedId"]
+    assert client.get_instant_coupon_request_status(requested_id)["data"]["content"]["status"] == "REQUESTED"
+    assert client.get_instant_coupon_request_status(requested_id)["data"]["content"]["status"] == "DONE"
+
+    stand_in.rate_limit_ratio = 1.0
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        client.get_all_products()
+    assert exc_info.value.response.status_code == 429
+    assert stand_in.stats()["status_counts"][429] == 1
+
+
+@pytest.mark.unit
+def test_percentile_uses_nearest_rank():
+    """Test that percentile returns the nearest-rank value for even and odd sample counts"""
+    values = list(range(1, 11))
+    assert percentile(values, 30) == 3
+    assert percentile(values, 50) == 5
+    assert percentile(values, 90) == 9
+    assert percentile(values, 95) == 10
+    assert percentile(list(range(1, 5)), 50) == 2
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) == 0.0
@@ -0,0 +1,93 @@
+"""
+Validator Cache Tests
+응답 검증 지문 캐시 테스트
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.models import Inquiry, Response
+from app.services.validator import ResponseValidator
+
+
+def make_response(db, n: int, text: str = "안녕하세요 고객님. 배송은 3일 이내에 도착할 예정입니다. 감사합니다.") -> Response:
+    inquiry = Inquiry(
+        coupang_inquiry_id=f"CACHE_INQ_{n}",
+        vendor_id="VENDOR_TEST",
+        inquiry_text="배송이 언제 오나요?",
+        inquiry_date=datetime.utcnow(),
+        classified_category="shipping",
+        risk_level="low"
+    )
+    db.add(inquiry)
+    db.flush()
+    response = Response(inquiry_id=inquiry.id, response_text=text, confidence_score=90.0)
+    db.add(response)
+    db.commit()
+    return response
+
+
+@pytest.mark.unit
+def test_unchanged_response_is_not_revalidated(test_db):
+    """Test that a second validation reuses the stored result without compounding confidence"""
+    response = make_response(test_db, 1)
+    validator = ResponseValidator(test_db)
+
+    first = validator.validate_response(response)
+    second = validator.validate_response(response)
+
+    assert "cached" not in first
+    assert second["cached"] is True
+    assert second["confidence"] == first["confidence"]
+    assert second["passed"] == first["passed"]
+    assert second["issues"] == first["issues"]
+    assert response.confidence_score == first["confidence"]
+
+
+@pytest.mark.unit
+def test_edited_text_or_inquiry_change_revalidates(test_db):
+    """Test that editing the text or the inquiry risk level invalidates the fingerprint"""
+    response = make_response(test_db, 2)
+    validator = ResponseValidator(test_db)
+    validator.validate_response(response)
+
+    response.response_text = "안녕하세요 고객님. 주문하신 상품은 내일 출고됩니다. 감사합니다."
+    assert "cached" not in validator.validate_response(response)
+    assert validator.validate_response(response)["cached"] is True
+
+    inquiry = test_db.query(Inquiry).filter(Inquiry.id == response.inquiry_id).first()
+    inquiry.risk_level = "high"
+    result = validator.validate_response(response, inquiry)
+    assert "cached" not in result
+    assert result["risk_level"] == "high"
+
+    assert "cached" not in validator.validate_response(response, inquiry, force=True)
+
+
+@pytest.mark.unit
+def test_validate_many_loads_inquiries_once_and_commits_once(test_db):
+    """Test that batch validation uses one inquiry query and a single commit"""
+    responses = [make_response(test_db, 10 + i) for i in range(5)]
+    validator = ResponseValidator(test_db)
+    validator.validate_response(responses[0])
+
+    statements = []
+    commits = []
+    engine = test_db.get_bind()
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(test_db, "after_commit", lambda session: commits.append(1))
+    try:
+        results = validator.validate_many([r.id for r in responses])
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    assert set(results) == {r.id for r in responses}
+    assert results[responses[0].id]["cached"] is True
+    assert all("cached" not in results[r.id] for r in responses[1:])
+    assert sum(1 for s in statements if s.lstrip().upper().startswith("SELECT") and "FROM inquiries" in s) == 1
+    assert len(commits) == 1
@@ -0,0 +1,84 @@
+"""
+Wing Inquiry Table Tests
+쿠팡윙 문의 테이블 대기/추출 테스트
+"""
+import time
+
+import pytest
+
+from app.services import wing_web_automation_v3
+from app.services.wing_web_automation_v3 import WingWebAutomationV3
+
+
+class FakeDriver:
+    """execute_script 결과만 흉내 내는 드라이버 스텁"""
+
+    def __init__(self, signatures, extract_results=None):
+        self.signatures = list(signatures)
+        self.extract_results = list(extract_results or [])
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        if script == wing_web_automation_v3._TABLE_SIGNATURE_JS:
+            return self.signatures.pop(0) if len(self.signatures) > 1 else self.signatures[0]
+        if script == wing_web_automation_v3._CLICK_TAB_JS:
+            return True
+        if script == wing_web_automation_v3._EXTRACT_INQUIRIES_JS:
+            return self.extract_results.pop(0)
+        return None
+
+
+@pytest.fixture
+def automation(monkeypatch):
+    monkeypatch.setattr(wing_web_automation_v3.settings, "OPENAI_API_KEY", "")
+    monkeypatch.setattr(WingWebAutomationV3, "_selector_cache", {})
+    bot = WingWebAutomationV3(username="seller", password="secret", headless=True)
+    bot.TABLE_SETTLE_SECONDS = 0.3
+    return bot
+
+
+@pytest.mark.unit
+def test_tab_switch_ready_when_rows_change_in_place(automation):
+    """Test that a tab switch completes as soon as the row signature changes, without a stale tbody marker"""
+    automation.TABLE_SETTLE_SECONDS = 5
+    automation.driver = FakeDriver(["3:aaa", None, "3:aaa", "5:bbb"])
+
+    started = time.monotonic()
+    assert automation.click_tab("24시간 이내")
+    assert time.monotonic() - started < 2
+
+
+@pytest.mark.unit
+def test_tab_switch_with_identical_rows_waits_only_settle_time(automation):
+    """Test that an unchanged table is accepted after the settle time instead of the full timeout"""
+    automation.driver = FakeDriver(["empty"])
+
+    started = time.monotonic()
+    assert automation.click_tab("24~72시간")
+    elapsed = time.monotonic() - started
+    assert automation.TABLE_SETTLE_SECONDS <= elapsed < 2
+
+
+@pytest.mark.unit
+def test_table_wait_times_out_while_loading(automation):
+    """Test that the wait gives up while the table is still loading"""
+    automation.driver = FakeDriver([None])
+    assert automation._wait_for_inquiry_table(timeout=0.5) is False
+
+
+@pytest.mark.unit
+def test_extraction_prefers_cached_selector_variant(automation):
+    """Test that the variant that matched last is tried first for the same page version"""
+    result = {"page_version": "data-v-1234", "cell_count": 1, "variant_hits": [0, 1, 0], "items": []}
+    automation.driver = FakeDriver(["empty"], [dict(result), dict(result)])
+    assert automation._last_page_version is None
+
+    automation._extract_inquiries()
+    first_order = [v["index"] for v in automation.driver.scripts[-1][1][0]]
+    automation._extract_inquiries()
+    second_order = [v["index"] for v in automation.driver.scripts[-1][1][0]]
+
+    assert first_order == [0, 1, 2]
+    assert second_order == [1, 0, 2]
+    assert automation._last_page_version == "data-v-1234"